@@ -46,6 +46,12 @@ class DatabaseConfig:
 
     path: str = "src/backend/data/nba.duckdb"
     timeout_seconds: int = 30
+    pool_size: int = 8
+    threads: int | None = None
+    memory_limit: str | None = None
+    result_cache_mb: int = 64
+    preview_rows: int = 1000
+    preview_max_mb: int = 16
 
 
 @dataclass
@@ -56,6 +62,10 @@ class LLMConfig:
     temperature: float = 0.1
     max_tokens: int = 2000
     rate_limit_rpm: int = 60
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 60.0
+    http2: bool = True
 
 
 @dataclass
@@ -75,6 +85,18 @@ class CacheConfig:
     semantic_threshold: float = 0.95
     ttl_hours: int = 24
     max_entries: int = 10000
+    eviction_policy: str = "lru"
+    sweep_interval_seconds: int = 60
+
+
+@dataclass
+class FlowConfig:
+    """Analyst flow configuration."""
+
+    sub_query_concurrency: int = 4
+    sql_templates: bool = True
+    sql_candidates: int = 1
+    name_search: bool = True
 
 
 @dataclass
@@ -94,6 +116,7 @@ class AppConfig:
     llm: LLMConfig = field(default_factory=LLMConfig)
     resilience: ResilienceConfig = field(default_factory=ResilienceConfig)
     cache: CacheConfig = field(default_factory=CacheConfig)
+    flow: FlowConfig = field(default_factory=FlowConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
 
 
@@ -129,6 +152,7 @@ def _apply_yaml_config(config: AppConfig, data: dict) -> None:
         "llm": (LLMConfig, "llm"),
         "resilience": (ResilienceConfig, "resilience"),
         "cache": (CacheConfig, "cache"),
+        "flow": (FlowConfig, "flow"),
         "logging": (LoggingConfig, "logging"),
     }
     for key, (klass, attr) in section_map.items():
@@ -140,9 +164,12 @@ def _apply_env_overrides(config: AppConfig) -> None:
     overrides = [
         ("NBA_DB_PATH", ("database", "path"), str),
         ("NBA_DB_TIMEOUT", ("database", "timeout_seconds"), int),
+        ("NBA_DB_THREADS", ("database", "threads"), int),
+        ("NBA_DB_MEMORY_LIMIT", ("database", "memory_limit"), str),
         ("LLM_MODEL", ("llm", "model"), str),
         ("LLM_TEMPERATURE", ("llm", "temperature"), float),
         ("LLM_MAX_TOKENS", ("llm", "max_tokens"), int),
+        ("LLM_MAX_CONNECTIONS", ("llm", "max_connections"), int),
         ("LOG_LEVEL", ("logging", "level"), str),
     ]
     for env_key, (section, attr), caster in overrides:
@@ -165,10 +192,12 @@ def get_config() -> AppConfig:
 
 DEFAULT_DATA_DIR = "src/backend/data/raw/csv"
 NBA_DEFAULT_SEASON = os.environ.get("NBA_API_DEFAULT_SEASON", get_current_nba_season())
-ENTITY_SAMPLE_SIZE = 1000
 SEARCH_SAMPLE_SIZE = 1000
 CSV_EXECUTION_TIMEOUT = 30
 API_EXECUTION_TIMEOUT = 60
+SANDBOX_WORKERS = 2
+SANDBOX_MEMORY_LIMIT_MB = 2048
+SANDBOX_MAX_TASKS_PER_WORKER = 100
 CHART_HISTORY_LIMIT = 10
 CHART_ROW_LIMIT = 10
 RAW_RESULT_TRUNCATION = 5000
@@ -188,7 +217,9 @@ _SEASON_PATTERN = re.compile(r"^\d{4}-\d{2}$")
 _POSITIVE_INT_CONFIGS: dict[str, int] = {
     "CSV_EXECUTION_TIMEOUT": CSV_EXECUTION_TIMEOUT,
     "API_EXECUTION_TIMEOUT": API_EXECUTION_TIMEOUT,
-    "ENTITY_SAMPLE_SIZE": ENTITY_SAMPLE_SIZE,
+    "SANDBOX_WORKERS": SANDBOX_WORKERS,
+    "SANDBOX_MEMORY_LIMIT_MB": SANDBOX_MEMORY_LIMIT_MB,
+    "SANDBOX_MAX_TASKS_PER_WORKER": SANDBOX_MAX_TASKS_PER_WORKER,
     "SEARCH_SAMPLE_SIZE": SEARCH_SAMPLE_SIZE,
     "CHART_HISTORY_LIMIT": CHART_HISTORY_LIMIT,
     "CHART_ROW_LIMIT": CHART_ROW_LIMIT,
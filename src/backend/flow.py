@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-from pocketflow import BatchFlow, Flow
+from pocketflow import AsyncBatchFlow, AsyncFlow, BatchFlow, Flow
 
+from src.backend.config import get_config
 from src.backend.nodes import (
     AskUser,
+    AsyncAskUser,
+    AsyncChartGenerator,
+    AsyncClarifyQuery,
+    AsyncCombineResults,
+    AsyncDataAnalyzer,
+    AsyncQueryPlanner,
+    AsyncQueryRewriter,
+    AsyncResponseGrader,
+    AsyncSQLExecutor,
+    AsyncSQLGenerator,
+    AsyncTableSelector,
+    AsyncTemplateMatcher,
     ChartGenerator,
     ClarifyQuery,
     CombineResults,
@@ -19,14 +34,26 @@ from src.backend.nodes import (
     SQLExecutor,
     SQLGenerator,
     TableSelector,
+    TemplateMatcher,
 )
+from src.backend.nodes.combine_results import topological_sort_sub_queries
+from src.backend.nodes.table_selector import rank_candidate_tables
+from src.backend.utils.logger import get_logger
+
+
+if TYPE_CHECKING:
+    from pocketflow import BaseNode
 
 
 logger = logging.getLogger(__name__)
 
 
 class SubQueryBatchFlow(BatchFlow):
-    """Batch flow for executing decomposed sub-queries."""
+    """Batch flow for executing decomposed sub-queries.
+
+    Candidate tables for every sub-query are ranked up front in one batched
+    embedding pass, so each branch's TableSelector skips its own search.
+    """
 
     def prep(self, shared: dict[str, Any]) -> list[dict[str, Any]]:
         query_plan = shared.get("query_plan")
@@ -42,54 +69,198 @@ class SubQueryBatchFlow(BatchFlow):
         shared["sub_query_sqls"] = {}
         shared["sub_query_tables"] = {}
         shared["sub_query_errors"] = {}
+        shared.setdefault("sub_query_attempts", {})
 
         params_list: list[dict[str, Any]] = []
         for idx, sub_query in enumerate(sub_queries, 1):
             if isinstance(sub_query, dict):
                 sub_id = sub_query.get("id") or f"sub_{idx}"
                 description = sub_query.get("description") or ""
+                depends_on = sub_query.get("depends_on") or []
             else:
                 sub_id = sub_query.id or f"sub_{idx}"
                 description = sub_query.description or ""
+                depends_on = sub_query.depends_on
             params_list.append(
                 {
                     "sub_query_id": str(sub_id),
                     "sub_query_description": str(description),
+                    "depends_on": [str(dep) for dep in depends_on],
                 }
             )
 
+        try:
+            ranked = rank_candidate_tables(
+                shared, [params["sub_query_description"] for params in params_list]
+            )
+        except Exception as exc:
+            logger.warning("Batched table ranking failed: %s", exc)
+        else:
+            for params, candidates in zip(params_list, ranked, strict=True):
+                params["candidate_tables"] = candidates
+
         return params_list
 
 
-def create_analyst_flow() -> Flow:
-    """Create the NBA Data Analyst Flow aligned with design.md."""
-    clarify = ClarifyQuery()
-    ask_user = AskUser()
-    rewriter = QueryRewriter()
-    planner = QueryPlanner()
-
-    selector = TableSelector()
-    sql_gen = SQLGenerator()
-    sql_exec = SQLExecutor()
-    chart_gen = ChartGenerator()
-    analyzer = DataAnalyzer()
-    grader = ResponseGrader()
-    combiner = CombineResults()
-
-    sub_selector = TableSelector()
-    sub_sql_gen = SQLGenerator()
-    sub_sql_exec = SQLExecutor()
+class AsyncSubQueryBatchFlow(AsyncBatchFlow, SubQueryBatchFlow):
+    """Sub-query batch flow for the async analyst flow."""
+
+    async def prep_async(self, shared: dict[str, Any]) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self.prep, shared)
+
+
+class ParallelSubQueryBatchFlow(AsyncSubQueryBatchFlow):
+    """Run independent sub-queries concurrently.
+
+    Sub-queries without dependencies start together, up to
+    ``max_concurrency`` branches at a time. A sub-query with ``depends_on``
+    waits for the sub-queries that precede it in topological order, so
+    ``chain`` plans keep their sequence.
+
+    Each branch runs against a shallow copy of the shared store. Scratch keys
+    such as ``table_schemas`` stay branch-local, while results land in the
+    branch's own slot of the shared ``sub_query_*`` dictionaries.
+    """
+
+    def __init__(
+        self,
+        start: BaseNode | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Initialize the flow.
+
+        Args:
+            start: First node of each sub-query branch.
+            max_concurrency: Maximum branches in flight. Defaults to
+                ``flow.sub_query_concurrency`` from config.
+        """
+        super().__init__(start=start)
+        if max_concurrency is None:
+            max_concurrency = get_config().flow.sub_query_concurrency
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def _run_async(self, shared: dict[str, Any]) -> Any:
+        params_list = await self.prep_async(shared) or []
+        order = [
+            node["id"]
+            for node in topological_sort_sub_queries(
+                [
+                    {"id": params["sub_query_id"], "depends_on": params["depends_on"]}
+                    for params in params_list
+                ]
+            )
+        ]
+        position = {sub_id: idx for idx, sub_id in enumerate(order)}
+        finished = {sub_id: asyncio.Event() for sub_id in order}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_branch(params: dict[str, Any]) -> None:
+            sub_id = params["sub_query_id"]
+            try:
+                # Only wait on earlier sub-queries, so a cycle cannot deadlock.
+                for dep in params["depends_on"]:
+                    if position.get(dep, len(order)) < position[sub_id]:
+                        await finished[dep].wait()
+                async with semaphore:
+                    get_logger().fork_context()
+                    await self._orch_async(dict(shared), {**self.params, **params})
+            except Exception as exc:
+                logger.warning("Sub-query %s failed: %s", sub_id, exc)
+                shared["sub_query_errors"][sub_id] = str(exc)
+            finally:
+                finished[sub_id].set()
+
+        await asyncio.gather(*(run_branch(params) for params in params_list))
+        return await self.post_async(shared, params_list, None)
+
+
+@dataclass(frozen=True)
+class _FlowClasses:
+    """Node and flow classes used to build one variant of the analyst flow."""
+
+    clarify: type[BaseNode]
+    ask_user: type[BaseNode]
+    rewriter: type[BaseNode]
+    template: type[BaseNode]
+    planner: type[BaseNode]
+    selector: type[BaseNode]
+    sql_gen: type[BaseNode]
+    sql_exec: type[BaseNode]
+    chart_gen: type[BaseNode]
+    analyzer: type[BaseNode]
+    grader: type[BaseNode]
+    combiner: type[BaseNode]
+    sub_flow: type[Flow]
+    flow: type[Flow]
+
+
+_SYNC_FLOW = _FlowClasses(
+    clarify=ClarifyQuery,
+    ask_user=AskUser,
+    rewriter=QueryRewriter,
+    template=TemplateMatcher,
+    planner=QueryPlanner,
+    selector=TableSelector,
+    sql_gen=SQLGenerator,
+    sql_exec=SQLExecutor,
+    chart_gen=ChartGenerator,
+    analyzer=DataAnalyzer,
+    grader=ResponseGrader,
+    combiner=CombineResults,
+    sub_flow=SubQueryBatchFlow,
+    flow=Flow,
+)
+
+_ASYNC_FLOW = _FlowClasses(
+    clarify=AsyncClarifyQuery,
+    ask_user=AsyncAskUser,
+    rewriter=AsyncQueryRewriter,
+    template=AsyncTemplateMatcher,
+    planner=AsyncQueryPlanner,
+    selector=AsyncTableSelector,
+    sql_gen=AsyncSQLGenerator,
+    sql_exec=AsyncSQLExecutor,
+    chart_gen=AsyncChartGenerator,
+    analyzer=AsyncDataAnalyzer,
+    grader=AsyncResponseGrader,
+    combiner=AsyncCombineResults,
+    sub_flow=ParallelSubQueryBatchFlow,
+    flow=AsyncFlow,
+)
+
+
+def _build_analyst_flow(classes: _FlowClasses) -> Flow:
+    """Wire the analyst flow graph from a set of node classes."""
+    clarify = classes.clarify()
+    ask_user = classes.ask_user()
+    rewriter = classes.rewriter()
+    template = classes.template()
+    planner = classes.planner()
+
+    selector = classes.selector()
+    sql_gen = classes.sql_gen()
+    sql_exec = classes.sql_exec()
+    chart_gen = classes.chart_gen()
+    analyzer = classes.analyzer()
+    grader = classes.grader()
+    combiner = classes.combiner()
+
+    sub_selector = classes.selector()
+    sub_sql_gen = classes.sql_gen()
+    sub_sql_exec = classes.sql_exec()
 
     _ = sub_selector >> sub_sql_gen
     _ = sub_sql_gen - "valid" >> sub_sql_exec
-    sub_flow = SubQueryBatchFlow(start=sub_selector)
+    sub_flow = classes.sub_flow(start=sub_selector)
 
     _ = clarify - "ambiguous" >> ask_user
     _ = clarify - "clear" >> rewriter
 
     _ = ask_user - "clarified" >> rewriter
 
-    _ = rewriter >> planner
+    _ = rewriter >> template
+    _ = template >> planner
+    _ = template - "template" >> sql_exec
     _ = planner - "simple" >> selector
     _ = planner - "complex" >> sub_flow
 
@@ -98,6 +269,7 @@ def create_analyst_flow() -> Flow:
     _ = sql_gen - "fallback" >> chart_gen
     _ = sql_exec - "success" >> chart_gen
     _ = sql_exec - "error" >> sql_gen
+    _ = sql_exec - "template_error" >> planner
 
     _ = chart_gen >> analyzer
     _ = sub_flow >> combiner >> chart_gen
@@ -105,8 +277,30 @@ def create_analyst_flow() -> Flow:
     _ = analyzer - "default" >> grader
     _ = grader - "fail" >> sql_gen
     _ = grader - "fail_complex" >> sub_flow
+    _ = grader - "fail_template" >> planner
+
+    return classes.flow(start=clarify)
+
+
+def create_analyst_flow() -> Flow:
+    """Create the NBA Data Analyst Flow aligned with design.md.
+
+    This synchronous flow is used by the CLI; the web app uses
+    ``create_async_analyst_flow``.
+    """
+    return _build_analyst_flow(_SYNC_FLOW)
+
+
+def create_async_analyst_flow() -> AsyncFlow:
+    """Create the async NBA Data Analyst Flow.
 
-    return Flow(start=clarify)
+    Same graph as ``create_analyst_flow``, but LLM calls are awaited through
+    ``call_llm_async``, blocking database work runs in worker threads, and
+    independent sub-queries of a complex plan run concurrently, so one
+    question does not block the event loop. Run it with
+    ``await flow.run_async(shared)``.
+    """
+    return _build_analyst_flow(_ASYNC_FLOW)
 
 
 if __name__ == "__main__":
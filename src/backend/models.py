@@ -114,6 +114,7 @@ class ExecutionTrace(BaseModel):
     total_latency_ms: int = 0
     retries: int = 0
     cache_hits: int = 0
+    ttft_ms: int | None = None
 
 
 class ResolvedReferences(BaseModel):
@@ -1,21 +1,42 @@
 """Public exports for backend node classes."""
 
-from src.backend.nodes.analysis import DataAnalyzer
-from src.backend.nodes.chart_generator import ChartGenerator
-from src.backend.nodes.combine_results import CombineResults
-from src.backend.nodes.planning import QueryPlanner
-from src.backend.nodes.query import AskUser, ClarifyQuery
-from src.backend.nodes.query_rewriter import QueryRewriter
-from src.backend.nodes.response_grader import ResponseGrader
-from src.backend.nodes.sql_executor import SQLExecutor
-from src.backend.nodes.sql_generator import SQLGenerator
-from src.backend.nodes.table_selector import TableSelector
+from src.backend.nodes.analysis import AsyncDataAnalyzer, DataAnalyzer
+from src.backend.nodes.chart_generator import AsyncChartGenerator, ChartGenerator
+from src.backend.nodes.combine_results import AsyncCombineResults, CombineResults
+from src.backend.nodes.planning import AsyncQueryPlanner, QueryPlanner
+from src.backend.nodes.query import (
+    AskUser,
+    AsyncAskUser,
+    AsyncClarifyQuery,
+    ClarifyQuery,
+)
+from src.backend.nodes.query_rewriter import AsyncQueryRewriter, QueryRewriter
+from src.backend.nodes.response_grader import AsyncResponseGrader, ResponseGrader
+from src.backend.nodes.sql_executor import AsyncSQLExecutor, SQLExecutor
+from src.backend.nodes.sql_generator import AsyncSQLGenerator, SQLGenerator
+from src.backend.nodes.table_selector import AsyncTableSelector, TableSelector
+from src.backend.nodes.template_matcher import (
+    AsyncTemplateMatcher,
+    TemplateMatcher,
+)
 
 
 __all__ = [
     "AskUser",
-    "ClarifyQuery",
+    "AsyncAskUser",
+    "AsyncChartGenerator",
+    "AsyncClarifyQuery",
+    "AsyncCombineResults",
+    "AsyncDataAnalyzer",
+    "AsyncQueryPlanner",
+    "AsyncQueryRewriter",
+    "AsyncResponseGrader",
+    "AsyncSQLExecutor",
+    "AsyncSQLGenerator",
+    "AsyncTableSelector",
+    "AsyncTemplateMatcher",
     "ChartGenerator",
+    "ClarifyQuery",
     "CombineResults",
     "DataAnalyzer",
     "QueryPlanner",
@@ -24,4 +45,5 @@ __all__ = [
     "SQLExecutor",
     "SQLGenerator",
     "TableSelector",
+    "TemplateMatcher",
 ]
@@ -1,23 +1,33 @@
 """Data analysis node for the NBA Data Analyst Agent.
 
 This module synthesizes SQL results into natural language answers,
-as specified in design.md Section 6.7.
+as specified in design.md Section 6.7. When the shared store carries an
+``answer_sink``, the async node streams the answer to it token by token.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 import yaml  # type: ignore[import-untyped]
 from pocketflow import Node
 
-from src.backend.utils.call_llm import call_llm
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.utils.answer_stream import AnswerStreamParser
+from src.backend.utils.call_llm import call_llm, call_llm_async
+from src.backend.utils.call_llm_streaming import call_llm_streaming_async
 from src.backend.utils.logger import get_logger
 from src.backend.utils.memory import get_memory
+from src.backend.utils.query_preview import format_result_summary
+
+
+if TYPE_CHECKING:
+    from src.backend.utils.answer_stream import TokenSink
 
 
 logger = logging.getLogger(__name__)
@@ -68,36 +78,43 @@ class DataAnalyzer(Node):
             "rewritten_query": shared.get("rewritten_query", ""),
             "sql_query": shared.get("sql_query", ""),
             "query_result": shared.get("query_result"),
+            "query_result_summary": shared.get("query_result_summary"),
             "execution_error": shared.get("execution_error"),
             "sub_query_sqls": shared.get("sub_query_sqls", {}),
             "query_plan": shared.get("query_plan"),
             "selected_tables": shared.get("selected_tables", []),
             "sub_query_tables": shared.get("sub_query_tables", {}),
+            "answer_sink": shared.get("answer_sink"),
         }
 
     def exec(self, prep_res: dict[str, Any]) -> dict[str, str]:
         """Generate final answer and transparency note."""
-        question = prep_res["question"]
-        rewritten_query = prep_res["rewritten_query"]
-        sql_query = prep_res["sql_query"]
-        query_result = prep_res["query_result"]
-        execution_error = prep_res["execution_error"]
-        sub_query_sqls = prep_res["sub_query_sqls"]
-
-        if query_result is None:
-            return self._fallback_response(question, execution_error)
-
-        sql_block = self._format_sql_block(sql_query, sub_query_sqls)
-        result_str = self._format_query_result(query_result)
-
-        prompt = DATA_ANALYZER_PROMPT.format(
-            question=question,
-            rewritten_query=rewritten_query,
+        if prep_res["query_result"] is None:
+            return self._fallback_response(
+                prep_res["question"], prep_res["execution_error"]
+            )
+
+        response = call_llm(self._build_prompt(prep_res))
+        return self._finalize_response(response)
+
+    def _build_prompt(self, prep_res: dict[str, Any]) -> str:
+        """Build the synthesis prompt from the query and its results."""
+        sql_block = self._format_sql_block(
+            prep_res["sql_query"], prep_res["sub_query_sqls"]
+        )
+        result_str = self._format_query_result(
+            prep_res["query_result"], prep_res.get("query_result_summary")
+        )
+
+        return DATA_ANALYZER_PROMPT.format(
+            question=prep_res["question"],
+            rewritten_query=prep_res["rewritten_query"],
             sql_query=sql_block,
             query_result_formatted=result_str,
         )
 
-        response = call_llm(prompt)
+    def _finalize_response(self, response: str) -> dict[str, str]:
+        """Parse the LLM response, filling in default text where missing."""
         parsed = self._parse_response(response)
 
         if not parsed.get("answer"):
@@ -142,17 +159,28 @@ class DataAnalyzer(Node):
             return "fallback"
         return "default"
 
-    def _format_query_result(self, result: Any) -> str:
-        """Format query result for prompt consumption."""
+    def _format_query_result(
+        self, result: Any, summary: dict[str, Any] | None = None
+    ) -> str:
+        """Format query result for prompt consumption.
+
+        When only a preview of the result was loaded, the full-result
+        statistics from ``summary`` are appended.
+        """
         if result is None:
             return "No results."
 
         if isinstance(result, pd.DataFrame):
             if result.empty:
                 return "Empty result set."
+            total_rows = len(result)
+            if summary and summary.get("total_rows") is not None:
+                total_rows = summary["total_rows"]
             preview = result.head(20).to_string(index=False)
-            if len(result) > 20:
-                preview += f"\n... ({len(result) - 20} more rows)"
+            if total_rows > 20:
+                preview += f"\n... ({total_rows - 20} more rows)"
+            if summary_text := format_result_summary(summary):
+                preview += f"\n\n{summary_text}"
             return self._truncate(preview)
 
         try:
@@ -233,3 +261,46 @@ class DataAnalyzer(Node):
             rewritten_query=shared.get("rewritten_query"),
             tables_used=tables_used or None,
         )
+
+
+class AsyncDataAnalyzer(AsyncNodeAdapter, DataAnalyzer):
+    """DataAnalyzer that awaits the LLM instead of blocking.
+
+    With an ``answer_sink`` in the shared store, the answer is streamed to it
+    as the LLM generates it; the full response is parsed as usual afterwards.
+    """
+
+    async def exec_async(self, prep_res: dict[str, Any]) -> dict[str, str]:
+        """Generate final answer and transparency note asynchronously."""
+        if prep_res["query_result"] is None:
+            return self._fallback_response(
+                prep_res["question"], prep_res["execution_error"]
+            )
+
+        prompt = await asyncio.to_thread(self._build_prompt, prep_res)
+        sink = prep_res.get("answer_sink")
+        if sink is None:
+            response = await call_llm_async(prompt)
+        else:
+            response = await self._stream_answer(prompt, sink)
+        return self._finalize_response(response)
+
+    async def _stream_answer(self, prompt: str, sink: TokenSink) -> str:
+        """Stream the answer block to the sink and return the full response.
+
+        If streaming fails, the sink is reset and the answer is generated
+        with a regular (retried, non-streamed) call instead.
+        """
+        parser = AnswerStreamParser()
+        chunks: list[str] = []
+        await sink.start()
+        try:
+            async for token in call_llm_streaming_async(prompt):
+                chunks.append(token)
+                if text := parser.feed(token):
+                    await sink.send(text)
+        except Exception as exc:
+            logger.warning("Answer streaming failed, retrying unstreamed: %s", exc)
+            await sink.start()
+            return await call_llm_async(prompt)
+        return "".join(chunks)
@@ -0,0 +1,37 @@
+"""Async adapter for the analyst flow's synchronous nodes.
+
+Async node variants subclass ``AsyncNodeAdapter`` together with the sync node
+they wrap, e.g. ``class AsyncQueryPlanner(AsyncNodeAdapter, QueryPlanner)``.
+The sync node's ``prep``/``post`` and any blocking ``exec`` run in a worker
+thread so the event loop stays free; nodes that call the LLM override
+``exec_async`` to await ``call_llm_async`` instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from pocketflow import AsyncNode
+
+
+class AsyncNodeAdapter(AsyncNode):
+    """Run a synchronous node's hooks without blocking the event loop."""
+
+    async def prep_async(self, shared: dict[str, Any]) -> Any:
+        """Run the sync ``prep`` in a worker thread."""
+        return await asyncio.to_thread(self.prep, shared)
+
+    async def exec_async(self, prep_res: Any) -> Any:
+        """Run the sync ``exec`` in a worker thread."""
+        return await asyncio.to_thread(self.exec, prep_res)
+
+    async def exec_fallback_async(self, prep_res: Any, exc: Exception) -> Any:
+        """Delegate to the sync ``exec_fallback``."""
+        return self.exec_fallback(prep_res, exc)
+
+    async def post_async(
+        self, shared: dict[str, Any], prep_res: Any, exec_res: Any
+    ) -> Any:
+        """Run the sync ``post`` in a worker thread."""
+        return await asyncio.to_thread(self.post, shared, prep_res, exec_res)
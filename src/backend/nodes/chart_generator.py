@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -13,6 +14,7 @@ import pandas as pd
 from pocketflow import Node
 
 from src.backend.config import CHART_HISTORY_LIMIT, CHART_ROW_LIMIT
+from src.backend.nodes.async_base import AsyncNodeAdapter
 from src.backend.utils.logger import get_logger
 
 
@@ -21,6 +23,9 @@ matplotlib.use("Agg")
 
 CHART_DIR = Path(__file__).parent.parent / "data" / "charts"
 
+# pyplot keeps global figure state; charts may be rendered from worker threads.
+_PYPLOT_LOCK = threading.Lock()
+
 
 class ChartGenerator(Node):
     """Generate a simple chart from query results when possible."""
@@ -61,16 +66,17 @@ class ChartGenerator(Node):
         chart_id = uuid4().hex[:8]
         chart_path = CHART_DIR / f"chart_{chart_id}.png"
 
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.bar(labels, values)
-        ax.set_title(f"{value_col} by {label_col or 'index'}")
-        ax.set_ylabel(value_col)
-        if label_col:
-            ax.set_xlabel(label_col)
-        ax.tick_params(axis="x", rotation=45)
-        fig.tight_layout()
-        fig.savefig(chart_path, dpi=150)
-        plt.close(fig)
+        with _PYPLOT_LOCK:
+            fig, ax = plt.subplots(figsize=(8, 4))
+            ax.bar(labels, values)
+            ax.set_title(f"{value_col} by {label_col or 'index'}")
+            ax.set_ylabel(value_col)
+            if label_col:
+                ax.set_xlabel(label_col)
+            ax.tick_params(axis="x", rotation=45)
+            fig.tight_layout()
+            fig.savefig(chart_path, dpi=150)
+            plt.close(fig)
 
         caption = f"{value_col} by {label_col or 'index'} (top {len(data)} rows)"
         return {"chart_path": str(chart_path), "chart_caption": caption}
@@ -107,3 +113,7 @@ class ChartGenerator(Node):
             "success",
         )
         return "default"
+
+
+class AsyncChartGenerator(AsyncNodeAdapter, ChartGenerator):
+    """ChartGenerator that renders charts in a worker thread."""
@@ -12,6 +12,7 @@ from typing import Any
 import pandas as pd
 from pocketflow import Node
 
+from src.backend.nodes.async_base import AsyncNodeAdapter
 from src.backend.utils.logger import get_logger
 
 
@@ -110,6 +111,7 @@ class CombineResults(Node):
         """
         shared["combined_result"] = exec_res["combined_result"]
         shared["query_result"] = exec_res["combined_result"]
+        shared.pop("query_result_summary", None)
 
         get_logger().log_node_end(
             "CombineResults",
@@ -349,31 +351,48 @@ class CombineResults(Node):
         Returns:
             Topologically sorted list.
         """
-        id_to_query = {}
-        for sq in sub_queries:
-            sq_id = sq.id if hasattr(sq, "id") else sq.get("id", "")
-            id_to_query[sq_id] = sq
-
-        visited = set()
-        result = []
-
-        def visit(sq_id: str) -> None:
-            if sq_id in visited:
-                return
-            visited.add(sq_id)
-
-            sq = id_to_query.get(sq_id)
-            if sq:
-                deps = (
-                    sq.depends_on
-                    if hasattr(sq, "depends_on")
-                    else sq.get("depends_on", [])
-                )
-                for dep in deps:
-                    visit(dep)
-                result.append(sq)
+        return topological_sort_sub_queries(sub_queries)
+
+
+def topological_sort_sub_queries(sub_queries: list[Any]) -> list[Any]:
+    """Sort sub-queries so each comes after the sub-queries it depends on.
+
+    Dependency cycles are broken at the first revisit, so every sub-query
+    appears exactly once.
+
+    Args:
+        sub_queries: Sub-query definitions (models or dicts).
+
+    Returns:
+        Topologically sorted list.
+    """
+    id_to_query = {}
+    for sq in sub_queries:
+        sq_id = sq.id if hasattr(sq, "id") else sq.get("id", "")
+        id_to_query[sq_id] = sq
+
+    visited = set()
+    result = []
+
+    def visit(sq_id: str) -> None:
+        if sq_id in visited:
+            return
+        visited.add(sq_id)
+
+        sq = id_to_query.get(sq_id)
+        if sq:
+            deps = (
+                sq.depends_on if hasattr(sq, "depends_on") else sq.get("depends_on", [])
+            )
+            for dep in deps:
+                visit(dep)
+            result.append(sq)
+
+    for sq_id in id_to_query:
+        visit(sq_id)
+
+    return result
 
-        for sq_id in id_to_query:
-            visit(sq_id)
 
-        return result
+class AsyncCombineResults(AsyncNodeAdapter, CombineResults):
+    """CombineResults that merges sub-query results in a worker thread."""
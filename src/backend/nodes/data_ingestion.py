@@ -1,27 +1,5 @@
 """Data ingestion nodes for loading local data and fetching NBA API content.
 
-# TODO (Performance): Implement DataFrame caching with invalidation
-# Current implementation reloads all CSVs on every question (LoadData.exec).
-# This is inefficient for repeated queries. Recommended approach:
-#   class DataFrameCache:
-#       def __init__(self, ttl=300):
-#           self._cache = {}
-#           self._timestamps = {}
-#       def get(self, filepath):
-#           if filepath in self._cache:
-#               if time.time() - self._timestamps[filepath] < self.ttl:
-#                   return self._cache[filepath]
-#           return None
-#       def set(self, filepath, df):
-#           self._cache[filepath] = df
-#           self._timestamps[filepath] = time.time()
-#       def invalidate(self, filepath=None):
-#           if filepath:
-#               self._cache.pop(filepath, None)
-#           else:
-#               self._cache.clear()
-# Invalidate on file upload or modification.
-
 # TODO (Refactoring): Split NBAApiDataLoader.exec into smaller methods
 # Current exec() method is 80+ lines with nested conditionals for each
 # endpoint type (player_career, league_leaders, etc.). Recommended:
@@ -63,17 +41,17 @@
 # Example: shared["api_status"] = "unavailable" for downstream handling.
 """
 
+import contextlib
 import logging
-import os
 from typing import Any
 
-import pandas as pd
 from pocketflow import Node
 
 
 logger = logging.getLogger(__name__)
 
 from backend.config import DEFAULT_DATA_DIR, NBA_DEFAULT_SEASON, PROJECT_ROOT
+from backend.utils.csv_catalog import get_csv_catalog
 from backend.utils.data_source_manager import data_source_manager
 from backend.utils.file_sanitizer import resolve_safe_dir
 from backend.utils.nba_api_client import nba_client
@@ -98,37 +76,23 @@ class LoadData(Node):
         )
 
     def exec(self, prep_res):
-        """Load all CSV files found in the provided directory into pandas DataFrames.
+        """Expose the CSV files found in the provided directory as lazily loaded DataFrames.
+
+        Tables come from the shared CSV catalog, so a file is parsed only when a
+        downstream node first reads it and is reused until it changes on disk.
+        Each header is read up front so files that cannot be parsed drop out here.
 
         Parameters:
             prep_res (str): Path to the directory containing CSV files.
 
         Returns:
-            dict: Mapping from table name (filename without the ".csv" extension) to the corresponding pandas DataFrame for each successfully read file.
+            LazyFrames: Read-only mapping from table name (filename without the ".csv" extension) to the corresponding pandas DataFrame; files that fail to parse are left out.
         """
-        csv_dir = prep_res
-        data = {}
-
-        if os.path.exists(csv_dir):
-            for filename in os.listdir(csv_dir):
-                if not filename.endswith(".csv"):
-                    continue
-
-                filepath = os.path.join(csv_dir, filename)
-                table_name = filename.replace(".csv", "")
-                try:
-                    try:
-                        data[table_name] = pd.read_csv(filepath, encoding="utf-8")
-                    except UnicodeDecodeError:
-                        data[table_name] = pd.read_csv(filepath, encoding="latin-1")
-                except (pd.errors.ParserError, UnicodeDecodeError) as exc:
-                    logger.exception(f"Error parsing CSV file {filename}: {exc}")
-                except FileNotFoundError as exc:
-                    logger.exception(f"File not found {filename}: {exc}")
-                except Exception as exc:
-                    logger.exception(f"Unexpected error loading {filename}: {exc}")
-
-        return data
+        catalog = get_csv_catalog(prep_res)
+        for name in catalog.refresh():
+            with contextlib.suppress(KeyError):
+                catalog.columns(name)
+        return catalog.frames()
 
     def post(self, shared, prep_res, exec_res) -> str:
         """Finalize CSV load results into the shared workflow state and choose the next transition.
@@ -2,6 +2,8 @@
 
 import json
 import logging
+from dataclasses import dataclass
+from typing import Any
 
 import pandas as pd
 from pocketflow import Node
@@ -9,14 +11,26 @@ from pocketflow import Node
 
 logger = logging.getLogger(__name__)
 
-from backend.config import ENTITY_SAMPLE_SIZE, SEARCH_SAMPLE_SIZE
+from backend.config import SEARCH_SAMPLE_SIZE
 from backend.utils.call_llm import call_llm
+from backend.utils.csv_catalog import LazyFrames
+from backend.utils.data_source_manager import MergedFrames
 from backend.utils.knowledge_store import knowledge_store
 from backend.utils.nba_api_client import nba_client
+from backend.utils.value_index import ValueIndex, get_value_index
+
+
+@dataclass(frozen=True)
+class _TableScan:
+    """One table's profile and sampled rows, scanned for each entity."""
+
+    name: str
+    profile: dict[str, Any]
+    sample: pd.DataFrame
 
 
 class EntityResolver(Node):
-    """Discover which tables contain entities mentioned in the query using configurable sampling."""
+    """Discover which tables contain entities mentioned in the query using an index of distinct values."""
 
     def prep(self, shared):
         """Prepare execution inputs for the EntityResolver by extracting required values from the shared context.
@@ -26,7 +40,6 @@ class EntityResolver(Node):
                 - "question": the user question text.
                 - "schema_str": serialized schema used for context.
                 - "dfs": mapping of table names to pandas DataFrame objects.
-                - "config" (optional): may contain "entity_sample_size" to override the default.
                 - "entity_ids" (optional): prepopulated entity identifier mappings.
 
         Returns:
@@ -34,50 +47,24 @@ class EntityResolver(Node):
                 - "question": the extracted question.
                 - "schema": the serialized schema string.
                 - "dfs": the DataFrames mapping.
-                - "sample_size": entity sampling size (configured value or default).
                 - "entity_ids": existing entity identifier mappings (empty dict if absent).
         """
         return {
             "question": shared["question"],
             "schema": shared["schema_str"],
             "dfs": shared["dfs"],
-            "sample_size": shared.get("config", {}).get(
-                "entity_sample_size",
-                ENTITY_SAMPLE_SIZE,
-            ),
             "entity_ids": shared.get("entity_ids", {}),
         }
 
-    @staticmethod
-    def _get_sample(df, col, sample_size):
-        """Return a non-null sample from a DataFrame column for entity scanning.
-
-        Attempts to extract non-missing values from `df[col]`. If the column's non-missing count is less than or equal to `sample_size`, returns the full non-missing Series; otherwise returns the first `sample_size` entries. If the column is missing or `df` does not support column access, returns an empty object-typed Series.
-
-        Parameters:
-            df: DataFrame-like object containing the column to sample.
-            col (str): Column name to sample.
-            sample_size (int): Maximum number of rows to return.
-
-        Returns:
-            pandas.Series: A Series of non-null values from the column (possibly empty).
-        """
-        try:
-            series = df[col].dropna()
-            if len(series) <= sample_size:
-                return series
-            return series.head(sample_size)
-        except (KeyError, AttributeError):
-            return pd.Series(dtype="object")
-
     def exec(self, prep_res):
         """Resolve entities mentioned in the prepared request, locate columns containing those entities across provided DataFrames, enrich with known IDs, and record mappings in the knowledge store.
 
+        Columns are found through the distinct-value index (see ``value_index``), which is synced with the DataFrames once per data fingerprint and covers every row rather than a sample.
+
         Parameters:
             prep_res (dict): Preparation result containing:
                 - question (str): The user question to extract entities from.
                 - dfs (dict[str, pandas.DataFrame]): Mapping of table name to DataFrame to search for entity occurrences.
-                - sample_size (int): Number of rows/values to sample from columns when searching for matches.
                 - entity_ids (dict, optional): Existing mapping of entities to ID dicts (e.g., {"player_id": ...} or {"team_id": ...}).
 
         Returns:
@@ -89,33 +76,28 @@ class EntityResolver(Node):
             }
         """
         question = prep_res["question"]
-        dfs = prep_res["dfs"]
-        sample_size = prep_res["sample_size"]
         entity_ids = dict(prep_res.get("entity_ids", {}))
 
         knowledge_hints = knowledge_store.get_all_hints()
         entities = self._extract_entities(question)
         entity_map: dict[str, dict[str, list[str]]] = {}
 
+        value_index = get_value_index()
+        if entities:
+            self._sync_value_index(value_index, prep_res["dfs"])
+
         for entity in entities:
-            entity_map[entity] = {}
             resolved_id = self._resolve_entity_id(entity)
             if resolved_id:
                 entity_ids[entity] = resolved_id
 
-            for table_name, df in dfs.items():
-                matching_cols = self._find_matching_columns(
+            entity_map[entity] = self._find_matching_columns(entity, value_index)
+            for table_name, matching_cols in entity_map[entity].items():
+                knowledge_store.add_entity_mapping(
                     entity,
-                    df,
-                    sample_size,
+                    table_name,
+                    matching_cols,
                 )
-                if matching_cols:
-                    entity_map[entity][table_name] = matching_cols
-                    knowledge_store.add_entity_mapping(
-                        entity,
-                        table_name,
-                        matching_cols,
-                    )
 
         return {
             "entities": entities,
@@ -124,6 +106,20 @@ class EntityResolver(Node):
             "entity_ids": entity_ids,
         }
 
+    @staticmethod
+    def _sync_value_index(value_index: ValueIndex, dfs) -> None:
+        """Sync the value index, keying CSV tables on their catalog signature.
+
+        CSV tables are indexed from the catalog rather than from merged copies,
+        so an unchanged file is not loaded, copied or hashed again.
+        """
+        if isinstance(dfs, MergedFrames):
+            value_index.sync(dfs.unmerged(), dfs.signatures())
+        elif isinstance(dfs, LazyFrames):
+            value_index.sync(dfs, dfs.signatures())
+        else:
+            value_index.sync(dfs)
+
     def _extract_entities(self, question: str) -> list[str]:
         extract_prompt = f"""Extract entities (people, teams, places, specific items) from this question.
 Return a JSON array of entity names only.
@@ -159,96 +155,28 @@ Return ONLY the JSON array, nothing else."""
     def _find_matching_columns(
         self,
         entity: str,
-        df: pd.DataFrame,
-        sample_size: int,
-    ) -> list[str]:
-        entity_lower = entity.lower()
-        entity_parts = entity_lower.split()
-        matching_cols: list[str] = []
-
-        name_cols = [
-            col
-            for col in df.columns
-            if any(
-                token in col.lower()
-                for token in [
-                    "first_name",
-                    "last_name",
-                    "player_name",
-                    "full_name",
-                    "display",
-                ]
-            )
-        ]
-
-        matching_cols.extend(
-            self._match_first_last_columns(df, name_cols, entity_parts, sample_size)
-        )
-        matching_cols.extend(
-            self._match_string_columns(df, entity_lower, sample_size, matching_cols)
-        )
-
-        return sorted(set(matching_cols))
-
-    def _match_first_last_columns(
-        self,
-        df: pd.DataFrame,
-        name_cols: list[str],
-        entity_parts: list[str],
-        sample_size: int,
-    ) -> list[str]:
-        if len(name_cols) < 2 or len(entity_parts) < 2:
-            return []
-
-        first_name_cols = [c for c in name_cols if "first" in c.lower()]
-        last_name_cols = [c for c in name_cols if "last" in c.lower()]
-        if not first_name_cols or not last_name_cols:
-            return []
-
-        try:
-            first_sample = self._get_sample(df, first_name_cols[0], sample_size)
-            last_sample = self._get_sample(df, last_name_cols[0], sample_size)
-            first_match = (
-                first_sample.astype(str)
-                .str.lower()
-                .str.contains(entity_parts[0], na=False)
-            )
-            last_match = (
-                last_sample.astype(str)
-                .str.lower()
-                .str.contains(entity_parts[-1], na=False)
-            )
-            if first_match.any() and last_match.any():
-                return [first_name_cols[0], last_name_cols[0]]
-        except (KeyError, AttributeError, TypeError):
-            return []
+        value_index: ValueIndex,
+    ) -> dict[str, list[str]]:
+        matches = {
+            table_name: set(columns)
+            for table_name, columns in value_index.find(entity).items()
+        }
 
-        return []
+        # "First Last" spread over separate first/last name columns
+        parts = entity.split()
+        if len(parts) >= 2:
+            first_hits = value_index.find(parts[0])
+            last_hits = value_index.find(parts[-1])
+            for table_name, first_cols in first_hits.items():
+                first_col = next((c for c in first_cols if "first" in c.lower()), None)
+                last_col = next(
+                    (c for c in last_hits.get(table_name, {}) if "last" in c.lower()),
+                    None,
+                )
+                if first_col and last_col:
+                    matches.setdefault(table_name, set()).update((first_col, last_col))
 
-    def _match_string_columns(
-        self,
-        df: pd.DataFrame,
-        entity_lower: str,
-        sample_size: int,
-        existing_cols: list[str],
-    ) -> list[str]:
-        matches: list[str] = []
-        for col in df.columns:
-            if col in existing_cols:
-                continue
-            try:
-                if df[col].dtype == "object":
-                    sample = self._get_sample(df, col, sample_size)
-                    contains_entity = (
-                        sample.astype(str)
-                        .str.lower()
-                        .str.contains(entity_lower, na=False)
-                    )
-                    if contains_entity.any():
-                        matches.append(col)
-            except (KeyError, AttributeError, TypeError):
-                continue
-        return matches
+        return {table_name: sorted(cols) for table_name, cols in matches.items()}
 
     def exec_fallback(self, prep_res, exc):
         """Handle failures during EntityResolver.exec by returning a safe default execution result.
@@ -364,6 +292,7 @@ class SearchExpander(Node):
             }
 
         Notes:
+            - Only tables the entity is already mapped to (by EntityResolver's value index, which covers every row) are loaded and scanned.
             - Sampling is performed via the class's _get_sample helper using the table's first name column when available.
             - String matching is case-insensitive and tolerant of missing columns or malformed data; index and type errors during scanning are ignored.
             - For each matched table, the method attempts to extract the first matching row's id value for any listed id_columns and records it in cross_references.
@@ -379,29 +308,20 @@ class SearchExpander(Node):
         cross_references: dict[str, dict[str, str]] = {}
 
         for entity in entities:
-            entity_lower = entity.lower()
-            parts = entity_lower.split()
-            for table_name, df in dfs.items():
+            # The value index already found every table mentioning the entity;
+            # only those are loaded and scanned for identifiers
+            for table_name in list(expanded_map.get(entity, {})):
+                try:
+                    df = dfs[table_name]
+                except KeyError:
+                    continue
                 table_profile = profile.get(table_name, {})
-                sampled_df = self._sample_table(df, table_profile, sample_size)
-                self._update_entity_mapping(
-                    expanded_map,
-                    entity,
-                    entity_lower,
-                    table_name,
-                    table_profile,
-                    sampled_df,
-                )
-                self._update_cross_references(
-                    cross_references,
-                    expanded_map,
-                    entity,
+                scan = _TableScan(
                     table_name,
                     table_profile,
-                    sampled_df,
-                    parts,
-                    entity_lower,
+                    self._sample_table(df, table_profile, sample_size),
                 )
+                self._update_cross_references(cross_references, entity, scan)
 
         return {
             "expanded_map": expanded_map,
@@ -419,67 +339,39 @@ class SearchExpander(Node):
         first_name_col = name_cols[0] if name_cols else ""
         return self._get_sample(df, first_name_col, sample_size)
 
-    def _update_entity_mapping(
-        self,
-        expanded_map: dict[str, dict[str, list[str]]],
-        entity: str,
-        entity_lower: str,
-        table_name: str,
-        table_profile: dict[str, Any],
-        sampled_df: pd.DataFrame,
-    ) -> None:
-        for col in table_profile.get("name_columns", []):
-            try:
-                matches = sampled_df[
-                    sampled_df[col]
-                    .astype(str)
-                    .str.lower()
-                    .str.contains(entity_lower, na=False)
-                ]
-                if not matches.empty and table_name not in expanded_map.get(entity, {}):
-                    expanded_map.setdefault(entity, {})[table_name] = [col]
-            except (KeyError, AttributeError, TypeError):
-                continue
-
     def _update_cross_references(
         self,
         cross_references: dict[str, dict[str, str]],
-        expanded_map: dict[str, dict[str, list[str]]],
         entity: str,
-        table_name: str,
-        table_profile: dict[str, Any],
-        sampled_df: pd.DataFrame,
-        parts: list[str],
-        entity_lower: str,
+        scan: _TableScan,
     ) -> None:
-        if table_name not in expanded_map.get(entity, {}):
-            return
-
-        name_cols = table_profile.get("name_columns", [])
+        name_cols = scan.profile.get("name_columns", [])
         if not name_cols:
             return
 
+        entity_lower = entity.lower()
+        parts = entity_lower.split()
         try:
             mask = (
-                sampled_df[name_cols[0]]
+                scan.sample[name_cols[0]]
                 .astype(str)
                 .str.lower()
                 .str.contains(parts[0] if parts else entity_lower, na=False)
             )
-            matches = sampled_df[mask]
+            matches = scan.sample[mask]
         except (KeyError, AttributeError, TypeError):
             return
 
         if matches.empty:
             return
 
-        for id_col in table_profile.get("id_columns", []):
+        for id_col in scan.profile.get("id_columns", []):
             try:
                 entity_id = str(matches.iloc[0].get(id_col, ""))
                 if entity_id and entity_id != "nan":
-                    cross_references.setdefault(entity, {})[
-                        f"{table_name}.{id_col}"
-                    ] = entity_id
+                    cross_references.setdefault(entity, {})[f"{scan.name}.{id_col}"] = (
+                        entity_id
+                    )
             except (IndexError, TypeError):
                 continue
 
@@ -1,33 +1,5 @@
 """Code safety and execution nodes.
 
-# TODO (Performance): Use thread pool instead of creating new threads
-# Current implementation creates a new thread for each code execution
-# (line 281-283). This has overhead for thread creation/destruction.
-# Recommended approach:
-#   from concurrent.futures import ThreadPoolExecutor
-#   _executor_pool = ThreadPoolExecutor(max_workers=4)
-#   future = _executor_pool.submit(target)
-#   result = future.result(timeout=timeout)
-# Benefits: Reduced overhead, better resource management, configurable pool size.
-
-# TODO (Performance): Consider process-based isolation for better security
-# Thread-based execution shares memory with the main process.
-# For stronger isolation, consider using multiprocessing:
-#   from multiprocessing import Process, Queue
-#   p = Process(target=target, args=(result_queue,))
-#   p.start()
-#   p.join(timeout=timeout)
-#   if p.is_alive():
-#       p.terminate()  # Can actually kill stuck processes
-# Trade-off: Higher overhead but true isolation and killable processes.
-
-# TODO (Security): Add resource limits (memory, CPU)
-# Current sandbox only limits execution time. Consider adding:
-#   - Memory limits: resource.setrlimit(resource.RLIMIT_AS, (max_mem, max_mem))
-#   - CPU time limits: resource.setrlimit(resource.RLIMIT_CPU, (max_cpu, max_cpu))
-#   - File descriptor limits: resource.setrlimit(resource.RLIMIT_NOFILE, ...)
-# Note: resource module only works on Unix; need Windows alternative.
-
 # TODO (Security): Enhance AST-based safety checks
 # Current checks are comprehensive but could be improved:
 #   1. Add detection for obfuscated attacks (e.g., getattr tricks)
@@ -46,25 +18,21 @@
 
 import ast
 import logging
-import queue
-import threading
-import time
 
-import pandas as pd
 from pocketflow import Node
 
 
 logger = logging.getLogger(__name__)
 
-from typing import Never
-
 from backend.config import API_EXECUTION_TIMEOUT, CSV_EXECUTION_TIMEOUT
-from backend.utils.nba_api_client import nba_client
+from backend.utils.sandbox import get_sandbox_pool
 
 
-def _blocked_global_call(*_args, **_kwargs) -> Never:
-    """Raise runtime error when globals() is called in sandbox."""
-    raise RuntimeError("globals() is not available in the sandbox")
+# Names bound for API snippets, resolved inside the sandbox worker
+API_SCOPE_IMPORTS = {
+    "nba_client": "backend.utils.nba_api_client:nba_client",
+    "time": "time",
+}
 
 
 class SafetyCheck(Node):
@@ -273,96 +241,25 @@ class Executor(Node):
 
     @staticmethod
     def _execute_code_with_timeout(code, dfs, extra_scope=None, timeout=None):
-        """Execute a user-provided code snippet in a restricted sandbox and return its result or an error.
+        """Execute a user-provided code snippet in a sandbox worker process and return its result or an error.
 
-        The function runs `code` inside a constrained execution environment where only a limited set of builtins and the provided scopes are available. The executed code must assign the final output to a variable named `final_result`; otherwise an error is returned. If execution exceeds `timeout` seconds, an error describing the timeout is returned.
+        The snippet runs in a warm worker from the sandbox pool (see ``backend.utils.sandbox``) with only a limited set of builtins, `pd`, `dfs` and the names in `extra_scope`. The executed code must assign the final output to a variable named `final_result`; otherwise an error is returned. If execution exceeds `timeout` seconds, the worker is killed and replaced and an error describing the timeout is returned.
 
         Parameters:
             code (str): Python source code to execute. Must set a variable `final_result` to produce a successful result.
             dfs (Any): Dataframes or dataset objects to expose to the executed code under the name `dfs`.
-            extra_scope (dict | None): Additional variables to inject into the execution scope (optional).
+            extra_scope (dict | None): Additional names to bind in the execution scope, as ``"module"`` or ``"module:attribute"`` import references (optional).
             timeout (float | None): Maximum number of seconds to allow code to run before aborting with a timeout error (optional).
 
         Returns:
-            tuple: A two-element tuple `(status, payload)` where `status` is `"success"` or `"error"`. For `"success"`, `payload` is the value of `final_result`. For `"error"`, `payload` is an error message describing why execution failed (syntax/runtime error, missing `final_result`, or timeout).
+            tuple: A two-element tuple `(status, payload)` where `status` is `"success"` or `"error"`. For `"success"`, `payload` is the value of `final_result`. For `"error"`, `payload` is an error message describing why execution failed (syntax/runtime error, missing `final_result`, timeout, or resource limit).
         """
-        result_queue: queue.Queue[tuple[str, object]] = queue.Queue()
-
-        def target() -> None:
-            """Execute the provided code string in a restricted sandbox and push a result tuple into `result_queue`.
-
-            Executes `code` with a local scope that includes `dfs`, `pd`, a limited set of safe builtins (with `globals()` blocked), and any mappings from `extra_scope`. On successful execution, if the executed code assigns a value to `final_result`, the function puts ("success", final_result) into `result_queue`. If `final_result` is missing or unchanged, it puts ("error", "Code did not define 'final_result' variable"). Any exception raised during execution is caught and put as ("error", str(exception)) into `result_queue`.
-            """
-            try:
-                final_result_sentinel = object()
-
-                safe_builtins = {
-                    "abs": abs,
-                    "all": all,
-                    "any": any,
-                    "dict": dict,
-                    "enumerate": enumerate,
-                    "float": float,
-                    "int": int,
-                    "len": len,
-                    "list": list,
-                    "locals": locals,
-                    "max": max,
-                    "min": min,
-                    "range": range,
-                    "round": round,
-                    "set": set,
-                    "sorted": sorted,
-                    "str": str,
-                    "sum": sum,
-                    "tuple": tuple,
-                    "zip": zip,
-                    "Exception": Exception,
-                    "NameError": NameError,
-                    "ValueError": ValueError,
-                    "KeyError": KeyError,
-                    "TypeError": TypeError,
-                    "RuntimeError": RuntimeError,
-                    "globals": _blocked_global_call,
-                }
-
-                local_scope = {
-                    "dfs": dfs,
-                    "pd": pd,
-                    "final_result": final_result_sentinel,
-                    "__builtins__": safe_builtins,
-                }
-                if extra_scope:
-                    local_scope.update(extra_scope)
-
-                exec(code, local_scope, local_scope)  # nosec B102  # noqa: S102
-
-                if (
-                    "final_result" not in local_scope
-                    or local_scope["final_result"] is final_result_sentinel
-                ):
-                    result_queue.put(
-                        ("error", "Code did not define 'final_result' variable"),
-                    )
-                else:
-                    result_queue.put(("success", local_scope["final_result"]))
-            except Exception as exc:
-                result_queue.put(("error", str(exc)))
-
-        thread = threading.Thread(target=target, daemon=True)
-        thread.start()
-        thread.join(timeout=timeout)
-
-        if thread.is_alive():
-            return (
-                "error",
-                f"Execution timed out after {timeout} seconds. The code may be stuck in an infinite loop or processing too much data.",
-            )
-
-        try:
-            return result_queue.get_nowait()
-        except queue.Empty:
-            return "error", "Execution failed without producing a result"
+        return get_sandbox_pool().run(
+            code,
+            dfs,
+            scope_imports=extra_scope,
+            timeout=timeout,
+        )
 
     def exec(self, prep_res):
         """Execute prepared CSV and API code snippets with sandboxing and timeouts, returning their execution statuses.
@@ -390,11 +287,10 @@ class Executor(Node):
                 timeout=CSV_EXECUTION_TIMEOUT,
             )
         if api_code:
-            api_scope = {"nba_client": nba_client, "time": time}
             api_status = self._execute_code_with_timeout(
                 api_code,
                 dfs,
-                extra_scope=api_scope,
+                extra_scope=API_SCOPE_IMPORTS,
                 timeout=API_EXECUTION_TIMEOUT,
             )
         return {"csv": csv_status, "api": api_status}
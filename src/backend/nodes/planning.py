@@ -14,7 +14,8 @@ import yaml  # type: ignore[import-untyped]
 from pocketflow import Node
 
 from src.backend.models import QueryComplexity, QueryPlan, SubQuery
-from src.backend.utils.call_llm import call_llm
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.utils.call_llm import call_llm, call_llm_async
 from src.backend.utils.logger import get_logger
 
 
@@ -174,3 +175,14 @@ class QueryPlanner(Node):
             sub_queries=[],
             combination_strategy=self._infer_strategy(query, complexity),
         )
+
+
+class AsyncQueryPlanner(AsyncNodeAdapter, QueryPlanner):
+    """QueryPlanner that awaits the LLM instead of blocking."""
+
+    async def exec_async(self, prep_res: dict[str, Any]) -> dict[str, Any]:
+        """Analyze query complexity using the async LLM client."""
+        rewritten_query = prep_res["rewritten_query"]
+        prompt = PLANNER_PROMPT.format(rewritten_query=rewritten_query)
+        response = await call_llm_async(prompt)
+        return self._parse_plan(response, rewritten_query)
@@ -14,7 +14,8 @@ import yaml  # type: ignore[import-untyped]
 from pocketflow import Node
 
 from src.backend.models import QueryIntent
-from src.backend.utils.call_llm import call_llm
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.utils.call_llm import call_llm, call_llm_async
 from src.backend.utils.input_sanitizer import sanitize_user_question
 from src.backend.utils.logger import get_logger
 from src.backend.utils.memory import get_memory
@@ -108,17 +109,7 @@ class ClarifyQuery(Node):
         Returns:
             Dictionary with intent, reasoning, and clarification_questions.
         """
-        question = prep_res["question"]
-        conversation_history = prep_res["conversation_history"]
-
-        history_text = self._format_conversation_history(conversation_history)
-
-        prompt = CLARIFY_QUERY_PROMPT.format(
-            question=question,
-            conversation_history=history_text or "No previous conversation.",
-        )
-
-        response = call_llm(prompt)
+        response = call_llm(self._build_prompt(prep_res))
         return self._parse_response(response)
 
     def post(
@@ -170,6 +161,23 @@ class ClarifyQuery(Node):
         logger.info("Query is clear: %s", exec_res.get("reasoning", ""))
         return "clear"
 
+    def _build_prompt(self, prep_res: dict[str, Any]) -> str:
+        """Build the clarity-check prompt.
+
+        Args:
+            prep_res: Dictionary with question and history.
+
+        Returns:
+            Prompt text.
+        """
+        history_text = self._format_conversation_history(
+            prep_res["conversation_history"]
+        )
+        return CLARIFY_QUERY_PROMPT.format(
+            question=prep_res["question"],
+            conversation_history=history_text or "No previous conversation.",
+        )
+
     def _format_conversation_history(self, history: list[Any]) -> str:
         """Format conversation history for the prompt.
 
@@ -317,6 +325,7 @@ class AskUser(Node):
             shared.pop("grader_feedback", None)
             shared.pop("sql_query", None)
             shared.pop("query_result", None)
+            shared.pop("query_result_summary", None)
             shared.pop("generation_attempts", None)
             shared.pop("query_plan", None)
             shared.pop("sub_query_results", None)
@@ -334,3 +343,16 @@ class AskUser(Node):
 
         logger.info("Exiting AskUser: %s", shared.get("final_text", ""))
         return "default"
+
+
+class AsyncClarifyQuery(AsyncNodeAdapter, ClarifyQuery):
+    """ClarifyQuery that awaits the LLM instead of blocking."""
+
+    async def exec_async(self, prep_res: dict[str, Any]) -> dict[str, Any]:
+        """Analyze query clarity using the async LLM client."""
+        response = await call_llm_async(self._build_prompt(prep_res))
+        return self._parse_response(response)
+
+
+class AsyncAskUser(AsyncNodeAdapter, AskUser):
+    """AskUser whose prompt runs in a worker thread."""
@@ -1,7 +1,10 @@
 """QueryRewriter node for the NBA Data Analyst Agent.
 
 This module normalizes queries and resolves conversational references,
-as specified in design.md Section 6.2.
+as specified in design.md Section 6.2. Player and team names are resolved
+through the DuckDB name search (``utils.entity_search``); questions without
+conversation history and without abbreviations to expand are rewritten from
+those matches alone, without an LLM call.
 """
 
 from __future__ import annotations
@@ -13,14 +16,39 @@ from typing import Any
 import yaml  # type: ignore[import-untyped]
 from pocketflow import Node
 
+from src.backend.config import get_config
 from src.backend.models import ResolvedReferences
-from src.backend.utils.call_llm import call_llm
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.utils.call_llm import call_llm, call_llm_async
+from src.backend.utils.entity_search import search_available, search_entities
 from src.backend.utils.logger import get_logger
 from src.backend.utils.memory import get_memory
 
 
 logger = logging.getLogger(__name__)
 
+# Runs of capitalized words or all-caps abbreviations ("LeBron James", "LAL")
+_NAME_SPAN_RE = re.compile(r"\b[A-Z][\w'.-]*(?:\s+[A-Z][\w'.-]*){0,3}")
+_NON_NAME_WORDS = frozenset(
+    {
+        "how", "what", "who", "which", "when", "where", "why", "did", "does",
+        "do", "is", "are", "was", "were", "show", "list", "compare", "give",
+        "find", "get", "tell", "the", "in", "for", "of", "and", "vs", "top",
+        "most", "nba",
+    }
+)  # fmt: skip
+# Minimum trigram similarity for a name match to be applied
+NAME_MATCH_SCORE = 0.6
+# Stat shorthand the LLM expands ("FG%" -> "field goal percentage")
+_WORD_RE = re.compile(r"[\w%+/-]+")
+_STAT_SHORTHAND = frozenset(
+    {
+        "pts", "ppg", "reb", "rpg", "ast", "apg", "stl", "blk", "tov", "fg",
+        "fga", "fgm", "fta", "ftm", "3p", "3pt", "3pa", "3pm", "efg", "ts",
+        "mpg", "pf", "+/-",
+    }
+)  # fmt: skip
+
 
 QUERY_REWRITER_PROMPT = """You are rewriting a user's NBA question to be self-contained and suitable for SQL generation.
 
@@ -50,6 +78,14 @@ If no changes are needed, return the original question as rewritten_query.
 """
 
 
+def name_search_enabled() -> bool:
+    """Whether names are resolved through the DuckDB name search."""
+    try:
+        return get_config().flow.name_search
+    except Exception:
+        return False
+
+
 class QueryRewriter(Node):
     """Normalize queries and resolve conversational references.
 
@@ -79,10 +115,13 @@ class QueryRewriter(Node):
             {"question": question, "history_turns": len(conversation_history)},
         )
 
+        search_ready = name_search_enabled() and search_available()
         return {
             "question": question,
             "conversation_history": conversation_history,
             "user_id": user_id,
+            "search_ready": search_ready,
+            "names": self._resolve_names(question) if search_ready else {},
         }
 
     def exec(self, prep_res: dict[str, Any]) -> dict[str, Any]:
@@ -94,47 +133,11 @@ class QueryRewriter(Node):
         Returns:
             Dictionary with rewritten_query and resolved_references.
         """
-        question = prep_res["question"]
-        conversation_history = prep_res["conversation_history"]
-
-        user_id = prep_res.get("user_id")
-        memory = get_memory(user_id)
-        rule_based_resolution = memory.extract_references(question)
-
-        history_text = self._format_conversation_history(conversation_history)
-        resolution_hints = self._format_resolution_hints(rule_based_resolution)
-
-        prompt = QUERY_REWRITER_PROMPT.format(
-            question=question,
-            conversation_history=history_text or "No previous conversation.",
-            resolution_hints=resolution_hints or "No hints available.",
-        )
-
+        if self._is_standalone(prep_res):
+            return self._rewrite_locally(prep_res)
+        prompt, rule_based_resolution = self._build_prompt(prep_res)
         response = call_llm(prompt)
-        result = self._parse_response(response, question)
-
-        final_query = result.get("rewritten_query", question)
-        resolved_entities = result.get("resolved_entities", {})
-
-        if rule_based_resolution.resolved_entities:
-            for ref, resolved in rule_based_resolution.resolved_entities.items():
-                if ref not in resolved_entities:
-                    resolved_entities[ref] = resolved
-        resolved_entities = {
-            str(ref): str(value)
-            for ref, value in resolved_entities.items()
-            if value is not None
-        }
-
-        return {
-            "rewritten_query": final_query,
-            "resolved_references": ResolvedReferences(
-                original_query=question,
-                expanded_query=final_query,
-                resolved_entities=resolved_entities,
-            ),
-            "reasoning": result.get("reasoning", ""),
-        }
+        return self._build_result(prep_res, response, rule_based_resolution)
 
     def post(
         self,
@@ -175,6 +178,164 @@ class QueryRewriter(Node):
 
         return "default"
 
+    def _resolve_names(self, question: str) -> dict[str, str]:
+        """Resolve player and team names in the question via name search.
+
+        Args:
+            question: The user question.
+
+        Returns:
+            Mapping of each confidently matched span to the canonical name.
+            Spans whose best match is tied with another entity are skipped.
+        """
+        names: dict[str, str] = {}
+        for found in _NAME_SPAN_RE.finditer(question):
+            words = found.group(0).split()
+            while words and words[0].lower() in _NON_NAME_WORDS:
+                words.pop(0)
+            span = " ".join(words)
+            if not span or span in names:
+                continue
+            matches = search_entities(span, k=2)
+            if not matches or matches[0].score < NAME_MATCH_SCORE:
+                continue
+            if len(matches) > 1 and matches[1].score >= matches[0].score:
+                continue
+            names[span] = matches[0].name
+        return names
+
+    def _is_standalone(self, prep_res: dict[str, Any]) -> bool:
+        """Whether the question can be rewritten without the LLM.
+
+        Without conversation history there are no references to resolve, so
+        name search covers the rewrite, provided the search tables exist and
+        no abbreviation is left for the LLM to expand.
+        """
+        return (
+            prep_res.get("search_ready", False)
+            and not prep_res["conversation_history"]
+            and not self._needs_expansion(prep_res["question"], prep_res["names"])
+        )
+
+    @staticmethod
+    def _needs_expansion(question: str, names: dict[str, str]) -> bool:
+        """Whether the question holds abbreviations name search does not cover.
+
+        Args:
+            question: The user question.
+            names: Spans already resolved by name search.
+
+        Returns:
+            True for stat shorthand, percentages or all-caps tokens outside
+            the resolved name spans.
+        """
+        for span in names:
+            question = question.replace(span, " ")
+        for word in _WORD_RE.findall(question):
+            lowered = word.lower()
+            if "%" in word or lowered in _STAT_SHORTHAND:
+                return True
+            if len(word) > 1 and word.isupper() and lowered not in _NON_NAME_WORDS:
+                return True
+        return False
+
+    def _rewrite_locally(self, prep_res: dict[str, Any]) -> dict[str, Any]:
+        """Rewrite a standalone question by canonicalizing matched names.
+
+        Args:
+            prep_res: Dictionary with question and resolved names.
+
+        Returns:
+            Dictionary with rewritten_query and resolved_references.
+        """
+        question = prep_res["question"]
+        rewritten = question
+        resolved_entities: dict[str, str] = {}
+        for span, name in prep_res["names"].items():
+            if span.lower() == name.lower():
+                continue
+            rewritten = re.sub(rf"\b{re.escape(span)}\b", name, rewritten)
+            resolved_entities[span] = name
+
+        return {
+            "rewritten_query": rewritten,
+            "resolved_references": ResolvedReferences(
+                original_query=question,
+                expanded_query=rewritten,
+                resolved_entities=resolved_entities,
+            ),
+            "reasoning": "Resolved names via name search",
+        }
+
+    def _build_prompt(self, prep_res: dict[str, Any]) -> tuple[str, ResolvedReferences]:
+        """Build the rewrite prompt with rule-based resolution hints.
+
+        Args:
+            prep_res: Dictionary with question and conversation_history.
+
+        Returns:
+            Tuple of (prompt text, rule-based reference resolution).
+        """
+        question = prep_res["question"]
+        memory = get_memory(prep_res.get("user_id"))
+        rule_based_resolution = memory.extract_references(question)
+
+        history_text = self._format_conversation_history(
+            prep_res["conversation_history"]
+        )
+        resolution_hints = self._format_resolution_hints(
+            rule_based_resolution, prep_res.get("names", {})
+        )
+
+        prompt = QUERY_REWRITER_PROMPT.format(
+            question=question,
+            conversation_history=history_text or "No previous conversation.",
+            resolution_hints=resolution_hints or "No hints available.",
+        )
+        return prompt, rule_based_resolution
+
+    def _build_result(
+        self,
+        prep_res: dict[str, Any],
+        response: str,
+        rule_based_resolution: ResolvedReferences,
+    ) -> dict[str, Any]:
+        """Merge the LLM rewrite with rule-based resolutions.
+
+        Args:
+            prep_res: Dictionary with question and conversation_history.
+            response: Raw LLM response.
+            rule_based_resolution: References resolved from memory.
+
+        Returns:
+            Dictionary with rewritten_query and resolved_references.
+        """
+        question = prep_res["question"]
+        result = self._parse_response(response, question)
+
+        final_query = result.get("rewritten_query", question)
+        resolved_entities = result.get("resolved_entities", {})
+
+        if rule_based_resolution.resolved_entities:
+            for ref, resolved in rule_based_resolution.resolved_entities.items():
+                if ref not in resolved_entities:
+                    resolved_entities[ref] = resolved
+        resolved_entities = {
+            str(ref): str(value)
+            for ref, value in resolved_entities.items()
+            if value is not None
+        }
+
+        return {
+            "rewritten_query": final_query,
+            "resolved_references": ResolvedReferences(
+                original_query=question,
+                expanded_query=final_query,
+                resolved_entities=resolved_entities,
+            ),
+            "reasoning": result.get("reasoning", ""),
+        }
+
     def _format_conversation_history(self, history: list[Any]) -> str:
         """Format conversation history for the prompt.
 
@@ -198,21 +359,29 @@ class QueryRewriter(Node):
 
         return "\n".join(lines)
 
-    def _format_resolution_hints(self, resolved: ResolvedReferences) -> str:
+    def _format_resolution_hints(
+        self,
+        resolved: ResolvedReferences,
+        names: dict[str, str] | None = None,
+    ) -> str:
         """Format rule-based resolution hints for the prompt.
 
         Args:
             resolved: ResolvedReferences from memory utility.
+            names: Names matched by name search, span to canonical name.
 
         Returns:
             Formatted hints string.
         """
-        if not resolved.resolved_entities:
-            return ""
-
-        lines = ["Detected references that may need resolution:"]
-        for ref, value in resolved.resolved_entities.items():
-            lines.append(f"  - '{ref}' might refer to '{value}'")
+        lines = []
+        if resolved.resolved_entities:
+            lines.append("Detected references that may need resolution:")
+            for ref, value in resolved.resolved_entities.items():
+                lines.append(f"  - '{ref}' might refer to '{value}'")
+        if names:
+            lines.append("Names matched in the database:")
+            for span, name in names.items():
+                lines.append(f"  - '{span}' is '{name}'")
 
         return "\n".join(lines)
 
@@ -246,3 +415,15 @@ class QueryRewriter(Node):
         except yaml.YAMLError as e:
             logger.warning("Failed to parse YAML response: %s", e)
             return {"rewritten_query": fallback_query, "resolved_entities": {}}
+
+
+class AsyncQueryRewriter(AsyncNodeAdapter, QueryRewriter):
+    """QueryRewriter that awaits the LLM instead of blocking."""
+
+    async def exec_async(self, prep_res: dict[str, Any]) -> dict[str, Any]:
+        """Rewrite the query using the async LLM client."""
+        if self._is_standalone(prep_res):
+            return self._rewrite_locally(prep_res)
+        prompt, rule_based_resolution = self._build_prompt(prep_res)
+        response = await call_llm_async(prompt)
+        return self._build_result(prep_res, response, rule_based_resolution)
@@ -6,6 +6,7 @@ as specified in design.md Section 6.8.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import Any
@@ -14,8 +15,12 @@ import yaml  # type: ignore[import-untyped]
 from pocketflow import Node
 
 from src.backend.models import GraderFeedback, GradeStatus
-from src.backend.utils.call_llm import call_llm
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.nodes.template_matcher import templates_enabled
+from src.backend.utils.call_llm import call_llm, call_llm_async
 from src.backend.utils.logger import get_logger
+from src.backend.utils.query_preview import format_result_summary
+from src.backend.utils.sql_templates import get_template_store
 
 
 logger = logging.getLogger(__name__)
@@ -93,9 +98,12 @@ class ResponseGrader(Node):
             "sql_query": shared.get("sql_query", ""),
             "sub_query_sqls": shared.get("sub_query_sqls", {}),
             "query_result": shared.get("query_result"),
+            "query_result_summary": shared.get("query_result_summary"),
             "final_answer": shared.get("final_answer", ""),
             "query_plan": shared.get("query_plan"),
             "grader_retries": shared.get("grader_retries", 0),
+            "template_id": shared.get("template_id"),
+            "selected_tables": shared.get("selected_tables", []),
         }
 
     def exec(self, prep_res: dict[str, Any]) -> GraderFeedback:
@@ -107,27 +115,33 @@ class ResponseGrader(Node):
         Returns:
             GraderFeedback with status, issues, and suggestions.
         """
-        question = prep_res["question"]
-        rewritten_query = prep_res["rewritten_query"]
-        sql_query = prep_res["sql_query"]
-        sub_query_sqls = prep_res["sub_query_sqls"]
-        query_result = prep_res["query_result"]
-        final_answer = prep_res["final_answer"]
-
-        result_str = self._format_query_result(query_result)
-        sql_block = self._format_sql_block(sql_query, sub_query_sqls)
-
-        prompt = GRADER_PROMPT.format(
-            question=question,
-            rewritten_query=rewritten_query,
+        response = call_llm(self._build_prompt(prep_res))
+        return self._parse_grader_response(response)
+
+    def _build_prompt(self, prep_res: dict[str, Any]) -> str:
+        """Build the grading prompt.
+
+        Args:
+            prep_res: Dictionary with all grading inputs.
+
+        Returns:
+            Prompt text.
+        """
+        result_str = self._format_query_result(
+            prep_res["query_result"], prep_res.get("query_result_summary")
+        )
+        sql_block = self._format_sql_block(
+            prep_res["sql_query"], prep_res["sub_query_sqls"]
+        )
+
+        return GRADER_PROMPT.format(
+            question=prep_res["question"],
+            rewritten_query=prep_res["rewritten_query"],
             sql_query=sql_block,
             query_result=result_str,
-            final_answer=final_answer,
+            final_answer=prep_res["final_answer"],
         )
 
-        response = call_llm(prompt)
-        return self._parse_grader_response(response)
-
     def post(
         self,
         shared: dict[str, Any],
@@ -142,7 +156,8 @@ class ResponseGrader(Node):
             exec_res: GraderFeedback from exec().
 
         Returns:
-            Action string: "pass", "fail", or "pass_with_warning".
+            Action string: "pass", "fail", "fail_complex", "fail_template",
+            or "pass_with_warning".
         """
         shared["grader_feedback"] = exec_res
 
@@ -161,8 +176,17 @@ class ResponseGrader(Node):
                 "Response passed quality check (confidence: %.2f)",
                 exec_res.confidence,
             )
+            self._learn_template(prep_res)
             return "pass"
 
+        if shared.pop("template_id", None) is not None:
+            logger.warning(
+                "Templated answer failed quality check, using full path. Issues: %s",
+                exec_res.issues,
+            )
+            self._forget_template(prep_res["template_id"])
+            return "fail_template"
+
         grader_retries = prep_res.get("grader_retries", 0) + 1
         shared["grader_retries"] = grader_retries
 
@@ -182,11 +206,39 @@ class ResponseGrader(Node):
         )
         return "pass_with_warning"
 
-    def _format_query_result(self, result: Any) -> str:
+    def _learn_template(self, prep_res: dict[str, Any]) -> None:
+        """Record a passing single-query answer as a reusable SQL template."""
+        if not templates_enabled() or prep_res["sub_query_sqls"]:
+            return
+        if self._get_complexity(prep_res.get("query_plan")) == "complex":
+            return
+        try:
+            if prep_res["template_id"]:
+                get_template_store().mark_hit(prep_res["template_id"])
+            elif prep_res["sql_query"]:
+                get_template_store().record(
+                    prep_res["rewritten_query"] or prep_res["question"],
+                    prep_res["sql_query"],
+                    prep_res["selected_tables"],
+                )
+        except Exception as e:
+            logger.warning("Failed to record SQL template: %s", e)
+
+    def _forget_template(self, template_id: str) -> None:
+        """Drop a template whose answer failed grading."""
+        try:
+            get_template_store().discard(template_id)
+        except Exception as e:
+            logger.warning("Failed to discard SQL template: %s", e)
+
+    def _format_query_result(
+        self, result: Any, summary: dict[str, Any] | None = None
+    ) -> str:
         """Format query result for the prompt.
 
         Args:
             result: DataFrame or None.
+            summary: Full-result statistics when only a preview was loaded.
 
         Returns:
             Formatted string representation.
@@ -201,12 +253,17 @@ class ResponseGrader(Node):
                 if result.empty:
                     return "Empty result set"
 
-                if len(result) > 20:
+                total_rows = len(result)
+                if summary and summary.get("total_rows") is not None:
+                    total_rows = summary["total_rows"]
+                if total_rows > 20:
                     result_str = str(result.head(20).to_string())
-                    result_str += f"\n... ({len(result) - 20} more rows)"
+                    result_str += f"\n... ({total_rows - 20} more rows)"
                 else:
                     result_str = str(result.to_string())
 
+                if summary_text := format_result_summary(summary):
+                    result_str += f"\n\n{summary_text}"
                 return result_str
 
         except Exception as e:
@@ -291,3 +348,13 @@ class ResponseGrader(Node):
             issues=[],
             suggestions=[],
         )
+
+
+class AsyncResponseGrader(AsyncNodeAdapter, ResponseGrader):
+    """ResponseGrader that awaits the LLM instead of blocking."""
+
+    async def exec_async(self, prep_res: dict[str, Any]) -> GraderFeedback:
+        """Evaluate the response quality asynchronously."""
+        prompt = await asyncio.to_thread(self._build_prompt, prep_res)
+        response = await call_llm_async(prompt)
+        return self._parse_grader_response(response)
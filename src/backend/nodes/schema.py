@@ -1,6 +1,8 @@
 """Schema analysis and data profiling nodes."""
 
+import contextlib
 import logging
+from typing import Any
 
 import pandas as pd
 from pocketflow import Node
@@ -8,6 +10,9 @@ from pocketflow import Node
 
 logger = logging.getLogger(__name__)
 
+from backend.utils.csv_catalog import LazyFrames
+from backend.utils.data_source_manager import MergedFrames
+
 
 class SchemaInference(Node):
     """Infer schema details from loaded DataFrames and expose summaries."""
@@ -34,8 +39,19 @@ class SchemaInference(Node):
         """
         dfs = prep_res
         schemas = {}
-        csv_schema = {}
-        api_schema = {}
+        csv_schema: dict[str, list[str]] = {}
+        api_schema: dict[str, list[str]] = {}
+
+        if isinstance(dfs, LazyFrames):
+            # CSV tables are described from their headers, so no rows are loaded
+            schemas = self._header_schemas(dfs)
+            if not isinstance(dfs, MergedFrames):
+                # Unmerged CSV tables carry no _source column
+                return schemas, csv_schema, api_schema
+            csv_schema = {
+                name: cols for name, cols in schemas.items() if name not in dfs.tables
+            }
+            dfs = dfs.tables
 
         for name, df in dfs.items():
             schemas[name] = list(df.columns)
@@ -49,6 +65,15 @@ class SchemaInference(Node):
                 csv_schema[name] = list(df.columns)
         return schemas, csv_schema, api_schema
 
+    @staticmethod
+    def _header_schemas(dfs: LazyFrames) -> dict[str, list[str]]:
+        """Column lists of lazily loaded tables, read from headers only."""
+        schemas = {}
+        for name in list(dfs):
+            with contextlib.suppress(KeyError):
+                schemas[name] = dfs.columns(name)
+        return schemas
+
     def post(self, shared, prep_res, exec_res) -> str:
         """Store inferred schema information in the shared state and produce human-readable schema strings.
 
@@ -92,24 +117,30 @@ class DataProfiler(Node):
     """Analyze data quality, column types, and identify key columns for each table."""
 
     def prep(self, shared):
-        """Provide the pipeline's loaded DataFrame mapping from the shared context.
+        """Provide the pipeline's DataFrame mapping and the tables to profile in full.
 
         Returns:
-            dict: Mapping from table name (str) to pandas.DataFrame stored under shared["dfs"].
+            dict: A mapping with keys:
+                - "dfs": mapping from table name (str) to pandas.DataFrame stored under shared["dfs"].
+                - "tables": names from shared["profile_tables"], or None to profile every table already in memory.
         """
-        return shared["dfs"]
+        return {"dfs": shared["dfs"], "tables": shared.get("profile_tables")}
 
     def exec(self, prep_res):
-        """Builds a profiling summary for each DataFrame in the provided mapping.
+        """Builds a profiling summary for each table in the provided mapping.
+
+        Tables that are asked about (or, by default, tables already in memory) are
+        profiled from their data; lazily loaded CSV tables are otherwise profiled
+        from their headers, so no rows are read and the statistics stay empty.
 
         Parameters:
-            prep_res (dict): Mapping from table name (str) to pandas DataFrame to be profiled.
+            prep_res (dict): Mapping with "dfs" (table name to DataFrame) and "tables" (names to profile in full, or None).
 
         Returns:
             dict: A mapping from table name to a profile dictionary with the following keys:
-                - row_count (int): Number of rows in the table.
+                - row_count (int | None): Number of rows in the table; None for header-only profiles.
                 - column_count (int): Number of columns in the table.
-                - columns (dict): Per-column metadata mapping column name to a dict with:
+                - columns (dict): Per-column metadata mapping column name to a dict with (empty for header-only profiles):
                     - dtype (str): Column dtype as a string.
                     - null_count (int): Number of null values in the column.
                     - unique_count (int): Number of unique values in the column.
@@ -118,58 +149,70 @@ class DataProfiler(Node):
                 - numeric_columns / numeric_cols (list[str]): Columns with numeric dtype.
                 - date_columns / date_cols (list[str]): Columns whose names suggest date or year fields.
         """
-        dfs = prep_res
-        profile: dict[str, dict] = {}
-        for table_name, df in dfs.items():
-            columns_info: dict[str, dict] = {}
-            name_columns: list[str] = []
-            name_cols: list[str] = []
-            id_columns: list[str] = []
-            id_cols: list[str] = []
-            numeric_columns: list[str] = []
-            numeric_cols: list[str] = []
-            date_columns: list[str] = []
-            date_cols: list[str] = []
-
-            for col in df.columns:
-                col_lower = col.lower()
-                col_info = {
-                    "dtype": str(df[col].dtype),
-                    "null_count": int(df[col].isna().sum()),
-                    "unique_count": int(df[col].nunique()),
-                }
-
-                if "name" in col_lower or "first" in col_lower or "last" in col_lower:
-                    name_columns.append(col)
-                    name_cols.append(col)
-                if "id" in col_lower:
-                    id_columns.append(col)
-                    id_cols.append(col)
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    numeric_columns.append(col)
-                    numeric_cols.append(col)
-                if "date" in col_lower or "year" in col_lower:
-                    date_columns.append(col)
-                    date_cols.append(col)
-
-                columns_info[col] = col_info
-
-            profile[table_name] = {
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "columns": columns_info,
-                "name_columns": name_columns,
-                "name_cols": name_cols,
-                "id_columns": id_columns,
-                "id_cols": id_cols,
-                "numeric_columns": numeric_columns,
-                "numeric_cols": numeric_cols,
-                "date_columns": date_columns,
-                "date_cols": date_cols,
-            }
+        dfs = prep_res["dfs"]
+        tables = prep_res["tables"]
+        if tables is None:
+            if isinstance(dfs, MergedFrames):
+                tables = list(dfs.tables)
+            elif isinstance(dfs, LazyFrames):
+                tables = []
+            else:
+                tables = list(dfs)
 
+        profile: dict[str, dict] = {}
+        for table_name in list(dfs):
+            with contextlib.suppress(KeyError):
+                if table_name in tables:
+                    profile[table_name] = self._profile_frame(dfs[table_name])
+                elif isinstance(dfs, LazyFrames):
+                    profile[table_name] = self._profile_header(dfs.columns(table_name))
+                else:
+                    profile[table_name] = self._profile_header(
+                        list(dfs[table_name].columns)
+                    )
         return profile
 
+    @staticmethod
+    def _profile_header(columns: list[str]) -> dict[str, Any]:
+        """Profile a table from its column names alone, leaving statistics empty."""
+        name_columns = [
+            col
+            for col in columns
+            if "name" in col.lower() or "first" in col.lower() or "last" in col.lower()
+        ]
+        id_columns = [col for col in columns if "id" in col.lower()]
+        date_columns = [
+            col for col in columns if "date" in col.lower() or "year" in col.lower()
+        ]
+        return {
+            "row_count": None,
+            "column_count": len(columns),
+            "columns": {col: {} for col in columns},
+            "name_columns": name_columns,
+            "name_cols": list(name_columns),
+            "id_columns": id_columns,
+            "id_cols": list(id_columns),
+            "numeric_columns": [],
+            "numeric_cols": [],
+            "date_columns": date_columns,
+            "date_cols": list(date_columns),
+        }
+
+    def _profile_frame(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Profile a table from its data: row count, per-column statistics and numeric columns."""
+        table = self._profile_header(list(df.columns))
+        table["row_count"] = len(df)
+        for col in df.columns:
+            table["columns"][col] = {
+                "dtype": str(df[col].dtype),
+                "null_count": int(df[col].isna().sum()),
+                "unique_count": int(df[col].nunique()),
+            }
+            if pd.api.types.is_numeric_dtype(df[col]):
+                table["numeric_columns"].append(col)
+                table["numeric_cols"].append(col)
+        return table
+
     def post(self, shared, prep_res, exec_res) -> str:
         """Store the profiling results in the shared state and print a brief summary.
 
@@ -1,7 +1,8 @@
 """SQLExecutor node for the NBA Data Analyst Agent.
 
 This module executes SQL safely with resilience,
-as specified in design.md Section 6.6.
+as specified in design.md Section 6.6. Only a capped preview of each result
+is loaded; statistics for the full result are computed in DuckDB.
 """
 
 from __future__ import annotations
@@ -11,18 +12,31 @@ from typing import Any
 
 from pocketflow import Node
 
+from src.backend.config import get_config
+from src.backend.nodes.async_base import AsyncNodeAdapter
 from src.backend.utils.duckdb_client import get_duckdb_client
 from src.backend.utils.logger import get_logger
+from src.backend.utils.query_preview import DEFAULT_PREVIEW_BYTES, DEFAULT_PREVIEW_ROWS
 
 
 logger = logging.getLogger(__name__)
 
 
+def _preview_limits() -> tuple[int, int]:
+    """Row and byte caps for result previews."""
+    try:
+        db_config = get_config().database
+    except Exception:
+        return DEFAULT_PREVIEW_ROWS, DEFAULT_PREVIEW_BYTES
+    return db_config.preview_rows, db_config.preview_max_mb * 1024 * 1024
+
+
 class SQLExecutor(Node):
     """Execute SQL safely with resilience.
 
     This node:
-    - Executes SQL via duckdb_client.execute_query()
+    - Executes SQL via duckdb_client.execute_preview()
+    - Loads at most ``database.preview_rows`` rows into pandas
     - Circuit breaker handles repeated failures
     - Timeout prevents runaway queries
     """
@@ -36,9 +50,12 @@ class SQLExecutor(Node):
         Returns:
             SQL query string.
         """
-        sql_query = shared.get("sql_query")
-        sql_query_str = str(sql_query) if sql_query is not None else ""
         sub_query_id = self.params.get("sub_query_id")
+        if sub_query_id:
+            sql_query = shared.get("sub_query_sqls", {}).get(sub_query_id)
+        else:
+            sql_query = shared.get("sql_query")
+        sql_query_str = str(sql_query) if sql_query is not None else ""
 
         get_logger().log_node_start(
             "SQLExecutor",
@@ -54,7 +71,8 @@ class SQLExecutor(Node):
             prep_res: SQL query to execute.
 
         Returns:
-            Dictionary with either 'result' (DataFrame) or 'error'.
+            Dictionary with either 'result' (preview DataFrame) and 'summary'
+            (full-result statistics), or 'error'.
         """
         sql = prep_res
         if not sql:
@@ -66,13 +84,20 @@ class SQLExecutor(Node):
 
         db_client = get_duckdb_client()
 
+        max_rows, max_bytes = _preview_limits()
+
         try:
-            result = db_client.execute_query(sql)
+            preview = db_client.execute_preview(
+                sql, max_rows=max_rows, max_bytes=max_bytes
+            )
+            result = preview.to_pandas()
+            row_count = preview.total_rows
             return {
                 "success": True,
                 "result": result,
+                "summary": preview.summary(),
                 "error": None,
-                "row_count": len(result) if result is not None else 0,
+                "row_count": len(result) if row_count is None else row_count,
             }
 
         except TimeoutError as e:
@@ -110,7 +135,8 @@ class SQLExecutor(Node):
             exec_res: Execution result from exec().
 
         Returns:
-            Action string: "success" or "error".
+            Action string: "success", "error", or "template_error" when SQL
+            filled from a template fails and the full path should take over.
         """
         sub_query_id = self.params.get("sub_query_id")
 
@@ -123,6 +149,7 @@ class SQLExecutor(Node):
                 sub_errors.pop(sub_query_id, None)
             else:
                 shared["query_result"] = exec_res["result"]
+                shared["query_result_summary"] = exec_res.get("summary")
                 shared["execution_error"] = None
 
             get_logger().log_node_end(
@@ -137,6 +164,16 @@ class SQLExecutor(Node):
             )
             return "success"
 
+        if not sub_query_id and shared.pop("template_id", None) is not None:
+            get_logger().log_node_end(
+                "SQLExecutor", {"error": exec_res["error"]}, "template_error"
+            )
+            logger.warning(
+                "Templated SQL failed, falling back to generation: %s",
+                exec_res["error"],
+            )
+            return "template_error"
+
         if sub_query_id:
             shared.setdefault("sub_query_errors", {})[sub_query_id] = exec_res["error"]
         else:
@@ -209,3 +246,7 @@ class SQLExecutorWithRetry(SQLExecutor):
             max_retries: Maximum retry attempts.
         """
         super().__init__(max_retries=max_retries)
+
+
+class AsyncSQLExecutor(AsyncNodeAdapter, SQLExecutor):
+    """SQLExecutor that runs the query in a worker thread."""
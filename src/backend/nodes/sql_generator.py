@@ -6,17 +6,31 @@ as specified in design.md Section 6.5.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
 
 import yaml  # type: ignore[import-untyped]
 from pocketflow import Node
 
+from src.backend.config import get_config
 from src.backend.models import SQLGenerationAttempt, ValidationResult
-from src.backend.utils.call_llm import call_llm
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.utils.call_llm import call_llm, call_llm_async
+from src.backend.utils.db_catalog import DatabaseCatalog
 from src.backend.utils.duckdb_client import get_duckdb_client
 from src.backend.utils.logger import get_logger
+from src.backend.utils.sql_validator import (
+    SQLValidator,
+    validator_for_catalog,
+    validator_for_ddl,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 logger = logging.getLogger(__name__)
@@ -54,6 +68,34 @@ sql: |
 """
 
 
+# Appended to the prompt of each speculative candidate so they differ
+CANDIDATE_HINTS = (
+    "",
+    "Approach: answer from a pre-aggregated analytics table if one fits.",
+    "Approach: build the answer from `_gold` tables with explicit JOINs.",
+    "Approach: structure the query as CTEs, one per logical step.",
+)
+
+
+def candidate_hints(count: int) -> list[str]:
+    """Pick approach hints for ``count`` concurrent candidates.
+
+    Args:
+        count: Number of candidates.
+
+    Returns:
+        One hint per candidate; the first is empty (the plain prompt).
+    """
+    hints = []
+    for i in range(count):
+        repeat, slot = divmod(i, len(CANDIDATE_HINTS))
+        hint = CANDIDATE_HINTS[slot]
+        if repeat:
+            hint = f"{hint} (Alternative #{repeat + 1}.)".strip()
+        hints.append(hint)
+    return hints
+
+
 PREVIOUS_ATTEMPT_TEMPLATE = """
 Your previous attempt had issues:
 - SQL: {previous_sql}
@@ -69,20 +111,27 @@ class SQLGenerator(Node):
 
     This node includes an internal reflection loop that:
     1. Generates SQL candidate
-    2. Validates syntax via duckdb_client.validate_sql_syntax()
-    3. Checks that referenced columns exist in the schema
+    2. Resolves tables and columns against the cached catalog, repairing
+       trivial mistakes locally (see ``sql_validator``)
+    3. Validates syntax via duckdb_client.validate_sql_syntax()
     4. If invalid and retries remaining: incorporates errors and regenerates
     """
 
-    def __init__(self, max_retries: int = 3) -> None:
+    def __init__(self, max_retries: int = 3, candidates: int | None = None) -> None:
         """Initialize the SQL generator.
 
         Args:
             max_retries: Maximum internal retries for validation.
+            candidates: SQL candidates requested concurrently in the first
+                round; 1 keeps the serial loop. Defaults to
+                ``flow.sql_candidates`` from the configuration.
         """
         super().__init__(max_retries=max_retries)
         self.internal_retries = 0
         self.max_internal_retries = max_retries
+        if candidates is None:
+            candidates = get_config().flow.sql_candidates
+        self.candidates = max(1, candidates)
 
     def prep(self, shared: dict[str, Any]) -> dict[str, Any]:
         """Read query, schemas, and any previous feedback.
@@ -134,110 +183,259 @@ class SQLGenerator(Node):
     def exec(self, prep_res: dict[str, Any]) -> dict[str, Any]:
         """Generate SQL with internal validation loop.
 
+        With more than one candidate configured, the first round generates
+        diverse candidates concurrently and keeps the first valid one; later
+        rounds fall back to the serial reflection loop.
+
         Args:
             prep_res: Dictionary with query and schema context.
 
         Returns:
             Dictionary with sql, is_valid, and attempts list.
         """
-        rewritten_query = prep_res["rewritten_query"]
-        table_schemas = prep_res["table_schemas"]
-        grader_feedback = prep_res["grader_feedback"]
-        execution_error = prep_res["execution_error"]
-        previous_attempts = prep_res["previous_attempts"]
-        sub_query_id = prep_res.get("sub_query_id")
-
         db_client = get_duckdb_client()
         attempts: list[SQLGenerationAttempt] = []
-        current_sql = ""
-        is_valid = False
-        last_errors: list[str] = []
         parsed: dict[str, str] = {}
+        first_round = 0
 
-        for attempt_num in range(self.max_internal_retries):
+        if self.candidates > 1:
+            attempts, parsed = self._generate_candidates(prep_res, db_client)
+            first_round = 1
+
+        for attempt_num in range(first_round, self.max_internal_retries):
+            if attempts and attempts[-1].validation.is_valid:
+                break
             self.internal_retries = attempt_num
 
-            previous_context = self._build_previous_context(
-                previous_attempts,
-                attempts,
-                grader_feedback,
-                execution_error,
-                last_errors,
+            attempt, parsed = self._generate_attempt(
+                prep_res, attempt_num, attempts, db_client
             )
+            attempts.append(attempt)
+            if not attempt.validation.is_valid:
+                self._log_invalid_attempt(attempt)
+
+        return self._exec_result(prep_res, attempts, parsed)
+
+    def _generate_attempt(
+        self,
+        prep_res: dict[str, Any],
+        attempt_num: int,
+        attempts: list[SQLGenerationAttempt],
+        db_client: Any,
+        *,
+        hint: str = "",
+    ) -> tuple[SQLGenerationAttempt, dict[str, str]]:
+        """Ask the LLM for one SQL candidate and validate it.
 
-            prompt = SQL_GENERATION_PROMPT.format(
-                rewritten_query=rewritten_query,
-                table_schemas=table_schemas,
-                previous_attempt_context=previous_context,
+        Args:
+            prep_res: Dictionary with query and schema context.
+            attempt_num: Zero-based round index.
+            attempts: Attempts made so far in this exec() loop.
+            db_client: Client used for syntax validation.
+            hint: Approach hint appended to the prompt for diversity.
+
+        Returns:
+            The validated attempt and the parsed LLM response.
+        """
+        last_errors = attempts[-1].validation.errors if attempts else []
+        prompt = self._build_prompt(prep_res, attempts, last_errors)
+        if hint:
+            prompt += f"\n{hint}\n"
+        parsed = self._parse_sql_response(call_llm(prompt))
+        attempt = self._validate_attempt(
+            attempt_num, parsed.get("sql", ""), prep_res["table_schemas"], db_client
+        )
+        return attempt, parsed
+
+    def _generate_candidates(
+        self, prep_res: dict[str, Any], db_client: Any
+    ) -> tuple[list[SQLGenerationAttempt], dict[str, str]]:
+        """Generate and validate candidates concurrently, keeping the first valid.
+
+        Candidates still in flight when a valid one arrives are abandoned; their
+        LLM responses still land in the LLM cache.
+
+        Args:
+            prep_res: Dictionary with query and schema context.
+            db_client: Client used for syntax validation.
+
+        Returns:
+            The attempts in completion order (a valid winner last) and the
+            parsed response of the last one.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.candidates, thread_name_prefix="sql-candidate"
+        )
+        futures = [
+            executor.submit(
+                self._generate_attempt, prep_res, 0, [], db_client, hint=hint
             )
+            for hint in candidate_hints(self.candidates)
+        ]
+        selection = _CandidateSelection(self.candidates, self._log_invalid_attempt)
+        try:
+            for future in as_completed(futures):
+                outcome: _CandidateOutcome
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = e
+                if selection.add(outcome):
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return selection.result()
+
+    def _exec_result(
+        self,
+        prep_res: dict[str, Any],
+        attempts: list[SQLGenerationAttempt],
+        parsed: dict[str, str],
+    ) -> dict[str, Any]:
+        """Build exec() output from the attempts; the last one decides."""
+        last = attempts[-1] if attempts else None
+        return {
+            # Locally repaired SQL replaces the generated text
+            "sql": last.sql if last else "",
+            "is_valid": bool(last and last.validation.is_valid),
+            "attempts": attempts,
+            "thinking": parsed.get("thinking", ""),
+            "sub_query_id": prep_res.get("sub_query_id"),
+        }
 
-            response = call_llm(prompt)
-            parsed = self._parse_sql_response(response)
-            current_sql = parsed.get("sql", "")
-
-            if not current_sql:
-                last_errors = ["Failed to parse SQL from LLM response"]
-                attempts.append(
-                    SQLGenerationAttempt(
-                        attempt_number=attempt_num + 1,
-                        sql="",
-                        validation=ValidationResult(
-                            is_valid=False,
-                            errors=last_errors,
-                        ),
-                    )
-                )
-                continue
-
-            validation = db_client.validate_sql_syntax(current_sql)
-            if not isinstance(validation, ValidationResult):
-                if hasattr(validation, "model_dump"):
-                    validation = ValidationResult(**validation.model_dump())
-                elif isinstance(validation, dict):
-                    validation = ValidationResult(**validation)
-                else:
-                    validation = ValidationResult(
-                        is_valid=bool(getattr(validation, "is_valid", False)),
-                        errors=list(getattr(validation, "errors", [])),
-                        warnings=list(getattr(validation, "warnings", [])),
-                    )
+    def _build_prompt(
+        self,
+        prep_res: dict[str, Any],
+        attempts: list[SQLGenerationAttempt],
+        last_errors: list[str],
+    ) -> str:
+        """Build the generation prompt for the next attempt.
 
-            schema_errors = self._validate_schema_references(current_sql, table_schemas)
-            if schema_errors:
-                validation = ValidationResult(
+        Args:
+            prep_res: Dictionary with query and schema context.
+            attempts: Attempts made so far in this exec() loop.
+            last_errors: Errors from the last attempt.
+
+        Returns:
+            Prompt text.
+        """
+        previous_context = self._build_previous_context(
+            prep_res["previous_attempts"],
+            attempts,
+            prep_res["grader_feedback"],
+            prep_res["execution_error"],
+            last_errors,
+        )
+
+        return SQL_GENERATION_PROMPT.format(
+            rewritten_query=prep_res["rewritten_query"],
+            table_schemas=prep_res["table_schemas"],
+            previous_attempt_context=previous_context,
+        )
+
+    def _validate_attempt(
+        self,
+        attempt_num: int,
+        sql: str,
+        table_schemas: str,
+        db_client: Any,
+    ) -> SQLGenerationAttempt:
+        """Validate a generated SQL candidate.
+
+        Args:
+            attempt_num: Zero-based attempt index.
+            sql: Generated SQL (empty if parsing failed).
+            table_schemas: DDL of the selected tables.
+            db_client: Client used for syntax validation.
+
+        Returns:
+            The attempt with its validation result.
+        """
+        if not sql:
+            return SQLGenerationAttempt(
+                attempt_number=attempt_num + 1,
+                sql="",
+                validation=ValidationResult(
                     is_valid=False,
-                    errors=validation.errors + schema_errors,
-                    warnings=validation.warnings,
-                )
+                    errors=["Failed to parse SQL from LLM response"],
+                ),
+            )
 
-            attempts.append(
-                SQLGenerationAttempt(
+        warnings: list[str] = []
+        validator = self._get_validator(db_client, table_schemas)
+        if validator is not None:
+            static = validator.validate(sql)
+            if not static.is_valid:
+                # Unknown tables or columns fail without an EXPLAIN round-trip
+                return SQLGenerationAttempt(
                     attempt_number=attempt_num + 1,
-                    sql=current_sql,
-                    validation=validation,
+                    sql=static.sql,
+                    validation=ValidationResult(is_valid=False, errors=static.errors),
                 )
+            if static.fixes:
+                logger.info("Repaired SQL locally: %s", "; ".join(static.fixes))
+                sql = static.sql
+                warnings = static.fixes
+
+        validation = db_client.validate_sql_syntax(sql)
+        if not isinstance(validation, ValidationResult):
+            if hasattr(validation, "model_dump"):
+                validation = ValidationResult(**validation.model_dump())
+            elif isinstance(validation, dict):
+                validation = ValidationResult(**validation)
+            else:
+                validation = ValidationResult(
+                    is_valid=bool(getattr(validation, "is_valid", False)),
+                    errors=list(getattr(validation, "errors", [])),
+                    warnings=list(getattr(validation, "warnings", [])),
+                )
+        if warnings:
+            validation = ValidationResult(
+                is_valid=validation.is_valid,
+                errors=validation.errors,
+                warnings=warnings + validation.warnings,
             )
 
-            if validation.is_valid:
-                is_valid = True
-                break
+        return SQLGenerationAttempt(
+            attempt_number=attempt_num + 1,
+            sql=sql,
+            validation=validation,
+        )
+
+    @staticmethod
+    def _get_validator(db_client: Any, table_schemas: str) -> SQLValidator | None:
+        """Get a static validator for the database, or for the prompt schema.
 
-            last_errors = validation.errors
+        Args:
+            db_client: DuckDB client; its cached catalog is preferred.
+            table_schemas: DDL of the selected tables, used without a catalog.
+
+        Returns:
+            Validator, or None when no schema is known.
+        """
+        get_catalog = getattr(db_client, "get_catalog", None)
+        if callable(get_catalog):
+            try:
+                catalog = get_catalog()
+            except Exception as e:
+                logger.debug("Schema catalog unavailable for validation: %s", e)
+            else:
+                if isinstance(catalog, DatabaseCatalog):
+                    return validator_for_catalog(catalog)
+        if table_schemas:
+            return validator_for_ddl(table_schemas)
+        return None
+
+    def _log_invalid_attempt(self, attempt: SQLGenerationAttempt) -> None:
+        """Log a failed validation (parse failures are not logged)."""
+        if attempt.sql:
             logger.warning(
                 "SQL validation failed (attempt %d/%d): %s",
-                attempt_num + 1,
+                attempt.attempt_number,
                 self.max_internal_retries,
-                last_errors,
+                attempt.validation.errors,
             )
 
-        return {
-            "sql": current_sql,
-            "is_valid": is_valid,
-            "attempts": attempts,
-            "thinking": parsed.get("thinking", ""),
-            "sub_query_id": sub_query_id,
-        }
-
     def exec_fallback(self, prep_res: dict[str, Any], exc: Exception) -> dict[str, Any]:
         """Return a safe fallback when SQL generation fails unexpectedly."""
         error_msg = str(exc)
@@ -416,98 +614,156 @@ class SQLGenerator(Node):
 
         return {"sql": "", "thinking": ""}
 
-    def _validate_schema_references(self, sql: str, table_schemas: str) -> list[str]:
-        """Validate that SQL references only tables/columns in the schema."""
-        errors: list[str] = []
 
-        table_pattern = r"CREATE TABLE\s+([A-Za-z_][\w]*)\s*\("
-        available_tables = set(re.findall(table_pattern, table_schemas, re.IGNORECASE))
+class AsyncSQLGenerator(AsyncNodeAdapter, SQLGenerator):
+    """SQLGenerator that awaits the LLM and validates SQL off-loop."""
 
-        from_pattern = (
-            r"FROM\s+([\"']?)([A-Za-z_][\w]*)\1"
-            r"(?:\s+(?:AS\s+)?([A-Za-z_][\w]*))?"
-        )
-        join_pattern = (
-            r"JOIN\s+([\"']?)([A-Za-z_][\w]*)\1"
-            r"(?:\s+(?:AS\s+)?([A-Za-z_][\w]*))?"
-        )
-        reserved_aliases = {
-            "where",
-            "join",
-            "on",
-            "group",
-            "order",
-            "limit",
-            "having",
-            "union",
-            "left",
-            "right",
-            "inner",
-            "outer",
-        }
+    async def exec_async(self, prep_res: dict[str, Any]) -> dict[str, Any]:
+        """Generate SQL with the internal validation loop, asynchronously."""
+        db_client = get_duckdb_client()
+        attempts: list[SQLGenerationAttempt] = []
+        parsed: dict[str, str] = {}
+        first_round = 0
 
-        alias_map = {
-            alias: table
-            for _, table, alias in re.findall(from_pattern, sql, re.IGNORECASE)
-            if alias and alias.lower() not in reserved_aliases
-        }
-        alias_map.update(
-            {
-                alias: table
-                for _, table, alias in re.findall(join_pattern, sql, re.IGNORECASE)
-                if alias and alias.lower() not in reserved_aliases
-            }
-        )
+        if self.candidates > 1:
+            attempts, parsed = await self._generate_candidates_async(
+                prep_res, db_client
+            )
+            first_round = 1
 
-        referenced_tables = {
-            table for _, table, _ in re.findall(from_pattern, sql, re.IGNORECASE)
-        }
-        referenced_tables.update(
-            table for _, table, _ in re.findall(join_pattern, sql, re.IGNORECASE)
-        )
+        for attempt_num in range(first_round, self.max_internal_retries):
+            if attempts and attempts[-1].validation.is_valid:
+                break
+            self.internal_retries = attempt_num
 
-        available_tables_lower = {t.lower() for t in available_tables}
-        errors.extend(
-            [
-                f"Table '{table}' is not in the available schema"
-                for table in referenced_tables
-                if table.lower() not in available_tables_lower
-            ]
-        )
+            attempt, parsed = await self._generate_attempt_async(
+                prep_res, attempt_num, attempts, db_client
+            )
+            attempts.append(attempt)
+            if not attempt.validation.is_valid:
+                self._log_invalid_attempt(attempt)
 
-        schema_columns = self._parse_schema_columns(table_schemas)
-        column_refs = re.findall(
-            r"([A-Za-z_][\w]*)\s*\.\s*([A-Za-z_][\w]*)",
-            sql,
-        )
-        for table_or_alias, column in column_refs:
-            table_name = alias_map.get(table_or_alias, table_or_alias)
-            columns = schema_columns.get(table_name.lower())
-            if columns is None:
-                continue
-            if column.lower() not in columns:
-                errors.append(f"Column '{column}' not found in table '{table_name}'")
-
-        return errors
-
-    def _parse_schema_columns(self, table_schemas: str) -> dict[str, set[str]]:
-        """Parse table schemas into a mapping of table -> columns."""
-        table_columns: dict[str, set[str]] = {}
-        pattern = re.compile(
-            r"CREATE TABLE\s+([A-Za-z_][\w]*)\s*\((.*?)\);",
-            re.IGNORECASE | re.DOTALL,
+        return self._exec_result(prep_res, attempts, parsed)
+
+    async def _generate_attempt_async(
+        self,
+        prep_res: dict[str, Any],
+        attempt_num: int,
+        attempts: list[SQLGenerationAttempt],
+        db_client: Any,
+        *,
+        hint: str = "",
+    ) -> tuple[SQLGenerationAttempt, dict[str, str]]:
+        """Await one SQL candidate and validate it off-loop."""
+        last_errors = attempts[-1].validation.errors if attempts else []
+        prompt = self._build_prompt(prep_res, attempts, last_errors)
+        if hint:
+            prompt += f"\n{hint}\n"
+        parsed = self._parse_sql_response(await call_llm_async(prompt))
+        attempt = await asyncio.to_thread(
+            self._validate_attempt,
+            attempt_num,
+            parsed.get("sql", ""),
+            prep_res["table_schemas"],
+            db_client,
         )
-        for match in pattern.finditer(table_schemas):
-            table_name = match.group(1)
-            column_block = match.group(2)
-            columns: set[str] = set()
-            for raw_line in column_block.splitlines():
-                line = raw_line.strip().rstrip(",")
-                if not line or line.startswith("--"):
-                    continue
-                col_name = line.split()[0].strip("\"'")
-                if col_name:
-                    columns.add(col_name.lower())
-            table_columns[table_name.lower()] = columns
-
-        return table_columns
+        return attempt, parsed
+
+    async def _generate_candidates_async(
+        self, prep_res: dict[str, Any], db_client: Any
+    ) -> tuple[list[SQLGenerationAttempt], dict[str, str]]:
+        """Generate and validate candidates concurrently, keeping the first valid.
+
+        Losing candidates are left to finish in the background rather than
+        cancelled, so callers coalesced onto the same LLM request are unaffected.
+        """
+        tasks = [
+            asyncio.create_task(
+                self._generate_attempt_async(prep_res, 0, [], db_client, hint=hint)
+            )
+            for hint in candidate_hints(self.candidates)
+        ]
+        selection = _CandidateSelection(self.candidates, self._log_invalid_attempt)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                outcome: _CandidateOutcome
+                try:
+                    outcome = await next_done
+                except Exception as e:
+                    outcome = e
+                if selection.add(outcome):
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    _detach(task)
+        return selection.result()
+
+
+_CandidateOutcome = tuple[SQLGenerationAttempt, dict[str, str]] | Exception
+
+
+class _CandidateSelection:
+    """Candidate outcomes in completion order, up to the first valid one.
+
+    Shared by the threaded and asyncio generators so both pick the same way.
+    """
+
+    def __init__(
+        self, total: int, log_invalid: Callable[[SQLGenerationAttempt], None]
+    ) -> None:
+        self.total = total
+        self.log_invalid = log_invalid
+        self.attempts: list[SQLGenerationAttempt] = []
+        self.parsed: dict[str, str] = {}
+        self.errors: list[Exception] = []
+
+    def add(self, outcome: _CandidateOutcome) -> bool:
+        """Record one finished candidate.
+
+        Args:
+            outcome: The candidate's attempt and parsed response, or its error.
+
+        Returns:
+            True once a valid candidate has been recorded.
+        """
+        if isinstance(outcome, Exception):
+            logger.warning("SQL candidate failed: %s", outcome)
+            self.errors.append(outcome)
+            return False
+        attempt, self.parsed = outcome
+        self.attempts.append(attempt)
+        if attempt.validation.is_valid:
+            logger.info(
+                "SQL candidate %d of %d is valid",
+                len(self.attempts) + len(self.errors),
+                self.total,
+            )
+            return True
+        self.log_invalid(attempt)
+        return False
+
+    def result(self) -> tuple[list[SQLGenerationAttempt], dict[str, str]]:
+        """Return the attempts seen and the parsed response of the last one.
+
+        Raises:
+            Exception: The first candidate error, if every candidate failed.
+        """
+        if not self.attempts and self.errors:
+            raise self.errors[0]
+        return self.attempts, self.parsed
+
+
+_background_candidates: set[asyncio.Task[Any]] = set()
+
+
+def _detach(task: asyncio.Task[Any]) -> None:
+    """Keep an abandoned candidate alive until it finishes, ignoring its result."""
+    _background_candidates.add(task)
+
+    def done(finished: asyncio.Task[Any]) -> None:
+        _background_candidates.discard(finished)
+        if not finished.cancelled():
+            finished.exception()
+
+    task.add_done_callback(done)
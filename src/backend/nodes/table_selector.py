@@ -6,6 +6,7 @@ as specified in design.md Section 6.4.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import TYPE_CHECKING, Any
@@ -13,16 +14,25 @@ from typing import TYPE_CHECKING, Any
 import yaml  # type: ignore[import-untyped]
 from pocketflow import Node
 
-from src.backend.utils.call_llm import call_llm
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.utils.call_llm import call_llm, call_llm_async
 from src.backend.utils.duckdb_client import get_duckdb_client
-from src.backend.utils.embeddings import embed_text, find_similar
+from src.backend.utils.embeddings import (
+    embed_batch,
+    embed_text,
+    register_candidates,
+)
 from src.backend.utils.logger import get_logger
+from src.backend.utils.schema_index import get_table_embedding_index
 
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from src.backend.models import TableMeta
+    from src.backend.utils.vector_index import CandidateMatrix
+
+DEFAULT_TOP_K_CANDIDATES = 10
 
 
 TABLE_SELECTION_PROMPT = """Given a user question about NBA data, select the most relevant tables.
@@ -61,7 +71,11 @@ class TableSelector(Node):
     3. Schema fetch: Get DDL for selected tables
     """
 
-    def __init__(self, top_k_candidates: int = 10, max_selected: int = 5) -> None:
+    def __init__(
+        self,
+        top_k_candidates: int = DEFAULT_TOP_K_CANDIDATES,
+        max_selected: int = 5,
+    ) -> None:
         """Initialize the table selector.
 
         Args:
@@ -86,16 +100,7 @@ class TableSelector(Node):
             "rewritten_query", shared.get("question", "")
         )
 
-        db_client = get_duckdb_client()
-        available_tables = shared.get("available_tables")
-        if available_tables is None:
-            available_tables = db_client.get_all_tables()
-            shared["available_tables"] = available_tables
-
-        table_embeddings = shared.get("table_embeddings")
-        if table_embeddings is None:
-            table_embeddings = self._compute_table_embeddings(available_tables)
-            shared["table_embeddings"] = table_embeddings
+        available_tables, table_candidates = load_table_candidates(shared)
 
         get_logger().log_node_start(
             "TableSelector",
@@ -108,7 +113,8 @@ class TableSelector(Node):
         return {
             "rewritten_query": rewritten_query,
             "available_tables": available_tables,
-            "table_embeddings": table_embeddings,
+            "table_candidates": table_candidates,
+            "precomputed_candidates": self.params.get("candidate_tables"),
         }
 
     def exec(self, prep_res: dict[str, Any]) -> dict[str, Any]:
@@ -120,34 +126,11 @@ class TableSelector(Node):
         Returns:
             Dictionary with candidates, selected tables, and schemas.
         """
-        rewritten_query = prep_res["rewritten_query"]
-        available_tables = prep_res["available_tables"]
-        table_embeddings = prep_res["table_embeddings"]
-
-        query_embedding = embed_text(rewritten_query)
-        candidate_names = find_similar(
-            query_embedding,
-            table_embeddings,
-            top_k=self.top_k_candidates,
+        candidate_names, candidates = self._rank_candidates(prep_res)
+        selected_names = self._llm_select_tables(
+            prep_res["rewritten_query"], candidates
         )
-
-        candidates = [t for t in available_tables if t.name in candidate_names]
-
-        candidates.sort(key=lambda t: candidate_names.index(t.name))
-
-        selected_names = self._llm_select_tables(rewritten_query, candidates)
-
-        if not selected_names:
-            selected_names = candidate_names[: self.max_selected]
-
-        db_client = get_duckdb_client()
-        table_schemas = db_client.get_table_schema(selected_names)
-
-        return {
-            "candidate_tables": candidate_names,
-            "selected_tables": selected_names,
-            "table_schemas": table_schemas,
-        }
+        return self._build_result(candidate_names, selected_names)
 
     def post(
         self,
@@ -192,28 +175,55 @@ class TableSelector(Node):
 
         return "default"
 
-    def _compute_table_embeddings(
-        self, tables: list[TableMeta]
-    ) -> dict[str, list[float]]:
-        """Compute embeddings for all tables.
+    def _rank_candidates(
+        self, prep_res: dict[str, Any]
+    ) -> tuple[list[str], list[TableMeta]]:
+        """Pre-filter candidate tables by embedding similarity.
 
         Args:
-            tables: List of table metadata.
+            prep_res: Dictionary with query and table data.
 
         Returns:
-            Dictionary mapping table names to embedding vectors.
+            Tuple of (candidate names in rank order, candidate table metadata).
         """
-        embeddings = {}
+        candidate_names = prep_res.get("precomputed_candidates")
+        if candidate_names is None:
+            query_embedding = embed_text(prep_res["rewritten_query"])
+            candidate_names = prep_res["table_candidates"].top_k(
+                query_embedding, self.top_k_candidates
+            )
+        candidate_names = list(candidate_names[: self.top_k_candidates])
+
+        candidates = [
+            t for t in prep_res["available_tables"] if t.name in candidate_names
+        ]
+
+        candidates.sort(key=lambda t: candidate_names.index(t.name))
+        return candidate_names, candidates
+
+    def _build_result(
+        self, candidate_names: list[str], selected_names: list[str]
+    ) -> dict[str, Any]:
+        """Fetch schemas for the selected tables.
 
-        for table in tables:
-            text = f"{table.name}: {table.description}"
-            if table.columns:
-                cols = ", ".join(table.columns[:10])
-                text += f" (columns: {cols})"
+        Args:
+            candidate_names: Pre-filtered candidate table names.
+            selected_names: Tables chosen by the LLM (may be empty).
 
-            embeddings[table.name] = embed_text(text)
+        Returns:
+            Dictionary with candidates, selected tables, and schemas.
+        """
+        if not selected_names:
+            selected_names = candidate_names[: self.max_selected]
+
+        db_client = get_duckdb_client()
+        table_schemas = db_client.get_table_schema(selected_names)
 
-        return embeddings
+        return {
+            "candidate_tables": candidate_names,
+            "selected_tables": selected_names,
+            "table_schemas": table_schemas,
+        }
 
     def _llm_select_tables(self, query: str, candidates: list[TableMeta]) -> list[str]:
         """Use LLM to select most relevant tables from candidates.
@@ -228,6 +238,19 @@ class TableSelector(Node):
         if not candidates:
             return []
 
+        response = call_llm(self._build_selection_prompt(query, candidates))
+        return self._parse_selection_response(response, candidates)
+
+    def _build_selection_prompt(self, query: str, candidates: list[TableMeta]) -> str:
+        """Build the table selection prompt.
+
+        Args:
+            query: The rewritten user query.
+            candidates: Pre-filtered candidate tables.
+
+        Returns:
+            Prompt text.
+        """
         candidate_descriptions = []
         for table in candidates:
             cols = ", ".join(table.columns[:8]) if table.columns else "unknown"
@@ -236,14 +259,11 @@ class TableSelector(Node):
                 f"- {table.name} {row_info}: {table.description}\n  Columns: {cols}"
             )
 
-        prompt = TABLE_SELECTION_PROMPT.format(
+        return TABLE_SELECTION_PROMPT.format(
             rewritten_query=query,
             candidate_tables_with_descriptions="\n".join(candidate_descriptions),
         )
 
-        response = call_llm(prompt)
-        return self._parse_selection_response(response, candidates)
-
     def _parse_selection_response(
         self, response: str, candidates: list[TableMeta]
     ) -> list[str]:
@@ -288,3 +308,81 @@ class TableSelector(Node):
         except yaml.YAMLError as e:
             logger.warning("Failed to parse YAML response: %s", e)
             return []
+
+
+class AsyncTableSelector(AsyncNodeAdapter, TableSelector):
+    """TableSelector that awaits the LLM and runs embedding/DB work off-loop."""
+
+    async def exec_async(self, prep_res: dict[str, Any]) -> dict[str, Any]:
+        """Execute hybrid table selection with the async LLM client."""
+        candidate_names, candidates = await asyncio.to_thread(
+            self._rank_candidates, prep_res
+        )
+        selected_names: list[str] = []
+        if candidates:
+            prompt = self._build_selection_prompt(
+                prep_res["rewritten_query"], candidates
+            )
+            response = await call_llm_async(prompt)
+            selected_names = self._parse_selection_response(response, candidates)
+        return await asyncio.to_thread(
+            self._build_result, candidate_names, selected_names
+        )
+
+
+def load_table_candidates(
+    shared: dict[str, Any],
+) -> tuple[list[TableMeta], CandidateMatrix]:
+    """Return available tables and their registered embedding matrix.
+
+    Table embeddings come from the process-wide index persisted next to the
+    database, which only re-embeds tables whose metadata changed. Embeddings
+    already present in the shared store take precedence.
+
+    Args:
+        shared: The shared store.
+
+    Returns:
+        Tuple of (available tables, table candidate matrix).
+    """
+    db_client = get_duckdb_client()
+    available_tables = shared.get("available_tables")
+    if available_tables is None:
+        available_tables = db_client.get_all_tables()
+        shared["available_tables"] = available_tables
+
+    table_candidates = shared.get("table_candidates")
+    if table_candidates is None:
+        table_embeddings = shared.get("table_embeddings")
+        if table_embeddings is not None:
+            table_candidates = register_candidates("tables", table_embeddings)
+        else:
+            index = get_table_embedding_index(db_client.db_path)
+            table_candidates = index.sync(available_tables)
+        shared["table_candidates"] = table_candidates
+
+    return available_tables, table_candidates
+
+
+def rank_candidate_tables(
+    shared: dict[str, Any],
+    queries: list[str],
+    top_k: int = DEFAULT_TOP_K_CANDIDATES,
+) -> list[list[str]]:
+    """Pre-filter candidate tables for many queries in one batch.
+
+    Embeds all queries with a single ``embed_batch`` call and scores them
+    against the table matrix in one matmul.
+
+    Args:
+        shared: The shared store.
+        queries: Query texts (e.g. sub-query descriptions).
+        top_k: Number of candidates per query.
+
+    Returns:
+        One list of candidate table names per query.
+    """
+    if not queries:
+        return []
+    _, table_candidates = load_table_candidates(shared)
+    return table_candidates.top_k_batch(embed_batch(queries), top_k)
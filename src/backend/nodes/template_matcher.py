@@ -0,0 +1,130 @@
+"""TemplateMatcher node for the NBA Data Analyst Agent.
+
+This module answers questions that match a learned SQL template, skipping
+planning, table selection and SQL generation. See ``utils.sql_templates``.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from pocketflow import Node
+
+from src.backend.config import get_config
+from src.backend.models import QueryComplexity, QueryPlan
+from src.backend.nodes.async_base import AsyncNodeAdapter
+from src.backend.utils.duckdb_client import get_duckdb_client
+from src.backend.utils.logger import get_logger
+from src.backend.utils.sql_templates import get_template_store
+
+
+logger = logging.getLogger(__name__)
+
+
+def templates_enabled() -> bool:
+    """Whether the question-to-SQL template cache is switched on."""
+    try:
+        return get_config().flow.sql_templates
+    except Exception:
+        return False
+
+
+class TemplateMatcher(Node):
+    """Fill a learned SQL template instead of generating SQL from scratch.
+
+    This node:
+    - Matches the rewritten query against stored templates
+    - Renders the template's SQL with the question's season, stat and names
+    - Validates the SQL and hands it straight to SQLExecutor
+    - Falls through to the full planning path on a miss or invalid SQL
+    """
+
+    def prep(self, shared: dict[str, Any]) -> str:
+        """Read the rewritten query from the shared store.
+
+        Args:
+            shared: The shared store.
+
+        Returns:
+            Query text to match.
+        """
+        query = shared.get("rewritten_query") or shared.get("question", "")
+
+        get_logger().log_node_start("TemplateMatcher", {"query": query})
+
+        return str(query)
+
+    def exec(self, prep_res: str) -> dict[str, Any] | None:
+        """Find a template and validate its rendered SQL.
+
+        Args:
+            prep_res: Query text.
+
+        Returns:
+            Dictionary with template_id, sql and tables, or None on a miss.
+        """
+        if not prep_res or not templates_enabled():
+            return None
+
+        match = get_template_store().match(prep_res)
+        if match is None:
+            return None
+        template, sql = match
+
+        validation = get_duckdb_client().validate_sql_syntax(sql)
+        if not validation.is_valid:
+            logger.info(
+                "Template %s rendered invalid SQL: %s",
+                template.template_id,
+                validation.errors,
+            )
+            return None
+
+        return {
+            "template_id": template.template_id,
+            "sql": sql,
+            "tables": template.tables,
+        }
+
+    def exec_fallback(self, prep_res: str, exc: Exception) -> None:
+        """Treat lookup failures as a miss."""
+        logger.warning("Template lookup failed: %s", exc)
+
+    def post(
+        self,
+        shared: dict[str, Any],
+        prep_res: str,
+        exec_res: dict[str, Any] | None,
+    ) -> str:
+        """Store the templated SQL and choose the next step.
+
+        Args:
+            shared: The shared store.
+            prep_res: Query text from prep().
+            exec_res: Match from exec(), or None.
+
+        Returns:
+            Action string: "template" on a hit, "default" otherwise.
+        """
+        if exec_res is None:
+            get_logger().log_node_end("TemplateMatcher", {"matched": False}, "miss")
+            return "default"
+
+        shared["sql_query"] = exec_res["sql"]
+        shared["sql_is_valid"] = True
+        shared["template_id"] = exec_res["template_id"]
+        shared["selected_tables"] = exec_res["tables"]
+        shared["query_plan"] = QueryPlan(complexity=QueryComplexity.SIMPLE)
+
+        get_logger().log_node_end(
+            "TemplateMatcher",
+            {"matched": True, "template_id": exec_res["template_id"]},
+            "template",
+        )
+        logger.info("Answering from SQL template %s", exec_res["template_id"])
+        return "template"
+
+
+class AsyncTemplateMatcher(AsyncNodeAdapter, TemplateMatcher):
+    """TemplateMatcher that runs the lookup and validation in a worker thread."""
@@ -0,0 +1,135 @@
+"""Live delivery of the final answer while the LLM is still writing it.
+
+DataAnalyzer asks the LLM for YAML with ``answer`` and ``transparency_note``
+keys. ``AnswerStreamParser`` pulls the text of the ``answer`` block out of the
+token stream as it arrives so a ``TokenSink`` (e.g. a Chainlit message) can
+show it immediately; the complete response is still parsed afterwards.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Protocol
+
+
+_ANSWER_KEY_RE = re.compile(r"^answer:[ \t]*", re.MULTILINE)
+_BLOCK_INDICATOR_RE = re.compile(r"[|>][-+0-9]*[ \t]*\n")
+
+
+class TokenSink(Protocol):
+    """Receiver for answer text streamed out of the flow."""
+
+    async def start(self) -> None:
+        """Begin a new answer, discarding any partial one shown so far."""
+
+    async def send(self, token: str) -> None:
+        """Append text to the answer being shown."""
+
+
+class AnswerStreamParser:
+    """Incrementally extract the ``answer`` value from a streamed YAML reply.
+
+    Handles both block scalars (``answer: |`` followed by indented lines) and
+    single-line values. Text before the key, and everything after the answer
+    ends, is swallowed. Blank lines are held back until more answer text
+    follows so trailing whitespace is never emitted.
+    """
+
+    def __init__(self) -> None:
+        """Start in the state of looking for the ``answer`` key."""
+        self._buffer = ""
+        self._state = "key"
+        self._indent: int | None = None
+        self._line_start = True
+        self._pending_newlines = 0
+        self._emitted = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the answer value has ended."""
+        return self._state == "done"
+
+    def feed(self, token: str) -> str:
+        """Consume a token and return any answer text it completes.
+
+        Args:
+            token: Next chunk of the LLM response.
+
+        Returns:
+            Answer text that is safe to display, possibly empty.
+        """
+        if self._state == "done":
+            return ""
+        self._buffer += token
+        out: list[str] = []
+        progressed = True
+        while progressed and self._buffer and self._state != "done":
+            if self._state == "key":
+                progressed = self._find_key()
+            elif self._state == "indicator":
+                progressed = self._read_indicator()
+            elif self._state == "inline":
+                progressed = self._read_inline(out)
+            else:
+                progressed = self._read_block(out)
+        return "".join(out)
+
+    def _find_key(self) -> bool:
+        match = _ANSWER_KEY_RE.search(self._buffer)
+        if match is None or match.end() == len(self._buffer):
+            return False
+        self._buffer = self._buffer[match.end() :]
+        self._state = "indicator"
+        return True
+
+    def _read_indicator(self) -> bool:
+        if self._buffer[0] not in "|>":
+            self._state = "inline"
+            return True
+        match = _BLOCK_INDICATOR_RE.match(self._buffer)
+        if match is None:
+            return False
+        self._buffer = self._buffer[match.end() :]
+        self._state = "block"
+        return True
+
+    def _read_inline(self, out: list[str]) -> bool:
+        line, newline, rest = self._buffer.partition("\n")
+        out.append(line)
+        self._buffer = rest
+        if newline:
+            self._state = "done"
+        return bool(line or newline)
+
+    def _read_block(self, out: list[str]) -> bool:
+        if self._line_start:
+            stripped = self._buffer.lstrip(" ")
+            if not stripped:
+                return False
+            if stripped[0] == "\n":
+                self._pending_newlines += 1
+                self._buffer = stripped[1:]
+                return True
+            indent = len(self._buffer) - len(stripped)
+            if indent == 0:
+                self._state = "done"
+                return False
+            if self._indent is None:
+                self._indent = indent
+            extra = max(0, indent - self._indent)
+            if self._emitted:
+                out.append("\n" * self._pending_newlines)
+            self._pending_newlines = 0
+            out.append(" " * extra)
+            self._buffer = stripped
+            self._line_start = False
+            return True
+
+        line, newline, rest = self._buffer.partition("\n")
+        out.append(line)
+        self._buffer = rest
+        if newline:
+            self._line_start = True
+            self._pending_newlines = 1
+        self._emitted = True
+        return bool(line or newline)
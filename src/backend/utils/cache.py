@@ -7,16 +7,23 @@ as specified in design.md Section 4.6.
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import re
+import sqlite3
 import threading
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from src.backend.utils.cache_store import CacheStore
+from src.backend.utils.eviction import create_eviction_policy
+from src.backend.utils.vector_index import VectorIndex
+
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,8 @@ CACHE_DIR = Path(__file__).parent.parent / "data" / "llm_cache"
 DEFAULT_SIMILARITY_THRESHOLD = 0.95
 DEFAULT_TTL_HOURS = 24
 DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_EVICTION_POLICY = "lru"
+LATENCY_WINDOW = 1000
 
 if TYPE_CHECKING:
     from src.backend.utils.embeddings import EmbeddingService
@@ -37,14 +46,18 @@ class CacheEntry:
     prompt: str
     response: str
     timestamp: float
-    embedding: list[float] | None = None
+    embedding: list[float] | np.ndarray | None = None
 
 
 class SemanticCache:
     """Semantic cache for LLM responses.
 
     Caches responses by semantic similarity, not just exact match.
-    Uses embeddings to find similar prompts.
+    Uses embeddings to find similar prompts. Entry embeddings live in a
+    contiguous normalized matrix so a semantic lookup is a single matmul.
+    Entries are persisted one row at a time and loaded lazily on first use.
+    When full, a pluggable LRU/LFU/TTL-first policy picks the victim, and
+    expired entries can be swept in the background.
     """
 
     def __init__(
@@ -53,6 +66,7 @@ class SemanticCache:
         ttl_hours: int = DEFAULT_TTL_HOURS,
         max_entries: int = DEFAULT_MAX_ENTRIES,
         use_embeddings: bool = True,
+        eviction_policy: str = DEFAULT_EVICTION_POLICY,
     ) -> None:
         """Initialize the semantic cache.
 
@@ -61,18 +75,33 @@ class SemanticCache:
             ttl_hours: Time-to-live in hours.
             max_entries: Maximum number of cached entries.
             use_embeddings: Whether to use embeddings for semantic matching.
+            eviction_policy: "lru", "lfu" or "ttl_first".
         """
         self.similarity_threshold = similarity_threshold
         self.ttl_seconds = ttl_hours * 3600
         self.max_entries = max_entries
         self.use_embeddings = use_embeddings
+        self.eviction_policy = eviction_policy
 
         self._cache: dict[str, CacheEntry] = {}
+        self._policy = create_eviction_policy(eviction_policy)
+        # Every entry shares one TTL, so insertion order is expiry order.
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._sweeper: threading.Thread | None = None
+        self._stop_sweeper = threading.Event()
+        self._index = VectorIndex()
         self._lock = threading.Lock()
         self._embedding_service: EmbeddingService | None = None
-
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self._load_cache()
+        self._lookup_latencies_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._store = CacheStore(
+            CACHE_DIR / "cache.sqlite3",
+            legacy_json=CACHE_DIR / "cache.json",
+        )
+        self._loaded = False
 
     def _get_embedding_service(self):
         """Lazy-load embedding service."""
@@ -86,49 +115,51 @@ class SemanticCache:
                 self.use_embeddings = False
         return self._embedding_service
 
-    def _load_cache(self) -> None:
-        """Load cache from disk."""
-        cache_file = CACHE_DIR / "cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-
-                current_time = time.time()
-                for entry_data in data.get("entries", []):
-                    if current_time - entry_data["timestamp"] < self.ttl_seconds:
-                        entry = CacheEntry(
-                            prompt_hash=entry_data["prompt_hash"],
-                            prompt=entry_data["prompt"],
-                            response=entry_data["response"],
-                            timestamp=entry_data["timestamp"],
-                            embedding=entry_data.get("embedding"),
-                        )
-                        self._cache[entry.prompt_hash] = entry
-
-                logger.debug(f"Loaded {len(self._cache)} cache entries")
-            except (json.JSONDecodeError, KeyError, OSError) as e:
-                logger.warning(f"Failed to load cache: {e}")
-
-    def _save_cache(self) -> None:
-        """Save cache to disk."""
-        cache_file = CACHE_DIR / "cache.json"
+    def _ensure_loaded(self) -> None:
+        """Load persisted entries on first use. Caller must hold the lock."""
+        if self._loaded:
+            return
+        self._loaded = True
         try:
-            entries = [
-                {
-                    "prompt_hash": e.prompt_hash,
-                    "prompt": e.prompt,
-                    "response": e.response,
-                    "timestamp": e.timestamp,
-                    "embedding": e.embedding,
-                }
-                for e in self._cache.values()
-            ]
+            stored = self._store.load(min_timestamp=time.time() - self.ttl_seconds)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to load cache: {e}")
+            return
+        for item in stored:
+            self._add_entry(
+                CacheEntry(
+                    prompt_hash=item.prompt_hash,
+                    prompt=item.prompt,
+                    response=item.response,
+                    timestamp=item.timestamp,
+                    embedding=item.embedding,
+                )
+            )
+        while len(self._cache) > self.max_entries:
+            self._evict_one()
+        logger.debug(f"Loaded {len(self._cache)} cache entries")
+
+    def _persist(self, entry: CacheEntry) -> None:
+        """Write a single entry to the store. Caller must hold the lock."""
+        try:
+            self._store.put(
+                entry.prompt_hash,
+                entry.prompt,
+                entry.response,
+                entry.timestamp,
+                entry.embedding,
+            )
+            if self._store.needs_compaction():
+                self._store.compact(min_timestamp=time.time() - self.ttl_seconds)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save cache entry: {e}")
 
-            with open(cache_file, "w") as f:
-                json.dump({"entries": entries}, f)
-        except OSError as e:
-            logger.warning(f"Failed to save cache: {e}")
+    def _unpersist(self, prompt_hashes: list[str]) -> None:
+        """Delete entries from the store. Caller must hold the lock."""
+        try:
+            self._store.delete(prompt_hashes)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete cache entries: {e}")
 
     def _get_hash(self, prompt: str) -> str:
         """Generate hash for a prompt."""
@@ -157,19 +188,28 @@ class SemanticCache:
         Returns:
             Cached response if found, None otherwise.
         """
-        with self._lock:
-            exact_match = self._get_exact_match(prompt)
-            if exact_match is not None:
-                return exact_match
-
-            if not self.use_embeddings:
-                return None
-
-            embedding_service = self._get_embedding_service()
-            if not embedding_service:
-                return None
-
-            return self._get_semantic_match(prompt, embedding_service)
+        start_time = time.perf_counter()
+        try:
+            with self._lock:
+                self._ensure_loaded()
+                response = self._get_exact_match(prompt)
+
+            if (
+                response is None
+                and self.use_embeddings
+                and (embedding_service := self._get_embedding_service())
+            ):
+                response = self._get_semantic_match(prompt, embedding_service)
+
+            with self._lock:
+                if response is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self._lookup_latencies_ms.append(elapsed_ms)
 
     def _get_exact_match(self, prompt: str) -> str | None:
         prompt_hash = self._get_hash(prompt)
@@ -178,48 +218,143 @@ class SemanticCache:
             return None
         if time.time() - entry.timestamp < self.ttl_seconds:
             logger.debug("Cache hit (exact match)")
+            self._policy.record_access(prompt_hash)
             return entry.response
-        del self._cache[prompt_hash]
+        self._remove_entry(prompt_hash)
+        self._expirations += 1
         return None
 
     def _get_semantic_match(self, prompt: str, embedding_service) -> str | None:
         try:
+            # Embed outside the lock: it may be a network call.
             query_embedding = embedding_service.embed_text(prompt)
-            best_match, best_similarity = self._find_best_match(
-                query_embedding,
-                embedding_service,
-            )
-            if best_match and best_similarity >= self.similarity_threshold:
-                logger.debug(
-                    f"Cache hit (semantic, similarity={best_similarity:.3f})"
-                )
+            with self._lock:
+                best_match, best_similarity = self._find_best_match(query_embedding)
+                if best_match and best_similarity >= self.similarity_threshold:
+                    self._policy.record_access(best_match.prompt_hash)
+                else:
+                    best_match = None
+            if best_match:
+                logger.debug(f"Cache hit (semantic, similarity={best_similarity:.3f})")
                 return best_match.response
         except Exception as e:
             logger.warning(f"Semantic cache lookup failed: {e}")
         return None
 
-    def _find_best_match(self, query_embedding, embedding_service):
-        best_match: CacheEntry | None = None
-        best_similarity = 0.0
+    def _find_best_match(
+        self, query_embedding: list[float]
+    ) -> tuple[CacheEntry | None, float]:
+        """Return the most similar live entry, dropping expired hits."""
         current_time = time.time()
-
-        for entry in list(self._cache.values()):
+        while True:
+            results = self._index.search(query_embedding, k=1)
+            if not results:
+                return None, 0.0
+            prompt_hash, similarity = results[0]
+            entry = self._cache.get(prompt_hash)
+            if entry is None:
+                self._index.remove(prompt_hash)
+                continue
             if current_time - entry.timestamp >= self.ttl_seconds:
-                del self._cache[entry.prompt_hash]
+                self._remove_entry(prompt_hash)
+                self._expirations += 1
                 continue
+            return entry, similarity
+
+    def _add_entry(self, entry: CacheEntry) -> None:
+        """Store an entry and keep the index and eviction order in sync."""
+        self._cache[entry.prompt_hash] = entry
+        self._policy.record_insert(entry.prompt_hash)
+        self._expiry[entry.prompt_hash] = entry.timestamp
+        self._expiry.move_to_end(entry.prompt_hash)
+        if entry.embedding is None:
+            self._index.remove(entry.prompt_hash)
+            return
+        try:
+            self._index.add(entry.prompt_hash, entry.embedding)
+        except ValueError as e:
+            logger.warning(f"Skipping cache embedding: {e}")
+            self._index.remove(entry.prompt_hash)
+
+    def _drop_entry(self, prompt_hash: str) -> None:
+        """Remove an entry from memory only."""
+        self._cache.pop(prompt_hash, None)
+        self._index.remove(prompt_hash)
+        self._policy.remove(prompt_hash)
+        self._expiry.pop(prompt_hash, None)
+
+    def _remove_entry(self, prompt_hash: str) -> None:
+        """Remove an entry from memory and from the store."""
+        self._drop_entry(prompt_hash)
+        self._unpersist([prompt_hash])
+
+    def _evict_one(self) -> None:
+        """Evict the entry chosen by the eviction policy."""
+        victim = self._policy.pop_victim()
+        if victim is None:
+            return
+        self._remove_entry(victim)
+        self._evictions += 1
+
+    def _expire_due(self, now: float) -> int:
+        """Remove every expired entry. Caller must hold the lock.
 
-            if entry.embedding is None:
-                entry.embedding = embedding_service.embed_text(entry.prompt)
+        Returns:
+            Number of entries expired.
+        """
+        expired: list[str] = []
+        cutoff = now - self.ttl_seconds
+        while self._expiry:
+            prompt_hash, timestamp = next(iter(self._expiry.items()))
+            if timestamp > cutoff:
+                break
+            self._drop_entry(prompt_hash)
+            expired.append(prompt_hash)
+        if expired:
+            self._unpersist(expired)
+            self._expirations += len(expired)
+        return len(expired)
+
+    def sweep(self) -> int:
+        """Remove expired entries now.
 
-            similarity = embedding_service.cosine_similarity(
-                query_embedding, entry.embedding
-            )
+        Returns:
+            Number of entries expired.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._expire_due(time.time())
+
+    def start_sweeper(self, interval_seconds: float) -> None:
+        """Start a daemon thread that sweeps expired entries periodically.
+
+        Args:
+            interval_seconds: Seconds between sweeps.
+        """
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._stop_sweeper.clear()
+
+        def _run() -> None:
+            while not self._stop_sweeper.wait(interval_seconds):
+                try:
+                    expired = self.sweep()
+                    if expired:
+                        logger.debug(f"Swept {expired} expired cache entries")
+                except Exception as e:
+                    logger.warning(f"Cache sweep failed: {e}")
 
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = entry
+        self._sweeper = threading.Thread(
+            target=_run, name="semantic-cache-sweeper", daemon=True
+        )
+        self._sweeper.start()
 
-        return best_match, best_similarity
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper if it is running."""
+        self._stop_sweeper.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=5)
+            self._sweeper = None
 
     def set(self, prompt: str, response: str) -> None:
         """Store a prompt-response pair in cache.
@@ -228,35 +363,34 @@ class SemanticCache:
             prompt: The prompt.
             response: The response to cache.
         """
-        with self._lock:
-            if len(self._cache) >= self.max_entries:
-                oldest_hash = min(
-                    self._cache.keys(),
-                    key=lambda k: self._cache[k].timestamp,
-                )
-                del self._cache[oldest_hash]
+        prompt_hash = self._get_hash(prompt)
 
-            prompt_hash = self._get_hash(prompt)
+        embedding = None
+        if self.use_embeddings:
+            try:
+                embedding_service = self._get_embedding_service()
+                if embedding_service:
+                    embedding = embedding_service.embed_text(prompt)
+            except Exception as e:
+                logger.warning(f"Failed to compute embedding: {e}")
+
+        entry = CacheEntry(
+            prompt_hash=prompt_hash,
+            prompt=prompt,
+            response=response,
+            timestamp=time.time(),
+            embedding=embedding,
+        )
 
-            embedding = None
-            if self.use_embeddings:
-                try:
-                    embedding_service = self._get_embedding_service()
-                    if embedding_service:
-                        embedding = embedding_service.embed_text(prompt)
-                except Exception as e:
-                    logger.warning(f"Failed to compute embedding: {e}")
-
-            entry = CacheEntry(
-                prompt_hash=prompt_hash,
-                prompt=prompt,
-                response=response,
-                timestamp=time.time(),
-                embedding=embedding,
-            )
+        with self._lock:
+            self._ensure_loaded()
+            if prompt_hash not in self._cache and len(self._cache) >= self.max_entries:
+                self._expire_due(entry.timestamp)
+                while len(self._cache) >= self.max_entries:
+                    self._evict_one()
 
-            self._cache[prompt_hash] = entry
-            self._save_cache()
+            self._add_entry(entry)
+            self._persist(entry)
 
     def invalidate(self, pattern: str) -> int:
         """Invalidate cache entries matching a pattern.
@@ -268,6 +402,7 @@ class SemanticCache:
             Number of entries invalidated.
         """
         with self._lock:
+            self._ensure_loaded()
             regex = re.compile(pattern, re.IGNORECASE)
             to_remove = [
                 hash_key
@@ -276,18 +411,23 @@ class SemanticCache:
             ]
 
             for hash_key in to_remove:
-                del self._cache[hash_key]
-
-            if to_remove:
-                self._save_cache()
+                self._drop_entry(hash_key)
+            self._unpersist(to_remove)
 
             return len(to_remove)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
+            self._loaded = True
             self._cache.clear()
-            self._save_cache()
+            self._index.clear()
+            self._policy.clear()
+            self._expiry.clear()
+            try:
+                self._store.clear()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to clear cache store: {e}")
 
     def stats(self) -> dict:
         """Get cache statistics.
@@ -296,22 +436,44 @@ class SemanticCache:
             Dictionary with cache stats.
         """
         with self._lock:
+            self._ensure_loaded()
             current_time = time.time()
             valid_entries = [
                 e
                 for e in self._cache.values()
                 if current_time - e.timestamp < self.ttl_seconds
             ]
+            lookups = self._hits + self._misses
 
             return {
                 "total_entries": len(self._cache),
                 "valid_entries": len(valid_entries),
+                "indexed_entries": len(self._index),
                 "max_entries": self.max_entries,
+                "eviction_policy": self.eviction_policy,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
                 "ttl_hours": self.ttl_seconds / 3600,
                 "similarity_threshold": self.similarity_threshold,
                 "use_embeddings": self.use_embeddings,
+                "lookup_latency_ms": self._latency_percentiles(),
             }
 
+    def _latency_percentiles(self) -> dict[str, float]:
+        """Summarize recent lookup latencies.
+
+        Returns:
+            Dictionary with p50/p95/p99 latencies in milliseconds.
+        """
+        samples = list(self._lookup_latencies_ms)
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
 
 @lru_cache(maxsize=1)
 def get_cache() -> SemanticCache:
@@ -320,7 +482,18 @@ def get_cache() -> SemanticCache:
     Returns:
         Semantic cache instance.
     """
-    return SemanticCache()
+    from src.backend.config import get_config
+
+    cache_config = get_config().cache
+    cache = SemanticCache(
+        similarity_threshold=cache_config.semantic_threshold,
+        ttl_hours=cache_config.ttl_hours,
+        max_entries=cache_config.max_entries,
+        eviction_policy=cache_config.eviction_policy,
+    )
+    if cache_config.sweep_interval_seconds > 0:
+        cache.start_sweeper(cache_config.sweep_interval_seconds)
+    return cache
 
 
 def get_cached(prompt: str) -> str | None:
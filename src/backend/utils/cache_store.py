@@ -0,0 +1,239 @@
+"""SQLite persistence for the semantic LLM cache.
+
+Entries are upserted one row at a time into a WAL-mode SQLite database, so a
+write costs O(entry) instead of rewriting the whole cache, and a crash can
+only lose the in-flight row. Embeddings are stored as raw float32 blobs and
+decoded with ``numpy.frombuffer`` on load.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPACT_EVERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    prompt_hash TEXT PRIMARY KEY,
+    prompt TEXT NOT NULL,
+    response TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    embedding BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries (timestamp);
+"""
+
+
+@dataclass
+class StoredEntry:
+    """A cache row as persisted on disk."""
+
+    prompt_hash: str
+    prompt: str
+    response: str
+    timestamp: float
+    embedding: np.ndarray | None = None
+
+
+def _encode_embedding(embedding: Sequence[float] | np.ndarray | None) -> bytes | None:
+    if embedding is None:
+        return None
+    return np.asarray(embedding, dtype=np.float32).tobytes()
+
+
+def _decode_embedding(blob: bytes | None) -> np.ndarray | None:
+    if not blob:
+        return None
+    return np.frombuffer(blob, dtype=np.float32)
+
+
+class CacheStore:
+    """Crash-safe, append-style store for semantic cache entries.
+
+    The connection is opened lazily on first use. Every ``compact_every``
+    writes, expired rows are purged and the WAL is checkpointed so the files
+    on disk stay proportional to the live cache.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        legacy_json: Path | None = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file.
+            legacy_json: Old ``cache.json`` file to import on first open.
+            compact_every: Number of writes between compactions.
+        """
+        self.path = path
+        self.legacy_json = legacy_json
+        self.compact_every = max(1, compact_every)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes_since_compact = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._import_legacy_json()
+        return self._conn
+
+    def _import_legacy_json(self) -> None:
+        """Import entries from the old whole-file JSON cache once."""
+        if self.legacy_json is None or not self.legacy_json.exists():
+            return
+        try:
+            with open(self.legacy_json) as f:
+                data = json.load(f)
+            rows = [
+                (
+                    item["prompt_hash"],
+                    item["prompt"],
+                    item["response"],
+                    item["timestamp"],
+                    _encode_embedding(item.get("embedding")),
+                )
+                for item in data.get("entries", [])
+            ]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?)", rows
+                )
+            self.legacy_json.rename(self.legacy_json.with_suffix(".json.migrated"))
+            logger.info(f"Migrated {len(rows)} entries from {self.legacy_json.name}")
+        except (json.JSONDecodeError, KeyError, OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to migrate legacy cache: {e}")
+
+    def load(self, min_timestamp: float = 0.0) -> list[StoredEntry]:
+        """Load all entries newer than ``min_timestamp``.
+
+        Args:
+            min_timestamp: Entries older than this are skipped.
+
+        Returns:
+            Stored entries ordered oldest first.
+        """
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT prompt_hash, prompt, response, timestamp, embedding "
+                    "FROM entries WHERE timestamp >= ? ORDER BY timestamp",
+                    (min_timestamp,),
+                )
+                .fetchall()
+            )
+        return [
+            StoredEntry(
+                prompt_hash=row[0],
+                prompt=row[1],
+                response=row[2],
+                timestamp=row[3],
+                embedding=_decode_embedding(row[4]),
+            )
+            for row in rows
+        ]
+
+    def put(
+        self,
+        prompt_hash: str,
+        prompt: str,
+        response: str,
+        timestamp: float,
+        embedding: Sequence[float] | np.ndarray | None = None,
+    ) -> None:
+        """Insert or replace a single entry."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (
+                        prompt_hash,
+                        prompt,
+                        response,
+                        timestamp,
+                        _encode_embedding(embedding),
+                    ),
+                )
+            self._writes_since_compact += 1
+
+    def delete(self, prompt_hashes: Iterable[str]) -> None:
+        """Delete entries by hash."""
+        keys = [(key,) for key in prompt_hashes]
+        if not keys:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM entries WHERE prompt_hash = ?", keys)
+            self._writes_since_compact += len(keys)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM entries")
+            self._writes_since_compact = self.compact_every
+
+    def needs_compaction(self) -> bool:
+        """Return whether enough writes have accumulated to compact."""
+        return self._writes_since_compact >= self.compact_every
+
+    def compact(self, min_timestamp: float) -> int:
+        """Purge expired rows and fold the WAL back into the database.
+
+        Args:
+            min_timestamp: Rows older than this are deleted.
+
+        Returns:
+            Number of rows deleted.
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    deleted = conn.execute(
+                        "DELETE FROM entries WHERE timestamp < ?", (min_timestamp,)
+                    ).rowcount
+                free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                total_pages = conn.execute("PRAGMA page_count").fetchone()[0]
+                if total_pages and free_pages * 4 > total_pages:
+                    conn.execute("VACUUM")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"Cache compaction failed: {e}")
+                return 0
+            self._writes_since_compact = 0
+            return deleted
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
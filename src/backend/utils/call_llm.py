@@ -1,11 +1,22 @@
-"""LLM wrapper for OpenRouter API with retries, caching, and async support."""
+"""LLM wrapper for OpenRouter API with retries, caching, and async support.
+
+Clients are pooled per process so HTTP keep-alive connections are reused
+across calls instead of paying a TLS handshake on every request.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import importlib.util
 import logging
 import os
+import threading
 import time
+import weakref
 from dataclasses import dataclass
+from typing import Any
 
 import httpx
 from openai import OpenAI
@@ -21,7 +32,7 @@ from tenacity import (
 
 from src.backend.utils.cache import get_cached, set_cached
 from src.backend.utils.logger import get_logger
-from src.backend.utils.resilience import circuit_breaker
+from src.backend.utils.resilience import SingleFlight, circuit_breaker
 
 
 logger = logging.getLogger(__name__)
@@ -31,8 +42,16 @@ DEFAULT_MODEL = "meta-llama/llama-3.3-70b-instruct"
 DEFAULT_TEMPERATURE = 0.1
 DEFAULT_MAX_TOKENS = 2000
 DEFAULT_TIMEOUT_SECONDS = 60.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
 
 CACHE_ENV = "LLM_CACHE_ENABLED"
+MAX_BACKOFF_SECONDS = 10
+
+# Identical prompts issued concurrently (e.g. the same starter question from
+# several sessions) share one OpenRouter request.
+_llm_calls = SingleFlight("llm_call")
 
 
 class AuthenticationError(RuntimeError):
@@ -108,6 +127,185 @@ def _load_llm_settings() -> LLMSettings:
     )
 
 
+@dataclass(frozen=True)
+class PoolSettings:
+    """HTTP connection pool settings shared by every OpenRouter client."""
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+    http2: bool = True
+
+    def limits(self) -> httpx.Limits:
+        """Build the httpx connection limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def _load_pool_settings() -> PoolSettings:
+    try:
+        from src.backend.config import get_config
+
+        llm_config = get_config().llm
+    except Exception:
+        return PoolSettings()
+
+    return PoolSettings(
+        max_connections=llm_config.max_connections,
+        max_keepalive_connections=llm_config.max_keepalive_connections,
+        keepalive_expiry=llm_config.keepalive_expiry_seconds,
+        http2=llm_config.http2,
+    )
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+ClientKey = tuple[str, str, float]
+
+
+class _ClientRegistry:
+    """Process-wide OpenRouter clients keyed by (api_key, base_url, timeout).
+
+    Sync and streaming calls share one ``OpenAI`` client per key. Async calls
+    share one ``httpx.AsyncClient`` per key and event loop, because httpx
+    connections are bound to the loop that opened them; entries for a loop
+    are dropped once the loop is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sync: dict[ClientKey, OpenAI] = {}
+        self._async: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[ClientKey, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._created = 0
+        self._checkouts = 0
+
+    def _http_options(self) -> dict[str, Any]:
+        pool = _load_pool_settings()
+        return {"limits": pool.limits(), "http2": pool.http2 and _http2_available()}
+
+    def _record_created(self, kind: str) -> None:
+        self._created += 1
+        logger.debug(f"Created pooled {kind} OpenRouter client")
+
+    def get_sync(self, settings: LLMSettings) -> OpenAI:
+        key = (settings.api_key, settings.base_url, settings.timeout)
+        with self._lock:
+            self._checkouts += 1
+            client = self._sync.get(key)
+            if client is None:
+                client = OpenAI(
+                    api_key=settings.api_key,
+                    base_url=settings.base_url,
+                    timeout=settings.timeout,
+                    # Newer SDKs annotate httpx2.Client but accept httpx.Client
+                    http_client=httpx.Client(  # type: ignore[arg-type]
+                        timeout=settings.timeout, **self._http_options()
+                    ),
+                )
+                self._sync[key] = client
+                self._record_created("sync")
+            return client
+
+    def get_async(self, settings: LLMSettings) -> httpx.AsyncClient:
+        key = (settings.api_key, settings.base_url, settings.timeout)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._checkouts += 1
+            clients = self._async.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    base_url=settings.base_url,
+                    timeout=settings.timeout,
+                    headers={"Authorization": f"Bearer {settings.api_key}"},
+                    **self._http_options(),
+                )
+                clients[key] = client
+                self._record_created("async")
+            return client
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "sync_clients": len(self._sync),
+                "async_clients": sum(len(c) for c in self._async.values()),
+                "created": self._created,
+                "checkouts": self._checkouts,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            sync_clients = list(self._sync.values())
+            self._sync.clear()
+            self._async.clear()
+            self._created = 0
+            self._checkouts = 0
+        for client in sync_clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Failed to close OpenRouter client: {e}")
+
+
+_registry = _ClientRegistry()
+
+
+def get_openai_client(settings: LLMSettings) -> OpenAI:
+    """Return the shared OpenAI client for these settings.
+
+    Args:
+        settings: Resolved LLM settings.
+
+    Returns:
+        Long-lived client whose connection pool is reused across calls.
+    """
+    return _registry.get_sync(settings)
+
+
+def get_async_http_client(settings: LLMSettings) -> httpx.AsyncClient:
+    """Return the shared httpx client for these settings on the running loop.
+
+    Args:
+        settings: Resolved LLM settings.
+
+    Returns:
+        Long-lived async client. Callers must not close it.
+    """
+    return _registry.get_async(settings)
+
+
+def llm_client_stats() -> dict[str, int]:
+    """Return client registry counters.
+
+    Returns:
+        Dictionary with live client counts, clients created and checkouts.
+    """
+    return _registry.stats()
+
+
+def close_llm_clients() -> None:
+    """Log pool usage and close every pooled client.
+
+    Async clients are dropped rather than closed, since closing them requires
+    the event loop that created them. Counters are reset and later calls open
+    fresh clients.
+    """
+    stats = _registry.stats()
+    if stats["checkouts"]:
+        get_logger().log_pool_stats(pool="openrouter", **stats)
+    _registry.close()
+
+
+atexit.register(close_llm_clients)
+
+
 def _log_llm_call(
     prompt: str,
     response: str,
@@ -117,37 +315,31 @@ def _log_llm_call(
     model: str,
 ) -> None:
     latency_ms = int((time.time() - start_time) * 1000) if start_time else 0
-    get_logger().log_llm_call(
+    structured_logger = get_logger()
+    structured_logger.log_llm_call(
         prompt=prompt,
         response=response,
         latency_ms=latency_ms,
         cached=cached,
         model=model,
     )
+    # Pool counters ride along with each request that reached the API, so
+    # long-running servers report them under the trace instead of at exit only
+    if not cached:
+        structured_logger.log_pool_stats(pool="openrouter", **_registry.stats())
 
 
-@circuit_breaker(threshold=5, recovery=120)
-def call_llm(prompt: str, max_retries: int = 3) -> str:
-    """Call OpenRouter synchronously with retries and caching."""
-    settings = _load_llm_settings()
-    attempts = max(1, max_retries)
-    cache_key = _build_cache_key(prompt, settings)
+def _coalesced_wait_timeout(settings: LLMSettings, attempts: int) -> float:
+    """Upper bound on how long a coalesced caller waits for the leader."""
+    return attempts * (settings.timeout + MAX_BACKOFF_SECONDS)
 
-    if _cache_enabled():
-        cached = get_cached(cache_key)
-        if cached is not None:
-            _log_llm_call(prompt, cached, 0.0, cached=True, model=settings.model)
-            return cached
 
-    client = OpenAI(
-        api_key=settings.api_key,
-        base_url=settings.base_url,
-        timeout=settings.timeout,
-    )
+def _complete(prompt: str, settings: LLMSettings, cache_key: str, attempts: int) -> str:
+    client = get_openai_client(settings)
     messages = [{"role": "user", "content": prompt}]
     retryer = Retrying(
         stop=stop_after_attempt(attempts),
-        wait=wait_exponential(multiplier=2, min=2, max=10),
+        wait=wait_exponential(multiplier=2, min=2, max=MAX_BACKOFF_SECONDS),
         retry=retry_if_exception_type(Exception)
         & retry_if_not_exception_type(AuthenticationError),
         before_sleep=before_sleep_log(logger, logging.WARNING),
@@ -192,19 +384,9 @@ def call_llm(prompt: str, max_retries: int = 3) -> str:
     return ""
 
 
-async def call_llm_async(prompt: str, max_retries: int = 3) -> str:
-    """Call OpenRouter asynchronously using httpx with retries and caching."""
-    settings = _load_llm_settings()
-    attempts = max(1, max_retries)
-    cache_key = _build_cache_key(prompt, settings)
-
-    if _cache_enabled():
-        cached = get_cached(cache_key)
-        if cached is not None:
-            _log_llm_call(prompt, cached, 0.0, cached=True, model=settings.model)
-            return cached
-
-    headers = {"Authorization": f"Bearer {settings.api_key}"}
+async def _complete_async(
+    prompt: str, settings: LLMSettings, cache_key: str, attempts: int
+) -> str:
     payload = {
         "model": settings.model,
         "messages": [{"role": "user", "content": prompt}],
@@ -214,7 +396,7 @@ async def call_llm_async(prompt: str, max_retries: int = 3) -> str:
 
     retryer = AsyncRetrying(
         stop=stop_after_attempt(attempts),
-        wait=wait_exponential(multiplier=2, min=2, max=10),
+        wait=wait_exponential(multiplier=2, min=2, max=MAX_BACKOFF_SECONDS),
         retry=retry_if_exception_type(Exception)
         & retry_if_not_exception_type(AuthenticationError),
         before_sleep=before_sleep_log(logger, logging.WARNING),
@@ -223,37 +405,31 @@ async def call_llm_async(prompt: str, max_retries: int = 3) -> str:
 
     start_time = time.time()
     try:
-        async with httpx.AsyncClient(
-            base_url=settings.base_url,
-            timeout=settings.timeout,
-            headers=headers,
-        ) as client:
-            async for attempt in retryer:
-                with attempt:
-                    response = await client.post(
-                        "/chat/completions",
-                        json=payload,
-                    )
-                    if response.status_code in {401, 403}:
-                        raise AuthenticationError(response.text)
-                    response.raise_for_status()
-                    data = response.json()
-                    content = (
-                        data.get("choices", [{}])[0]
-                        .get("message", {})
-                        .get("content")
-                        or ""
-                    )
-                    if _cache_enabled() and content:
-                        set_cached(cache_key, content)
-                    _log_llm_call(
-                        prompt,
-                        content,
-                        start_time,
-                        cached=False,
-                        model=settings.model,
-                    )
-                    return content
+        client = get_async_http_client(settings)
+        async for attempt in retryer:
+            with attempt:
+                response = await client.post(
+                    "/chat/completions",
+                    json=payload,
+                )
+                if response.status_code in {401, 403}:
+                    raise AuthenticationError(response.text)
+                response.raise_for_status()
+                data = response.json()
+                content = (
+                    data.get("choices", [{}])[0].get("message", {}).get("content") or ""
+                )
+                if _cache_enabled() and content:
+                    # The semantic cache embeds the prompt over blocking HTTP
+                    await asyncio.to_thread(set_cached, cache_key, content)
+                _log_llm_call(
+                    prompt,
+                    content,
+                    start_time,
+                    cached=False,
+                    model=settings.model,
+                )
+                return content
     except AuthenticationError as e:
         raise RuntimeError(
             "OpenRouter authentication failed. Set OPENROUTER_API_KEY.",
@@ -265,5 +441,50 @@ async def call_llm_async(prompt: str, max_retries: int = 3) -> str:
     return ""
 
 
+@circuit_breaker(threshold=5, recovery=120)
+def call_llm(prompt: str, max_retries: int = 3) -> str:
+    """Call OpenRouter synchronously with retries and caching.
+
+    Concurrent calls with the same cache key share one in-flight request.
+    """
+    settings = _load_llm_settings()
+    attempts = max(1, max_retries)
+    cache_key = _build_cache_key(prompt, settings)
+
+    if _cache_enabled():
+        cached = get_cached(cache_key)
+        if cached is not None:
+            _log_llm_call(prompt, cached, 0.0, cached=True, model=settings.model)
+            return cached
+
+    return _llm_calls.do(
+        cache_key,
+        functools.partial(_complete, prompt, settings, cache_key, attempts),
+        wait_timeout=_coalesced_wait_timeout(settings, attempts),
+    )
+
+
+async def call_llm_async(prompt: str, max_retries: int = 3) -> str:
+    """Call OpenRouter asynchronously using httpx with retries and caching.
+
+    Concurrent calls with the same cache key share one in-flight request.
+    """
+    settings = _load_llm_settings()
+    attempts = max(1, max_retries)
+    cache_key = _build_cache_key(prompt, settings)
+
+    if _cache_enabled():
+        cached = await asyncio.to_thread(get_cached, cache_key)
+        if cached is not None:
+            _log_llm_call(prompt, cached, 0.0, cached=True, model=settings.model)
+            return cached
+
+    return await _llm_calls.do_async(
+        cache_key,
+        functools.partial(_complete_async, prompt, settings, cache_key, attempts),
+        wait_timeout=_coalesced_wait_timeout(settings, attempts),
+    )
+
+
 if __name__ == "__main__":
     prompt = "What is the meaning of life?"
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
-from typing import Iterable
-
-from openai import OpenAI
+from typing import TYPE_CHECKING
 
 from src.backend.utils.cache import get_cached, set_cached
 from src.backend.utils.call_llm import (
@@ -17,7 +17,14 @@ from src.backend.utils.call_llm import (
     _cache_enabled,
     _load_llm_settings,
     _log_llm_call,
+    get_async_http_client,
+    get_openai_client,
 )
+from src.backend.utils.logger import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
 
 
 def _chunk_text(text: str, size: int = 64) -> Iterable[str]:
@@ -39,6 +46,27 @@ def _resolve_settings(model: str | None) -> LLMSettings:
     return settings
 
 
+def _log_first_token(start_time: float, model: str) -> int:
+    ttft_ms = int((time.time() - start_time) * 1000)
+    get_logger().log_first_token(model=model, ttft_ms=ttft_ms)
+    return ttft_ms
+
+
+def _parse_sse_line(line: str) -> str | None:
+    """Extract the content delta from one server-sent event line."""
+    if not line.startswith("data:"):
+        return None
+    data = line[len("data:") :].strip()
+    if not data or data == "[DONE]":
+        return None
+    chunk = json.loads(data)
+    if "error" in chunk:
+        raise RuntimeError(f"OpenRouter stream error: {chunk['error']}")
+    choices = chunk.get("choices") or [{}]
+    content: str | None = (choices[0].get("delta") or {}).get("content")
+    return content
+
+
 def call_llm_streaming(prompt: str, model: str | None = None):
     """Stream response tokens from OpenRouter for the given prompt."""
     settings = _resolve_settings(model)
@@ -51,11 +79,7 @@ def call_llm_streaming(prompt: str, model: str | None = None):
             yield from _chunk_text(cached)
             return
 
-    client = OpenAI(
-        api_key=settings.api_key,
-        base_url=settings.base_url,
-        timeout=settings.timeout,
-    )
+    client = get_openai_client(settings)
 
     kwargs = {
         "model": settings.model or DEFAULT_MODEL,
@@ -66,18 +90,95 @@ def call_llm_streaming(prompt: str, model: str | None = None):
     }
 
     start_time = time.time()
+    ttft_ms = None
     full_response = ""
     stream = client.chat.completions.create(**kwargs)
 
     for chunk in stream:
         delta = chunk.choices[0].delta.content
         if delta:
+            if ttft_ms is None:
+                ttft_ms = _log_first_token(start_time, settings.model)
             full_response += delta
             yield delta
 
     if _cache_enabled() and full_response:
         set_cached(cache_key, full_response)
-    _log_llm_call(prompt, full_response, start_time, cached=False, model=settings.model)
+    _log_llm_call(
+        prompt,
+        full_response,
+        start_time,
+        cached=False,
+        model=settings.model,
+    )
+
+
+async def call_llm_streaming_async(
+    prompt: str, model: str | None = None
+) -> AsyncIterator[str]:
+    """Stream response tokens from OpenRouter without blocking the event loop.
+
+    Uses the pooled async httpx client and OpenRouter's server-sent events.
+    Time to first token is recorded on the current trace.
+
+    Args:
+        prompt: Prompt text.
+        model: Model override, defaults to the configured model.
+
+    Yields:
+        Content deltas as they arrive.
+
+    Raises:
+        RuntimeError: If authentication fails or the stream reports an error.
+    """
+    settings = _resolve_settings(model)
+    cache_key = _build_cache_key(prompt, settings)
+
+    if _cache_enabled():
+        cached = await asyncio.to_thread(get_cached, cache_key)
+        if cached is not None:
+            _log_llm_call(prompt, cached, 0.0, cached=True, model=settings.model)
+            for chunk in _chunk_text(cached):
+                yield chunk
+            return
+
+    payload = {
+        "model": settings.model or DEFAULT_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "stream": True,
+        "temperature": settings.temperature or DEFAULT_TEMPERATURE,
+        "max_tokens": settings.max_tokens or DEFAULT_MAX_TOKENS,
+    }
+
+    client = get_async_http_client(settings)
+    start_time = time.time()
+    ttft_ms = None
+    parts: list[str] = []
+
+    async with client.stream("POST", "/chat/completions", json=payload) as response:
+        if response.status_code in {401, 403}:
+            raise RuntimeError(
+                "OpenRouter authentication failed. Set OPENROUTER_API_KEY."
+            )
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            delta = _parse_sse_line(line)
+            if delta:
+                if ttft_ms is None:
+                    ttft_ms = _log_first_token(start_time, settings.model)
+                parts.append(delta)
+                yield delta
+
+    full_response = "".join(parts)
+    if _cache_enabled() and full_response:
+        await asyncio.to_thread(set_cached, cache_key, full_response)
+    _log_llm_call(
+        prompt,
+        full_response,
+        start_time,
+        cached=False,
+        model=settings.model,
+    )
 
 
 def call_llm_with_callback(prompt: str, callback=None, model: str | None = None) -> str:
@@ -0,0 +1,332 @@
+"""Lazy catalog of the CSV tables in a data directory.
+
+Listing tables and their columns only reads file metadata and CSV headers;
+rows are loaded when a table is first asked for. The first load parses the
+CSV with ``pd.read_csv`` (so dtypes match what generated code expects) and
+writes a Parquet sidecar keyed by the file's size and mtime, so later loads,
+including those from other processes, skip CSV parsing. Loaded DataFrames are
+kept in memory until their file changes.
+
+One catalog exists per directory and is shared by the analysis nodes and the
+frontend (see :func:`get_csv_catalog`).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import ItemsView, Iterator, Mapping, ValuesView
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_DIR = Path(__file__).resolve().parents[1] / "data" / "csv_cache"
+_ENCODINGS = ("utf-8", "latin-1")
+
+
+@dataclass(frozen=True)
+class _Entry:
+    path: Path
+    signature: tuple[int, int]
+    columns: list[str] | None = None
+    frame: pd.DataFrame | None = None
+    failed: bool = False
+
+
+def _read_csv(path: Path, **kwargs) -> pd.DataFrame:
+    try:
+        return pd.read_csv(path, encoding=_ENCODINGS[0], **kwargs)
+    except UnicodeDecodeError:
+        return pd.read_csv(path, encoding=_ENCODINGS[1], **kwargs)
+
+
+class CSVCatalog:
+    """Tables of one CSV directory, materialized on first access."""
+
+    def __init__(self, csv_dir: str | Path, sidecar_dir: Path | None = None) -> None:
+        """Initialize the catalog. Nothing is read until tables are listed.
+
+        Args:
+            csv_dir: Directory holding ``*.csv`` files.
+            sidecar_dir: Root directory for Parquet sidecars; defaults to
+                ``SIDECAR_DIR``.
+        """
+        self.csv_dir = Path(csv_dir).resolve()
+        dir_key = hashlib.sha256(str(self.csv_dir).encode()).hexdigest()[:12]
+        self.sidecar_dir = (sidecar_dir or SIDECAR_DIR) / dir_key
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+
+    def refresh(self) -> list[str]:
+        """Rescan the directory, dropping tables whose file changed or vanished.
+
+        Returns:
+            Table names, sorted.
+        """
+        found: dict[str, tuple[Path, tuple[int, int]]] = {}
+        if self.csv_dir.is_dir():
+            for filename in os.listdir(self.csv_dir):
+                if not filename.endswith(".csv"):
+                    continue
+                path = self.csv_dir / filename
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                found[filename.removesuffix(".csv")] = (
+                    path,
+                    (stat.st_size, stat.st_mtime_ns),
+                )
+
+        with self._lock:
+            self._entries = {
+                name: entry
+                if (entry := self._entries.get(name)) and entry.signature == signature
+                else _Entry(path, signature)
+                for name, (path, signature) in found.items()
+            }
+            return sorted(self._entries)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Forget loaded data for one table, or for all tables.
+
+        Args:
+            name: Table name, or None for every table.
+        """
+        with self._lock:
+            if name is None:
+                self._entries = {}
+            else:
+                self._entries.pop(name, None)
+
+    def tables(self) -> list[str]:
+        """List table names without loading any rows."""
+        with self._lock:
+            if self._entries:
+                return sorted(self._entries)
+        return self.refresh()
+
+    def failed(self, name: str) -> bool:
+        """Whether a table's CSV could not be parsed."""
+        entry = self._entries.get(name)
+        return entry is not None and entry.failed
+
+    def signature(self, name: str) -> tuple[int, int]:
+        """Size and modification time (ns) of a table's CSV when last scanned.
+
+        Raises:
+            KeyError: If the table is not in the catalog or its CSV cannot be
+                parsed.
+        """
+        with self._lock:
+            return self._entry(name).signature
+
+    def _entry(self, name: str) -> _Entry:
+        if not self._entries:
+            self.refresh()
+        entry = self._entries.get(name)
+        if entry is None or entry.failed:
+            raise KeyError(name)
+        return entry
+
+    def columns(self, name: str) -> list[str]:
+        """Column names of a table, read from the CSV header only.
+
+        Args:
+            name: Table name.
+
+        Returns:
+            Column names in file order.
+
+        Raises:
+            KeyError: If the table is not in the catalog or its CSV cannot be
+                parsed.
+        """
+        with self._lock:
+            entry = self._entry(name)
+            if entry.frame is not None:
+                return list(entry.frame.columns)
+            if entry.columns is None:
+                header = self._load(name, entry, lambda: _read_csv(entry.path, nrows=0))
+                entry = self._entries[name] = _Entry(
+                    entry.path, entry.signature, columns=list(header.columns)
+                )
+            return list(entry.columns)
+
+    def _load(self, name: str, entry: _Entry, read) -> pd.DataFrame:
+        # ParserError, EmptyDataError and UnicodeDecodeError are ValueErrors
+        try:
+            return read()
+        except (ValueError, OSError) as exc:
+            logger.warning(f"Could not load {entry.path.name}: {exc}")
+            self._entries[name] = _Entry(entry.path, entry.signature, failed=True)
+            raise KeyError(name) from exc
+
+    def _sidecar_path(self, name: str, signature: tuple[int, int]) -> Path:
+        key = hashlib.sha256(f"{signature[0]}:{signature[1]}".encode()).hexdigest()
+        return self.sidecar_dir / f"{name}.{key[:16]}.parquet"
+
+    def _write_sidecar(self, name: str, df: pd.DataFrame, sidecar: Path) -> None:
+        tmp_path = sidecar.with_name(sidecar.name + ".tmp")
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, sidecar)
+        except (OSError, ValueError, TypeError, pa.ArrowException) as e:
+            # Columns Arrow cannot hold (e.g. mixed types) stay CSV-only
+            tmp_path.unlink(missing_ok=True)
+            logger.debug(f"No Parquet sidecar for {sidecar.name}: {e}")
+            return
+        for stale in sidecar.parent.glob(f"{name}.{'?' * 16}.parquet"):
+            if stale != sidecar:
+                stale.unlink(missing_ok=True)
+
+    def _materialize(self, name: str, entry: _Entry) -> pd.DataFrame:
+        sidecar = self._sidecar_path(name, entry.signature)
+        if sidecar.exists():
+            try:
+                return pd.read_parquet(sidecar)
+            except (OSError, ValueError, pa.ArrowException) as e:
+                logger.warning(f"Ignoring unreadable sidecar {sidecar.name}: {e}")
+        df = _read_csv(entry.path)
+        self._write_sidecar(name, df, sidecar)
+        return df
+
+    def table(self, name: str) -> pd.DataFrame:
+        """Load a table, from memory, its Parquet sidecar or the CSV.
+
+        The same DataFrame object is returned until the file changes.
+
+        Args:
+            name: Table name.
+
+        Returns:
+            Table data.
+
+        Raises:
+            KeyError: If the table is not in the catalog or its CSV cannot be
+                parsed.
+        """
+        with self._lock:
+            entry = self._entry(name)
+            if entry.frame is None:
+                frame = self._load(name, entry, lambda: self._materialize(name, entry))
+                entry = self._entries[name] = _Entry(
+                    entry.path, entry.signature, list(frame.columns), frame
+                )
+                logger.debug(f"Loaded CSV table {name} ({len(frame)} rows)")
+            return entry.frame
+
+    def frames(self) -> LazyFrames:
+        """Mapping view of the catalog that loads each table on first access."""
+        return LazyFrames(self, self.tables())
+
+
+class LazyFrames(Mapping[str, pd.DataFrame]):
+    """Read-only ``{table: DataFrame}`` mapping backed by a :class:`CSVCatalog`.
+
+    Iterating over names, ``len`` and :meth:`columns` load no rows; indexing
+    (and ``items()``/``values()``) loads the tables it touches. Tables whose
+    CSV fails to parse drop out of the view, as they did when every file was
+    read up front.
+    """
+
+    def __init__(self, catalog: CSVCatalog, names: list[str]) -> None:
+        """Initialize the view.
+
+        Args:
+            catalog: Catalog that loads the tables.
+            names: Table names in this view.
+        """
+        self.catalog = catalog
+        self._names = list(names)
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        """Load a table through the catalog."""
+        if name not in self._names:
+            raise KeyError(name)
+        return self.catalog.table(name)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over table names, skipping tables that failed to parse."""
+        return (name for name in self._names if not self.catalog.failed(name))
+
+    def __contains__(self, name: object) -> bool:
+        """Check a table name without loading the table."""
+        return name in self._names and not self.catalog.failed(str(name))
+
+    def __len__(self) -> int:
+        """Count the tables in the view."""
+        return sum(1 for _ in self)
+
+    def items(self) -> ItemsView[str, pd.DataFrame]:
+        """Pairs of table name and DataFrame, loading each table in turn."""
+        return _SkippingItemsView(self)
+
+    def values(self) -> ValuesView[pd.DataFrame]:
+        """DataFrames of every table, loading each in turn."""
+        return _SkippingValuesView(self)
+
+    def __repr__(self) -> str:
+        """Show table names only, never data."""
+        return f"LazyFrames({self._names!r})"
+
+    def columns(self, name: str) -> list[str]:
+        """Column names of a table without loading its rows."""
+        if name not in self._names:
+            raise KeyError(name)
+        return self.catalog.columns(name)
+
+    def signatures(self) -> dict[str, tuple[int, int]]:
+        """File size and mtime of every table in the view, loading no rows."""
+        signatures = {}
+        for name in self:
+            with contextlib.suppress(KeyError):
+                signatures[name] = self.catalog.signature(name)
+        return signatures
+
+
+class _SkippingItemsView(ItemsView[str, pd.DataFrame]):
+    _mapping: LazyFrames
+
+    def __iter__(self) -> Iterator[tuple[str, pd.DataFrame]]:
+        for name in self._mapping:
+            try:
+                yield name, self._mapping[name]
+            except KeyError:
+                continue
+
+
+class _SkippingValuesView(ValuesView[pd.DataFrame]):
+    _mapping: LazyFrames
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for _, df in _SkippingItemsView(self._mapping):
+            yield df
+
+
+@lru_cache(maxsize=8)
+def _catalog_for(csv_dir: Path) -> CSVCatalog:
+    return CSVCatalog(csv_dir)
+
+
+def get_csv_catalog(csv_dir: str | Path) -> CSVCatalog:
+    """Get the process-wide catalog for a CSV directory.
+
+    Args:
+        csv_dir: Directory holding ``*.csv`` files; relative paths resolve
+            against the working directory.
+
+    Returns:
+        Catalog shared by every caller using the same directory.
+    """
+    return _catalog_for(Path(csv_dir).resolve())
@@ -1,10 +1,92 @@
 from __future__ import annotations
 
+import contextlib
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+from backend.utils.csv_catalog import LazyFrames
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+
+class MergedFrames(LazyFrames):
+    """Merged ``{table: DataFrame}`` view that keeps CSV-only tables lazy.
+
+    API and merged tables are held in :attr:`tables`. A CSV-only table stays in
+    the CSV catalog until it is first indexed; it is then copied once and
+    tagged with ``_source == "csv"``, like an eagerly merged table.
+    """
+
+    def __init__(
+        self,
+        csv_frames: LazyFrames,
+        tables: dict[str, pd.DataFrame],
+        *,
+        tag_csv: bool = True,
+    ) -> None:
+        """Initialize the view.
+
+        Args:
+            csv_frames: Untagged CSV tables from the catalog.
+            tables: API and merged tables, already tagged with ``_source``.
+            tag_csv: Whether CSV-only tables get a ``_source`` column; when
+                False they are the catalog's own DataFrames.
+        """
+        super().__init__(csv_frames.catalog, list(csv_frames))
+        self.csv_frames = csv_frames
+        self.tables = tables
+        self.tag_csv = tag_csv
+        self._tagged: dict[str, pd.DataFrame] = {}
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        """Return a merged table, tagging a CSV-only table on first access."""
+        if name in self.tables:
+            return self.tables[name]
+        if not self.tag_csv:
+            return super().__getitem__(name)
+        if name not in self._tagged:
+            df = super().__getitem__(name).copy()
+            df["_source"] = "csv"
+            self._tagged[name] = df
+        return self._tagged[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over CSV table names, then API-only table names."""
+        csv_names = list(super().__iter__())
+        yield from csv_names
+        yield from (name for name in self.tables if name not in csv_names)
+
+    def __contains__(self, name: object) -> bool:
+        """Check a table name without loading the table."""
+        return name in self.tables or super().__contains__(name)
+
+    def __repr__(self) -> str:
+        """Show table names only, never data."""
+        return f"MergedFrames({list(self)!r})"
+
+    def columns(self, name: str) -> list[str]:
+        """Column names of a table; CSV-only tables are not loaded."""
+        if name in self.tables:
+            return list(self.tables[name].columns)
+        columns = super().columns(name)
+        return [*columns, "_source"] if self.tag_csv else columns
+
+    def signatures(self) -> dict[str, tuple[int, int]]:
+        """File size and mtime of the CSV-only tables, loading no rows."""
+        return {
+            name: signature
+            for name, signature in super().signatures().items()
+            if name not in self.tables
+        }
+
+    def unmerged(self) -> MergedFrames:
+        """The same tables, with CSV-only ones served untagged from the catalog."""
+        return MergedFrames(self.csv_frames, self.tables, tag_csv=False)
+
 
 class DataSourceManager:
     """Coordinates CSV + NBA API dataframes and resolves conflicts."""
@@ -94,26 +176,37 @@ class DataSourceManager:
 
     def merge_data_sources(
         self,
-        csv_data: dict[str, pd.DataFrame],
-        api_data: dict[str, pd.DataFrame],
-    ) -> tuple[dict[str, pd.DataFrame], list[dict[str, Any]], dict[str, str]]:
-        """Merge CSV + API dataframes with source tracking and discrepancies."""
+        csv_data: Mapping[str, pd.DataFrame],
+        api_data: Mapping[str, pd.DataFrame],
+    ) -> tuple[Mapping[str, pd.DataFrame], list[dict[str, Any]], dict[str, str]]:
+        """Merge CSV + API dataframes with source tracking and discrepancies.
+
+        Lazily loaded CSV tables (:class:`LazyFrames`) stay lazy: only those an
+        API table is merged into are loaded, and the result is a
+        :class:`MergedFrames` view.
+        """
         merged: dict[str, pd.DataFrame] = {}
         discrepancies: list[dict[str, Any]] = []
         sources: dict[str, str] = {}
 
         csv_data = csv_data or {}
         api_data = api_data or {}
+        lazy_csv = csv_data if isinstance(csv_data, LazyFrames) else None
 
-        for name, df in csv_data.items():
-            merged[name] = df.copy()
-            merged[name]["_source"] = "csv"
+        for name in csv_data:
             sources[name] = "csv"
+            if lazy_csv is None:
+                merged[name] = csv_data[name].copy()
+                merged[name]["_source"] = "csv"
 
         for name, df in api_data.items():
-            if name in merged:
+            csv_df = merged.get(name)
+            if csv_df is None and lazy_csv is not None and name in lazy_csv:
+                with contextlib.suppress(KeyError):
+                    csv_df = lazy_csv[name]
+            if csv_df is not None:
                 merged_df, table_discrepancies = self._merge_table(
-                    merged[name],
+                    csv_df,
                     df,
                     name,
                 )
@@ -125,6 +218,8 @@ class DataSourceManager:
                 merged[name]["_source"] = "api"
                 sources[name] = "api"
 
+        if lazy_csv is not None:
+            return MergedFrames(lazy_csv, merged), discrepancies, sources
         return merged, discrepancies, sources
 
     def _merge_table(
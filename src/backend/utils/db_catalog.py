@@ -0,0 +1,148 @@
+"""Schema catalog snapshot for a DuckDB database.
+
+The catalog is read with a single bulk query over ``duckdb_tables()``,
+``duckdb_views()`` and ``duckdb_columns()``. Row counts come from DuckDB's
+``estimated_size`` statistic rather than ``COUNT(*)`` scans. A snapshot is
+tagged with a version derived from the database and WAL file metadata, so
+callers can tell when it is stale.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import duckdb
+
+
+CATALOG_QUERY = """
+    WITH relations AS (
+        SELECT table_name, estimated_size AS estimated_rows, FALSE AS is_view
+        FROM duckdb_tables()
+        WHERE database_name = current_database()
+          AND schema_name = 'main'
+          AND NOT internal
+          AND NOT temporary
+        UNION ALL
+        SELECT view_name AS table_name, NULL AS estimated_rows, TRUE AS is_view
+        FROM duckdb_views()
+        WHERE database_name = current_database()
+          AND schema_name = 'main'
+          AND NOT internal
+          AND NOT temporary
+    )
+    SELECT
+        r.table_name,
+        r.estimated_rows,
+        r.is_view,
+        c.column_name,
+        c.data_type,
+        c.is_nullable
+    FROM relations r
+    LEFT JOIN duckdb_columns() c
+        ON c.database_name = current_database()
+        AND c.schema_name = 'main'
+        AND c.table_name = r.table_name
+    ORDER BY
+        CASE
+            WHEN r.table_name LIKE '%_gold' THEN 1
+            WHEN r.table_name LIKE '%_silver' THEN 2
+            WHEN r.table_name LIKE '%_raw' THEN 4
+            ELSE 3
+        END,
+        r.table_name,
+        c.column_index
+"""
+
+
+@dataclass(frozen=True)
+class ColumnInfo:
+    """A column in the catalog."""
+
+    name: str
+    data_type: str
+    is_nullable: bool = True
+
+
+@dataclass
+class TableInfo:
+    """A table or view in the catalog."""
+
+    name: str
+    columns: list[ColumnInfo] = field(default_factory=list)
+    estimated_rows: int | None = None
+    is_view: bool = False
+
+    @property
+    def column_names(self) -> list[str]:
+        """Column names in ordinal order."""
+        return [column.name for column in self.columns]
+
+
+@dataclass
+class DatabaseCatalog:
+    """Snapshot of every user table and view in the database."""
+
+    version: str
+    tables: dict[str, TableInfo] = field(default_factory=dict)
+
+    def get(self, table_name: str) -> TableInfo | None:
+        """Look up a table by exact name."""
+        return self.tables.get(table_name)
+
+    @property
+    def table_names(self) -> list[str]:
+        """Table names in catalog order (gold, silver, other, raw)."""
+        return list(self.tables)
+
+
+def database_file_version(db_path: Path) -> str:
+    """Describe the on-disk state of a database file and its WAL.
+
+    Args:
+        db_path: Path to the DuckDB database file.
+
+    Returns:
+        Version string that changes whenever either file is rewritten.
+    """
+    parts = []
+    for path in (db_path, db_path.with_name(db_path.name + ".wal")):
+        try:
+            stat = path.stat()
+        except OSError:
+            parts.append("-")
+            continue
+        parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+    return "/".join(parts)
+
+
+def load_catalog(conn: duckdb.DuckDBPyConnection, version: str) -> DatabaseCatalog:
+    """Read the full catalog in one query.
+
+    Args:
+        conn: Open DuckDB connection.
+        version: Version tag to attach to the snapshot.
+
+    Returns:
+        Catalog snapshot.
+    """
+    catalog = DatabaseCatalog(version=version)
+    rows = conn.execute(CATALOG_QUERY).fetchall()
+    for table_name, estimated_rows, is_view, column, data_type, nullable in rows:
+        table = catalog.tables.get(table_name)
+        if table is None:
+            table = TableInfo(
+                name=table_name,
+                estimated_rows=None if estimated_rows is None else int(estimated_rows),
+                is_view=bool(is_view),
+            )
+            catalog.tables[table_name] = table
+        if column is not None:
+            table.columns.append(
+                ColumnInfo(name=column, data_type=data_type, is_nullable=bool(nullable))
+            )
+    return catalog
@@ -11,27 +11,56 @@ Parameterized queries are used wherever possible to prevent SQL injection.
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
 import os
 import re
+import threading
 import time
 from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import duckdb
 
+from src.backend.config import DatabaseConfig
 from src.backend.models import TableMeta, ValidationResult
+from src.backend.utils.db_catalog import (
+    DatabaseCatalog,
+    TableInfo,
+    database_file_version,
+    load_catalog,
+)
+from src.backend.utils.duckdb_pool import DuckDBConnectionPool
 from src.backend.utils.logger import get_logger
-from src.backend.utils.resilience import circuit_breaker, timeout
+from src.backend.utils.query_preview import (
+    DEFAULT_PREVIEW_BYTES,
+    DEFAULT_PREVIEW_ROWS,
+    QueryPreview,
+    read_preview,
+    summarize,
+)
+from src.backend.utils.resilience import circuit_breaker, run_with_timeout
+from src.backend.utils.result_cache import (
+    DEFAULT_RESULT_CACHE_BYTES,
+    ResultCache,
+    result_cache_key,
+)
 
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "nba.duckdb"
 
+T = TypeVar("T")
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
+
     import pandas as pd
+    import pyarrow as pa
 
 
 # ============================================================================
@@ -311,6 +340,54 @@ def _validate_column_name(
     return column_name
 
 
+# ============================================================================
+# QUERY CANCELLATION
+# ============================================================================
+
+
+class _RunningQuery:
+    """Tracks the cursor executing a query so it can be interrupted.
+
+    The cursor is only registered while the query runs, so an interrupt that
+    arrives late cannot hit a later query that reuses the same pooled cursor.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._conn: duckdb.DuckDBPyConnection | None = None
+        self.cancelled = False
+
+    def attach(self, conn: duckdb.DuckDBPyConnection) -> bool:
+        """Register the cursor. Returns False if the query was already cancelled."""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self._conn = conn
+            return True
+
+    def detach(self) -> None:
+        """Unregister the cursor once the query has finished."""
+        with self._lock:
+            self._conn = None
+
+    def interrupt(self) -> None:
+        """Cancel the query, interrupting it if it is running."""
+        with self._lock:
+            self.cancelled = True
+            if self._conn is not None:
+                self._conn.interrupt()
+
+
+def _to_arrow_table(result: Any) -> pa.Table:
+    """Materialize ``DuckDBPyConnection.arrow()`` output as a table.
+
+    Newer DuckDB releases return a record batch reader instead of a table.
+    """
+    if hasattr(result, "read_all"):
+        return result.read_all()
+    return result
+
+
 # ============================================================================
 # DUCKDB CLIENT CLASS
 # ============================================================================
@@ -321,46 +398,153 @@ class DuckDBClient:
 
     Provides read-only database access with timeout protection,
     circuit breaker for repeated failures, and comprehensive SQL injection prevention.
+    Queries run on pooled cursors over one shared database instance, so
+    concurrent callers execute in parallel.
     """
 
     def __init__(
         self,
         db_path: str | Path | None = None,
-        query_timeout: int = 30,
+        query_timeout: float = 30,
+        *,
+        config: DatabaseConfig | None = None,
+        result_cache_bytes: int = DEFAULT_RESULT_CACHE_BYTES,
     ) -> None:
         """Initialize a DuckDB client.
 
         Args:
             db_path: Path to DuckDB database file.
             query_timeout: Query timeout in seconds.
+            config: Pool size, DuckDB worker threads and memory limit; the
+                remaining fields are ignored. Defaults to ``DatabaseConfig()``.
+            result_cache_bytes: Size bound of the query result cache (0 disables).
         """
+        config = config or DatabaseConfig()
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self.query_timeout = query_timeout
-        self._connection: duckdb.DuckDBPyConnection | None = None
+        self._pool = DuckDBConnectionPool(
+            self.db_path,
+            max_cursors=config.pool_size,
+            threads=config.threads,
+            memory_limit=config.memory_limit,
+        )
         self._structured_logger = get_logger()
-        # Cache of valid table names for validation
-        self._valid_tables: set[str] | None = None
-
-    def _get_connection(self) -> duckdb.DuckDBPyConnection:
-        """Get or create a database connection.
+        # Query results, invalidated when the database file changes
+        self._result_cache = ResultCache(result_cache_bytes)
+        # Schema catalog snapshot, invalidated when the database file changes
+        self._catalog: DatabaseCatalog | None = None
+        self._table_metas: list[TableMeta] = []
+        self._ddl_cache: dict[str, str] = {}
+        self._ddl_cache_version: str | None = None
+        self._catalog_lock = threading.Lock()
+
+    def _cursor(self) -> AbstractContextManager[duckdb.DuckDBPyConnection]:
+        """Check out a pooled cursor.
 
         Returns:
-            DuckDB connection.
+            Context manager yielding a DuckDB cursor.
 
         Raises:
             FileNotFoundError: If database file doesn't exist.
         """
-        if self._connection is None:
-            if not self.db_path.exists():
-                raise FileNotFoundError(f"Database not found: {self.db_path}")
-            self._connection = duckdb.connect(str(self.db_path), read_only=True)
-        return self._connection
+        return self._pool.cursor()
+
+    def pool_stats(self) -> dict[str, int]:
+        """Get connection pool usage counters.
+
+        Returns:
+            Dictionary with cursor counts, checkouts and waits.
+        """
+        return self._pool.stats()
+
+    def result_cache_stats(self) -> dict[str, int]:
+        """Get query result cache counters.
+
+        Returns:
+            Dictionary with entries, bytes used, hits, misses and evictions.
+        """
+        return self._result_cache.stats()
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """Close all pooled cursors and the database instance."""
+        self._close_pool(self._pool)
+
+    def _close_pool(self, pool: DuckDBConnectionPool) -> None:
+        """Log the usage counters of ``pool`` and close it."""
+        stats = pool.stats()
+        if stats["checkouts"]:
+            self._structured_logger.log_pool_stats(pool=self.db_path.name, **stats)
+        pool.close()
+
+    def _replace_pool(self) -> None:
+        """Swap in a fresh pool and drain the old one in a background thread.
+
+        Queries still running on the old pool finish on the old snapshot. The
+        new pool opens its instance once the old one is closed. Caller must
+        hold the catalog lock.
+        """
+        old_pool = self._pool
+        self._pool = old_pool.replacement()
+        threading.Thread(
+            target=self._close_pool,
+            args=(old_pool,),
+            name="duckdb-pool-drain",
+            daemon=True,
+        ).start()
+
+    def get_catalog(self) -> DatabaseCatalog:
+        """Get the cached schema catalog, reloading it if the database changed.
+
+        The catalog is keyed by the database and WAL file metadata. When either
+        file changes, a fresh connection pool replaces the current one so the
+        new snapshot reflects the file on disk; the old pool is drained in the
+        background rather than under the catalog lock.
+
+        Returns:
+            Catalog snapshot of all tables and views.
+        """
+        version = database_file_version(self.db_path)
+        with self._catalog_lock:
+            if self._catalog is not None and self._catalog.version == version:
+                return self._catalog
+            if self._catalog is not None:
+                logger.info("Database file changed; reloading schema catalog")
+                self._replace_pool()
+            self._load_catalog(version)
+            return self._catalog
+
+    def refresh_catalog(self) -> DatabaseCatalog:
+        """Force a reload of the schema catalog.
+
+        Returns:
+            Fresh catalog snapshot.
+        """
+        with self._catalog_lock:
+            self._replace_pool()
+            self._load_catalog(database_file_version(self.db_path))
+            return self._catalog
+
+    def _load_catalog(self, version: str) -> None:
+        """Read the catalog in one query. Caller must hold the catalog lock."""
+        start_time = time.time()
+        with self._cursor() as conn:
+            catalog = load_catalog(conn, version)
+        self._table_metas = [
+            TableMeta(
+                name=table.name,
+                description=self._generate_table_description(
+                    table.name, table.column_names
+                ),
+                row_count=table.estimated_rows,
+                columns=table.column_names,
+            )
+            for table in catalog.tables.values()
+        ]
+        self._catalog = catalog
+        logger.debug(
+            f"Loaded catalog with {len(catalog.tables)} tables "
+            f"in {int((time.time() - start_time) * 1000)}ms"
+        )
 
     def _get_valid_tables(self) -> set[str]:
         """Get the set of valid table names from the database.
@@ -368,17 +552,28 @@ class DuckDBClient:
         Returns:
             Set of valid table names.
         """
-        if self._valid_tables is None:
-            conn = self._get_connection()
-            result = conn.execute("""
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'main'
-            """).fetchdf()
-            self._valid_tables = (
-                set(result["table_name"].tolist()) if not result.empty else set()
+        return set(self.get_catalog().tables)
+
+    def _validate_table(self, table_name: str) -> str:
+        """Validate a table name against the cached catalog.
+
+        Args:
+            table_name: The table name to validate.
+
+        Returns:
+            The validated table name.
+
+        Raises:
+            ValueError: If the table name is not found in the database.
+        """
+        _is_valid_identifier(table_name)
+        valid_tables = self._get_valid_tables()
+        if table_name not in valid_tables:
+            raise ValueError(
+                f"Table '{table_name}' not found in database. "
+                f"Valid tables: {', '.join(sorted(valid_tables))}"
             )
-        return self._valid_tables
+        return table_name
 
     def _is_valid_table(self, table_name: str) -> bool:
         """Check if a table name is valid in the database.
@@ -395,59 +590,14 @@ class DuckDBClient:
     def get_all_tables(self) -> list[TableMeta]:
         """Get all tables in the database with metadata.
 
+        Row counts are DuckDB's ``estimated_size`` statistics (None for
+        views), read from the cached catalog instead of scanning each table.
+
         Returns:
             List of TableMeta objects with table names and descriptions.
         """
-        conn = self._get_connection()
-
-        tables_query = """
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'main'
-            AND table_type IN ('BASE TABLE', 'VIEW')
-            ORDER BY 
-                CASE 
-                    WHEN table_name LIKE '%_gold' THEN 1
-                    WHEN table_name LIKE '%_silver' THEN 2
-                    WHEN table_name LIKE '%_raw' THEN 4
-                    ELSE 3
-                END,
-                table_name
-        """
-        tables_df = conn.execute(tables_query).fetchdf()
-
-        result = []
-        for table_name in tables_df["table_name"]:
-            # Validate and quote table name
-            table_identifier = _quote_identifier(table_name)
-
-            # Build COUNT query safely
-            count_query = f"SELECT COUNT(*) as cnt FROM {table_identifier}"
-            count_result = conn.execute(count_query).fetchone()
-            row_count = count_result[0] if count_result else 0
-
-            # Parameterized query for columns
-            columns_query = """
-                SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = ?
-                    ORDER BY ordinal_position
-            """
-            columns_df = conn.execute(columns_query, [table_name]).fetchdf()
-            columns = columns_df["column_name"].tolist()
-
-            description = self._generate_table_description(table_name, columns)
-
-            result.append(
-                TableMeta(
-                    name=table_name,
-                    description=description,
-                    row_count=row_count,
-                    columns=columns,
-                )
-            )
-
-        return result
+        self.get_catalog()
+        return [meta.model_copy() for meta in self._table_metas]
 
     def _generate_table_description(self, table_name: str, columns: list[str]) -> str:
         """Generate a description for a table based on its name and columns.
@@ -510,6 +660,9 @@ class DuckDBClient:
     def get_table_schema(self, tables: list[str]) -> str:
         """Get CREATE TABLE statements for specified tables.
 
+        Columns and row estimates come from the cached catalog, and rendered
+        DDL is memoized per table until the catalog version changes.
+
         Args:
             tables: List of table names.
 
@@ -519,55 +672,67 @@ class DuckDBClient:
         Raises:
             ValueError: If any table name is invalid.
         """
-        conn = self._get_connection()
+        catalog = self.get_catalog()
         ddl_parts = []
 
         for table_name in tables:
             # Validate table name against database
-            _validate_table_name(table_name, conn)
+            self._validate_table(table_name)
 
-            table_identifier = _quote_identifier(table_name)
+            with self._catalog_lock:
+                if self._ddl_cache_version != catalog.version:
+                    self._ddl_cache = {}
+                    self._ddl_cache_version = catalog.version
+                ddl = self._ddl_cache.get(table_name)
+                if ddl is None:
+                    table = catalog.get(table_name)
+                    ddl = self._render_table_ddl(table) if table else ""
+                    self._ddl_cache[table_name] = ddl
 
-            # Parameterized query for column information
-            columns_query = """
-                    SELECT column_name, data_type, is_nullable
-                        FROM information_schema.columns
-                        WHERE table_name = ?
-                        ORDER BY ordinal_position
-                """
-            columns_df = conn.execute(columns_query, [table_name]).fetchdf()
-
-            if columns_df.empty:
-                continue
-
-            column_defs = []
-            for _, row in columns_df.iterrows():
-                # Validate and quote column name
-                column_identifier = _quote_identifier(row["column_name"])
-                nullable = "" if row["is_nullable"] == "YES" else " NOT NULL"
-                column_defs.append(
-                    f"    {column_identifier} {row['data_type']}{nullable}"
-                )
-
-            ddl = f"CREATE TABLE {table_identifier} (\n"
-            ddl += ",\n".join(column_defs)
-            ddl += "\n);"
-
-            # Build COUNT query safely
-            count_query = f"SELECT COUNT(*) as cnt FROM {table_identifier}"
-            count_result = conn.execute(count_query).fetchone()
-            row_count = count_result[0] if count_result else 0
-            ddl += f"\n-- {row_count:,} rows"
-
-            ddl_parts.append(ddl)
+            if ddl:
+                ddl_parts.append(ddl)
 
         return "\n\n".join(ddl_parts)
 
+    @staticmethod
+    def _render_table_ddl(table: TableInfo) -> str:
+        """Render a CREATE TABLE statement for a catalog table.
+
+        Args:
+            table: Catalog entry for the table.
+
+        Returns:
+            DDL string, or an empty string if the table has no columns.
+        """
+        if not table.columns:
+            return ""
+
+        column_defs = []
+        for column in table.columns:
+            # Validate and quote column name
+            column_identifier = _quote_identifier(column.name)
+            nullable = "" if column.is_nullable else " NOT NULL"
+            column_defs.append(f"    {column_identifier} {column.data_type}{nullable}")
+
+        ddl = f"CREATE TABLE {_quote_identifier(table.name)} (\n"
+        ddl += ",\n".join(column_defs)
+        ddl += "\n);"
+        if table.estimated_rows is not None:
+            ddl += f"\n-- {table.estimated_rows:,} rows"
+        return ddl
+
     @circuit_breaker(threshold=3, recovery=60)
-    @timeout(seconds=30)
     def execute_query(self, sql: str, params: list[Any] | None = None) -> pd.DataFrame:
         """Execute a read-only SQL query with timeout protection.
 
+        The query runs on a pooled cursor. When it exceeds ``query_timeout``,
+        the cursor is interrupted so DuckDB stops the work instead of letting
+        it run on in the background.
+
+        Results are cached as Arrow tables keyed by the canonical SQL, the
+        parameters and the database file version, so repeated queries skip
+        execution until the populate pipeline rewrites the database.
+
         Args:
             sql: SQL query to execute.
             params: Optional parameter list for parameterized queries.
@@ -583,33 +748,199 @@ class DuckDBClient:
         # Check for SQL injection patterns
         _check_for_sql_injection(sql)
 
-        conn = self._get_connection()
         start_time = time.time()
-
         try:
-            if params:
-                result = conn.execute(sql, params).fetchdf()
-            else:
-                result = conn.execute(sql).fetchdf()
+            table, cached = self._run_cached(
+                sql,
+                params,
+                "table",
+                functools.partial(self._fetch_table, sql, params),
+                name="execute_query",
+            )
+            result = self._arrow_to_df(table)
             latency_ms = int((time.time() - start_time) * 1000)
 
             self._structured_logger.log_sql_execution(
                 sql=sql,
                 row_count=len(result),
                 latency_ms=latency_ms,
+                cached=cached if self._result_cache.enabled else None,
             )
 
             return result
 
         except Exception as e:
+            self._log_sql_error(sql, start_time, e)
+            raise
+
+    @circuit_breaker(threshold=3, recovery=60)
+    def execute_preview(
+        self,
+        sql: str,
+        params: list[Any] | None = None,
+        max_rows: int = DEFAULT_PREVIEW_ROWS,
+        max_bytes: int = DEFAULT_PREVIEW_BYTES,
+    ) -> QueryPreview:
+        """Execute a read-only query, keeping only a capped Arrow preview.
+
+        Rows are streamed from a record-batch reader and reading stops at
+        ``max_rows`` or ``max_bytes``, so an unbounded query cannot pull the
+        whole result into memory. Row counts and column statistics for the
+        full result are computed in DuckDB with ``SUMMARIZE``. The preview is
+        converted to pandas only when ``QueryPreview.to_pandas()`` is called.
+
+        Args:
+            sql: SQL query to execute.
+            params: Optional parameter list for parameterized queries.
+            max_rows: Maximum rows to keep in the preview.
+            max_bytes: Maximum Arrow bytes to keep in the preview.
+
+        Returns:
+            Preview with full-result statistics.
+
+        Raises:
+            TimeoutError: If query exceeds timeout.
+            duckdb.Error: If query fails.
+            ValueError: If SQL injection patterns are detected.
+        """
+        _check_for_sql_injection(sql)
+
+        start_time = time.time()
+        try:
+            preview, cached = self._run_cached(
+                sql,
+                params,
+                f"preview:{max_rows}:{max_bytes}",
+                functools.partial(
+                    self._fetch_preview, sql, params, max_rows, max_bytes
+                ),
+                name="execute_preview",
+            )
+            # Each caller gets its own pandas conversion of a cached preview
+            preview = dataclasses.replace(preview, converter=self._arrow_to_df)
             latency_ms = int((time.time() - start_time) * 1000)
+
             self._structured_logger.log_sql_execution(
                 sql=sql,
-                row_count=0,
+                row_count=preview.total_rows or preview.preview_rows,
                 latency_ms=latency_ms,
-                error=str(e),
+                cached=cached if self._result_cache.enabled else None,
             )
+
+            return preview
+
+        except Exception as e:
+            self._log_sql_error(sql, start_time, e)
+            raise
+
+    def _run_cached(
+        self,
+        sql: str,
+        params: list[Any] | None,
+        variant: str,
+        fetch: Callable[[duckdb.DuckDBPyConnection], T],
+        name: str,
+    ) -> tuple[T, bool]:
+        """Serve a result from the result cache or run ``fetch`` to produce it.
+
+        ``fetch`` runs on a pooled cursor under the query timeout; on timeout
+        the cursor is interrupted.
+
+        Returns:
+            The result and whether it came from the cache.
+        """
+        version = database_file_version(self.db_path)
+        cache_key = None
+        if self._result_cache.enabled:
+            cache_key = result_cache_key(sql, params, version, variant=variant)
+            cached = self._result_cache.get(cache_key, version)
+            if cached is not None:
+                # The variant in the key ties the entry to this fetch's type
+                return cast("T", cached), True
+
+        self._reopen_if_stale(version)
+        running = _RunningQuery()
+        result = run_with_timeout(
+            functools.partial(self._on_cursor, running, fetch),
+            self.query_timeout,
+            on_timeout=running.interrupt,
+            name=name,
+        )
+        if cache_key is not None:
+            self._result_cache.put(cache_key, result, version)
+        return result, False
+
+    def _on_cursor(
+        self,
+        running: _RunningQuery,
+        fetch: Callable[[duckdb.DuckDBPyConnection], T],
+    ) -> T:
+        """Run ``fetch`` on a pooled cursor registered with ``running``.
+
+        Raises:
+            duckdb.InterruptException: If the query was cancelled.
+        """
+        with self._cursor() as conn:
+            if not running.attach(conn):
+                raise duckdb.InterruptException("Query cancelled before it started")
+            try:
+                return fetch(conn)
+            finally:
+                running.detach()
+
+    def _log_sql_error(self, sql: str, start_time: float, error: Exception) -> None:
+        latency_ms = int((time.time() - start_time) * 1000)
+        self._structured_logger.log_sql_execution(
+            sql=sql,
+            row_count=0,
+            latency_ms=latency_ms,
+            error=str(error),
+        )
+
+    def _reopen_if_stale(self, version: str) -> None:
+        """Reopen the database if the file changed since the catalog was read.
+
+        A read-only instance keeps serving the data it opened with, so a
+        result read from it would be cached under the new version.
+        """
+        catalog = self._catalog
+        if catalog is not None and catalog.version != version:
+            self.get_catalog()
+
+    @staticmethod
+    def _fetch_table(
+        sql: str, params: list[Any] | None, conn: duckdb.DuckDBPyConnection
+    ) -> pa.Table:
+        """Fetch a full result as an Arrow table."""
+        if params:
+            return _to_arrow_table(conn.execute(sql, params).arrow())
+        return _to_arrow_table(conn.execute(sql).arrow())
+
+    @staticmethod
+    def _fetch_preview(
+        sql: str,
+        params: list[Any] | None,
+        max_rows: int,
+        max_bytes: int,
+        conn: duckdb.DuckDBPyConnection,
+    ) -> QueryPreview:
+        """Stream a capped preview, then summarize the full result."""
+        preview = read_preview(conn.execute(sql, params or None), max_rows, max_bytes)
+        try:
+            summarize(conn, preview, sql, params)
+        except duckdb.InterruptException:
             raise
+        except duckdb.Error as e:
+            logger.warning(f"Could not summarize query result: {e}")
+        return preview
+
+    def _arrow_to_df(self, table: pa.Table) -> pd.DataFrame:
+        """Convert an Arrow table with DuckDB's own pandas conversion.
+
+        Going through DuckDB keeps the dtypes identical to ``fetchdf()``.
+        """
+        with self._cursor() as conn:
+            return conn.from_arrow(table).df()
 
     def validate_sql_syntax(self, sql: str) -> ValidationResult:
         """Validate SQL syntax without executing.
@@ -623,7 +954,6 @@ class DuckDBClient:
         Returns:
             ValidationResult with validation status and any errors.
         """
-        conn = self._get_connection()
         errors = []
         warnings = []
 
@@ -631,8 +961,10 @@ class DuckDBClient:
             # Check for SQL injection patterns first
             _check_for_sql_injection(sql)
 
-            # Use parameterized query for EXPLAIN to prevent injection
-            conn.execute("EXPLAIN ?", [sql])
+            # EXPLAIN cannot take the statement as a parameter; the injection
+            # check above has already rejected stacked or mutating statements
+            with self._cursor() as conn:
+                conn.execute(f"EXPLAIN {sql}")
         except duckdb.Error as e:
             error_msg = str(e)
             errors.append(error_msg)
@@ -665,10 +997,8 @@ class DuckDBClient:
         Raises:
             ValueError: If table_name is invalid or not in database.
         """
-        conn = self._get_connection()
-
         # Validate table name against database
-        _validate_table_name(table_name, conn)
+        self._validate_table(table_name)
 
         # Build safe query
         table_identifier = _quote_identifier(table_name)
@@ -679,7 +1009,19 @@ class DuckDBClient:
 
 @cache
 def _get_duckdb_client_cached(db_path: str | None) -> DuckDBClient:
-    return DuckDBClient(db_path=db_path)
+    try:
+        from src.backend.config import get_config
+
+        db_config = get_config().database
+    except Exception:
+        return DuckDBClient(db_path=db_path)
+
+    return DuckDBClient(
+        db_path=db_path,
+        query_timeout=db_config.timeout_seconds,
+        config=db_config,
+        result_cache_bytes=db_config.result_cache_mb * 1024 * 1024,
+    )
 
 
 def _resolve_db_path(db_path: str | Path | None) -> str | None:
@@ -0,0 +1,209 @@
+"""Read-only DuckDB connection pool.
+
+One database instance is opened per file and shared by all callers. Each
+query checks out its own cursor (``conn.cursor()``), a lightweight connection
+to the same instance, so concurrent requests execute in parallel instead of
+serializing on a single connection. Cursors are returned to an idle list and
+reused by later checkouts.
+
+DuckDB shares one instance per database path within a process, so a pool
+created with ``replacement()`` opens its instance only after the pool it
+replaces has closed; otherwise it would attach to the old snapshot.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CURSORS = 8
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 30.0
+
+
+class DuckDBConnectionPool:
+    """Pool of cursors over a single read-only DuckDB database instance."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_cursors: int = DEFAULT_MAX_CURSORS,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+    ) -> None:
+        """Initialize the pool. The database is opened on first checkout.
+
+        Args:
+            db_path: Path to the DuckDB database file.
+            max_cursors: Maximum number of cursors checked out at once.
+            threads: DuckDB worker threads for the instance (None for default).
+            memory_limit: DuckDB memory limit such as ``"2GB"`` (None for default).
+        """
+        self.db_path = db_path
+        self.max_cursors = max(1, max_cursors)
+        self.threads = threads
+        self.memory_limit = memory_limit
+
+        self._database: duckdb.DuckDBPyConnection | None = None
+        self._idle: list[duckdb.DuckDBPyConnection] = []
+        self._cond = threading.Condition()
+        self._draining = False
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._created = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._closed = threading.Event()
+        self._predecessor: DuckDBConnectionPool | None = None
+
+    def replacement(self) -> DuckDBConnectionPool:
+        """Create an empty pool with the same settings to take over from this one.
+
+        The new pool opens its database instance once this pool is closed, so
+        the caller can drain this pool in the background.
+
+        Returns:
+            Pool whose first checkout waits for this pool to close.
+        """
+        pool = DuckDBConnectionPool(
+            self.db_path,
+            max_cursors=self.max_cursors,
+            threads=self.threads,
+            memory_limit=self.memory_limit,
+        )
+        pool._predecessor = self
+        return pool
+
+    def wait_closed(self, timeout: float | None = None) -> bool:
+        """Wait for ``close()`` to finish.
+
+        Args:
+            timeout: Seconds to wait (None to wait indefinitely).
+
+        Returns:
+            True if the pool has been closed.
+        """
+        return self._closed.wait(timeout)
+
+    def _config(self) -> dict[str, Any]:
+        config: dict[str, Any] = {}
+        if self.threads is not None:
+            config["threads"] = self.threads
+        if self.memory_limit is not None:
+            config["memory_limit"] = self.memory_limit
+        return config
+
+    def _open_database(self) -> duckdb.DuckDBPyConnection:
+        """Open the shared instance. Caller must hold the pool condition."""
+        if self._database is None:
+            if not self.db_path.exists():
+                raise FileNotFoundError(f"Database not found: {self.db_path}")
+            self._database = duckdb.connect(
+                str(self.db_path), read_only=True, config=self._config()
+            )
+            logger.debug(f"Opened DuckDB instance for {self.db_path}")
+        return self._database
+
+    @contextmanager
+    def cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Check out a cursor for the duration of the ``with`` block.
+
+        Blocks while ``max_cursors`` cursors are in use or the pool is being
+        closed.
+
+        Yields:
+            DuckDB cursor owned exclusively by the caller.
+
+        Raises:
+            FileNotFoundError: If the database file does not exist.
+        """
+        predecessor = self._predecessor
+        if predecessor is not None:
+            predecessor.wait_closed()
+            self._predecessor = None
+
+        with self._cond:
+            if self._draining or self._in_use >= self.max_cursors:
+                self._waits += 1
+                self._cond.wait_for(
+                    lambda: not self._draining and self._in_use < self.max_cursors
+                )
+            database = self._open_database()
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = database.cursor()
+                self._created += 1
+            self._in_use += 1
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+        try:
+            yield conn
+        finally:
+            with self._cond:
+                self._in_use -= 1
+                if self._database is database and not self._draining:
+                    self._idle.append(conn)
+                else:
+                    conn.close()
+                self._cond.notify_all()
+
+    def close(self, drain_timeout: float = DEFAULT_DRAIN_TIMEOUT_SECONDS) -> None:
+        """Close every cursor and the database instance.
+
+        Waits up to ``drain_timeout`` seconds for checked-out cursors to be
+        returned, so a reload does not cut off queries that are still running.
+
+        Args:
+            drain_timeout: Seconds to wait for in-flight queries.
+        """
+        with self._cond:
+            if self._database is None:
+                self._closed.set()
+                return
+            self._draining = True
+            try:
+                if not self._cond.wait_for(
+                    lambda: self._in_use == 0, timeout=drain_timeout
+                ):
+                    logger.warning(
+                        f"Closing DuckDB pool with {self._in_use} cursors still in use"
+                    )
+                for conn in self._idle:
+                    conn.close()
+                self._idle.clear()
+                self._database.close()
+                self._database = None
+            finally:
+                self._draining = False
+                self._closed.set()
+                self._cond.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        """Return pool usage counters.
+
+        Returns:
+            Dictionary with cursor counts, checkouts and waits.
+        """
+        with self._cond:
+            return {
+                "max_cursors": self.max_cursors,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+            }
@@ -0,0 +1,229 @@
+"""Append-only binary storage for cached embeddings.
+
+Vectors are appended as raw float32 rows to ``embeddings.f32`` and read back
+through a memory map, so startup never deserializes the vectors themselves.
+Row keys are appended one per line to ``embeddings.keys``; the row number of a
+key is its line number. Both files only ever grow, which keeps each flush
+proportional to the number of new embeddings.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_BATCH_SIZE = 64
+DEFAULT_FLUSH_DELAY_SECONDS = 2.0
+
+
+class EmbeddingStore:
+    """Memory-mapped float32 embedding cache with debounced writes.
+
+    New vectors are held in memory and appended to disk when
+    ``flush_batch_size`` of them are pending, ``flush_delay_seconds`` after the
+    last write, or at interpreter shutdown, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        legacy_json: Path | None = None,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_delay_seconds: float = DEFAULT_FLUSH_DELAY_SECONDS,
+    ) -> None:
+        """Initialize the store. Nothing is read until first access.
+
+        Args:
+            directory: Directory holding the store files.
+            legacy_json: ``embeddings.json`` to import when the store is empty.
+            flush_batch_size: Pending vectors that trigger an immediate flush.
+            flush_delay_seconds: Debounce delay before pending vectors are written.
+        """
+        self.directory = directory
+        self.legacy_json = legacy_json
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.flush_delay_seconds = flush_delay_seconds
+
+        self._vectors_path = directory / "embeddings.f32"
+        self._keys_path = directory / "embeddings.keys"
+        self._meta_path = directory / "embeddings.meta.json"
+
+        self.dim: int | None = None
+        self._rows: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+        self._pending: dict[str, np.ndarray] = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._timer: threading.Timer | None = None
+        atexit.register(self.flush)
+
+    def __len__(self) -> int:
+        """Return the number of stored and pending vectors."""
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._rows) + len(self._pending)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a vector is stored for ``key``."""
+        with self._lock:
+            self._ensure_loaded()
+            return key in self._pending or key in self._rows
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._meta_path.exists():
+            self._import_legacy_json()
+            return
+        try:
+            self.dim = int(json.loads(self._meta_path.read_text())["dim"])
+            keys = self._keys_path.read_text().splitlines()
+            row_bytes = self.dim * np.dtype(np.float32).itemsize
+            complete_rows = self._vectors_path.stat().st_size // row_bytes
+            # A crash between the two appends can leave one file longer.
+            rows = min(len(keys), complete_rows)
+            if len(keys) != rows or complete_rows * row_bytes != (
+                self._vectors_path.stat().st_size
+            ):
+                self._truncate(keys[:rows], rows * row_bytes)
+            self._rows = {key: i for i, key in enumerate(keys[:rows])}
+            self._remap(rows)
+            logger.debug(f"Opened embedding store with {rows} vectors")
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Failed to open embedding store: {e}")
+            self._rows = {}
+            self._matrix = None
+
+    def _truncate(self, keys: list[str], vector_bytes: int) -> None:
+        """Cut both files back to their last consistent row."""
+        logger.warning(
+            f"Repairing embedding store after partial write ({len(keys)} rows)"
+        )
+        with open(self._vectors_path, "r+b") as f:
+            f.truncate(vector_bytes)
+        self._keys_path.write_text("".join(f"{key}\n" for key in keys))
+
+    def _remap(self, rows: int) -> None:
+        if rows == 0:
+            self._matrix = None
+            return
+        self._matrix = np.memmap(
+            self._vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim)
+        )
+
+    def _import_legacy_json(self) -> None:
+        """Convert an old ``embeddings.json`` dict into the binary format."""
+        if self.legacy_json is None or not self.legacy_json.exists():
+            return
+        try:
+            with open(self.legacy_json) as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to read legacy embedding cache: {e}")
+            return
+        for key, vector in legacy.items():
+            self._stage(key, vector)
+        self._flush_locked()
+        logger.info(f"Migrated {len(legacy)} embeddings from {self.legacy_json.name}")
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return the stored vector for ``key``.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Float32 vector, or None when not cached.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            row = self._rows.get(key)
+            if row is None or self._matrix is None:
+                return None
+            return np.array(self._matrix[row])
+
+    def put(self, key: str, vector: Sequence[float] | np.ndarray) -> None:
+        """Queue a vector for storage.
+
+        Args:
+            key: Cache key.
+            vector: Embedding vector.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._rows or not self._stage(key, vector):
+                return
+            if len(self._pending) >= self.flush_batch_size:
+                self._flush_locked()
+            else:
+                self._schedule_flush()
+
+    def _stage(self, key: str, vector: Sequence[float] | np.ndarray) -> bool:
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        if self.dim is None:
+            self.dim = array.shape[0]
+        if array.shape[0] != self.dim:
+            logger.warning(
+                f"Not caching embedding of dimension {array.shape[0]}; "
+                f"store dimension is {self.dim}"
+            )
+            return False
+        self._pending[key] = array
+        return True
+
+    def _schedule_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.flush_delay_seconds, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Append pending vectors to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        keys = list(self._pending)
+        block = np.stack([self._pending[key] for key in keys])
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if not self._meta_path.exists():
+                self._meta_path.write_text(json.dumps({"dim": self.dim}))
+            start = len(self._rows)
+            # Drop the old map before appending so the file can grow safely.
+            self._matrix = None
+            with open(self._vectors_path, "ab") as f:
+                f.write(block.tobytes())
+            with open(self._keys_path, "a") as f:
+                f.write("".join(f"{key}\n" for key in keys))
+        except OSError as e:
+            logger.warning(f"Failed to flush embedding store: {e}")
+            self._remap(len(self._rows))
+            return
+        for offset, key in enumerate(keys):
+            self._rows[key] = start + offset
+        self._pending.clear()
+        self._remap(len(self._rows))
@@ -7,7 +7,6 @@ as specified in design.md Section 4.3.
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
 from functools import lru_cache
@@ -16,6 +15,9 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+from src.backend.utils.embedding_store import EmbeddingStore
+from src.backend.utils.vector_index import CandidateMatrix
+
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +25,12 @@ CACHE_DIR = Path(__file__).parent.parent / "data" / "embeddings_cache"
 EMBEDDING_DIM = 1536  # openai/text-embedding-3-small dimension (OpenRouter)
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 DEFAULT_EMBEDDING_MODEL = "openai/text-embedding-3-small"
+# Model identifier of the hash-based vectors used when the API is unavailable
+FALLBACK_MODEL = "fallback"
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from openai import OpenAI
 
 
@@ -32,7 +38,9 @@ class EmbeddingService:
     """Service for generating and searching embeddings.
 
     Supports OpenRouter embeddings with local caching for efficiency.
-    Falls back to simple TF-IDF-like embeddings when API is unavailable.
+    Cached vectors live in a memory-mapped binary store and new ones are
+    written in debounced batches. Falls back to simple TF-IDF-like embeddings
+    when API is unavailable.
     """
 
     def __init__(
@@ -52,12 +60,11 @@ class EmbeddingService:
             or DEFAULT_EMBEDDING_MODEL
         )
         self.use_cache = use_cache
-        self._cache: dict[str, list[float]] = {}
+        self._store = EmbeddingStore(
+            CACHE_DIR, legacy_json=CACHE_DIR / "embeddings.json"
+        )
         self._openai_client: OpenAI | None = None
-
-        if use_cache:
-            CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            self._load_cache()
+        self._candidate_sets: dict[str, CandidateMatrix] = {}
 
     def _get_openai_client(self) -> OpenAI | None:
         """Lazy-load OpenRouter OpenAI-compatible client."""
@@ -81,28 +88,19 @@ class EmbeddingService:
                 )
         return self._openai_client
 
-    def _load_cache(self) -> None:
-        """Load cached embeddings from disk."""
-        cache_file = CACHE_DIR / "embeddings.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    self._cache = json.load(f)
-                logger.debug(f"Loaded {len(self._cache)} cached embeddings")
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning(f"Failed to load embedding cache: {e}")
-
-    def _save_cache(self) -> None:
-        """Save cached embeddings to disk."""
-        if not self.use_cache:
-            return
+    @property
+    def active_model(self) -> str:
+        """Identifier of the model that produces new embeddings.
+
+        Returns "fallback" when the API client is unavailable, so persisted
+        vectors from different sources are never mixed.
+        """
+        return self.model if self._get_openai_client() else FALLBACK_MODEL
 
-        cache_file = CACHE_DIR / "embeddings.json"
-        try:
-            with open(cache_file, "w") as f:
-                json.dump(self._cache, f)
-        except OSError as e:
-            logger.warning(f"Failed to save embedding cache: {e}")
+    def flush(self) -> None:
+        """Write pending cached embeddings to disk."""
+        if self.use_cache:
+            self._store.flush()
 
     def _get_cache_key(self, text: str) -> str:
         """Generate a cache key for text."""
@@ -122,10 +120,9 @@ class EmbeddingService:
         Returns:
             Embedding vector as list of floats.
         """
-        cache_key = self._get_cache_key(text)
-
-        if self.use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._get_cached_embedding(text)
+        if cached is not None:
+            return cached
 
         client = self._get_openai_client()
 
@@ -138,8 +135,7 @@ class EmbeddingService:
                 embedding = self._normalize_embedding(response.data[0].embedding)
 
                 if self.use_cache:
-                    self._cache[cache_key] = embedding
-                    self._save_cache()
+                    self._store.put(self._get_cache_key(text), embedding)
 
                 return embedding
             except Exception as e:
@@ -156,6 +152,23 @@ class EmbeddingService:
         Returns:
             List of embedding vectors.
         """
+        return self.embed_batch_with_fallbacks(texts)[0]
+
+    def embed_batch_with_fallbacks(
+        self, texts: list[str]
+    ) -> tuple[list[list[float]], list[bool]]:
+        """Generate embeddings for multiple texts, flagging fallback vectors.
+
+        Callers that persist vectors use the flags to avoid storing hash-based
+        fallbacks produced while the API was failing.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            Embedding vectors, and for each whether it is a fallback vector
+            rather than one from the model.
+        """
         results: list[list[float] | None] = [None] * len(texts)
         uncached_texts: list[str] = []
         uncached_indices: list[int] = []
@@ -170,28 +183,32 @@ class EmbeddingService:
 
         if uncached_texts:
             embeddings = self._embed_uncached_texts(uncached_texts)
-            for idx, embedding in zip(uncached_indices, embeddings):
+            for idx, embedding in zip(uncached_indices, embeddings or [], strict=False):
                 results[idx] = embedding
 
-        return [emb or self._fallback_embedding(texts[i]) for i, emb in enumerate(results)]
+        fallbacks = [not emb for emb in results]
+        vectors = [
+            emb or self._fallback_embedding(texts[i]) for i, emb in enumerate(results)
+        ]
+        return vectors, fallbacks
 
     def _get_cached_embedding(self, text: str) -> list[float] | None:
         if not self.use_cache:
             return None
-        cache_key = self._get_cache_key(text)
-        return self._cache.get(cache_key)
+        cached = self._store.get(self._get_cache_key(text))
+        if cached is None:
+            return None
+        vector: list[float] = cached.tolist()
+        return vector
 
-    def _embed_uncached_texts(self, texts: list[str]) -> list[list[float]]:
+    def _embed_uncached_texts(self, texts: list[str]) -> list[list[float]] | None:
         client = self._get_openai_client()
         if client:
             try:
-                embeddings = self._embed_with_client(client, texts)
-                if self.use_cache:
-                    self._save_cache()
-                return embeddings
+                return self._embed_with_client(client, texts)
             except Exception as e:
                 logger.warning(f"OpenRouter batch embedding failed: {e}")
-        return [self._fallback_embedding(text) for text in texts]
+        return None
 
     def _embed_with_client(self, client, texts: list[str]) -> list[list[float]]:
         response = client.embeddings.create(
@@ -203,8 +220,7 @@ class EmbeddingService:
             embedding = self._normalize_embedding(embedding_data.embedding)
             embeddings.append(embedding)
             if self.use_cache:
-                cache_key = self._get_cache_key(text)
-                self._cache[cache_key] = embedding
+                self._store.put(self._get_cache_key(text), embedding)
         return embeddings
 
     def _fallback_embedding(self, text: str) -> list[float]:
@@ -236,6 +252,37 @@ class EmbeddingService:
 
         return embedding
 
+    def register_candidates(
+        self,
+        name: str,
+        candidates: Mapping[str, Sequence[float] | np.ndarray],
+    ) -> CandidateMatrix:
+        """Build and register a named candidate set for repeated top-k search.
+
+        Registering again under the same name replaces the previous set.
+
+        Args:
+            name: Name of the candidate set (e.g. "tables").
+            candidates: Dictionary mapping item names to their embeddings.
+
+        Returns:
+            The candidate matrix, ready for ``top_k``/``top_k_batch`` calls.
+        """
+        matrix = CandidateMatrix(candidates)
+        self._candidate_sets[name] = matrix
+        return matrix
+
+    def get_candidates(self, name: str) -> CandidateMatrix | None:
+        """Return a previously registered candidate set.
+
+        Args:
+            name: Name used at registration.
+
+        Returns:
+            The candidate matrix, or None if not registered.
+        """
+        return self._candidate_sets.get(name)
+
     def find_similar(
         self,
         query_vec: list[float],
@@ -244,6 +291,9 @@ class EmbeddingService:
     ) -> list[str]:
         """Find top-k most similar items by cosine similarity.
 
+        For repeated searches over the same candidates, prefer
+        ``register_candidates`` so the matrix is built only once.
+
         Args:
             query_vec: Query embedding vector.
             candidates: Dictionary mapping item names to their embeddings.
@@ -255,27 +305,7 @@ class EmbeddingService:
         if not candidates:
             return []
 
-        query_arr = np.array(query_vec)
-        query_norm = np.linalg.norm(query_arr)
-
-        if query_norm == 0:
-            return list(candidates.keys())[:top_k]
-
-        similarities = []
-        for name, vec in candidates.items():
-            vec_arr = np.array(vec)
-            vec_norm = np.linalg.norm(vec_arr)
-
-            if vec_norm > 0:
-                similarity = np.dot(query_arr, vec_arr) / (query_norm * vec_norm)
-            else:
-                similarity = 0.0
-
-            similarities.append((name, similarity))
-
-        similarities.sort(key=lambda x: x[1], reverse=True)
-
-        return [name for name, _ in similarities[:top_k]]
+        return CandidateMatrix(candidates).top_k(query_vec, top_k)
 
     def cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
         """Calculate cosine similarity between two vectors.
@@ -333,6 +363,36 @@ def embed_batch(texts: list[str]) -> list[list[float]]:
     return get_embedding_service().embed_batch(texts)
 
 
+def embed_batch_with_fallbacks(
+    texts: list[str],
+) -> tuple[list[list[float]], list[bool]]:
+    """Convenience function to embed multiple texts, flagging fallback vectors.
+
+    Args:
+        texts: Texts to embed.
+
+    Returns:
+        Embedding vectors, and for each whether it is a fallback vector.
+    """
+    return get_embedding_service().embed_batch_with_fallbacks(texts)
+
+
+def register_candidates(
+    name: str,
+    candidates: dict[str, list[float]],
+) -> CandidateMatrix:
+    """Convenience function to register a named candidate set.
+
+    Args:
+        name: Name of the candidate set.
+        candidates: Dictionary of item names to embeddings.
+
+    Returns:
+        Candidate matrix for top-k searches.
+    """
+    return get_embedding_service().register_candidates(name, candidates)
+
+
 def find_similar(
     query_vec: list[float],
     candidates: dict[str, list[float]],
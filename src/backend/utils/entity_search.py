@@ -0,0 +1,274 @@
+"""Fuzzy player and team name search inside the DuckDB file.
+
+Names, team nicknames and abbreviations from ``player_gold``, ``team_gold`` and
+``common_player_info_silver`` are collected into an ``entity_search`` alias
+table, and every alias is split into padded trigrams stored in
+``entity_search_grams``. A lookup joins the query's trigrams against that
+table and ranks aliases by trigram (Dice) similarity, so misspelled or partial
+names resolve with one indexed query instead of an LLM call.
+
+The tables are written by :func:`build_entity_search`, which runs after the
+gold entity tables are rebuilt; :func:`search_entities` only reads them.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import duckdb
+import pandas as pd
+
+from src.backend.utils.duckdb_client import get_duckdb_client
+
+
+if TYPE_CHECKING:
+    from src.backend.utils.duckdb_client import DuckDBClient
+
+
+logger = logging.getLogger(__name__)
+
+ALIAS_TABLE = "entity_search"
+GRAM_TABLE = "entity_search_grams"
+GRAM_SIZE = 3
+# Aliases sharing less than this fraction of trigrams with the query are dropped
+MIN_SCORE = 0.3
+
+# (table, id column, entity type, alias column, alias kind); the first name
+# alias found for an entity becomes its canonical name
+_ALIAS_SOURCES = (
+    ("player_gold", "id", "player", "full_name", "name"),
+    ("common_player_info_silver", "person_id", "player", "display_first_last", "name"),
+    (
+        "common_player_info_silver",
+        "person_id",
+        "player",
+        "display_last_comma_first",
+        "name",
+    ),
+    ("player_gold", "id", "player", "last_name", "last_name"),
+    ("team_gold", "id", "team", "full_name", "name"),
+    ("team_gold", "id", "team", "nickname", "nickname"),
+    ("team_gold", "id", "team", "abbreviation", "abbreviation"),
+)
+
+# Table names are module constants, never user input
+_SEARCH_SQL = f"""
+WITH query_grams AS (
+    SELECT DISTINCT unnest(?::VARCHAR[]) AS gram
+),
+hits AS (
+    SELECT g.alias_id, count(*) AS shared
+    FROM {GRAM_TABLE} g
+    JOIN query_grams q ON g.gram = q.gram
+    GROUP BY g.alias_id
+),
+scored AS (
+    SELECT
+        a.entity_type,
+        a.entity_id,
+        a.name,
+        a.alias,
+        a.kind,
+        CASE
+            WHEN a.alias_norm = ? THEN 1.0
+            ELSE 2.0 * h.shared / (a.gram_count + ?)
+        END AS score
+    FROM hits h
+    JOIN {ALIAS_TABLE} a ON a.alias_id = h.alias_id
+)
+SELECT entity_type, entity_id, name, alias, kind, score
+FROM scored
+WHERE score >= ?
+QUALIFY row_number() OVER (
+    PARTITION BY entity_type, entity_id ORDER BY score DESC
+) = 1
+ORDER BY score DESC, name
+LIMIT ?
+"""  # noqa: S608
+
+
+@dataclass(frozen=True)
+class EntityMatch:
+    """A ranked name search hit."""
+
+    entity_type: str
+    entity_id: int
+    name: str
+    alias: str
+    kind: str
+    score: float
+
+
+def normalize_name(text: str) -> str:
+    """Fold accents and case, and reduce punctuation to single spaces."""
+    folded = unicodedata.normalize("NFKD", str(text))
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", folded.lower()).split())
+
+
+def name_grams(normalized: str) -> list[str]:
+    """Split a normalized name into padded trigrams.
+
+    Padding marks word starts and ends, so short names and abbreviations still
+    produce distinctive grams.
+    """
+    if not normalized:
+        return []
+    padded = f"  {normalized} "
+    return sorted(
+        {padded[i : i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)}
+    )
+
+
+def _read_aliases(conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    columns = {
+        (table, column)
+        for table, column in conn.execute(
+            "SELECT table_name, column_name FROM information_schema.columns"
+        ).fetchall()
+    }
+    frames = []
+    for table, id_col, entity_type, alias_col, kind in _ALIAS_SOURCES:
+        if (table, id_col) not in columns or (table, alias_col) not in columns:
+            continue
+        # Identifiers come from the constant _ALIAS_SOURCES
+        frame = conn.execute(
+            f'SELECT DISTINCT CAST("{id_col}" AS BIGINT) AS entity_id, '  # noqa: S608
+            f'CAST("{alias_col}" AS VARCHAR) AS alias FROM "{table}" '
+            f'WHERE "{alias_col}" IS NOT NULL AND "{id_col}" IS NOT NULL'
+        ).df()
+        frame["entity_type"] = entity_type
+        frame["kind"] = kind
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=["entity_id", "alias", "entity_type", "kind"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def build_entity_search(conn: duckdb.DuckDBPyConnection) -> int:
+    """(Re)build the name search tables from the entity tables present.
+
+    Args:
+        conn: Writable DuckDB connection.
+
+    Returns:
+        Number of aliases indexed.
+    """
+    aliases = _read_aliases(conn)
+    aliases["alias_norm"] = aliases["alias"].map(normalize_name)
+    aliases = aliases[aliases["alias_norm"] != ""]
+    aliases = aliases.drop_duplicates(["entity_type", "entity_id", "alias_norm"])
+
+    names = aliases[aliases["kind"] == "name"].drop_duplicates(
+        ["entity_type", "entity_id"]
+    )
+    canonical = names.set_index(["entity_type", "entity_id"])["alias"]
+    keys = pd.MultiIndex.from_frame(aliases[["entity_type", "entity_id"]])
+    aliases["name"] = canonical.reindex(keys).fillna(aliases["alias"]).to_numpy()
+
+    aliases = aliases.reset_index(drop=True)
+    aliases["alias_id"] = aliases.index.astype("int32")
+    grams = aliases["alias_norm"].map(name_grams)
+    aliases["gram_count"] = grams.map(len).astype("int32")
+    gram_rows = pd.DataFrame({"alias_id": aliases["alias_id"], "gram": grams}).explode(
+        "gram"
+    )
+
+    alias_df = aliases[
+        [
+            "alias_id",
+            "entity_type",
+            "entity_id",
+            "name",
+            "alias",
+            "kind",
+            "alias_norm",
+            "gram_count",
+        ]
+    ]
+    gram_df = gram_rows.dropna()
+    conn.register("alias_df", alias_df)
+    conn.register("gram_df", gram_df)
+    try:
+        conn.execute(f"CREATE OR REPLACE TABLE {ALIAS_TABLE} AS SELECT * FROM alias_df")  # noqa: S608
+        # Sorted by gram so DuckDB's zone maps skip most row groups per lookup
+        conn.execute(
+            f"CREATE OR REPLACE TABLE {GRAM_TABLE} AS "  # noqa: S608
+            "SELECT CAST(gram AS VARCHAR) AS gram, CAST(alias_id AS INTEGER) AS alias_id "
+            "FROM gram_df ORDER BY gram"
+        )
+    finally:
+        conn.unregister("alias_df")
+        conn.unregister("gram_df")
+    logger.info(f"Indexed {len(alias_df)} entity name aliases for search")
+    return len(alias_df)
+
+
+def search_available(db_client: DuckDBClient | None = None) -> bool:
+    """Whether the name search tables exist in the database.
+
+    Args:
+        db_client: Client to check (defaults to the shared client).
+
+    Returns:
+        True when both search tables have been built.
+    """
+    db_client = db_client or get_duckdb_client()
+    try:
+        catalog = db_client.get_catalog()
+    except (FileNotFoundError, TimeoutError, ValueError, duckdb.Error) as e:
+        logger.warning(f"Entity name search unavailable: {e}")
+        return False
+    return catalog.get(ALIAS_TABLE) is not None and catalog.get(GRAM_TABLE) is not None
+
+
+def search_entities(
+    text: str,
+    k: int = 5,
+    *,
+    db_client: DuckDBClient | None = None,
+    min_score: float = MIN_SCORE,
+) -> list[EntityMatch]:
+    """Find the players and teams whose names best match ``text``.
+
+    Args:
+        text: Name, nickname or abbreviation, possibly misspelled or partial.
+        k: Maximum number of entities to return.
+        db_client: Client to query (defaults to the shared client).
+        min_score: Minimum trigram similarity, from 0 to 1.
+
+    Returns:
+        Best match per entity, highest score first. Empty when the search
+        tables have not been built or the lookup fails.
+    """
+    query = normalize_name(text)
+    grams = name_grams(query)
+    if not grams or k <= 0:
+        return []
+
+    db_client = db_client or get_duckdb_client()
+    if not search_available(db_client):
+        return []
+    try:
+        rows = db_client.execute_query(
+            _SEARCH_SQL, params=[grams, query, len(grams), min_score, k]
+        )
+    except (FileNotFoundError, TimeoutError, ValueError, duckdb.Error) as e:
+        logger.warning(f"Entity name search failed: {e}")
+        return []
+
+    return [
+        EntityMatch(
+            entity_type=row.entity_type,
+            entity_id=int(row.entity_id),
+            name=row.name,
+            alias=row.alias,
+            kind=row.kind,
+            score=round(float(row.score), 4),
+        )
+        for row in rows.itertuples(index=False)
+    ]
@@ -0,0 +1,144 @@
+"""Eviction policies for bounded in-memory caches.
+
+Each policy tracks keys only; the owning cache stores the values and asks the
+policy for a victim when it is full. All operations are O(1), except LFU
+which is O(log n) through a lazily-invalidated heap.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import OrderedDict
+
+
+EVICTION_POLICIES = ("lru", "lfu", "ttl_first")
+
+
+class LRUPolicy:
+    """Evict the least recently used key."""
+
+    def __init__(self) -> None:
+        """Initialize an empty policy."""
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys."""
+        return len(self._order)
+
+    def record_insert(self, key: str) -> None:
+        """Track a newly inserted or replaced key."""
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def record_access(self, key: str) -> None:
+        """Mark a key as just used."""
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        """Stop tracking a key."""
+        self._order.pop(key, None)
+
+    def pop_victim(self) -> str | None:
+        """Remove and return the next key to evict."""
+        if not self._order:
+            return None
+        key, _ = self._order.popitem(last=False)
+        return key
+
+    def clear(self) -> None:
+        """Stop tracking every key."""
+        self._order.clear()
+
+
+class TTLFirstPolicy(LRUPolicy):
+    """Evict the key closest to expiry.
+
+    Every entry shares the same TTL, so the oldest insert expires first and
+    accesses do not change the order.
+    """
+
+    def record_access(self, key: str) -> None:
+        """Accesses do not extend an entry's lifetime."""
+
+
+class LFUPolicy:
+    """Evict the least frequently used key, oldest first on ties.
+
+    Each key's live heap entry is ``(count, sequence)``; heap items that do
+    not match it exactly are stale and skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty policy."""
+        self._entries: dict[str, tuple[int, int]] = {}
+        self._heap: list[tuple[int, int, str]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys."""
+        return len(self._entries)
+
+    def _push(self, key: str, count: int) -> None:
+        entry = (count, next(self._sequence))
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (*entry, key))
+        # Stale heap items are skipped lazily; rebuild before they dominate.
+        # Live entries keep their sequence so ties stay in order.
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (count, sequence, k) for k, (count, sequence) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def record_insert(self, key: str) -> None:
+        """Track a newly inserted or replaced key."""
+        self._push(key, 1)
+
+    def record_access(self, key: str) -> None:
+        """Count a use of the key."""
+        if key in self._entries:
+            self._push(key, self._entries[key][0] + 1)
+
+    def remove(self, key: str) -> None:
+        """Stop tracking a key."""
+        self._entries.pop(key, None)
+
+    def pop_victim(self) -> str | None:
+        """Remove and return the next key to evict."""
+        while self._heap:
+            count, sequence, key = heapq.heappop(self._heap)
+            if self._entries.get(key) == (count, sequence):
+                del self._entries[key]
+                return key
+        return None
+
+    def clear(self) -> None:
+        """Stop tracking every key."""
+        self._entries.clear()
+        self._heap.clear()
+
+
+def create_eviction_policy(name: str) -> LRUPolicy | LFUPolicy:
+    """Create an eviction policy by name.
+
+    Args:
+        name: One of ``"lru"``, ``"lfu"`` or ``"ttl_first"``.
+
+    Returns:
+        A fresh policy instance.
+
+    Raises:
+        ValueError: If the policy name is unknown.
+    """
+    policies: dict[str, type[LRUPolicy] | type[LFUPolicy]] = {
+        "lru": LRUPolicy,
+        "lfu": LFUPolicy,
+        "ttl_first": TTLFirstPolicy,
+    }
+    try:
+        return policies[name.lower()]()
+    except KeyError:
+        msg = f"Unknown eviction policy '{name}'. Expected one of {EVICTION_POLICIES}"
+        raise ValueError(msg) from None
@@ -1,34 +1,13 @@
 """Persistent knowledge store for learned patterns and entity mappings.
 
-# TODO (Scalability): Replace JSON file with proper database
-# Current JSON-based storage won't scale for:
-#   - Large knowledge bases (100k+ patterns)
-#   - Concurrent write access (race conditions possible)
-#   - Query performance (full file scan for every lookup)
-# Recommended approach:
-#   1. SQLite for single-user deployments:
-#      import sqlite3
-#      conn = sqlite3.connect("knowledge_store.db")
-#      cursor.execute("CREATE TABLE IF NOT EXISTS patterns ...")
-#   2. PostgreSQL/Redis for multi-user deployments
-#   3. Consider vector database for semantic similarity search
-
-# TODO (Scalability): Add knowledge store sharding by entity type
-# As the store grows, partition data for faster lookups:
-#   knowledge_store/
-#   ├── players.json
-#   ├── teams.json
-#   ├── patterns.json
-#   └── index.json
-
-# TODO (Reliability): Add atomic writes with backup
-# Current save() can corrupt data if interrupted. Use atomic write:
-#   def save_atomic(self):
-#       temp_path = KNOWLEDGE_FILE + ".tmp"
-#       with open(temp_path, "w") as f:
-#           json.dump(self.data, f)
-#       os.replace(temp_path, KNOWLEDGE_FILE)  # Atomic on POSIX
-# Also keep a backup: knowledge_store.json.bak
+Knowledge lives in a WAL-mode SQLite database with one indexed table per kind
+of hint (entity mappings, column hints, join patterns, successful patterns).
+Writes are queued in memory and committed together in one transaction, either
+once ``FLUSH_EVERY`` writes are pending, ``FLUSH_INTERVAL_SECONDS`` after the
+first queued write, before any read, or at exit. WAL mode lets worker
+processes read while another process commits.
+
+The old ``knowledge_store.json`` document is imported once on first open.
 
 # TODO (Feature): Add knowledge expiration and pruning
 # Old patterns may become stale. Add TTL and cleanup:
@@ -56,9 +35,12 @@
 #   - Most frequently accessed entities
 """
 
+from __future__ import annotations
+
+import atexit
 import json
 import logging
-import os
+import sqlite3
 import threading
 from pathlib import Path
 from typing import Any
@@ -68,128 +50,328 @@ from backend.config import SUCCESSFUL_PATTERN_LIMIT
 
 logger = logging.getLogger(__name__)
 
-KNOWLEDGE_FILE = str(
-    Path(__file__).resolve().parents[1] / "data" / "json" / "knowledge_store.json",
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+KNOWLEDGE_DB = DATA_DIR / "knowledge_store.sqlite3"
+KNOWLEDGE_FILE = str(DATA_DIR / "json" / "knowledge_store.json")
+
+FLUSH_EVERY = 64
+FLUSH_INTERVAL_SECONDS = 1.0
+BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entity_mappings (
+    entity TEXT NOT NULL,
+    entity_lower TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    PRIMARY KEY (entity, table_name, column_name)
+);
+CREATE INDEX IF NOT EXISTS idx_entity_mappings_lower
+    ON entity_mappings (entity_lower, entity);
+CREATE TABLE IF NOT EXISTS column_hints (
+    description TEXT PRIMARY KEY,
+    table_name TEXT NOT NULL,
+    column_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS join_patterns (
+    tables TEXT NOT NULL,
+    keys TEXT NOT NULL,
+    PRIMARY KEY (tables, keys)
+);
+CREATE TABLE IF NOT EXISTS successful_patterns (
+    query_type TEXT NOT NULL,
+    pattern TEXT NOT NULL,
+    PRIMARY KEY (query_type, pattern)
+);
+"""
+
+_ALL_ENTITY_MAPPINGS = (
+    "SELECT entity, table_name, column_name FROM entity_mappings ORDER BY rowid"
 )
+_TABLES = ("entity_mappings", "column_hints", "join_patterns", "successful_patterns")
+
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, sort_keys=True)
 
 
 class KnowledgeStore:
     """Manages persistence and retrieval of knowledge patterns."""
 
-    def __init__(self) -> None:
-        self.data: dict[str, Any] = {
-            "entity_mappings": {},
-            "successful_patterns": {},
-            "column_hints": {},
-            "join_patterns": [],
-        }
-        self._lock = threading.Lock()
-        self.load()
+    def __init__(
+        self,
+        path: Path = KNOWLEDGE_DB,
+        legacy_json: Path | None = Path(KNOWLEDGE_FILE),
+        flush_every: int = FLUSH_EVERY,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the store. The database is opened on first use.
+
+        Args:
+            path: SQLite database file.
+            legacy_json: Old JSON knowledge file to import on first open.
+            flush_every: Pending writes that trigger an immediate commit.
+            flush_interval: Seconds a queued write may wait before it is
+                committed.
+        """
+        self.path = path
+        self.legacy_json = legacy_json
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self._conn: sqlite3.Connection | None = None
+        self._pending: list[tuple[str, tuple]] = []
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database. Caller must hold the lock."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=BUSY_TIMEOUT_MS / 1000,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._import_legacy_json()
+        return self._conn
+
+    def _import_legacy_json(self) -> None:
+        """Import the old whole-file JSON store once."""
+        if self.legacy_json is None or not self.legacy_json.exists():
+            return
+        try:
+            with open(self.legacy_json) as f:
+                data = json.load(f)
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entity_mappings VALUES (?, ?, ?, ?)",
+                    [
+                        (entity, entity.lower(), table, column)
+                        for entity, tables in data.get("entity_mappings", {}).items()
+                        for table, columns in tables.items()
+                        for column in columns
+                    ],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO column_hints VALUES (?, ?, ?)",
+                    [
+                        (description, hint["table"], hint["column"])
+                        for description, hint in data.get("column_hints", {}).items()
+                    ],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO join_patterns VALUES (?, ?)",
+                    [
+                        (_dump(sorted(p["tables"])), _dump(p["keys"]))
+                        for p in data.get("join_patterns", [])
+                    ],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO successful_patterns VALUES (?, ?)",
+                    [
+                        (query_type, _dump(pattern))
+                        for query_type, patterns in data.get(
+                            "successful_patterns", {}
+                        ).items()
+                        for pattern in patterns
+                    ],
+                )
+            self.legacy_json.rename(self.legacy_json.with_suffix(".json.migrated"))
+            logger.info(f"Migrated knowledge store from {self.legacy_json.name}")
+        except (json.JSONDecodeError, KeyError, TypeError, OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to migrate legacy knowledge store: {e}")
+
+    def _queue(self, sql: str, params: tuple) -> None:
+        """Queue one write and commit the batch when it is due."""
+        with self._lock:
+            self._pending.append((sql, params))
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.save)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush(self) -> None:
+        """Commit pending writes in one transaction. Caller must hold the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            conn = self._connect()
+            with conn:
+                for sql, params in pending:
+                    conn.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.warning(f"Warning: Could not save knowledge store: {e}")
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Read rows after committing pending writes."""
+        with self._lock:
+            self._flush()
+            try:
+                return self._connect().execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read knowledge store: {e}")
+                return []
 
     def load(self) -> None:
+        """Open the database, importing the legacy JSON store if present."""
         with self._lock:
-            if os.path.exists(KNOWLEDGE_FILE):
-                try:
-                    with open(KNOWLEDGE_FILE) as f:
-                        self.data = json.load(f)
-                except (OSError, json.JSONDecodeError):
-                    pass
+            try:
+                self._connect()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to open knowledge store: {e}")
 
     def save(self) -> None:
+        """Commit pending writes now."""
         with self._lock:
-            try:
-                Path(KNOWLEDGE_FILE).parent.mkdir(parents=True, exist_ok=True)
-                with open(KNOWLEDGE_FILE, "w") as f:
-                    json.dump(self.data, f, indent=2)
-            except OSError as e:
-                logger.warning(f"Warning: Could not save knowledge store: {e}")
+            self._flush()
 
-    def get_entity_hints(self, entity_name):
+    def close(self) -> None:
+        """Commit pending writes and close the connection."""
         with self._lock:
-            entity_lower = entity_name.lower()
-            return {
-                key: value
-                for key, value in self.data.get("entity_mappings", {}).items()
-                if entity_lower in key.lower() or key.lower() in entity_lower
-            }
+            self._flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
-    def add_entity_mapping(self, entity, table, columns) -> None:
+    def clear(self) -> None:
+        """Delete all stored knowledge."""
         with self._lock:
-            if entity not in self.data["entity_mappings"]:
-                self.data["entity_mappings"][entity] = {}
-            if table not in self.data["entity_mappings"][entity]:
-                self.data["entity_mappings"][entity][table] = []
-            for col in columns:
-                if col not in self.data["entity_mappings"][entity][table]:
-                    self.data["entity_mappings"][entity][table].append(col)
-        self.save()
+            self._pending.clear()
+            for table in _TABLES:
+                self._pending.append((f"DELETE FROM {table}", ()))  # noqa: S608
+            self._flush()
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Snapshot of the whole store in the legacy JSON document layout."""
+        return {
+            "entity_mappings": self._entity_mappings(_ALL_ENTITY_MAPPINGS),
+            "successful_patterns": self.get_successful_patterns(),
+            "column_hints": self.get_column_hints(),
+            "join_patterns": self.get_join_patterns(),
+        }
+
+    def _entity_mappings(
+        self, sql: str, params: tuple = ()
+    ) -> dict[str, dict[str, list[str]]]:
+        mappings: dict[str, dict[str, list[str]]] = {}
+        for entity, table, column in self._query(sql, params):
+            mappings.setdefault(entity, {}).setdefault(table, []).append(column)
+        return mappings
+
+    def get_entity_hints(self, entity_name):
+        entity_lower = entity_name.lower()
+        # Both containment directions; the scan only reads the compact
+        # (entity_lower, entity) index, and matching rows are then fetched by key
+        return self._entity_mappings(
+            "SELECT m.entity, m.table_name, m.column_name FROM entity_mappings m "
+            "JOIN (SELECT DISTINCT entity FROM entity_mappings "
+            "WHERE instr(entity_lower, ?) > 0 OR instr(?, entity_lower) > 0) k "
+            "ON m.entity = k.entity ORDER BY m.rowid",
+            (entity_lower, entity_lower),
+        )
+
+    def add_entity_mapping(self, entity, table, columns) -> None:
+        for col in columns:
+            self._queue(
+                "INSERT OR IGNORE INTO entity_mappings VALUES (?, ?, ?, ?)",
+                (entity, entity.lower(), table, col),
+            )
 
     def get_successful_patterns(self, query_type=None):
-        with self._lock:
-            patterns = self.data.get("successful_patterns", {})
-            if query_type:
-                return patterns.get(query_type, [])
-            return patterns
+        if query_type:
+            return [
+                json.loads(pattern)
+                for (pattern,) in self._query(
+                    "SELECT pattern FROM successful_patterns WHERE query_type = ? "
+                    "ORDER BY rowid",
+                    (query_type,),
+                )
+            ]
+        patterns: dict[str, list[Any]] = {}
+        for qtype, pattern in self._query(
+            "SELECT query_type, pattern FROM successful_patterns ORDER BY rowid"
+        ):
+            patterns.setdefault(qtype, []).append(json.loads(pattern))
+        return patterns
 
     def add_successful_pattern(self, query_type, pattern) -> None:
-        """Store a successful pattern under the given query type and persist the updated list.
+        """Store a successful pattern under the given query type.
 
-        Adds the pattern to the in-memory list for query_type if not already present, trims the list to the most recent SUCCESSFUL_PATTERN_LIMIT entries when it exceeds that limit, and then saves the store to disk.
+        Adds the pattern for query_type if not already present and trims the
+        type to its most recent SUCCESSFUL_PATTERN_LIMIT entries. Both writes
+        are committed with the next batch.
 
         Parameters:
             query_type (str): Category or type of query to associate the pattern with.
             pattern: Representation of the successful pattern to record (e.g., string or serializable object).
         """
         with self._lock:
-            if query_type not in self.data["successful_patterns"]:
-                self.data["successful_patterns"][query_type] = []
-            if pattern not in self.data["successful_patterns"][query_type]:
-                self.data["successful_patterns"][query_type].append(pattern)
-                if (
-                    len(self.data["successful_patterns"][query_type])
-                    > SUCCESSFUL_PATTERN_LIMIT
-                ):
-                    self.data["successful_patterns"][query_type] = self.data[
-                        "successful_patterns"
-                    ][query_type][-SUCCESSFUL_PATTERN_LIMIT:]
-        self.save()
+            self._queue(
+                "INSERT OR IGNORE INTO successful_patterns VALUES (?, ?)",
+                (query_type, _dump(pattern)),
+            )
+            self._queue(
+                "DELETE FROM successful_patterns WHERE query_type = ? AND rowid NOT IN "
+                "(SELECT rowid FROM successful_patterns WHERE query_type = ? "
+                "ORDER BY rowid DESC LIMIT ?)",
+                (query_type, query_type, SUCCESSFUL_PATTERN_LIMIT),
+            )
 
     def add_column_hint(self, description, table, column) -> None:
-        """Store a column hint in the knowledge store keyed by a lowercase description and persist the change.
+        """Store a column hint keyed by a lowercase description.
 
         Parameters:
             description (str): Human-readable description used as the lookup key; it is normalized to lowercase.
             table (str): Name of the table associated with the hint.
             column (str): Name of the column associated with the hint.
         """
-        with self._lock:
-            key = description.lower()
-            self.data["column_hints"][key] = {"table": table, "column": column}
-        self.save()
+        self._queue(
+            "INSERT OR REPLACE INTO column_hints VALUES (?, ?, ?)",
+            (description.lower(), table, column),
+        )
 
     def get_column_hints(self):
-        with self._lock:
-            return self.data.get("column_hints", {})
+        return {
+            description: {"table": table, "column": column}
+            for description, table, column in self._query(
+                "SELECT description, table_name, column_name FROM column_hints "
+                "ORDER BY rowid"
+            )
+        }
 
     def add_join_pattern(self, tables, join_keys) -> None:
-        with self._lock:
-            pattern = {"tables": sorted(tables), "keys": join_keys}
-            if pattern not in self.data["join_patterns"]:
-                self.data["join_patterns"].append(pattern)
-        self.save()
+        self._queue(
+            "INSERT OR IGNORE INTO join_patterns VALUES (?, ?)",
+            (_dump(sorted(tables)), _dump(join_keys)),
+        )
 
     def get_join_patterns(self):
-        with self._lock:
-            return self.data.get("join_patterns", [])
+        return [
+            {"tables": json.loads(tables), "keys": json.loads(keys)}
+            for tables, keys in self._query(
+                "SELECT tables, keys FROM join_patterns ORDER BY rowid"
+            )
+        ]
 
     def get_all_hints(self):
-        with self._lock:
-            return {
-                "entity_mappings": self.data.get("entity_mappings", {}),
-                "column_hints": self.data.get("column_hints", {}),
-                "join_patterns": self.data.get("join_patterns", []),
-                "note": "These are hints from previous queries. Use as guidance, not absolute facts.",
-            }
+        return {
+            "entity_mappings": self._entity_mappings(_ALL_ENTITY_MAPPINGS),
+            "column_hints": self.get_column_hints(),
+            "join_patterns": self.get_join_patterns(),
+            "note": "These are hints from previous queries. Use as guidance, not absolute facts.",
+        }
 
 
 knowledge_store = KnowledgeStore()
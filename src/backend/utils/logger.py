@@ -12,6 +12,7 @@ import logging
 import threading
 import time
 import uuid
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from functools import lru_cache
@@ -22,7 +23,11 @@ from src.backend.models import ExecutionTrace, NodeExecution
 
 @dataclass
 class LogContext:
-    """Thread-local context for logging."""
+    """Per-request context for logging.
+
+    Stored in a ContextVar, so it follows a request across asyncio tasks and
+    ``asyncio.to_thread`` calls instead of being tied to one thread.
+    """
 
     trace_id: str = ""
     node_name: str = ""
@@ -30,6 +35,9 @@ class LogContext:
     user_id: str = ""
 
 
+_log_context: ContextVar[LogContext | None] = ContextVar("log_context", default=None)
+
+
 class StructuredLogger:
     """Structured logger for the NBA Data Analyst Agent.
 
@@ -48,7 +56,8 @@ class StructuredLogger:
         self._logger.setLevel(level)
         self._lock = threading.Lock()
         self._traces: dict[str, ExecutionTrace] = {}
-        self._contexts: dict[int, LogContext] = {}  # Thread ID -> context
+        self._sql_cache_lookups = 0
+        self._sql_cache_hits = 0
 
         if not self._logger.handlers:
             handler = logging.StreamHandler()
@@ -58,11 +67,28 @@ class StructuredLogger:
             self._logger.addHandler(handler)
 
     def _get_context(self) -> LogContext:
-        """Get the context for the current thread."""
-        thread_id = threading.get_ident()
-        if thread_id not in self._contexts:
-            self._contexts[thread_id] = LogContext()
-        return self._contexts[thread_id]
+        """Get the context for the current request."""
+        context = _log_context.get()
+        if context is None:
+            context = LogContext()
+            _log_context.set(context)
+        return context
+
+    def fork_context(self) -> None:
+        """Give the current task its own copy of the log context.
+
+        Call this at the start of a concurrently running branch so its node
+        timings do not overwrite those of sibling branches.
+        """
+        parent = self._get_context()
+        _log_context.set(
+            LogContext(
+                trace_id=parent.trace_id,
+                node_name=parent.node_name,
+                start_time=parent.start_time,
+                user_id=parent.user_id,
+            )
+        )
 
     def start_trace(self, question: str = "", user_id: str | None = None) -> str:
         """Start a new execution trace.
@@ -79,10 +105,12 @@ class StructuredLogger:
                 trace_id=trace_id,
                 question=question,
             )
-        context = self._get_context()
-        context.trace_id = trace_id
-        context.start_time = time.time()
-        context.user_id = user_id or ""
+        context = LogContext(
+            trace_id=trace_id,
+            start_time=time.time(),
+            user_id=user_id or "",
+        )
+        _log_context.set(context)
 
         self._emit_log(
             event="trace_start",
@@ -114,6 +142,7 @@ class StructuredLogger:
                     nodes_executed=len(trace.nodes_executed),
                     llm_calls=trace.llm_calls,
                     retries=trace.retries,
+                    ttft_ms=trace.ttft_ms,
                 )
                 return trace
         return None
@@ -216,12 +245,36 @@ class StructuredLogger:
             model=model,
         )
 
+    def log_first_token(self, model: str, ttft_ms: int) -> None:
+        """Log the time to first token of a streamed LLM call.
+
+        The first value seen in a trace is kept on it as ``ttft_ms``.
+
+        Args:
+            model: The model used.
+            ttft_ms: Milliseconds from request to first content token.
+        """
+        context = self._get_context()
+
+        with self._lock:
+            trace = self._traces.get(context.trace_id)
+            if trace and trace.ttft_ms is None:
+                trace.ttft_ms = ttft_ms
+
+        self._emit_log(
+            event="llm_first_token",
+            trace_id=context.trace_id,
+            model=model,
+            ttft_ms=ttft_ms,
+        )
+
     def log_sql_execution(
         self,
         sql: str,
         row_count: int,
         latency_ms: int,
         error: str | None = None,
+        cached: bool | None = None,
     ) -> None:
         """Log SQL execution.
 
@@ -230,8 +283,16 @@ class StructuredLogger:
             row_count: Number of rows returned.
             latency_ms: Latency in milliseconds.
             error: Error message if failed.
+            cached: Whether the result was served from the result cache, or
+                None when result caching is off.
         """
         context = self._get_context()
+        cache_hit_rate = None
+        if cached is not None:
+            with self._lock:
+                self._sql_cache_lookups += 1
+                self._sql_cache_hits += cached
+                cache_hit_rate = self._sql_cache_hits / self._sql_cache_lookups
         sql_hash = hashlib.sha256(sql.encode()).hexdigest()[:8]
         sql_preview = sql if len(sql) <= 500 else sql[:500] + "..."
 
@@ -242,6 +303,8 @@ class StructuredLogger:
             sql_preview=sql_preview,
             row_count=row_count,
             latency_ms=latency_ms,
+            cached=bool(cached),
+            cache_hit_rate=cache_hit_rate,
             error=error,
             status="error" if error else "success",
         )
@@ -280,6 +343,22 @@ class StructuredLogger:
             failure_count=failure_count,
         )
 
+    def log_pool_stats(self, pool: str, **stats: int) -> None:
+        """Log connection pool usage.
+
+        Args:
+            pool: Pool name.
+            **stats: Pool counters such as checkouts, peak_in_use and waits.
+        """
+        context = self._get_context()
+
+        self._emit_log(
+            event="pool_stats",
+            trace_id=context.trace_id,
+            pool=pool,
+            **stats,
+        )
+
     def get_trace(self, trace_id: str | None = None) -> ExecutionTrace | None:
         """Get the execution trace.
 
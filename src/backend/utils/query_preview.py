@@ -0,0 +1,240 @@
+"""Row-capped Arrow previews of SQL results.
+
+Instead of materializing a whole result in pandas, the query is streamed as an
+Arrow record-batch reader and only the first rows, up to a row and byte cap,
+are kept. Statistics for the full result come from DuckDB's ``SUMMARIZE``, so
+row counts, ranges and averages stay accurate even when the preview is cut
+short. The preview is converted to pandas only when a node asks for it.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import duckdb
+    import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREVIEW_ROWS = 1000
+DEFAULT_PREVIEW_BYTES = 16 * 1024 * 1024
+PREVIEW_BATCH_ROWS = 1024
+
+SUMMARY_FIELDS = ("min", "max", "avg", "std", "approx_unique", "null_percentage")
+
+
+@dataclass
+class ColumnSummary:
+    """Statistics for one column of the full result."""
+
+    name: str
+    data_type: str
+    stats: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class QueryPreview:
+    """The first rows of a query result plus statistics for all of it."""
+
+    table: pa.Table
+    truncated: bool = False
+    total_rows: int | None = None
+    columns: list[ColumnSummary] = field(default_factory=list)
+    converter: Callable[[pa.Table], pd.DataFrame] | None = field(
+        default=None, repr=False
+    )
+    _frame: pd.DataFrame | None = field(default=None, init=False, repr=False)
+
+    @property
+    def preview_rows(self) -> int:
+        """Number of rows in the preview window."""
+        rows: int = self.table.num_rows
+        return rows
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the preview's Arrow buffers."""
+        size: int = self.table.nbytes
+        return size
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Convert the preview window to pandas, once.
+
+        Uses ``converter`` when set (DuckDBClient converts through DuckDB so
+        dtypes match ``fetchdf()``), otherwise pyarrow's own conversion.
+
+        Returns:
+            DataFrame with at most the preview rows.
+        """
+        if self._frame is None:
+            if self.converter is not None:
+                self._frame = self.converter(self.table)
+            else:
+                self._frame = self.table.to_pandas()
+        return self._frame
+
+    def summary(self) -> dict[str, Any]:
+        """Describe the full result for the shared store and prompts.
+
+        Returns:
+            Dictionary with row counts, truncation flag and column statistics.
+        """
+        return {
+            "total_rows": self.total_rows,
+            "preview_rows": self.preview_rows,
+            "truncated": self.truncated,
+            "columns": [
+                {"name": column.name, "type": column.data_type, **column.stats}
+                for column in self.columns
+            ],
+        }
+
+
+def _arrow_reader(result: duckdb.DuckDBPyConnection) -> pa.RecordBatchReader:
+    """Open a record-batch reader on an executed query."""
+    if hasattr(result, "to_arrow_reader"):
+        return result.to_arrow_reader(PREVIEW_BATCH_ROWS)
+    return result.fetch_record_batch(PREVIEW_BATCH_ROWS)
+
+
+def read_preview(
+    result: duckdb.DuckDBPyConnection,
+    max_rows: int = DEFAULT_PREVIEW_ROWS,
+    max_bytes: int = DEFAULT_PREVIEW_BYTES,
+) -> QueryPreview:
+    """Pull record batches from an executed query until a cap is reached.
+
+    Batches are read lazily, so DuckDB stops producing rows once the preview
+    is full. A batch that would cross a cap is sliced to fit.
+
+    Args:
+        result: Cursor on which the query has been executed.
+        max_rows: Maximum rows to keep.
+        max_bytes: Maximum Arrow bytes to keep.
+
+    Returns:
+        Preview without statistics; ``truncated`` is set if rows were left.
+    """
+    reader = _arrow_reader(result)
+    batches: list[pa.RecordBatch] = []
+    rows = 0
+    nbytes = 0
+    truncated = False
+
+    for batch in reader:
+        if batch.num_rows == 0:
+            continue
+        if rows >= max_rows or nbytes >= max_bytes:
+            truncated = True
+            break
+        row_bytes = max(1, batch.nbytes // batch.num_rows)
+        take = min(
+            batch.num_rows, max_rows - rows, max(1, (max_bytes - nbytes) // row_bytes)
+        )
+        kept = batch
+        if take < batch.num_rows:
+            kept = batch.slice(0, take)
+            truncated = True
+        batches.append(kept)
+        rows += kept.num_rows
+        nbytes += kept.nbytes
+        if truncated:
+            break
+
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return QueryPreview(table=table, truncated=truncated)
+
+
+def summarize(
+    conn: duckdb.DuckDBPyConnection,
+    preview: QueryPreview,
+    sql: str,
+    params: list[Any] | None = None,
+) -> None:
+    """Fill in full-result statistics with DuckDB's ``SUMMARIZE``.
+
+    Untruncated previews are summarized from the Arrow table already in
+    memory; truncated ones re-run the query inside DuckDB, which aggregates
+    without handing the rows to Python.
+
+    Args:
+        conn: Cursor to run the summary on.
+        preview: Preview to update in place.
+        sql: The original query.
+        params: Query parameters, if any.
+    """
+    if preview.truncated:
+        cursor = conn.execute(f"SUMMARIZE {sql}", params or None)
+        columns = [d[0] for d in cursor.description]
+        summary_rows = cursor.fetchall()
+    else:
+        relation = conn.from_arrow(preview.table).query(
+            "preview", "SUMMARIZE SELECT * FROM preview"
+        )
+        columns = relation.columns
+        summary_rows = relation.fetchall()
+    rows = [dict(zip(columns, row, strict=True)) for row in summary_rows]
+
+    preview.columns = [
+        ColumnSummary(
+            name=row["column_name"],
+            data_type=row["column_type"],
+            stats={
+                key: _plain(row[key])
+                for key in SUMMARY_FIELDS
+                if row.get(key) is not None
+            },
+        )
+        for row in rows
+    ]
+    if rows:
+        preview.total_rows = int(rows[0]["count"])
+    elif not preview.truncated:
+        preview.total_rows = preview.preview_rows
+
+
+def _plain(value: Any) -> Any:
+    """Convert DuckDB scalars (e.g. Decimal) into JSON-friendly values."""
+    if isinstance(value, (int, float, str)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def format_result_summary(summary: dict[str, Any] | None) -> str:
+    """Render a result summary for an LLM prompt.
+
+    Args:
+        summary: Output of ``QueryPreview.summary()``.
+
+    Returns:
+        Short text block, or an empty string when there is nothing to add.
+    """
+    if not summary or not summary.get("truncated"):
+        return ""
+    total = summary.get("total_rows")
+    total_text = f"{total:,}" if isinstance(total, int) else "unknown"
+    lines = [
+        (
+            f"Full result: {total_text} rows "
+            f"(only the first {summary['preview_rows']:,} were loaded)."
+        ),
+        "Column statistics over the full result:",
+    ]
+    for column in summary.get("columns", []):
+        stats = ", ".join(
+            f"{key}={column[key]}" for key in SUMMARY_FIELDS if key in column
+        )
+        lines.append(f"- {column['name']} ({column['type']}): {stats}")
+    return "\n".join(lines)
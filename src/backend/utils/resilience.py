@@ -1,16 +1,17 @@
 """Resilience patterns for external service calls.
 
 This module provides decorators for circuit breaking, rate limiting, and timeouts
-as specified in design.md Section 7.
+as specified in design.md Section 7, plus single-flight request coalescing.
 """
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import logging
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
 from enum import Enum
@@ -18,7 +19,7 @@ from typing import TYPE_CHECKING, ParamSpec, TypeVar
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,8 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 R = TypeVar("R")
 
+TIMEOUT_EXECUTOR_WORKERS = 32
+
 
 class CircuitState(Enum):
     """States for the circuit breaker."""
@@ -238,9 +241,62 @@ def rate_limit(
     return decorator
 
 
+@functools.lru_cache(maxsize=1)
+def get_timeout_executor() -> ThreadPoolExecutor:
+    """Get the shared executor that runs timeout-guarded calls.
+
+    Returns:
+        Process-wide thread pool executor.
+    """
+    return ThreadPoolExecutor(
+        max_workers=TIMEOUT_EXECUTOR_WORKERS, thread_name_prefix="timeout"
+    )
+
+
+def run_with_timeout(
+    func: Callable[[], R],
+    seconds: float,
+    on_timeout: Callable[[], None] | None = None,
+    name: str | None = None,
+) -> R:
+    """Run a call on the shared executor and stop waiting after a deadline.
+
+    Python threads cannot be killed, so a timed-out call keeps running unless
+    ``on_timeout`` cancels it (for example by interrupting a database query).
+    The caller is released either way.
+
+    Args:
+        func: Zero-argument callable to run.
+        seconds: Maximum time to wait in seconds.
+        on_timeout: Optional hook invoked once the deadline passes.
+        name: Name used in the timeout message.
+
+    Returns:
+        The callable's return value.
+
+    Raises:
+        TimeoutError: If the call does not finish within ``seconds``.
+    """
+    future = get_timeout_executor().submit(func)
+    try:
+        return future.result(timeout=seconds)
+    except FuturesTimeoutError:
+        future.cancel()
+        if on_timeout is not None:
+            try:
+                on_timeout()
+            except Exception as e:
+                logger.warning(f"Timeout handler failed: {e}")
+        label = name or getattr(func, "__name__", "call")
+        raise TimeoutError(f"Function {label} timed out after {seconds}s") from None
+
+
 def timeout(seconds: int = 30) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Timeout decorator to prevent runaway operations.
 
+    Calls run on a shared executor instead of a per-call thread pool, so a
+    timed-out call frees the caller immediately.
+
     Args:
         seconds: Maximum execution time in seconds.
 
@@ -259,20 +315,142 @@ def timeout(seconds: int = 30) -> Callable[[Callable[P, R]], Callable[P, R]]:
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(func, *args, **kwargs)
-                try:
-                    return future.result(timeout=seconds)
-                except FuturesTimeoutError:
-                    raise TimeoutError(
-                        f"Function {func.__name__} timed out after {seconds}s"
-                    ) from None
+            return run_with_timeout(
+                functools.partial(func, *args, **kwargs),
+                seconds,
+                name=func.__name__,
+            )
 
         return wrapper
 
     return decorator
 
 
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key (the leader) runs the call; callers that
+    arrive while it is in flight wait on the leader's future and receive the
+    same result or exception. The key is released as soon as the call
+    finishes, so later callers run again (typically hitting a cache).
+
+    Sync and async callers share the same in-flight table, so a coroutine can
+    wait on a call led by a worker thread and vice versa.
+    """
+
+    def __init__(self, name: str = "single_flight") -> None:
+        """Initialize the group.
+
+        Args:
+            name: Name used in log and timeout messages.
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self.coalesced = 0
+
+    def _join(self, key: str) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _settle(
+        self, key: str, future: Future, result: object, error: BaseException | None
+    ) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if future.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            error = RuntimeError(f"{self.name}: in-flight call was cancelled")
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(
+        self, key: str, func: Callable[[], R], wait_timeout: float | None = None
+    ) -> R:
+        """Run ``func`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Coalescing key; calls with equal keys share one execution.
+            func: Zero-argument callable to run if no call is in flight.
+            wait_timeout: Maximum seconds a waiting caller blocks for the
+                leader (None waits indefinitely). The leader is not limited.
+
+        Returns:
+            The callable's return value, possibly computed by another caller.
+
+        Raises:
+            TimeoutError: If a waiting caller exceeds ``wait_timeout``.
+        """
+        future, leader = self._join(key)
+        if not leader:
+            try:
+                result: R = future.result(timeout=wait_timeout)
+            except FuturesTimeoutError:
+                raise TimeoutError(
+                    f"{self.name}: waited {wait_timeout}s for in-flight call"
+                ) from None
+            return result
+
+        try:
+            result = func()
+        except BaseException as e:
+            self._settle(key, future, None, e)
+            raise
+        self._settle(key, future, result, None)
+        return result
+
+    async def do_async(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[R]],
+        wait_timeout: float | None = None,
+    ) -> R:
+        """Await ``func`` once for all concurrent callers with the same key.
+
+        A waiting caller that is cancelled or times out stops waiting without
+        affecting the leader or other waiters.
+
+        Args:
+            key: Coalescing key; calls with equal keys share one execution.
+            func: Zero-argument coroutine function to await if no call is in
+                flight.
+            wait_timeout: Maximum seconds a waiting caller waits for the
+                leader (None waits indefinitely).
+
+        Returns:
+            The coroutine's result, possibly computed by another caller.
+
+        Raises:
+            TimeoutError: If a waiting caller exceeds ``wait_timeout``.
+        """
+        future, leader = self._join(key)
+        if not leader:
+            waiter = asyncio.shield(asyncio.wrap_future(future))
+            try:
+                return await asyncio.wait_for(waiter, timeout=wait_timeout)
+            except TimeoutError:
+                raise TimeoutError(
+                    f"{self.name}: waited {wait_timeout}s for in-flight call"
+                ) from None
+
+        try:
+            result = await func()
+        except BaseException as e:
+            self._settle(key, future, None, e)
+            raise
+        self._settle(key, future, result, None)
+        return result
+
+
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
@@ -0,0 +1,186 @@
+"""Versioned, byte-bounded cache of SQL query results.
+
+Results are stored as Arrow tables or capped Arrow previews and keyed by the
+canonical SQL text, its parameters and the database version (see
+``database_file_version``). When the version changes, for example after the
+populate pipeline rewrites the file, every cached result is dropped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from src.backend.utils.query_preview import QueryPreview
+
+    CachedResult: TypeAlias = pa.Table | QueryPreview
+
+
+DEFAULT_RESULT_CACHE_BYTES = 64 * 1024 * 1024
+
+_SQL_TOKEN_RE = re.compile(
+    r"""
+    (?P<literal>'(?:[^']|'')*'|"(?:[^"]|"")*")
+    | (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<space>\s+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def canonicalize_sql(sql: str) -> str:
+    """Normalize SQL text so trivially different spellings share a cache key.
+
+    Comments are removed, whitespace runs outside string literals and quoted
+    identifiers collapse to one space, and trailing semicolons are dropped.
+    Case is preserved because it affects output column names.
+
+    Args:
+        sql: SQL query text.
+
+    Returns:
+        Canonical SQL text.
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        if match.group("literal") is not None:
+            return match.group("literal")
+        return " "
+
+    canonical = _SQL_TOKEN_RE.sub(replace, sql)
+    canonical = re.sub(r" {2,}", " ", canonical).strip()
+    return canonical.rstrip(";").rstrip()
+
+
+def result_cache_key(
+    sql: str, params: list[Any] | None, version: str, variant: str = ""
+) -> str:
+    """Build the cache key for a query.
+
+    Args:
+        sql: SQL query text.
+        params: Query parameters, if any.
+        version: Database version fingerprint.
+        variant: Result shape, e.g. full table or a capped preview.
+
+    Returns:
+        Hex digest identifying the query and database state.
+    """
+    payload = json.dumps(
+        [version, variant, canonicalize_sql(sql), params or []],
+        default=str,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache of Arrow results bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_RESULT_CACHE_BYTES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total Arrow buffer size to keep (0 disables).
+        """
+        self.max_bytes = max(0, max_bytes)
+        self._entries: OrderedDict[str, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: str | None = None
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.max_bytes > 0
+
+    def _check_version(self, version: str) -> None:
+        """Drop every entry if the database version changed. Caller holds lock."""
+        if version != self._version:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
+
+    def get(self, key: str, version: str) -> CachedResult | None:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key from ``result_cache_key``.
+            version: Current database version fingerprint.
+
+        Returns:
+            Cached result, or None on a miss.
+        """
+        with self._lock:
+            self._check_version(version)
+            result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: str, result: CachedResult, version: str) -> None:
+        """Store a result, evicting least recently used entries to fit.
+
+        Results larger than the whole cache are not stored.
+
+        Args:
+            key: Cache key from ``result_cache_key``.
+            result: Query result (anything exposing ``nbytes``).
+            version: Database version the result was read from.
+        """
+        size = result.nbytes
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._check_version(version)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            while self._entries and self._bytes + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._evictions += 1
+            self._entries[key] = result
+            self._bytes += size
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return self._hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary with entry count, bytes used, hits, misses and evictions.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
@@ -0,0 +1,493 @@
+"""Warm process pool that runs generated pandas code.
+
+Snippets run in long-lived worker processes forked from a server that has
+already imported pandas, numpy and pyarrow, so a task pays neither interpreter
+start-up nor import time. Each worker runs under a memory rlimit, and each task
+under a CPU-time rlimit and a wall-clock deadline; a worker that misses its
+deadline is killed and replaced, so a runaway loop cannot keep a core busy.
+
+Input DataFrames are written once as Arrow IPC files in shared memory
+(``/dev/shm`` where available) and memory-mapped by the workers, instead of
+being pickled through the task pipe on every execution. A frame is republished
+only when a different object, shape or column set is passed. DataFrame results
+come back the same way.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import importlib
+import itertools
+import logging
+import math
+import multiprocessing as mp
+import pickle
+import queue
+import shutil
+import tempfile
+import threading
+import weakref
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Never
+
+import pandas as pd
+import pyarrow as pa
+
+from backend.config import (
+    SANDBOX_MAX_TASKS_PER_WORKER,
+    SANDBOX_MEMORY_LIMIT_MB,
+    SANDBOX_WORKERS,
+)
+
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, deadlines still apply
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+
+logger = logging.getLogger(__name__)
+
+# tmpfs; the pool creates a private (0700) directory inside it
+_SHARED_MEMORY_DIR = Path("/dev/shm")  # noqa: S108
+_FINAL_RESULT_MISSING = "Code did not define 'final_result' variable"
+
+
+def _blocked_global_call(*_args, **_kwargs) -> Never:
+    """Raise runtime error when globals() is called in sandbox."""
+    raise RuntimeError("globals() is not available in the sandbox")
+
+
+SAFE_BUILTINS: dict[str, Any] = {
+    "abs": abs,
+    "all": all,
+    "any": any,
+    "dict": dict,
+    "enumerate": enumerate,
+    "float": float,
+    "int": int,
+    "len": len,
+    "list": list,
+    "locals": locals,
+    "max": max,
+    "min": min,
+    "range": range,
+    "round": round,
+    "set": set,
+    "sorted": sorted,
+    "str": str,
+    "sum": sum,
+    "tuple": tuple,
+    "zip": zip,
+    "Exception": Exception,
+    "NameError": NameError,
+    "ValueError": ValueError,
+    "KeyError": KeyError,
+    "TypeError": TypeError,
+    "RuntimeError": RuntimeError,
+    "globals": _blocked_global_call,
+}
+
+
+@dataclass(frozen=True)
+class _Frame:
+    """A DataFrame handed to a worker: an Arrow file path, or the frame itself."""
+
+    path: str | None = None
+    frame: Any = None
+
+
+@dataclass
+class _Task:
+    code: str
+    frames: dict[str, _Frame] | None
+    dfs: Any
+    scope_imports: dict[str, str]
+    cpu_seconds: int | None
+    work_dir: str
+
+
+@dataclass
+class _Worker:
+    process: BaseProcess
+    conn: Connection
+    tasks: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Arrow hand-off
+# ---------------------------------------------------------------------------
+
+
+def _write_arrow(df: pd.DataFrame, path: Path) -> bool:
+    """Write a DataFrame as an Arrow IPC file; False if Arrow cannot hold it."""
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return False
+    with (
+        pa.OSFile(str(path), "wb") as sink,
+        pa.ipc.new_file(sink, table.schema) as writer,
+    ):
+        writer.write_table(table)
+    return True
+
+
+def _read_arrow(path: str) -> pd.DataFrame:
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+class _FrameStore:
+    """Arrow copies of input DataFrames, kept while the DataFrame is alive."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._frames: dict[int, tuple[weakref.ref, tuple, str]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(df: pd.DataFrame) -> tuple:
+        return df.shape, tuple(map(str, df.columns))
+
+    def publish(self, df: pd.DataFrame) -> _Frame:
+        key = id(df)
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached and cached[0]() is df and cached[1] == self._signature(df):
+                return _Frame(path=cached[2])
+
+            path = self.root / f"frame-{next(self._counter)}.arrow"
+            if not _write_arrow(df, path):
+                return _Frame(frame=df)
+            ref = weakref.ref(df, lambda _ref: self._discard(key, path))
+            self._frames[key] = (ref, self._signature(df), str(path))
+            return _Frame(path=str(path))
+
+    def _discard(self, key: int, path: Path) -> None:
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached and cached[2] == str(path):
+                del self._frames[key]
+        path.unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+
+def _limit_memory(memory_limit_mb: int) -> None:
+    if resource is None or memory_limit_mb <= 0:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    # RLIMIT_DATA counts heap and anonymous mappings, not the mapped Arrow files
+    with contextlib.suppress(ValueError, OSError):
+        resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+
+
+def _limit_cpu(seconds: int | None) -> None:
+    if resource is None:
+        return
+    _soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if seconds is None:
+        soft = hard
+    else:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime) + seconds
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    with contextlib.suppress(ValueError, OSError):
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _resolve_import(reference: str) -> Any:
+    module_name, _, attr = reference.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+
+def _load_dfs(task: _Task, cache: dict[str, pd.DataFrame]) -> Any:
+    if task.frames is None:
+        return task.dfs
+    dfs = {}
+    for name, frame in task.frames.items():
+        if frame.path is None:
+            dfs[name] = frame.frame
+            continue
+        if frame.path not in cache:
+            cache[frame.path] = _read_arrow(frame.path)
+        dfs[name] = cache[frame.path]
+    # Keep only the frames this task used, so dropped inputs are released
+    for path in set(cache) - {f.path for f in task.frames.values()}:
+        del cache[path]
+    return dfs
+
+
+def _pack_result(result: Any, work_dir: str) -> tuple[str, Any]:
+    if isinstance(result, pd.DataFrame):
+        with tempfile.NamedTemporaryFile(
+            dir=work_dir, prefix="result-", suffix=".arrow", delete=False
+        ) as f:
+            path = Path(f.name)
+        if _write_arrow(result, path):
+            return "arrow", str(path)
+        path.unlink(missing_ok=True)
+    pickle.dumps(result)
+    return "value", result
+
+
+def _run_task(task: _Task, cache: dict[str, pd.DataFrame]) -> tuple[str, Any, bool]:
+    """Run one snippet. Returns (status, (kind, payload) or message, recycle)."""
+    try:
+        _limit_cpu(task.cpu_seconds)
+        final_result_sentinel = object()
+        local_scope = {
+            "dfs": _load_dfs(task, cache),
+            "pd": pd,
+            "final_result": final_result_sentinel,
+            "__builtins__": dict(SAFE_BUILTINS),
+        }
+        for name, reference in task.scope_imports.items():
+            local_scope[name] = _resolve_import(reference)
+
+        exec(task.code, local_scope, local_scope)  # nosec B102  # noqa: S102
+
+        result = local_scope.get("final_result", final_result_sentinel)
+        if result is final_result_sentinel:
+            return "error", _FINAL_RESULT_MISSING, False
+        try:
+            return "success", _pack_result(result, task.work_dir), False
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            return "error", f"Result cannot be returned from the sandbox: {exc}", False
+    except MemoryError:
+        return "error", "Execution exceeded the sandbox memory limit", True
+    except Exception as exc:
+        return "error", str(exc), False
+    finally:
+        _limit_cpu(None)
+
+
+def _worker_main(conn: Connection, memory_limit_mb: int) -> None:
+    _limit_memory(memory_limit_mb)
+    cache: dict[str, pd.DataFrame] = {}
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        conn.send(_run_task(task, cache))
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+
+def _context() -> mp.context.ForkServerContext | mp.context.SpawnContext:
+    if "forkserver" in mp.get_all_start_methods():
+        ctx = mp.get_context("forkserver")
+        # Workers fork from a server that already imported pandas/numpy/pyarrow
+        ctx.set_forkserver_preload([__name__, "numpy"])
+        return ctx
+    return mp.get_context("spawn")
+
+
+@dataclass
+class SandboxStats:
+    """Counters for the sandbox pool."""
+
+    tasks: int = 0
+    timeouts: int = 0
+    crashes: int = 0
+    recycled: int = 0
+
+
+class SandboxPool:
+    """Pool of warm worker processes that run code snippets in isolation."""
+
+    def __init__(
+        self,
+        workers: int = SANDBOX_WORKERS,
+        memory_limit_mb: int = SANDBOX_MEMORY_LIMIT_MB,
+        max_tasks_per_worker: int = SANDBOX_MAX_TASKS_PER_WORKER,
+    ) -> None:
+        """Initialize the pool. Workers start on first use.
+
+        Args:
+            workers: Number of worker processes.
+            memory_limit_mb: Per-worker data segment limit (0 disables).
+            max_tasks_per_worker: Tasks after which a worker is replaced.
+        """
+        self.workers = max(1, workers)
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_worker = max(1, max_tasks_per_worker)
+        self.stats = SandboxStats()
+        self._ctx = _context()
+        shm = _SHARED_MEMORY_DIR if _SHARED_MEMORY_DIR.is_dir() else None
+        self._root = Path(tempfile.mkdtemp(prefix="nba-sandbox-", dir=shm))
+        self._frames = _FrameStore(self._root)
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    @property
+    def shared_dir(self) -> Path:
+        """Directory holding the Arrow files of frames shared with workers."""
+        return self._root
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.memory_limit_mb),
+            name="nba-sandbox-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process=process, conn=parent_conn)
+
+    def start(self) -> None:
+        """Start the worker processes if they are not running yet."""
+        with self._lock:
+            if self._started or self._closed:
+                return
+            self._started = True
+            for _ in range(self.workers):
+                self._idle.put(self._spawn())
+        logger.info(f"Started {self.workers} sandbox workers")
+
+    def _stop(self, worker: _Worker, *, kill: bool) -> None:
+        if kill:
+            worker.process.kill()
+        else:
+            with contextlib.suppress(OSError):
+                worker.conn.send(None)
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.conn.close()
+
+    def _replace(self, worker: _Worker, *, kill: bool) -> None:
+        self._stop(worker, kill=kill)
+        self.stats.recycled += 1
+        if not self._closed:
+            self._idle.put(self._spawn())
+
+    def _prepare_dfs(self, dfs: Any) -> tuple[dict[str, _Frame] | None, Any]:
+        if not isinstance(dfs, Mapping):
+            return None, dfs
+        return {
+            name: self._frames.publish(df)
+            if isinstance(df, pd.DataFrame)
+            else _Frame(frame=df)
+            for name, df in dfs.items()
+        }, None
+
+    def run(
+        self,
+        code: str,
+        dfs: Any,
+        *,
+        scope_imports: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[str, Any]:
+        """Run a snippet in a worker and return its ``final_result``.
+
+        Args:
+            code: Python source that assigns ``final_result``.
+            dfs: DataFrames exposed to the code as ``dfs``.
+            scope_imports: Extra names to bind in the worker, as ``"module"``
+                or ``"module:attribute"`` references.
+            timeout: Wall-clock seconds before the worker is killed (None for
+                no deadline). Also bounds the task's CPU time.
+
+        Returns:
+            ``("success", final_result)`` or ``("error", message)``.
+        """
+        self.start()
+        frames, plain_dfs = self._prepare_dfs(dfs)
+        task = _Task(
+            code=code,
+            frames=frames,
+            dfs=plain_dfs,
+            scope_imports=dict(scope_imports or {}),
+            cpu_seconds=math.ceil(timeout) if timeout else None,
+            work_dir=str(self._root),
+        )
+        try:
+            message = pickle.dumps(task)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            return "error", f"Inputs cannot be passed to the sandbox: {exc}"
+
+        worker = self._idle.get()
+        self.stats.tasks += 1
+        try:
+            worker.conn.send_bytes(message)
+            if not worker.conn.poll(timeout):
+                self.stats.timeouts += 1
+                self._replace(worker, kill=True)
+                return (
+                    "error",
+                    f"Execution timed out after {timeout} seconds. The code may be stuck in an infinite loop or processing too much data.",
+                )
+            status, payload, recycle = worker.conn.recv()
+        except (EOFError, OSError) as exc:
+            self.stats.crashes += 1
+            self._replace(worker, kill=True)
+            exitcode = worker.process.exitcode
+            return "error", f"Sandbox worker failed (exit code {exitcode}): {exc}"
+
+        worker.tasks += 1
+        if recycle or worker.tasks >= self.max_tasks_per_worker:
+            self._replace(worker, kill=False)
+        else:
+            self._idle.put(worker)
+
+        if status != "success":
+            return status, payload
+        kind, value = payload
+        if kind == "arrow":
+            try:
+                return status, _read_arrow(value)
+            finally:
+                Path(value).unlink(missing_ok=True)
+        return status, value
+
+    def close(self) -> None:
+        """Stop all workers and remove the shared-memory files."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._stop(worker, kill=False)
+        shutil.rmtree(self._root, ignore_errors=True)
+
+
+@lru_cache(maxsize=1)
+def get_sandbox_pool() -> SandboxPool:
+    """Get the process-wide sandbox pool.
+
+    Returns:
+        Sandbox pool, closed at interpreter exit.
+    """
+    pool = SandboxPool()
+    atexit.register(pool.close)
+    return pool
@@ -0,0 +1,225 @@
+"""Persisted table-embedding index for table selection.
+
+Table embeddings depend only on each table's name, description and columns,
+so they are computed once per database schema and saved next to the DuckDB
+file. When the schema changes, only the tables whose embedding text changed
+are re-embedded, in a single ``embed_batch`` call. Fallback vectors returned
+while the embedding API is failing are used for that sync only and never
+saved, so those tables are embedded again on the next sync.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.backend.utils.embeddings import (
+    FALLBACK_MODEL,
+    embed_batch_with_fallbacks,
+    get_embedding_service,
+)
+
+
+if TYPE_CHECKING:
+    from src.backend.models import TableMeta
+    from src.backend.utils.vector_index import CandidateMatrix
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".table_index.npz"
+CANDIDATE_SET_NAME = "tables"
+
+
+def table_embedding_text(table: TableMeta) -> str:
+    """Build the text embedded for a table.
+
+    Args:
+        table: Table metadata.
+
+    Returns:
+        Text combining the table name, description and leading columns.
+    """
+    text = f"{table.name}: {table.description}"
+    if table.columns:
+        cols = ", ".join(table.columns[:10])
+        text += f" (columns: {cols})"
+    return text
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class TableEmbeddingIndex:
+    """Table embeddings for one database, persisted as an ``.npz`` sidecar."""
+
+    def __init__(self, index_path: Path) -> None:
+        """Initialize the index. The sidecar is read on first sync.
+
+        Args:
+            index_path: Path of the ``.npz`` file holding the index.
+        """
+        self.index_path = index_path
+        self.fingerprint: str | None = None
+        self._model: str | None = None
+        self._vectors: dict[str, np.ndarray] = {}
+        self._text_hashes: dict[str, str] = {}
+        self._candidates: CandidateMatrix | None = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def compute_fingerprint(text_hashes: dict[str, str], model: str) -> str:
+        """Fingerprint a schema from its per-table text hashes.
+
+        Args:
+            text_hashes: Table name to embedding-text hash, in table order.
+            model: Embedding model identifier.
+
+        Returns:
+            Hex digest identifying the schema and model.
+        """
+        digest = hashlib.sha256(model.encode())
+        for name, text_hash in text_hashes.items():
+            digest.update(f"{name}\0{text_hash}\n".encode())
+        return digest.hexdigest()
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.index_path.exists():
+            return
+        try:
+            with np.load(self.index_path) as data:
+                names = data["names"].tolist()
+                hashes = data["text_hashes"].tolist()
+                vectors = data["vectors"]
+                self._model = str(data["model"])
+                self.fingerprint = str(data["fingerprint"])
+            self._text_hashes = dict(zip(names, hashes, strict=True))
+            self._vectors = {
+                name: vectors[i].astype(np.float32) for i, name in enumerate(names)
+            }
+            logger.debug(f"Loaded {len(names)} table embeddings from {self.index_path}")
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Failed to load table embedding index: {e}")
+            self._vectors = {}
+            self._text_hashes = {}
+            self.fingerprint = None
+
+    def _save(self) -> None:
+        names = list(self._vectors)
+        vectors = (
+            np.stack([self._vectors[name] for name in names])
+            if names
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    names=np.array(names, dtype=str),
+                    text_hashes=np.array(
+                        [self._text_hashes[n] for n in names], dtype=str
+                    ),
+                    vectors=vectors,
+                    model=np.array(self._model or ""),
+                    fingerprint=np.array(self.fingerprint or ""),
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to save table embedding index: {e}")
+
+    def sync(self, tables: list[TableMeta]) -> CandidateMatrix:
+        """Bring the index up to date with ``tables`` and return its matrix.
+
+        Args:
+            tables: Current table metadata, in preferred ranking order.
+
+        Returns:
+            Candidate matrix registered under the "tables" candidate set.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            service = get_embedding_service()
+            model = service.active_model
+            texts = {table.name: table_embedding_text(table) for table in tables}
+            text_hashes = {name: _text_hash(text) for name, text in texts.items()}
+            fingerprint = self.compute_fingerprint(text_hashes, model)
+
+            if fingerprint == self.fingerprint and self._candidates is not None:
+                return self._candidates
+
+            if model != self._model:
+                self._vectors.clear()
+                self._text_hashes.clear()
+                self._model = model
+
+            changed = [
+                name
+                for name, text_hash in text_hashes.items()
+                if self._text_hashes.get(name) != text_hash or name not in self._vectors
+            ]
+            provisional: dict[str, np.ndarray] = {}
+            if changed:
+                logger.info(f"Embedding {len(changed)} changed tables")
+                embeddings, fallbacks = embed_batch_with_fallbacks(
+                    [texts[name] for name in changed]
+                )
+                for name, embedding, fallback in zip(
+                    changed, embeddings, fallbacks, strict=True
+                ):
+                    vector = np.asarray(embedding, dtype=np.float32)
+                    if fallback and model != FALLBACK_MODEL:
+                        provisional[name] = vector
+                        continue
+                    self._vectors[name] = vector
+                    self._text_hashes[name] = text_hashes[name]
+                if provisional:
+                    logger.warning(
+                        f"Using fallback embeddings for {len(provisional)} tables "
+                        "until the embedding API recovers"
+                    )
+
+            removed = set(self._vectors) - set(texts)
+            for name in removed:
+                self._vectors.pop(name, None)
+                self._text_hashes.pop(name, None)
+
+            # With provisional vectors the index is not in sync: nothing is
+            # saved and the next call embeds those tables again
+            stale = fingerprint != self.fingerprint
+            self.fingerprint = None if provisional else fingerprint
+            if stale and not provisional:
+                self._save()
+
+            vectors = {**self._vectors, **provisional}
+            self._candidates = service.register_candidates(
+                CANDIDATE_SET_NAME,
+                {name: vectors[name] for name in texts},
+            )
+            return self._candidates
+
+
+@lru_cache(maxsize=8)
+def get_table_embedding_index(db_path: str | Path) -> TableEmbeddingIndex:
+    """Get the process-wide table-embedding index for a database file.
+
+    Args:
+        db_path: Path to the DuckDB database.
+
+    Returns:
+        Table embedding index persisted next to the database.
+    """
+    db_path = Path(db_path)
+    return TableEmbeddingIndex(db_path.with_name(db_path.name + INDEX_SUFFIX))
@@ -0,0 +1,435 @@
+"""Parameterized question-to-SQL templates learned from graded answers.
+
+When an answer passes the ResponseGrader, its rewritten question and SQL are
+generalized into a template: literals that also appear in the question
+(seasons, stat names, entity names) become slots. A later question with the
+same shape matches the template's pattern, its slots are filled from the new
+question, and the rendered SQL goes straight to execution.
+
+Templates are persisted in SQLite next to the other runtime data and loaded
+into memory on first use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DB = Path(__file__).parent.parent / "data" / "sql_templates.sqlite3"
+
+# Question wording -> stat column. Longer phrases are matched first.
+STAT_TERMS = {
+    "points": "pts",
+    "rebounds": "reb",
+    "offensive rebounds": "oreb",
+    "defensive rebounds": "dreb",
+    "assists": "ast",
+    "steals": "stl",
+    "blocks": "blk",
+    "turnovers": "tov",
+    "three pointers": "fg3m",
+    "threes": "fg3m",
+    "free throws": "ftm",
+    "field goal percentage": "fg_pct",
+    "plus minus": "plus_minus",
+}
+
+_SEASON_PATTERN = r"(?:19|20)\d{2}(?:-\d{2})?"
+_STAT_PATTERN = "|".join(
+    re.escape(term) for term in sorted(STAT_TERMS, key=len, reverse=True)
+)
+_SEASON_RE = re.compile(rf"\b({_SEASON_PATTERN})\b")
+_STAT_RE = re.compile(rf"\b({_STAT_PATTERN})\b", re.IGNORECASE)
+_STRING_LITERAL_RE = re.compile(r"'((?:[^']|'')*)'")
+# Words that join or qualify names rather than belong to one
+_ENTITY_STOPWORDS = (
+    "and|or|vs|versus|with|without|against|than|in|of|on|at|for|from|to|by|"
+    "per|during|the|this|that|his|her|their"
+)
+# An entity is up to four name-like words, so a slot cannot swallow a second
+# name or the rest of a longer question
+_ENTITY_WORD = rf"(?!(?:{_ENTITY_STOPWORDS})\b)[\w.'-]+"
+_ENTITY_PATTERN = rf"{_ENTITY_WORD}(?: {_ENTITY_WORD}){{0,3}}"
+_SLOT_PATTERNS = {
+    "season": _SEASON_PATTERN,
+    "stat": _STAT_PATTERN,
+    "entity": _ENTITY_PATTERN,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    template_id TEXT PRIMARY KEY,
+    pattern TEXT NOT NULL,
+    sql TEXT NOT NULL,
+    slots TEXT NOT NULL,
+    tables TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class Slot:
+    """A placeholder lifted from a question and its SQL.
+
+    ``fmt`` records how the question value was written into the SQL:
+    ``range:<offset>`` or ``year`` for seasons, ``upper``/``lower`` for stat
+    columns and entity names, or empty for verbatim.
+    """
+
+    name: str
+    kind: str
+    fmt: str = ""
+
+
+@dataclass
+class SQLTemplate:
+    """A question pattern and the SQL that answers it."""
+
+    template_id: str
+    pattern: str
+    sql: str
+    slots: list[Slot] = field(default_factory=list)
+    tables: list[str] = field(default_factory=list)
+    hits: int = 0
+
+    def __post_init__(self) -> None:
+        """Compile the question pattern."""
+        self._regex = _compile_pattern(self.pattern, self.slots)
+
+    def match(self, question: str) -> dict[str, str] | None:
+        """Extract slot values from a question with this template's shape.
+
+        Args:
+            question: Question text.
+
+        Returns:
+            Slot values keyed by slot name, or None if the question differs.
+        """
+        found = self._regex.fullmatch(normalize_question(question))
+        if found is None:
+            return None
+        return {slot.name: found.group(slot.name) for slot in self.slots}
+
+    def render(self, values: dict[str, str]) -> str:
+        """Fill the SQL slots.
+
+        Args:
+            values: Slot values from ``match``.
+
+        Returns:
+            Executable SQL.
+        """
+        rendered = {
+            slot.name: _render_slot(slot, values[slot.name]) for slot in self.slots
+        }
+        return self.sql.format(**rendered)
+
+
+def normalize_question(question: str) -> str:
+    """Collapse whitespace and drop trailing punctuation."""
+    return " ".join(question.split()).rstrip("?.! ")
+
+
+def _compile_pattern(pattern: str, slots: list[Slot]) -> re.Pattern[str]:
+    kinds = {slot.name: slot.kind for slot in slots}
+    parts = re.split(r"\{(\w+)\}", pattern)
+    regex = []
+    for idx, part in enumerate(parts):
+        if idx % 2 == 0:
+            regex.append(re.escape(part))
+        else:
+            regex.append(f"(?P<{part}>{_SLOT_PATTERNS[kinds[part]]})")
+    return re.compile("".join(regex), re.IGNORECASE)
+
+
+def _season_literal(start_year: int, fmt: str) -> str:
+    if fmt == "year":
+        return str(start_year)
+    year = start_year + int(fmt.split(":", 1)[1])
+    return f"{year}-{(year + 1) % 100:02d}"
+
+
+def _apply_case(value: str, fmt: str) -> str:
+    if fmt == "upper":
+        return value.upper()
+    if fmt == "lower":
+        return value.lower()
+    return value
+
+
+def _render_slot(slot: Slot, value: str) -> str:
+    if slot.kind == "season":
+        # An explicit "2019-20" names the season; a bare year follows the
+        # offset learned from the original question.
+        fmt = "range:0" if "-" in value and slot.fmt != "year" else slot.fmt
+        return _season_literal(int(value[:4]), fmt)
+    if slot.kind == "stat":
+        return _apply_case(STAT_TERMS[value.lower()], slot.fmt)
+    return _apply_case(value, slot.fmt).replace("'", "''")
+
+
+def _replace_bounded(sql: str, literal: str, placeholder: str) -> tuple[str, int]:
+    """Replace ``literal`` where it is not part of a longer number or word."""
+    return re.subn(rf"(?<![\w-]){re.escape(literal)}(?![\w-])", placeholder, sql)
+
+
+def _lift_seasons(question: str, sql: str, spans: list[tuple[int, int, Slot]]) -> str:
+    for found in _SEASON_RE.finditer(question):
+        start_year = int(found.group(1)[:4])
+        name = f"season_{len(spans)}"
+        for fmt in ("range:0", "range:-1", "year"):
+            sql, count = _replace_bounded(
+                sql, _season_literal(start_year, fmt), f"{{{name}}}"
+            )
+            if count:
+                spans.append((found.start(), found.end(), Slot(name, "season", fmt)))
+                break
+    return sql
+
+
+def _lift_stats(question: str, sql: str, spans: list[tuple[int, int, Slot]]) -> str:
+    for found in _STAT_RE.finditer(question):
+        column = STAT_TERMS[found.group(1).lower()]
+        name = f"stat_{len(spans)}"
+        for fmt, form in (("lower", column), ("upper", column.upper())):
+            sql, count = _replace_bounded(sql, form, f"{{{name}}}")
+            if count:
+                spans.append((found.start(), found.end(), Slot(name, "stat", fmt)))
+                break
+    return sql
+
+
+def _entity_case(core: str, span_text: str) -> str | None:
+    """Return how the SQL literal relates to the question text, if at all."""
+    if core == span_text:
+        return ""
+    if core == span_text.lower():
+        return "lower"
+    if core == span_text.upper():
+        return "upper"
+    return None
+
+
+def _lift_entities(question: str, sql: str, spans: list[tuple[int, int, Slot]]) -> str:
+    def replace(literal: re.Match[str]) -> str:
+        core = literal.group(1).replace("''", "'").strip("%")
+        if len(core) < 2 or "{" in literal.group(1):
+            return literal.group(0)
+        found = re.search(rf"\b{re.escape(core)}\b", question, re.IGNORECASE)
+        if found is None or any(
+            start < found.end() and found.start() < end for start, end, _ in spans
+        ):
+            return literal.group(0)
+        fmt = _entity_case(core, found.group(0))
+        if fmt is None:
+            return literal.group(0)
+        name = f"entity_{len(spans)}"
+        spans.append((found.start(), found.end(), Slot(name, "entity", fmt)))
+        escaped = core.replace("'", "''")
+        return "'" + literal.group(1).replace(escaped, f"{{{name}}}", 1) + "'"
+
+    return _STRING_LITERAL_RE.sub(replace, sql)
+
+
+def build_template(
+    question: str, sql: str, tables: list[str] | None = None
+) -> SQLTemplate:
+    """Generalize a question and its SQL into a template.
+
+    Args:
+        question: Rewritten question that the SQL answered.
+        sql: SQL that passed grading.
+        tables: Tables the SQL was generated from.
+
+    Returns:
+        Template whose slots cover every season, stat and entity literal that
+        appears in both the question and the SQL.
+    """
+    question = normalize_question(question)
+    sql = sql.strip().replace("{", "{{").replace("}", "}}")
+    spans: list[tuple[int, int, Slot]] = []
+    sql = _lift_seasons(question, sql, spans)
+    sql = _lift_stats(question, sql, spans)
+    sql = _lift_entities(question, sql, spans)
+
+    pattern_parts = []
+    cursor = 0
+    for start, end, slot in sorted(spans, key=lambda span: span[0]):
+        pattern_parts.append(question[cursor:start].replace("{", "").replace("}", ""))
+        pattern_parts.append(f"{{{slot.name}}}")
+        cursor = end
+    pattern_parts.append(question[cursor:].replace("{", "").replace("}", ""))
+    pattern = "".join(pattern_parts)
+
+    template_id = hashlib.sha256(pattern.lower().encode()).hexdigest()[:16]
+    return SQLTemplate(
+        template_id=template_id,
+        pattern=pattern,
+        sql=sql,
+        slots=[slot for _, _, slot in spans],
+        tables=list(tables or []),
+    )
+
+
+class TemplateStore:
+    """SQLite-backed store of SQL templates with an in-memory index."""
+
+    def __init__(self, path: Path = TEMPLATE_DB) -> None:
+        """Initialize the store. Templates are loaded on first use.
+
+        Args:
+            path: SQLite database file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._templates: dict[str, SQLTemplate] | None = None
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _load(self) -> dict[str, SQLTemplate]:
+        """Load templates from disk. Caller must hold the lock."""
+        if self._templates is not None:
+            return self._templates
+        self._templates = {}
+        try:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT template_id, pattern, sql, slots, tables, hits FROM templates"
+                )
+                .fetchall()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to load SQL templates: {e}")
+            return self._templates
+        for template_id, pattern, sql, slots, tables, hits in rows:
+            self._templates[template_id] = SQLTemplate(
+                template_id=template_id,
+                pattern=pattern,
+                sql=sql,
+                slots=[Slot(**slot) for slot in json.loads(slots)],
+                tables=json.loads(tables),
+                hits=hits,
+            )
+        return self._templates
+
+    def _write(self, sql: str, params: tuple) -> None:
+        """Run one write statement. Caller must hold the lock."""
+        try:
+            with self._connect() as conn:
+                conn.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist SQL template: {e}")
+
+    def record(
+        self, question: str, sql: str, tables: list[str] | None = None
+    ) -> SQLTemplate:
+        """Learn a template from a graded question and SQL.
+
+        Args:
+            question: Rewritten question that the SQL answered.
+            sql: SQL that passed grading.
+            tables: Tables the SQL was generated from.
+
+        Returns:
+            The stored template.
+        """
+        template = build_template(question, sql, tables)
+        with self._lock:
+            existing = self._load().get(template.template_id)
+            if existing is not None:
+                template.hits = existing.hits
+            self._templates[template.template_id] = template
+            self._write(
+                "INSERT OR REPLACE INTO templates VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    template.template_id,
+                    template.pattern,
+                    template.sql,
+                    json.dumps([asdict(slot) for slot in template.slots]),
+                    json.dumps(template.tables),
+                    template.hits,
+                    time.time(),
+                ),
+            )
+        logger.debug(f"Recorded SQL template {template.pattern!r}")
+        return template
+
+    def match(self, question: str) -> tuple[SQLTemplate, str] | None:
+        """Find a template for a question and render its SQL.
+
+        Templates with fewer free-text entity slots are tried first, since
+        they constrain the question more tightly.
+
+        Args:
+            question: Rewritten question.
+
+        Returns:
+            The matching template and its rendered SQL, or None.
+        """
+        with self._lock:
+            templates = list(self._load().values())
+        templates.sort(
+            key=lambda t: (sum(slot.kind == "entity" for slot in t.slots), -t.hits)
+        )
+        for template in templates:
+            values = template.match(question)
+            if values is None:
+                continue
+            try:
+                return template, template.render(values)
+            except (KeyError, ValueError) as e:
+                logger.debug(f"Template {template.template_id} failed to render: {e}")
+        return None
+
+    def mark_hit(self, template_id: str) -> None:
+        """Count a successful reuse of a template."""
+        with self._lock:
+            template = self._load().get(template_id)
+            if template is None:
+                return
+            template.hits += 1
+            self._write(
+                "UPDATE templates SET hits = ? WHERE template_id = ?",
+                (template.hits, template_id),
+            )
+
+    def discard(self, template_id: str) -> None:
+        """Forget a template whose answer failed."""
+        with self._lock:
+            self._load().pop(template_id, None)
+            self._write("DELETE FROM templates WHERE template_id = ?", (template_id,))
+
+    def __len__(self) -> int:
+        """Number of stored templates."""
+        with self._lock:
+            return len(self._load())
+
+
+@lru_cache(maxsize=1)
+def get_template_store() -> TemplateStore:
+    """Get the process-wide template store.
+
+    Returns:
+        Shared TemplateStore instance.
+    """
+    return TemplateStore()
@@ -0,0 +1,1023 @@
+"""Static, catalog-aware validation of generated SQL.
+
+Generated SQL is tokenized and parsed once into a tree of parenthesized
+groups. Each query block (the statement, CTEs, derived tables and
+subqueries) gets a scope of relations resolved against a table catalog, and
+every column reference is checked against the relations it can see, including
+correlated references to enclosing scopes. Anything the parser cannot
+interpret (PIVOT, table functions, ``SELECT *`` CTEs) makes the affected scope
+lenient rather than producing false errors; DuckDB's ``EXPLAIN`` remains the
+authoritative check for statements that pass.
+
+Trivial problems are repaired locally instead of costing another LLM call:
+table name case mismatches, a table or column name with exactly one close
+match in scope, and an unterminated string literal. Column case is left as
+written because DuckDB resolves it case-insensitively and it names the output.
+"""
+
+from __future__ import annotations
+
+import difflib
+import itertools
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypeGuard
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from src.backend.utils.db_catalog import DatabaseCatalog
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<quoted>"(?:[^"]|"")*")
+    | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+    | (?P<ident>[A-Za-z_][A-Za-z0-9_$]*)
+    | (?P<param>\$\w+|\?)
+    | (?P<op>::|:=|->>|->|<=|>=|<>|!=|==|\|\||\*\*|//|[-+*/%=<>!~^&|:;\[\]{}\#@])
+    | (?P<punct>[(),.])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Where an unterminated string literal most plausibly ends
+_LITERAL_END_RE = re.compile(
+    r"\s*(?:\)|,|;|\Z)"
+    r"|\s+(?:AND|OR|ORDER|GROUP|LIMIT|HAVING|UNION|THEN|WHEN|ELSE|END)\b",
+    re.IGNORECASE,
+)
+# An apostrophe inside a name, e.g. 'Shaquille O'Neal'
+_INNER_APOSTROPHE_RE = re.compile(r"(?<=[A-Za-z])'(?=[A-Za-z])")
+_PLAIN_IDENTIFIER_RE = re.compile(r"[a-z_][a-z0-9_]*")
+
+_JOIN_WORDS = frozenset(
+    {
+        "LEFT",
+        "RIGHT",
+        "INNER",
+        "OUTER",
+        "FULL",
+        "CROSS",
+        "NATURAL",
+        "ASOF",
+        "POSITIONAL",
+        "ANTI",
+        "SEMI",
+    }
+)
+_CLAUSE_WORDS = frozenset(
+    {"WHERE", "GROUP", "HAVING", "QUALIFY", "WINDOW", "ORDER", "LIMIT", "OFFSET"}
+)
+_SET_OPERATIONS = frozenset({"UNION", "INTERSECT", "EXCEPT"})
+
+# Words that never name a column when unquoted: SQL keywords, type names,
+# date parts and niladic functions
+_KEYWORDS = (
+    _JOIN_WORDS
+    | _CLAUSE_WORDS
+    | _SET_OPERATIONS
+    | frozenset(
+        """
+        SELECT FROM JOIN ON USING AS WITH RECURSIVE MATERIALIZED DISTINCT ALL
+        AND OR NOT IN IS NULL LIKE ILIKE GLOB SIMILAR ESCAPE BETWEEN EXISTS
+        ANY SOME CASE WHEN THEN ELSE END BY ASC DESC NULLS FIRST LAST FETCH
+        NEXT ONLY OVER PARTITION ROWS RANGE GROUPS UNBOUNDED PRECEDING
+        FOLLOWING CURRENT ROW TIES EXCLUDE REPLACE RENAME FILTER WITHIN TRUE
+        FALSE CAST TRY_CAST INTERVAL LATERAL COLLATE SAMPLE TABLESAMPLE PIVOT
+        UNPIVOT VALUES TABLE NAME FOR BOTH LEADING TRAILING AT ZONE ARRAY MAP
+        STRUCT LIST UNNEST ROLLUP CUBE SETS GROUPING
+        CURRENT_DATE CURRENT_TIME CURRENT_TIMESTAMP LOCALTIME LOCALTIMESTAMP
+        INTEGER INT INT2 INT4 INT8 BIGINT SMALLINT TINYINT HUGEINT UBIGINT
+        UINTEGER USMALLINT UTINYINT DOUBLE FLOAT FLOAT4 FLOAT8 REAL DECIMAL
+        NUMERIC VARCHAR CHAR TEXT STRING BOOLEAN BOOL BLOB DATE TIME TIMESTAMP
+        TIMESTAMPTZ UUID JSON PRECISION VARYING WITHOUT
+        MILLENNIUM CENTURY DECADE YEAR YEARS QUARTER MONTH MONTHS WEEK WEEKS
+        DAY DAYS DOW DOY EPOCH HOUR HOURS MINUTE MINUTES SECOND SECONDS
+        MILLISECOND MILLISECONDS MICROSECOND MICROSECONDS
+        """.split()  # noqa: SIM905
+    )
+)
+
+_UNRESOLVED = object()
+
+
+class SQLSyntaxError(ValueError):
+    """SQL text that cannot be tokenized or whose parentheses do not balance."""
+
+    def __init__(self, message: str, position: int, kind: str = "syntax") -> None:
+        super().__init__(message)
+        self.position = position
+        self.kind = kind
+
+
+@dataclass(frozen=True)
+class Token:
+    """A lexical token and its span in the SQL text."""
+
+    kind: str
+    text: str
+    start: int
+    end: int
+
+    @property
+    def word(self) -> str:
+        """Upper-cased text of an unquoted identifier, otherwise empty."""
+        return self.text.upper() if self.kind == "ident" else ""
+
+    @property
+    def name(self) -> str:
+        """Identifier name with quotes removed."""
+        if self.kind == "quoted":
+            return self.text[1:-1].replace('""', '"')
+        return self.text
+
+    @property
+    def is_name(self) -> bool:
+        """Whether the token is an identifier (quoted or not)."""
+        return self.kind in {"ident", "quoted"}
+
+
+@dataclass
+class _Group:
+    """A parenthesized run of tokens and nested groups."""
+
+    items: list[Token | _Group]
+
+    @property
+    def is_query(self) -> bool:
+        first = self.items[0] if self.items else None
+        return isinstance(first, Token) and first.word in {"SELECT", "WITH"}
+
+
+Columns = dict[str, str]
+
+
+@dataclass
+class _Relation:
+    """A table, CTE or derived table visible in a query block."""
+
+    name: str | None
+    columns: Columns | None
+
+
+@dataclass
+class _Scope:
+    """Relations and output aliases of one query block."""
+
+    parent: _Scope | None
+    relations: list[_Relation] = field(default_factory=list)
+    aliases: set[str] = field(default_factory=set)
+    opaque: bool = False
+
+    def find_relation(self, name: str) -> _Relation | None:
+        key = name.lower()
+        scope: _Scope | None = self
+        while scope is not None:
+            for relation in scope.relations:
+                if relation.name is not None and relation.name.lower() == key:
+                    return relation
+            scope = scope.parent
+        return None
+
+    def resolve_column(self, name: str) -> object:
+        """Find a column by name in this scope or an enclosing one.
+
+        Returns:
+            The catalog spelling of the column, ``_UNRESOLVED`` when a scope
+            with unknown columns could supply it, or None if no relation has it.
+        """
+        key = name.lower()
+        scope: _Scope | None = self
+        seen_relation = False
+        while scope is not None:
+            if key in scope.aliases:
+                return name
+            unknown = scope.opaque
+            for relation in scope.relations:
+                seen_relation = True
+                if relation.columns is None:
+                    unknown = True
+                elif key in relation.columns:
+                    return relation.columns[key]
+            if unknown:
+                return _UNRESOLVED
+            scope = scope.parent
+        return None if seen_relation else _UNRESOLVED
+
+    def visible_columns(self) -> Columns:
+        """Known columns of the relations in this block."""
+        columns: Columns = {}
+        for relation in self.relations:
+            columns.update(relation.columns or {})
+        return columns
+
+
+@dataclass
+class StaticValidation:
+    """Outcome of validating one SQL statement."""
+
+    sql: str
+    errors: list[str] = field(default_factory=list)
+    fixes: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether no errors remain after local repairs."""
+        return not self.errors
+
+
+@dataclass
+class _Context:
+    """Errors and pending text edits collected during one validation."""
+
+    errors: list[str] = field(default_factory=list)
+    fixes: list[str] = field(default_factory=list)
+    edits: dict[int, tuple[int, str]] = field(default_factory=dict)
+    lambdas: set[str] = field(default_factory=set)
+
+    def error(self, message: str) -> None:
+        if message not in self.errors:
+            self.errors.append(message)
+
+    def rename(self, token: Token, name: str, fix: str) -> None:
+        if token.start in self.edits:
+            return
+        self.edits[token.start] = (token.end, _render_identifier(name, token))
+        if fix not in self.fixes:
+            self.fixes.append(fix)
+
+
+def tokenize(sql: str) -> list[Token]:
+    """Split SQL into tokens, dropping whitespace and comments.
+
+    Args:
+        sql: SQL text.
+
+    Returns:
+        Tokens in order.
+
+    Raises:
+        SQLSyntaxError: On an unterminated literal or an unknown character.
+    """
+    tokens: list[Token] = []
+    pos = 0
+    while pos < len(sql):
+        match = _TOKEN_RE.match(sql, pos)
+        if match is None:
+            char = sql[pos]
+            if char == "'":
+                raise SQLSyntaxError(
+                    f"Unterminated string literal at position {pos}",
+                    pos,
+                    "unterminated_string",
+                )
+            if char == '"':
+                raise SQLSyntaxError(
+                    f"Unterminated quoted identifier at position {pos}",
+                    pos,
+                    "unterminated_identifier",
+                )
+            raise SQLSyntaxError(
+                f"Unexpected character {char!r} at position {pos}", pos
+            )
+        kind = match.lastgroup or ""
+        if kind == "punct":
+            kind = match.group()
+        if kind not in {"space", "comment"}:
+            tokens.append(Token(kind, match.group(), match.start(), match.end()))
+        pos = match.end()
+    return tokens
+
+
+def _nest(tokens: list[Token]) -> list[Token | _Group]:
+    """Fold a token list into nested parenthesized groups."""
+    stack: list[list[Token | _Group]] = [[]]
+    opened: list[Token] = []
+    for token in tokens:
+        if token.kind == "(":
+            opened.append(token)
+            stack.append([])
+        elif token.kind == ")":
+            if not opened:
+                raise SQLSyntaxError(
+                    f"Unbalanced ')' at position {token.start}", token.start
+                )
+            opened.pop()
+            items = stack.pop()
+            stack[-1].append(_Group(items))
+        else:
+            stack[-1].append(token)
+    if opened:
+        raise SQLSyntaxError(
+            f"Unclosed '(' at position {opened[-1].start}", opened[-1].start
+        )
+    return stack[0]
+
+
+def _render_identifier(name: str, original: Token) -> str:
+    if original.kind == "quoted" or not _PLAIN_IDENTIFIER_RE.fullmatch(name.lower()):
+        return '"' + name.replace('"', '""') + '"'
+    return name
+
+
+def _is_word(item: Token | _Group | None, *words: str) -> TypeGuard[Token]:
+    return isinstance(item, Token) and item.word in words
+
+
+def _is_kind(item: Token | _Group | None, kind: str) -> TypeGuard[Token]:
+    return isinstance(item, Token) and item.kind == kind
+
+
+def _is_alias(item: Token | _Group | None) -> TypeGuard[Token]:
+    return (
+        isinstance(item, Token)
+        and item.is_name
+        and (item.kind == "quoted" or item.word not in _KEYWORDS)
+    )
+
+
+def _at(items: list[Token | _Group], index: int) -> Token | _Group | None:
+    return items[index] if index < len(items) else None
+
+
+def _split(items: list[Token | _Group], kind: str = ",") -> list[list[Token | _Group]]:
+    parts: list[list[Token | _Group]] = [[]]
+    for item in items:
+        if _is_kind(item, kind):
+            parts.append([])
+        else:
+            parts[-1].append(item)
+    return parts
+
+
+def _suggest(name: str, candidates: Iterable[str]) -> str:
+    close = difflib.get_close_matches(name.lower(), list(candidates), n=3, cutoff=0.6)
+    return f" (did you mean: {', '.join(close)}?)" if close else ""
+
+
+def _unique_match(name: str, candidates: Columns) -> str | None:
+    """Find the one candidate a misspelled name most plausibly refers to.
+
+    Args:
+        name: Identifier as written.
+        candidates: Lower-cased name -> catalog spelling.
+
+    Returns:
+        The catalog spelling, or None if there is no single close match.
+    """
+    key = name.lower()
+    if key in candidates:
+        return candidates[key]
+    squashed = key.replace("_", "")
+    hits = {value for k, value in candidates.items() if k.replace("_", "") == squashed}
+    if len(hits) == 1:
+        return hits.pop()
+    close = difflib.get_close_matches(key, list(candidates), n=2, cutoff=0.85)
+    if len(close) == 1:
+        return candidates[close[0]]
+    return None
+
+
+def _repair_unterminated(sql: str, error: SQLSyntaxError) -> tuple[str, str] | None:
+    """Try to close an unterminated string literal or quoted identifier.
+
+    Returns:
+        Repaired SQL and a description of the fix, or None.
+    """
+    if error.kind == "unterminated_string":
+        doubled = _INNER_APOSTROPHE_RE.sub("''", sql)
+        if doubled != sql and _tokenizes(doubled):
+            return doubled, "Escaped an apostrophe inside a string literal"
+        match = _LITERAL_END_RE.search(sql, error.position + 1)
+        end = match.start() if match else len(sql)
+        closed = sql[:end] + "'" + sql[end:]
+        if _tokenizes(closed):
+            return closed, "Closed an unterminated string literal"
+    elif error.kind == "unterminated_identifier":
+        match = re.compile(r"[^\w ]|\Z").search(sql, error.position + 1)
+        end = match.start() if match else len(sql)
+        closed = sql[:end] + '"' + sql[end:]
+        if _tokenizes(closed):
+            return closed, "Closed an unterminated quoted identifier"
+    return None
+
+
+def _tokenizes(sql: str) -> bool:
+    try:
+        tokenize(sql)
+    except SQLSyntaxError:
+        return False
+    return True
+
+
+def _select_aliases(select_items: list[Token | _Group]) -> set[str]:
+    """Collect output and ``AS`` aliases defined in a select list."""
+    aliases: set[str] = set()
+
+    def collect_as(items: list[Token | _Group]) -> None:
+        for prev, item in itertools.pairwise(items):
+            if isinstance(item, _Group):
+                collect_as(item.items)
+            elif _is_word(prev, "AS") and isinstance(item, Token) and item.is_name:
+                aliases.add(item.name.lower())
+
+    collect_as(select_items)
+    for expr in _split(select_items):
+        name = _output_name(expr)
+        if name and len(expr) > 1:
+            aliases.add(name.lower())
+    return aliases
+
+
+def _split_set_operations(
+    items: list[Token | _Group],
+) -> list[list[Token | _Group]]:
+    """Split a query at top-level UNION, INTERSECT and EXCEPT."""
+    parts: list[list[Token | _Group]] = [[]]
+    i = 0
+    while i < len(items):
+        if _is_word(items[i], *_SET_OPERATIONS):
+            parts.append([])
+            i += 1
+            while _is_word(_at(items, i), "ALL", "DISTINCT", "BY", "NAME"):
+                i += 1
+            continue
+        parts[-1].append(items[i])
+        i += 1
+    return parts
+
+
+def _clause_bounds(items: list[Token | _Group]) -> tuple[int, int]:
+    """Find where the FROM clause of a SELECT starts and ends.
+
+    Returns:
+        Index of ``FROM`` (or the length) and of the first clause after it.
+    """
+    from_index = len(items)
+    for k in range(1, len(items)):
+        # Skip IS [NOT] DISTINCT FROM
+        if _is_word(items[k], "FROM") and not _is_word(items[k - 1], "DISTINCT"):
+            from_index = k
+            break
+    for k in range(from_index, len(items)):
+        if _is_word(items[k], *_CLAUSE_WORDS):
+            return from_index, k
+    return from_index, len(items)
+
+
+def _output_name(expr: list[Token | _Group]) -> str | None:
+    """Name of a select-list expression, if it has one."""
+    if not expr:
+        return None
+    last = expr[-1]
+    if not isinstance(last, Token) or not last.is_name:
+        return None
+    if len(expr) == 1:
+        return last.name if _is_alias(last) else None
+    prev = expr[-2]
+    if _is_word(prev, "AS") or _is_kind(prev, "."):
+        return last.name
+    if isinstance(prev, _Group) or (
+        isinstance(prev, Token)
+        and prev.kind
+        in {
+            "ident",
+            "quoted",
+            "string",
+            "number",
+        }
+    ):
+        return last.name if _is_alias(last) else None
+    return None
+
+
+def _strip_select_prefix(items: list[Token | _Group]) -> list[Token | _Group]:
+    """Drop ``SELECT``, ``DISTINCT [ON (...)]`` and ``ALL`` from a select list."""
+    i = 1
+    if _is_word(_at(items, i), "DISTINCT", "ALL"):
+        i += 1
+        if _is_word(_at(items, i), "ON"):
+            i += 2
+    return items[i:]
+
+
+class SQLValidator:
+    """Validate and locally repair SQL against a fixed table catalog."""
+
+    def __init__(self, tables: Mapping[str, Iterable[str]]) -> None:
+        """Initialize the validator.
+
+        Args:
+            tables: Table name -> column names.
+        """
+        self._table_names: Columns = {name.lower(): name for name in tables}
+        self._columns: dict[str, Columns] = {
+            name.lower(): {column.lower(): column for column in columns}
+            for name, columns in tables.items()
+        }
+
+    @property
+    def table_names(self) -> list[str]:
+        """Names of the catalog tables."""
+        return list(self._table_names.values())
+
+    def validate(self, sql: str, repair: bool = True) -> StaticValidation:
+        """Check a statement's tables and columns without touching the database.
+
+        Args:
+            sql: SQL statement.
+            repair: Whether to fix trivial problems in place.
+
+        Returns:
+            The possibly repaired SQL with its remaining errors and applied fixes.
+        """
+        fixes: list[str] = []
+        try:
+            tokens = tokenize(sql)
+        except SQLSyntaxError as e:
+            repaired = _repair_unterminated(sql, e) if repair else None
+            if repaired is None:
+                return StaticValidation(sql=sql, errors=[str(e)])
+            sql, fix = repaired
+            fixes.append(fix)
+            tokens = tokenize(sql)
+
+        while tokens and _is_kind(tokens[-1], "op") and tokens[-1].text == ";":
+            tokens.pop()
+        if any(token.text == ";" for token in tokens):
+            return StaticValidation(
+                sql=sql, errors=["Only a single SQL statement is allowed"], fixes=fixes
+            )
+
+        try:
+            items = _nest(tokens)
+        except SQLSyntaxError as e:
+            return StaticValidation(sql=sql, errors=[str(e)], fixes=fixes)
+
+        ctx = _Context(fixes=fixes)
+        if items and _is_word(items[0], "SELECT", "WITH"):
+            self._check_query(items, None, {}, ctx)
+
+        if ctx.errors or not repair:
+            return StaticValidation(sql=sql, errors=ctx.errors, fixes=fixes)
+        for start in sorted(ctx.edits, reverse=True):
+            end, text = ctx.edits[start]
+            sql = sql[:start] + text + sql[end:]
+        return StaticValidation(sql=sql, fixes=ctx.fixes)
+
+    def _check_query(
+        self,
+        items: list[Token | _Group],
+        outer: _Scope | None,
+        ctes: dict[str, Columns | None],
+        ctx: _Context,
+    ) -> Columns | None:
+        """Validate a query block and return its output columns, if known."""
+        start = 0
+        if _is_word(_at(items, 0), "WITH"):
+            ctes = dict(ctes)
+            start = self._read_ctes(items, outer, ctes, ctx)
+            if start is None:
+                return None
+
+        outputs = [
+            self._check_core(part, outer, ctes, ctx)
+            for part in _split_set_operations(items[start:])
+        ]
+        return outputs[0] if outputs else None
+
+    def _read_ctes(
+        self,
+        items: list[Token | _Group],
+        outer: _Scope | None,
+        ctes: dict[str, Columns | None],
+        ctx: _Context,
+    ) -> int | None:
+        """Validate a WITH clause, registering each CTE in ``ctes``.
+
+        Returns:
+            Index of the main query, or None if the clause could not be parsed.
+        """
+        i = 2 if _is_word(_at(items, 1), "RECURSIVE") else 1
+        while i < len(items):
+            name = items[i]
+            if not isinstance(name, Token) or not name.is_name:
+                return None
+            i += 1
+            declared: Columns | None = None
+            if isinstance(group := _at(items, i), _Group):
+                declared = self._name_list(group)
+                i += 1
+            if not _is_word(_at(items, i), "AS"):
+                return None
+            i += 1
+            while _is_word(_at(items, i), "NOT", "MATERIALIZED"):
+                i += 1
+            body = _at(items, i)
+            if not isinstance(body, _Group):
+                return None
+            # A recursive CTE may refer to itself
+            ctes[name.name.lower()] = declared
+            output = self._check_query(body.items, outer, ctes, ctx)
+            ctes[name.name.lower()] = declared or output
+            i += 1
+            if not _is_kind(_at(items, i), ","):
+                break
+            i += 1
+        return i
+
+    def _check_core(
+        self,
+        items: list[Token | _Group],
+        outer: _Scope | None,
+        ctes: dict[str, Columns | None],
+        ctx: _Context,
+    ) -> Columns | None:
+        """Validate a single SELECT and return its output columns, if known."""
+        first = _at(items, 0)
+        if isinstance(first, _Group) and first.is_query:
+            return self._check_query(first.items, outer, ctes, ctx)
+        if not _is_word(first, "SELECT"):
+            return None
+
+        from_index, clause_index = _clause_bounds(items)
+        scope = _Scope(parent=outer)
+        select_items = _strip_select_prefix(items[:from_index])
+        conditions = self._read_from_clause(
+            items[from_index + 1 : clause_index], scope, ctes, ctx
+        )
+        tail = items[clause_index:]
+        scope.aliases = _select_aliases(select_items) | {
+            item.name.lower()
+            for prev, item in itertools.pairwise(tail)
+            if _is_word(prev, "WINDOW") and isinstance(item, Token)
+        }
+
+        self._check_expressions(select_items, scope, ctes, ctx)
+        self._check_expressions(conditions, scope, ctes, ctx)
+        self._check_expressions(tail, scope, ctes, ctx)
+
+        output: Columns = {}
+        for expr in _split(select_items):
+            name = _output_name(expr)
+            if name is None:
+                return None
+            output[name.lower()] = name
+        return output
+
+    def _read_from_clause(
+        self,
+        items: list[Token | _Group],
+        scope: _Scope,
+        ctes: dict[str, Columns | None],
+        ctx: _Context,
+    ) -> list[Token | _Group]:
+        """Register the relations of a FROM clause and return its join conditions."""
+        conditions: list[Token | _Group] = []
+        expect_relation = True
+        in_condition = False
+        i = 0
+        while i < len(items):
+            item = items[i]
+            if expect_relation:
+                i = self._read_relation(items, i, scope, ctes, ctx)
+                expect_relation = False
+                in_condition = False
+                continue
+            if _is_kind(item, ",") or _is_word(item, "JOIN"):
+                expect_relation = True
+            elif _is_word(item, "ON"):
+                in_condition = True
+            elif _is_word(item, "USING"):
+                in_condition = False
+                i += 1
+            elif _is_word(item, "PIVOT", "UNPIVOT", "SAMPLE", "TABLESAMPLE"):
+                scope.opaque = True
+                break
+            elif _is_word(item, *_JOIN_WORDS) and not isinstance(
+                _at(items, i + 1), _Group
+            ):
+                in_condition = False
+            elif in_condition:
+                conditions.append(item)
+            i += 1
+        return conditions
+
+    def _read_relation(
+        self,
+        items: list[Token | _Group],
+        i: int,
+        scope: _Scope,
+        ctes: dict[str, Columns | None],
+        ctx: _Context,
+    ) -> int:
+        """Register one FROM-clause relation and return the index after it."""
+        lateral = _is_word(items[i], "LATERAL")
+        if lateral:
+            i += 1
+        item = _at(items, i)
+        name: str | None = None
+        columns: Columns | None = None
+        if isinstance(item, _Group):
+            if item.is_query:
+                columns = self._check_query(
+                    item.items, scope if lateral else scope.parent, ctes, ctx
+                )
+            else:
+                scope.opaque = True
+            i += 1
+        elif isinstance(item, Token) and item.is_name:
+            parts = [item]
+            i += 1
+            while (
+                _is_kind(_at(items, i), ".")
+                and isinstance(part := _at(items, i + 1), Token)
+                and part.is_name
+            ):
+                parts.append(part)
+                i += 2
+            name = parts[-1].name
+            if i < len(items) and isinstance(items[i], _Group):
+                i += 1
+            else:
+                name, columns = self._resolve_table(parts, ctes, ctx)
+        else:
+            scope.opaque = True
+            return i + 1
+
+        if _is_word(_at(items, i), "AS"):
+            i += 1
+        if _is_alias(alias := _at(items, i)):
+            name = alias.name
+            i += 1
+            if isinstance(group := _at(items, i), _Group):
+                columns = self._name_list(group)
+                i += 1
+        scope.relations.append(_Relation(name, columns))
+        return i
+
+    def _resolve_table(
+        self,
+        parts: list[Token],
+        ctes: dict[str, Columns | None],
+        ctx: _Context,
+    ) -> tuple[str, Columns | None]:
+        """Resolve a (possibly schema-qualified) table name."""
+        token = parts[-1]
+        if len(parts) > 2 or (len(parts) == 2 and parts[0].name.lower() != "main"):
+            return token.name, None
+        key = token.name.lower()
+        if len(parts) == 1 and key in ctes:
+            return token.name, ctes[key]
+
+        match = _unique_match(token.name, self._table_names)
+        if match is None:
+            ctx.error(
+                f"Table '{token.name}' does not exist"
+                + _suggest(token.name, self._table_names)
+            )
+            return token.name, None
+        if match != token.name:
+            if match.lower() == key:
+                ctx.rename(
+                    token, match, f"Normalized table name '{token.name}' to '{match}'"
+                )
+            else:
+                ctx.rename(
+                    token,
+                    match,
+                    f"Replaced unknown table '{token.name}' with '{match}'",
+                )
+        return match, self._columns[match.lower()]
+
+    def _check_expressions(
+        self,
+        items: list[Token | _Group],
+        scope: _Scope,
+        ctes: dict[str, Columns | None],
+        ctx: _Context,
+    ) -> None:
+        """Check the column references in an expression sequence."""
+        i = 0
+        while i < len(items):
+            item = items[i]
+            prev = items[i - 1] if i > 0 else None
+            nxt = _at(items, i + 1)
+            if isinstance(item, _Group):
+                if _is_kind(nxt, "op") and nxt.text == "->":
+                    ctx.lambdas.update(
+                        t.name.lower()
+                        for t in item.items
+                        if isinstance(t, Token) and t.is_name
+                    )
+                elif item.is_query:
+                    self._check_query(item.items, scope, ctes, ctx)
+                else:
+                    self._check_expressions(item.items, scope, ctes, ctx)
+                i += 1
+                continue
+            # Collation names such as NOCASE are not columns
+            if not item.is_name or _is_kind(prev, ".") or _is_word(prev, "COLLATE"):
+                i += 1
+                continue
+            if _is_kind(nxt, ".") and i + 2 < len(items):
+                i = self._check_dotted(items, i, scope, ctx)
+                continue
+            if _is_kind(nxt, "op") and nxt.text == "->":
+                ctx.lambdas.add(item.name.lower())
+            elif not (
+                (item.kind == "ident" and item.word in _KEYWORDS)
+                or isinstance(nxt, _Group)
+                or _is_kind(nxt, "string")
+                or (_is_kind(prev, "op") and prev.text == "::")
+                or _is_word(prev, "AS", "OVER")
+                or item.name.lower() in ctx.lambdas
+            ):
+                self._check_column(item, scope, ctx)
+            i += 1
+
+    def _check_dotted(
+        self,
+        items: list[Token | _Group],
+        i: int,
+        scope: _Scope,
+        ctx: _Context,
+    ) -> int:
+        """Check the dotted reference at ``items[i]`` and return the index after it.
+
+        ``schema.table.column`` is checked as ``table.column`` when the first
+        part names neither a relation nor a column in scope.
+        """
+        qualifier = items[i]
+        column = items[i + 2]
+        i += 3
+        if (
+            isinstance(qualifier, Token)
+            and _is_kind(_at(items, i), ".")
+            and isinstance(column, Token)
+            and column.is_name
+            and scope.find_relation(qualifier.name) is None
+            and scope.resolve_column(qualifier.name) is None
+            and scope.find_relation(column.name) is not None
+        ):
+            qualifier, column = column, items[i + 1]
+            i += 2
+        if isinstance(qualifier, Token):
+            self._check_qualified(qualifier, column, scope, ctx)
+        return i
+
+    def _check_qualified(
+        self,
+        qualifier: Token,
+        column: Token | _Group,
+        scope: _Scope,
+        ctx: _Context,
+    ) -> None:
+        """Check a ``qualifier.column`` reference."""
+        relation = scope.find_relation(qualifier.name)
+        if relation is None:
+            if scope.resolve_column(qualifier.name) is not None:
+                # Struct field access on a column
+                return
+            ctx.error(
+                f"Unknown table or alias '{qualifier.name}'"
+                + _suggest(
+                    qualifier.name,
+                    [r.name.lower() for r in scope.relations if r.name is not None],
+                )
+            )
+            return
+        if (
+            not isinstance(column, Token)
+            or not column.is_name
+            or relation.columns is None
+        ):
+            return
+        match = _unique_match(column.name, relation.columns)
+        if match is None:
+            ctx.error(
+                f"Column '{column.name}' not found in '{relation.name}'"
+                + _suggest(column.name, relation.columns)
+            )
+        elif match.lower() != column.name.lower():
+            ctx.rename(
+                column,
+                match,
+                f"Replaced unknown column '{column.name}' with '{match}' in '{relation.name}'",
+            )
+
+    def _check_column(self, token: Token, scope: _Scope, ctx: _Context) -> None:
+        """Check an unqualified column reference."""
+        resolved = scope.resolve_column(token.name)
+        if resolved is _UNRESOLVED or isinstance(resolved, str):
+            return
+        visible = scope.visible_columns()
+        match = _unique_match(token.name, visible)
+        if match is not None:
+            ctx.rename(
+                token, match, f"Replaced unknown column '{token.name}' with '{match}'"
+            )
+            return
+        tables = ", ".join(r.name for r in scope.relations if r.name is not None)
+        ctx.error(
+            f"Column '{token.name}' not found in {tables or 'any table in scope'}"
+            + _suggest(token.name, visible)
+        )
+
+    @staticmethod
+    def _name_list(group: _Group) -> Columns:
+        return {
+            item.name.lower(): item.name
+            for item in group.items
+            if isinstance(item, Token) and item.is_name
+        }
+
+
+def parse_ddl_columns(ddl: str) -> dict[str, list[str]]:
+    """Read table and column names from ``CREATE TABLE`` statements.
+
+    Args:
+        ddl: DDL text such as the schema section of the SQL generation prompt.
+
+    Returns:
+        Table name -> column names.
+    """
+    tables: dict[str, list[str]] = {}
+    try:
+        items = _nest(tokenize(ddl))
+    except SQLSyntaxError:
+        return tables
+    for k in range(len(items) - 2):
+        if not (_is_word(items[k], "CREATE") and _is_word(items[k + 1], "TABLE")):
+            continue
+        j = k + 2
+        while j < len(items) and not isinstance(items[j], _Group):
+            j += 1
+        group, table = _at(items, j), items[j - 1]
+        if not isinstance(group, _Group) or not isinstance(table, Token):
+            continue
+        columns = []
+        for definition in _split(group.items):
+            first = definition[0] if definition else None
+            if (
+                isinstance(first, Token)
+                and first.is_name
+                and first.word
+                not in {"PRIMARY", "FOREIGN", "UNIQUE", "CHECK", "CONSTRAINT"}
+            ):
+                columns.append(first.name)
+        tables[table.name] = columns
+    return tables
+
+
+@lru_cache(maxsize=64)
+def validator_for_ddl(ddl: str) -> SQLValidator:
+    """Get a validator for the tables described by a DDL string.
+
+    Args:
+        ddl: ``CREATE TABLE`` statements.
+
+    Returns:
+        Validator, memoized per DDL text.
+    """
+    return SQLValidator(parse_ddl_columns(ddl))
+
+
+class _CatalogValidatorCache:
+    """The validator for the most recent catalog snapshot."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._catalog: DatabaseCatalog | None = None
+        self._validator: SQLValidator | None = None
+
+    def get(self, catalog: DatabaseCatalog) -> SQLValidator:
+        with self._lock:
+            if self._validator is None or self._catalog is not catalog:
+                self._validator = SQLValidator(
+                    {name: table.column_names for name, table in catalog.tables.items()}
+                )
+                self._catalog = catalog
+            return self._validator
+
+
+_catalog_validators = _CatalogValidatorCache()
+
+
+def validator_for_catalog(catalog: DatabaseCatalog) -> SQLValidator:
+    """Get a validator for a database catalog snapshot.
+
+    Args:
+        catalog: Catalog from ``DuckDBClient.get_catalog``.
+
+    Returns:
+        Validator, rebuilt only when the catalog snapshot changes.
+    """
+    return _catalog_validators.get(catalog)
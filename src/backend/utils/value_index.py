@@ -0,0 +1,322 @@
+"""Inverted index over the distinct string values of loaded tables.
+
+Every distinct value of every string column is normalized (lower-cased,
+whitespace collapsed) and split into trigrams; each trigram maps to the values
+that contain it. A lookup intersects the postings of the query's trigrams,
+starting from the rarest, and confirms the surviving values with a substring
+check, so finding which columns mention an entity costs a few set operations
+instead of scanning sampled rows.
+
+Distinct values and their row counts are persisted per table in an ``.npz``
+sidecar, keyed by a fingerprint. Tables read from CSV files are fingerprinted
+by their file's size and mtime, so an unchanged file is neither loaded nor
+hashed; other tables are fingerprinted by their contents, memoized per
+DataFrame object. Only tables whose fingerprint changed are rescanned;
+trigram postings are rebuilt in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path(__file__).parent.parent / "data" / "value_index.npz"
+GRAM_SIZE = 3
+# Longer values (free text, JSON blobs) are not useful entity matches
+MAX_VALUE_LENGTH = 120
+
+
+def normalize_value(value: str) -> str:
+    """Lower-case a value and collapse its whitespace."""
+    return " ".join(str(value).lower().split())
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _string_columns(df: pd.DataFrame) -> list[str]:
+    return [
+        col
+        for col in df.columns
+        if pd.api.types.is_object_dtype(df[col])
+        or pd.api.types.is_string_dtype(df[col])
+    ]
+
+
+def table_fingerprint(name: str, df: pd.DataFrame) -> str:
+    """Fingerprint a table's shape and string contents.
+
+    Args:
+        name: Table name.
+        df: Table data.
+
+    Returns:
+        Hex digest that changes when any string value changes.
+    """
+    digest = hashlib.sha256(f"{name}\0{df.shape}\0".encode())
+    for col in _string_columns(df):
+        digest.update(f"{col}\0".encode())
+        hashed = pd.util.hash_pandas_object(df[col].astype(str), index=False)
+        digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def source_fingerprint(name: str, signature: Hashable) -> str:
+    """Fingerprint a table by the signature of its source file.
+
+    Args:
+        name: Table name.
+        signature: Value that changes with the file, e.g. its size and mtime.
+
+    Returns:
+        Hex digest, distinct from any content fingerprint.
+    """
+    return hashlib.sha256(f"{name}\0source\0{signature!r}".encode()).hexdigest()
+
+
+@dataclass
+class _TableValues:
+    """Distinct normalized values per string column of one table."""
+
+    fingerprint: str
+    columns: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    @classmethod
+    def scan(cls, fingerprint: str, df: pd.DataFrame) -> _TableValues:
+        table = cls(fingerprint)
+        for col in _string_columns(df):
+            counts = df[col].dropna().astype(str).map(normalize_value).value_counts()
+            table.columns[str(col)] = {
+                value: int(count)
+                for value, count in counts.items()
+                if value and len(value) <= MAX_VALUE_LENGTH
+            }
+        return table
+
+
+class ValueIndex:
+    """Trigram index of distinct string values, persisted as an ``.npz`` file."""
+
+    def __init__(self, index_path: Path) -> None:
+        """Initialize the index. The sidecar is read on first sync.
+
+        Args:
+            index_path: Path of the ``.npz`` file holding the distinct values.
+        """
+        self.index_path = index_path
+        self._tables: dict[str, _TableValues] = {}
+        self._values: list[str] = []
+        self._locations: list[list[tuple[str, str, int]]] = []
+        self._postings: dict[str, set[int]] = {}
+        self._synced: tuple[str, ...] = ()
+        # name -> (DataFrame, shape/columns/dtypes, content fingerprint)
+        self._memo: dict[str, tuple[weakref.ref[pd.DataFrame], Any, str]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _fingerprint(self, name: str, df: pd.DataFrame) -> str:
+        """Content fingerprint, recomputed only for a new or reshaped DataFrame.
+
+        Loaded tables are treated as read-only; an in-place edit that keeps the
+        shape, columns and dtypes is not noticed.
+        """
+        signature = (df.shape, tuple(df.columns), tuple(map(str, df.dtypes)))
+        memo = self._memo.get(name)
+        if memo is not None and memo[0]() is df and memo[1] == signature:
+            return memo[2]
+        fingerprint = table_fingerprint(name, df)
+        self._memo[name] = (weakref.ref(df), signature, fingerprint)
+        return fingerprint
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.index_path.exists():
+            return
+        try:
+            with np.load(self.index_path) as data:
+                names = data["tables"].tolist()
+                fingerprints = data["fingerprints"].tolist()
+                column_tables = data["column_tables"].tolist()
+                column_names = data["column_names"].tolist()
+                values = data["values"].tolist()
+                value_columns = data["value_columns"].tolist()
+                counts = data["counts"].tolist()
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Failed to load value index: {e}")
+            return
+        tables = {
+            name: _TableValues(fingerprint)
+            for name, fingerprint in zip(names, fingerprints, strict=True)
+        }
+        columns = [
+            tables[table].columns.setdefault(column, {})
+            for table, column in zip(column_tables, column_names, strict=True)
+        ]
+        for value, column_id, count in zip(values, value_columns, counts, strict=True):
+            columns[column_id][value] = count
+        self._tables = tables
+        logger.debug(f"Loaded value index for {len(tables)} tables")
+
+    def _save(self) -> None:
+        column_tables: list[str] = []
+        column_names: list[str] = []
+        values: list[str] = []
+        value_columns: list[int] = []
+        counts: list[int] = []
+        for name, table in self._tables.items():
+            for column, column_values in table.columns.items():
+                column_id = len(column_names)
+                column_tables.append(name)
+                column_names.append(column)
+                values.extend(column_values)
+                value_columns.extend([column_id] * len(column_values))
+                counts.extend(column_values.values())
+
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    tables=np.array(list(self._tables), dtype=str),
+                    fingerprints=np.array(
+                        [t.fingerprint for t in self._tables.values()], dtype=str
+                    ),
+                    column_tables=np.array(column_tables, dtype=str),
+                    column_names=np.array(column_names, dtype=str),
+                    values=np.array(values, dtype=str),
+                    value_columns=np.array(value_columns, dtype=np.int32),
+                    counts=np.array(counts, dtype=np.int64),
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to save value index: {e}")
+
+    def sync(
+        self,
+        dfs: Mapping[str, pd.DataFrame],
+        signatures: Mapping[str, Hashable] | None = None,
+    ) -> None:
+        """Bring the index up to date with the loaded tables.
+
+        Args:
+            dfs: Table name to DataFrame; may load tables lazily, as only
+                tables that need rescanning or content hashing are read.
+            signatures: Source file signature per table (such as the CSV
+                catalog's size and mtime), used instead of hashing contents.
+        """
+        signatures = signatures or {}
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            fingerprints = {
+                name: source_fingerprint(name, signatures[name])
+                if name in signatures
+                else self._fingerprint(name, dfs[name])
+                for name in dfs
+            }
+            for name in set(self._memo) - set(fingerprints):
+                del self._memo[name]
+            key = tuple(sorted(fingerprints.values()))
+            if key == self._synced:
+                return
+
+            changed = [
+                name
+                for name, fingerprint in fingerprints.items()
+                if name not in self._tables
+                or self._tables[name].fingerprint != fingerprint
+            ]
+            for name in changed:
+                try:
+                    df = dfs[name]
+                except KeyError:
+                    # A lazily loaded table can fail to parse
+                    continue
+                self._tables[name] = _TableValues.scan(fingerprints[name], df)
+            removed = set(self._tables) - set(fingerprints)
+            for name in removed:
+                del self._tables[name]
+            if changed or removed:
+                logger.info(f"Indexed distinct values of {len(changed)} changed tables")
+                self._save()
+
+            self._build_postings()
+            self._synced = key
+
+    def _build_postings(self) -> None:
+        locations: dict[str, list[tuple[str, str, int]]] = defaultdict(list)
+        for name, table in self._tables.items():
+            for column, column_values in table.columns.items():
+                for value, count in column_values.items():
+                    locations[value].append((name, column, count))
+
+        self._values = list(locations)
+        self._locations = list(locations.values())
+        postings: dict[str, set[int]] = defaultdict(set)
+        for value_id, value in enumerate(self._values):
+            for gram in _grams(value):
+                postings[gram].add(value_id)
+        self._postings = dict(postings)
+
+    def _matching_values(self, query: str) -> list[int]:
+        grams = _grams(query)
+        if not grams:
+            return [i for i, value in enumerate(self._values) if query in value]
+        ordered = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        candidates = set(self._postings.get(ordered[0], ()))
+        for gram in ordered[1:]:
+            if not candidates:
+                break
+            candidates &= self._postings[gram]
+        return [i for i in candidates if query in self._values[i]]
+
+    def find(self, text: str) -> dict[str, dict[str, int]]:
+        """Find the columns whose values contain ``text``.
+
+        Args:
+            text: Entity name or fragment; matched case-insensitively.
+
+        Returns:
+            Table name -> column name -> number of rows with a matching value.
+        """
+        query = normalize_value(text)
+        if not query:
+            return {}
+        with self._lock:
+            matches: dict[str, dict[str, int]] = {}
+            for value_id in self._matching_values(query):
+                for table, column, count in self._locations[value_id]:
+                    columns = matches.setdefault(table, {})
+                    columns[column] = columns.get(column, 0) + count
+            return matches
+
+
+@lru_cache(maxsize=1)
+def get_value_index() -> ValueIndex:
+    """Get the process-wide value index.
+
+    Returns:
+        Value index persisted under the backend data directory.
+    """
+    return ValueIndex(INDEX_PATH)
@@ -0,0 +1,283 @@
+"""In-memory vector indexes for cosine-similarity search.
+
+Vectors are stored L2-normalized in a single contiguous float32 matrix so a
+lookup is one matrix-vector product instead of a Python loop over entries.
+``VectorIndex`` supports inserts and deletes; ``CandidateMatrix`` is a fixed
+set of named candidates scored in bulk.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INITIAL_CAPACITY = 64
+
+
+def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize vectors along the last axis.
+
+    Zero vectors are left as zeros so they score 0.0 against everything.
+
+    Args:
+        vectors: Array of shape ``(dim,)`` or ``(n, dim)``.
+
+    Returns:
+        Float32 array with the same shape and unit-length rows.
+    """
+    array = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized: np.ndarray = array / norms
+    return normalized
+
+
+class VectorIndex:
+    """Brute-force cosine index over a contiguous, pre-normalized matrix.
+
+    Rows are addressed by string keys. Removal swaps the last row into the
+    freed slot, so inserts and deletes are O(1) amortized and the live rows
+    always occupy ``matrix[:len(index)]``.
+    """
+
+    def __init__(
+        self,
+        dim: int | None = None,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            dim: Vector dimension. Inferred from the first insert when omitted.
+            initial_capacity: Number of rows to preallocate.
+        """
+        self.dim = dim
+        self._initial_capacity = max(1, initial_capacity)
+        self._matrix: np.ndarray | None = None
+        self._keys: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of indexed vectors."""
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a key is indexed."""
+        return key in self._rows
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if self._matrix is None:
+            capacity = max(self._initial_capacity, rows)
+            self._matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+            return
+        if rows <= self._matrix.shape[0]:
+            return
+        capacity = max(rows, self._matrix.shape[0] * 2)
+        grown = np.zeros((capacity, self.dim), dtype=np.float32)
+        grown[: len(self._keys)] = self._matrix[: len(self._keys)]
+        self._matrix = grown
+
+    def add(self, key: str, vector: Sequence[float] | np.ndarray) -> None:
+        """Insert or replace the vector stored under ``key``.
+
+        Args:
+            key: Identifier for the vector.
+            vector: Raw (unnormalized) embedding.
+
+        Raises:
+            ValueError: If the vector dimension does not match the index.
+        """
+        row_vector = normalize_vectors(np.asarray(vector, dtype=np.float32).ravel())
+        with self._lock:
+            if self.dim is None:
+                self.dim = row_vector.shape[0]
+            if row_vector.shape[0] != self.dim:
+                msg = (
+                    f"Vector dimension {row_vector.shape[0]} does not match "
+                    f"index dimension {self.dim}"
+                )
+                raise ValueError(msg)
+
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._keys)
+                self._ensure_capacity(row + 1)
+                self._keys.append(key)
+                self._rows[key] = row
+            self._matrix[row] = row_vector
+
+    def remove(self, key: str) -> bool:
+        """Remove a vector from the index.
+
+        Args:
+            key: Identifier of the vector to remove.
+
+        Returns:
+            True if the key was present.
+        """
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is None:
+                return False
+            last = len(self._keys) - 1
+            if row != last:
+                moved_key = self._keys[last]
+                self._matrix[row] = self._matrix[last]
+                self._keys[row] = moved_key
+                self._rows[moved_key] = row
+            self._keys.pop()
+            return True
+
+    def clear(self) -> None:
+        """Remove every vector and release the matrix."""
+        with self._lock:
+            self._matrix = None
+            self._keys.clear()
+            self._rows.clear()
+
+    def search(
+        self,
+        query: Sequence[float] | np.ndarray,
+        k: int = 1,
+    ) -> list[tuple[str, float]]:
+        """Return the ``k`` most similar keys by cosine similarity.
+
+        Args:
+            query: Raw query embedding.
+            k: Number of results to return.
+
+        Returns:
+            List of ``(key, similarity)`` pairs, best first.
+        """
+        query_vector = normalize_vectors(np.asarray(query, dtype=np.float32).ravel())
+        with self._lock:
+            size = len(self._keys)
+            if size == 0 or k <= 0 or query_vector.shape[0] != self.dim:
+                return []
+            scores = self._matrix[:size] @ query_vector
+            k = min(k, size)
+            if k == size:
+                top = np.argsort(-scores)
+            else:
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top])]
+            return [(self._keys[i], float(scores[i])) for i in top]
+
+
+class CandidateMatrix:
+    """Immutable, pre-normalized matrix of named candidate vectors.
+
+    Built once per candidate set (for example, table embeddings) so each query
+    is scored with one matmul and ``argpartition`` instead of per-candidate
+    numpy conversions. Candidates whose dimension differs from the majority
+    (stale or placeholder embeddings) are kept as zero rows and score 0.0.
+    """
+
+    def __init__(self, candidates: Mapping[str, Sequence[float] | np.ndarray]) -> None:
+        """Build the matrix.
+
+        Args:
+            candidates: Mapping of candidate names to raw embeddings.
+        """
+        self.names: list[str] = list(candidates)
+        vectors = [
+            np.asarray(candidates[name], dtype=np.float32).ravel()
+            for name in self.names
+        ]
+        dim = (
+            Counter(v.shape[0] for v in vectors).most_common(1)[0][0] if vectors else 0
+        )
+        self.matrix = np.zeros((len(vectors), dim), dtype=np.float32)
+        stale = []
+        for row, (name, vector) in enumerate(zip(self.names, vectors, strict=True)):
+            if vector.shape[0] == dim:
+                self.matrix[row] = vector
+            else:
+                stale.append(name)
+        if stale:
+            logger.warning(
+                f"Scoring {len(stale)} candidate(s) as 0.0: embedding dimension "
+                f"differs from {dim} (e.g. {stale[0]!r})"
+            )
+        self.matrix = normalize_vectors(self.matrix)
+        self._dim_warned = False
+
+    def __len__(self) -> int:
+        """Return the number of candidates."""
+        return len(self.names)
+
+    def _rank(self, scores: np.ndarray, k: int) -> list[str]:
+        if k >= len(self.names):
+            top = np.argsort(-scores, kind="stable")
+        else:
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+        return [self.names[i] for i in top]
+
+    def top_k(self, query_vec: Sequence[float] | np.ndarray, k: int = 10) -> list[str]:
+        """Return the ``k`` candidates most similar to one query.
+
+        A zero query vector carries no signal, so the first ``k`` candidates
+        are returned in registration order.
+
+        Args:
+            query_vec: Raw query embedding.
+            k: Number of results.
+
+        Returns:
+            Candidate names, most similar first.
+        """
+        return self.top_k_batch(np.asarray(query_vec, dtype=np.float32)[np.newaxis], k)[
+            0
+        ]
+
+    def top_k_batch(
+        self,
+        query_vecs: Sequence[Sequence[float]] | np.ndarray,
+        k: int = 10,
+    ) -> list[list[str]]:
+        """Return the top ``k`` candidates for each of many queries at once.
+
+        Queries whose dimension does not match the candidates are treated
+        like zero queries: the first ``k`` candidates in registration order.
+
+        Args:
+            query_vecs: Raw query embeddings, one per row.
+            k: Number of results per query.
+
+        Returns:
+            One list of candidate names per query, most similar first.
+        """
+        queries = np.asarray(query_vecs, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis, :]
+        if not self.names or k <= 0:
+            return [[] for _ in range(queries.shape[0])]
+        if queries.shape[1] != self.matrix.shape[1]:
+            if not self._dim_warned:
+                self._dim_warned = True
+                logger.warning(
+                    f"Query dimension {queries.shape[1]} does not match candidate "
+                    f"dimension {self.matrix.shape[1]}; returning unranked candidates"
+                )
+            return [self.names[:k] for _ in range(queries.shape[0])]
+
+        nonzero = np.linalg.norm(queries, axis=1) > 0
+        scores = normalize_vectors(queries) @ self.matrix.T
+        return [
+            self._rank(row_scores, k) if has_signal else self.names[:k]
+            for row_scores, has_signal in zip(scores, nonzero, strict=True)
+        ]
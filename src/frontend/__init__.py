@@ -31,15 +31,16 @@ from src.frontend.handlers import (
     set_starters,
 )
 from src.frontend.steps import (
+    ChainlitAnswerSink,
     display_result_with_streaming,
     step_load_data,
     step_run_analysis,
     step_schema,
-    stream_response,
 )
 
 
 __all__ = [
+    "ChainlitAnswerSink",
     "chat_profile",
     "display_result_with_streaming",
     "display_schema_summary",
@@ -62,5 +63,4 @@ __all__ = [
     "step_load_data",
     "step_run_analysis",
     "step_schema",
-    "stream_response",
 ]
@@ -1,92 +1,33 @@
 """DataFrame caching for efficient data loading."""
 
-import contextlib
-import logging
 import os
 
-import pandas as pd
-
-
-logger = logging.getLogger(__name__)
+from backend.utils.csv_catalog import get_csv_catalog
 
 
 class DataFrameCache:
     """Cache for loaded DataFrames to avoid re-reading CSV files on each command.
 
-    Implements cache invalidation based on directory modification time.
+    Backed by the CSV catalog the analysis nodes use, so a table parsed for a
+    question is not parsed again for a command, and vice versa. Tables are
+    reloaded when their file's size or modification time changes.
     """
 
     def __init__(self, csv_dir: str = "src/backend/data/raw/csv") -> None:
         self.csv_dir = csv_dir
-        self._cache: dict[str, pd.DataFrame] = {}
-        self._last_mtime: float | None = None
-        self._file_mtimes: dict[str, float] = {}
-
-    def _get_dir_state(self):
-        """Get the current state of the CSV directory (files and their mtimes)."""
-        if not os.path.exists(self.csv_dir):
-            return None, {}
-
-        dir_mtime = os.path.getmtime(self.csv_dir)
-        file_mtimes = {}
-        for filename in os.listdir(self.csv_dir):
-            if filename.endswith(".csv"):
-                filepath = os.path.join(self.csv_dir, filename)
-                with contextlib.suppress(OSError):
-                    file_mtimes[filename] = os.path.getmtime(filepath)
-        return dir_mtime, file_mtimes
-
-    def _is_cache_valid(self) -> bool:
-        """Check if the cache is still valid based on directory state."""
-        dir_mtime, file_mtimes = self._get_dir_state()
-
-        # Invalid if directory doesn't exist or was modified
-        if dir_mtime is None:
-            return False
-        if self._last_mtime is None or dir_mtime != self._last_mtime:
-            return False
-
-        # Invalid if any file was modified or files changed
-        if set(file_mtimes.keys()) != set(self._file_mtimes.keys()):
-            return False
-        for filename, mtime in file_mtimes.items():
-            if self._file_mtimes.get(filename) != mtime:
-                return False
-
-        return True
 
     def invalidate(self) -> None:
         """Force cache invalidation (e.g., after upload/delete)."""
-        self._cache = {}
-        self._last_mtime = None
-        self._file_mtimes = {}
+        get_csv_catalog(self.csv_dir).invalidate()
 
     def get_dataframes(self):
-        """Get cached DataFrames, reloading if cache is invalid."""
-        if self._is_cache_valid() and self._cache:
-            return self._cache
-
-        # Reload DataFrames
-        dfs = {}
+        """Get the CSV tables as a mapping that loads each DataFrame on first access."""
         if not os.path.exists(self.csv_dir):
             os.makedirs(self.csv_dir)
 
-        for filename in os.listdir(self.csv_dir):
-            if filename.endswith(".csv"):
-                filepath = os.path.join(self.csv_dir, filename)
-                try:
-                    table_name = filename.replace(".csv", "")
-                    dfs[table_name] = pd.read_csv(filepath)
-                except (pd.errors.ParserError, UnicodeDecodeError) as e:
-                    logger.warning(f"Warning: Could not parse {filename}: {e}")
-                except Exception as e:
-                    logger.warning(f"Warning: Unexpected error loading {filename}: {e}")
-
-        # Update cache state
-        self._cache = dfs
-        self._last_mtime, self._file_mtimes = self._get_dir_state()
-
-        return dfs
+        catalog = get_csv_catalog(self.csv_dir)
+        catalog.refresh()
+        return catalog.frames()
 
 
 # Global DataFrame cache instance
@@ -141,20 +141,12 @@ def get_schema_summary_data() -> dict | None:
 
 def _get_column_info(table_name: str) -> pd.DataFrame:
     """Fetch column metadata for a table."""
-    client = get_duckdb_client()
-    df = client.execute_query(
-        """
-        SELECT column_name, data_type, is_nullable
-        FROM information_schema.columns
-        WHERE table_name = ?
-        ORDER BY ordinal_position
-        """,
-        params=[table_name],
-    )
-    return df.rename(
-        columns={
-            "column_name": "Column",
-            "data_type": "Type",
-            "is_nullable": "Nullable",
+    table = get_duckdb_client().get_catalog().get(table_name)
+    columns = table.columns if table else []
+    return pd.DataFrame(
+        {
+            "Column": [column.name for column in columns],
+            "Type": [column.data_type for column in columns],
+            "Nullable": ["YES" if column.is_nullable else "NO" for column in columns],
         }
     )
@@ -13,6 +13,7 @@ from src.frontend.commands import handle_command
 from src.frontend.config import EXAMPLE_QUESTIONS, fetch_openrouter_models
 from src.frontend.data_utils import get_table_names
 from src.frontend.steps import (
+    ChainlitAnswerSink,
     display_result_with_streaming,
     step_load_data,
     step_run_analysis,
@@ -244,7 +245,10 @@ def _build_response_parts(shared: dict) -> tuple[str, list[cl.Image]]:
 
 
 async def _run_analysis_pipeline(
-    question: str, settings: dict, progress_msg: cl.Message
+    question: str,
+    settings: dict,
+    progress_msg: cl.Message,
+    answer_sink: ChainlitAnswerSink,
 ) -> dict | None:
     await _update_progress(progress_msg, "Loading tables...")
     await step_load_data()
@@ -253,7 +257,7 @@ async def _run_analysis_pipeline(
     await step_schema()
 
     await _update_progress(progress_msg, "Running analysis...")
-    return await step_run_analysis(question, settings or {})
+    return await step_run_analysis(question, settings or {}, answer_sink)
 
 
 @cl.on_message
@@ -284,8 +288,11 @@ async def on_message(message: cl.Message) -> None:
 
     progress_msg = await cl.Message(content="Starting analysis...").send()
 
+    answer_sink = ChainlitAnswerSink()
     try:
-        shared = await _run_analysis_pipeline(question, settings, progress_msg)
+        shared = await _run_analysis_pipeline(
+            question, settings, progress_msg, answer_sink
+        )
 
         if not shared:
             await _update_progress(progress_msg, "Analysis failed.")
@@ -294,7 +301,9 @@ async def on_message(message: cl.Message) -> None:
 
         await _update_progress(progress_msg, "Analysis complete.")
         final_text, elements = _build_response_parts(shared)
-        await display_result_with_streaming(final_text, elements=elements or None)
+        await display_result_with_streaming(
+            final_text, elements=elements or None, answer_sink=answer_sink
+        )
 
     except Exception as exc:
         logger.exception("Analysis failed with unexpected error")
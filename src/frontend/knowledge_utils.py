@@ -44,11 +44,5 @@ def get_knowledge_store_data():
 
 def clear_knowledge_store() -> str:
     """Clear all data from the knowledge store."""
-    knowledge_store.data = {
-        "entity_mappings": {},
-        "successful_patterns": {},
-        "column_hints": {},
-        "join_patterns": [],
-    }
-    knowledge_store.save()
+    knowledge_store.clear()
     return "Knowledge store cleared!"
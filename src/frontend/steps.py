@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 
 import chainlit as cl
 
 from src.backend.config import get_config
-from src.backend.flow import create_analyst_flow
+from src.backend.flow import create_async_analyst_flow
 from src.backend.utils.logger import get_logger
 from src.backend.utils.memory import get_memory
 from src.frontend.data_utils import get_schema_info, get_table_names
@@ -34,9 +33,37 @@ async def step_schema() -> str:
     return get_schema_info()
 
 
+class ChainlitAnswerSink:
+    """Stream the analyzer's answer into a Chainlit message as it is written.
+
+    The message is sent on the first token. If the grader sends the flow
+    round again, ``start`` clears it so the next answer replaces the old one.
+    """
+
+    def __init__(self) -> None:
+        self.message: cl.Message | None = None
+
+    async def start(self) -> None:
+        """Clear any partially streamed answer."""
+        if self.message is not None and self.message.content:
+            self.message.content = ""
+            await self.message.update()
+
+    async def send(self, token: str) -> None:
+        """Append a token to the streamed message."""
+        if self.message is None:
+            self.message = cl.Message(content="")
+            await self.message.send()
+        await self.message.stream_token(token)
+
+
 @cl.step(type="tool", name="Running Analysis")
-async def step_run_analysis(question: str, settings: dict) -> dict | None:
-    """Run the analysis pipeline."""
+async def step_run_analysis(
+    question: str,
+    settings: dict,
+    answer_sink: ChainlitAnswerSink | None = None,
+) -> dict | None:
+    """Run the analysis pipeline, streaming the answer to ``answer_sink``."""
     api_key = settings.get("api_key", "")
     model = settings.get("model", "")
 
@@ -66,44 +93,40 @@ async def step_run_analysis(question: str, settings: dict) -> dict | None:
         "grader_retries": 0,
         "max_retries": config.resilience.max_retries,
     }
+    if answer_sink is not None:
+        shared["answer_sink"] = answer_sink
 
     trace_logger = get_logger()
     trace_id = trace_logger.start_trace(question=question, user_id=user_id)
 
     try:
-        analyst_flow = create_analyst_flow()
-        analyst_flow.run(shared)
+        analyst_flow = create_async_analyst_flow()
+        await analyst_flow.run_async(shared)
     finally:
+        shared.pop("answer_sink", None)
         shared["execution_trace"] = trace_logger.end_trace(trace_id)
 
     return shared
 
 
-async def stream_response(content: str, elements: list | None = None):
-    """Stream a response to the user for a more interactive feel."""
-    msg = cl.Message(content="", elements=elements or [])
-    await msg.send()
-
-    chunk_size = 50
-    position = 0
-
-    while position < len(content):
-        end_pos = min(position + chunk_size, len(content))
-        chunk = content[position:end_pos]
-        await msg.stream_token(chunk)
-        position = end_pos
-        await asyncio.sleep(0.02)
-
-    await msg.update()
-    return msg
-
-
 async def display_result_with_streaming(
     final_text: str,
     elements: list | None = None,
-) -> None:
-    """Display the analysis result with optional streaming."""
-    if len(final_text) < 2000:
-        await stream_response(final_text, elements)
-    else:
-        await cl.Message(content=final_text, elements=elements or []).send()
+    answer_sink: ChainlitAnswerSink | None = None,
+) -> cl.Message:
+    """Display the analysis result.
+
+    If the answer was already streamed, that message is completed in place
+    with the full response (transparency note, SQL, chart); otherwise a new
+    message is sent.
+    """
+    msg = answer_sink.message if answer_sink is not None else None
+    if msg is None:
+        msg = cl.Message(content=final_text, elements=elements or [])
+        await msg.send()
+        return msg
+
+    msg.content = final_text
+    msg.elements = elements or []
+    await msg.update()
+    return msg
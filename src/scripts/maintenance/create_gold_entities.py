@@ -2,6 +2,8 @@ import logging
 
 import duckdb
 
+from src.backend.utils.entity_search import build_entity_search
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -145,6 +147,10 @@ def create_gold_entities(db_path: str = "src/backend/data/nba.duckdb"):
             WHERE pgs.game_id NOT IN (SELECT game_id FROM game_gold)
         """)
 
+    # 4. Rebuild the player/team name search index over the new entity tables
+    logger.info("Building entity name search...")
+    build_entity_search(conn)
+
     conn.close()
     logger.info("Gold entities creation complete.")
 
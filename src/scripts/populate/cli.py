@@ -133,7 +133,7 @@ def cmd_game_gold(args) -> None:
 
 
 def cmd_gold_entities(args) -> None:
-    """Create gold entity tables (player_gold, team_gold)."""
+    """Create gold entity tables (player_gold, team_gold) and the name search."""
     from src.scripts.maintenance.create_gold_entities import create_gold_entities
     from src.scripts.populate.config import get_db_path
 
@@ -1,9 +1,11 @@
 """Integration tests for the SQL-based analysis flow."""
 
 import pandas as pd
+import pyarrow as pa
 
 from backend.flow import create_analyst_flow
 from backend.models import TableMeta, ValidationResult
+from backend.utils.query_preview import QueryPreview
 
 
 class StubDuckDBClient:
@@ -22,6 +24,9 @@ class StubDuckDBClient:
     def execute_query(self, sql):
         return pd.DataFrame([{"player_name": "Player X", "total_points": 2000}])
 
+    def execute_preview(self, sql, params=None, max_rows=None, max_bytes=None):
+        return QueryPreview(pa.Table.from_pandas(self.execute_query(sql)))
+
 
 def test_simple_flow_runs(mocker, mock_call_llm_in_nodes, mock_llm_response) -> None:
     """Run the flow end-to-end with mocked LLM and DB."""
@@ -0,0 +1,81 @@
+"""Tests for streaming the analyzer's answer while it is generated."""
+
+import pytest
+
+from backend.nodes.analysis import AsyncDataAnalyzer
+from backend.utils.answer_stream import AnswerStreamParser
+
+
+RESPONSE = """```yaml
+answer: |
+  Joel Embiid led the league
+  with 34.7 points per game.
+
+  He also led in usage.
+transparency_note: |
+  I averaged points per game for 2023-24.
+```"""
+
+
+class RecordingSink:
+    """Token sink that records what it was sent."""
+
+    def __init__(self) -> None:
+        self.starts = 0
+        self.tokens: list[str] = []
+
+    async def start(self) -> None:
+        self.starts += 1
+        self.tokens.clear()
+
+    async def send(self, token: str) -> None:
+        self.tokens.append(token)
+
+
+@pytest.mark.parametrize("size", [1, 3, 16, len(RESPONSE)])
+def test_parser_extracts_answer_block(size) -> None:
+    """Only the answer text is emitted, regardless of chunk boundaries."""
+    parser = AnswerStreamParser()
+
+    text = "".join(
+        parser.feed(RESPONSE[i : i + size]) for i in range(0, len(RESPONSE), size)
+    )
+
+    assert text == (
+        "Joel Embiid led the league\nwith 34.7 points per game.\n\n"
+        "He also led in usage."
+    )
+    assert parser.done
+
+
+@pytest.mark.asyncio
+async def test_async_analyzer_streams_answer_to_sink(mocker) -> None:
+    """Tokens reach the sink live and the full reply is still parsed."""
+
+    async def fake_stream(prompt):
+        for i in range(0, len(RESPONSE), 5):
+            yield RESPONSE[i : i + 5]
+
+    mocker.patch(
+        "backend.nodes.analysis.call_llm_streaming_async", side_effect=fake_stream
+    )
+    call_llm_async = mocker.patch("backend.nodes.analysis.call_llm_async")
+    sink = RecordingSink()
+    node = AsyncDataAnalyzer()
+
+    result = await node.exec_async(
+        {
+            "question": "Who scored the most?",
+            "rewritten_query": "Who scored the most?",
+            "sql_query": "SELECT 1",
+            "query_result": [{"name": "Joel Embiid"}],
+            "execution_error": None,
+            "sub_query_sqls": {},
+            "answer_sink": sink,
+        }
+    )
+
+    assert "".join(sink.tokens) == result["answer"]
+    assert result["transparency_note"].startswith("I averaged")
+    assert sink.starts == 1
+    call_llm_async.assert_not_called()
@@ -1,11 +1,33 @@
 """Tests for call_llm utility - LLM API wrapper with retry logic."""
 
+import asyncio
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
-from backend.utils.call_llm import call_llm
+from backend.utils import call_llm as call_llm_module
+from backend.utils.call_llm import (
+    LLMSettings,
+    call_llm,
+    close_llm_clients,
+    get_async_http_client,
+    llm_client_stats,
+)
+from backend.utils.call_llm_streaming import call_llm_streaming_async
+from backend.utils.resilience import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_clients():
+    """Drop pooled clients so each test sees a fresh (possibly patched) client."""
+    close_llm_clients()
+    yield
+    close_llm_clients()
 
 
 class TestCallLLMBasicFunctionality:
@@ -316,6 +338,7 @@ class TestCallLLMErrorHandling:
             ):
                 call_llm("Test prompt")
 
+
 class TestCallLLMEdgeCases:
     """Test edge cases."""
 
@@ -358,3 +381,179 @@ class TestCallLLMEdgeCases:
             result = call_llm("Bonjour 世界 🌍")
 
             assert result == "Réponse"
+
+
+class TestCallLLMClientPool:
+    """Test that OpenRouter clients are pooled across calls."""
+
+    def test_reuses_client_across_calls(self, mock_env_vars) -> None:
+        """Repeated calls share one client instead of reconnecting."""
+        with patch("backend.utils.call_llm.OpenAI") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.chat.completions.create.return_value.choices[
+                0
+            ].message.content = "Response"
+            mock_client_class.return_value = mock_client
+
+            call_llm("First prompt")
+            call_llm("Second prompt")
+
+            mock_client_class.assert_called_once()
+            assert mock_client.chat.completions.create.call_count == 2
+            assert llm_client_stats()["checkouts"] == 2
+
+    def test_logs_pool_stats_with_each_request(self, mock_env_vars) -> None:
+        """Pool counters are logged per request, not only at shutdown."""
+        with (
+            patch("backend.utils.call_llm.OpenAI") as mock_client_class,
+            patch("backend.utils.call_llm.get_logger") as get_logger,
+        ):
+            mock_client_class.return_value.chat.completions.create.return_value.choices[
+                0
+            ].message.content = "Response"
+
+            call_llm("First prompt")
+            call_llm("Second prompt")
+
+            log_pool_stats = get_logger.return_value.log_pool_stats
+            assert log_pool_stats.call_count == 2
+            assert log_pool_stats.call_args.kwargs["pool"] == "openrouter"
+            assert log_pool_stats.call_args.kwargs["checkouts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_client_is_shared_per_loop(self) -> None:
+        """Async callers on the same loop get the same open client."""
+        settings = LLMSettings(
+            api_key="key", model="m", temperature=0.1, max_tokens=10, timeout=5.0
+        )
+
+        first = get_async_http_client(settings)
+        second = get_async_http_client(settings)
+
+        assert first is second
+        assert not first.is_closed
+        assert llm_client_stats()["async_clients"] == 1
+        await first.aclose()
+
+
+def _wait_for_waiters(flight: SingleFlight, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while flight.coalesced < count:
+        assert time.monotonic() < deadline, "callers never joined the flight"
+        time.sleep(0.01)
+
+
+class TestCallLLMSingleFlight:
+    """Test coalescing of identical in-flight calls."""
+
+    @pytest.fixture
+    def flight(self, monkeypatch) -> SingleFlight:
+        """Fresh single-flight group installed in call_llm."""
+        flight = SingleFlight("test")
+        monkeypatch.setattr(call_llm_module, "_llm_calls", flight)
+        return flight
+
+    def test_concurrent_identical_calls_share_one_request(
+        self, flight, mock_env_vars
+    ) -> None:
+        """Callers that arrive while a request is in flight reuse its result."""
+        with patch("backend.utils.call_llm.OpenAI") as mock_client_class:
+            mock_client = MagicMock()
+            response = MagicMock()
+            response.choices[0].message.content = "Shared"
+
+            def create(**kwargs):
+                _wait_for_waiters(flight, 3)
+                return response
+
+            mock_client.chat.completions.create.side_effect = create
+            mock_client_class.return_value = mock_client
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(call_llm, ["Same prompt"] * 4))
+
+            assert results == ["Shared"] * 4
+            assert mock_client.chat.completions.create.call_count == 1
+
+    def test_leader_error_reaches_waiters(self, flight, mock_env_vars) -> None:
+        """A failed in-flight request fails every coalesced caller."""
+        with patch("backend.utils.call_llm.OpenAI") as mock_client_class:
+            mock_client = MagicMock()
+
+            def create(**kwargs):
+                _wait_for_waiters(flight, 2)
+                raise ConnectionError("Upstream error")
+
+            mock_client.chat.completions.create.side_effect = create
+            mock_client_class.return_value = mock_client
+
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                futures = [
+                    pool.submit(call_llm, "Same prompt", max_retries=1)
+                    for _ in range(3)
+                ]
+                errors = [f.exception() for f in futures]
+
+            assert all(isinstance(e, RuntimeError) for e in errors)
+            assert all("Upstream error" in str(e) for e in errors)
+            assert mock_client.chat.completions.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_waiter_timeout_leaves_leader_running(self) -> None:
+        """A waiter that times out does not cancel the shared call."""
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+
+        async def slow() -> str:
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await flight.do_async("key", slow, wait_timeout=0.01)
+
+        waiter = asyncio.create_task(flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await leader == "done"
+        assert await waiter == "done"
+
+
+class TestCallLLMStreamingAsync:
+    """Test token streaming over the pooled async client."""
+
+    @pytest.mark.asyncio
+    async def test_yields_deltas_and_records_ttft(self, mock_env_vars) -> None:
+        """Server-sent deltas are yielded in order and TTFT is logged."""
+        body = (
+            ": OPENROUTER PROCESSING\n\n"
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(200, text=body)
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://test"
+        )
+        with (
+            patch(
+                "backend.utils.call_llm_streaming.get_async_http_client",
+                return_value=client,
+            ),
+            patch("backend.utils.call_llm_streaming._log_llm_call") as log_call,
+            patch("backend.utils.call_llm_streaming.get_logger") as get_logger,
+        ):
+            tokens = [token async for token in call_llm_streaming_async("Hi")]
+
+        assert tokens == ["Hel", "lo"]
+        assert log_call.call_args.args[1] == "Hello"
+        log_first_token = get_logger.return_value.log_first_token
+        log_first_token.assert_called_once()
+        assert isinstance(log_first_token.call_args.kwargs["ttft_ms"], int)
+        await client.aclose()
@@ -1,7 +1,9 @@
 """Tests for ClarifyQuery node."""
 
+import pytest
+
 from backend.models import QueryIntent
-from backend.nodes import ClarifyQuery
+from backend.nodes import AsyncClarifyQuery, ClarifyQuery
 
 
 def test_clarify_query_clear(mocker) -> None:
@@ -60,3 +62,27 @@ def test_clarify_query_fills_history() -> None:
 
     assert "conversation_history" in shared
     assert isinstance(prep_res["conversation_history"], list)
+
+
+@pytest.mark.asyncio
+async def test_async_clarify_query_awaits_llm(mocker) -> None:
+    """AsyncClarifyQuery uses call_llm_async and the sync post logic."""
+    call_llm = mocker.patch("src.backend.nodes.query.call_llm")
+    mocker.patch(
+        "src.backend.nodes.query.call_llm_async",
+        new=mocker.AsyncMock(
+            return_value="""```yaml
+intent: ambiguous
+reasoning: "Missing metric definition"
+clarification_questions:
+  - "Best by which metric?"
+```"""
+        ),
+    )
+
+    shared = {"question": "Who is the best player?", "conversation_history": []}
+    action = await AsyncClarifyQuery().run_async(shared)
+
+    assert action == "ambiguous"
+    assert shared["clarification_questions"] == ["Best by which metric?"]
+    call_llm.assert_not_called()
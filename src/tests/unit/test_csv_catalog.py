@@ -0,0 +1,138 @@
+"""Tests for the lazy CSV catalog behind LoadData and the frontend cache."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from backend.nodes.data_ingestion import DataMerger, LoadData
+from backend.nodes.entity import EntityResolver
+from backend.nodes.schema import DataProfiler, SchemaInference
+from backend.utils import value_index
+from backend.utils.csv_catalog import CSVCatalog, get_csv_catalog
+from frontend.cache import DataFrameCache
+
+
+@pytest.fixture
+def csv_dir(tmp_path, mocker):
+    mocker.patch("backend.utils.csv_catalog.SIDECAR_DIR", tmp_path / "sidecars")
+    data = tmp_path / "csv"
+    data.mkdir()
+    pd.DataFrame({"team_id": [1, 2], "nickname": ["Lakers", "Celtics"]}).to_csv(
+        data / "team.csv", index=False
+    )
+    (data / "broken.csv").write_text("")
+    return data
+
+
+def test_schema_comes_from_headers_without_loading_rows(mocker, csv_dir) -> None:
+    """The loading, merging and schema nodes work from headers only."""
+    mocker.patch("backend.nodes.data_ingestion.resolve_safe_dir", return_value=csv_dir)
+    materialize = mocker.spy(CSVCatalog, "_materialize")
+    shared = {}
+
+    LoadData().run(shared)
+    DataMerger().run(shared)
+    SchemaInference().run(shared)
+    DataProfiler().run(shared)
+
+    materialize.assert_not_called()
+    assert shared["schemas"] == {"team": ["team_id", "nickname", "_source"]}
+    assert "Table 'team' [CSV]" in shared["csv_schema_str"]
+    assert shared["data_profile"]["team"]["id_columns"] == ["team_id"]
+    assert list(shared["dfs"]) == ["team"]
+    assert shared["data_sources"] == {"team": "csv"}
+
+    assert shared["dfs"]["team"]["_source"].tolist() == ["csv", "csv"]
+    assert "_source" not in shared["csv_dfs"]["team"].columns
+    materialize.assert_called_once()
+
+
+def test_api_tables_merge_into_lazy_csv_tables(mocker, csv_dir) -> None:
+    """Only CSV tables an API table merges into are loaded by DataMerger."""
+    mocker.patch("backend.nodes.data_ingestion.resolve_safe_dir", return_value=csv_dir)
+    pd.DataFrame({"player_id": [1]}).to_csv(csv_dir / "player.csv", index=False)
+    materialize = mocker.spy(CSVCatalog, "_materialize")
+    shared = {
+        "api_dfs": {"team": pd.DataFrame({"team_id": [3], "nickname": ["Knicks"]})}
+    }
+
+    LoadData().run(shared)
+    DataMerger().run(shared)
+    DataProfiler().run(shared)
+
+    assert [call.args[1] for call in materialize.call_args_list] == ["team"]
+    assert shared["data_sources"] == {"player": "csv", "team": "merged"}
+    assert len(shared["dfs"]["team"]) == 3
+    assert shared["data_profile"]["team"]["row_count"] == 3
+    assert shared["data_profile"]["player"]["row_count"] is None
+
+
+def test_unparseable_directory_has_no_data(mocker, csv_dir) -> None:
+    """A directory holding only broken CSVs ends the flow with no_data."""
+    (csv_dir / "team.csv").unlink()
+    mocker.patch("backend.nodes.data_ingestion.resolve_safe_dir", return_value=csv_dir)
+    shared = {}
+
+    assert LoadData().run(shared) == "no_data"
+    assert shared["data_sources"] == {}
+
+
+def test_tables_load_once_and_reload_after_a_change(mocker, csv_dir) -> None:
+    """A table is parsed once, served from its sidecar, and reloaded when edited."""
+    sidecars = csv_dir.parent / "sidecars"
+    catalog = CSVCatalog(csv_dir)
+    frames = catalog.frames()
+
+    first = frames["team"]
+    assert frames["team"] is first
+    assert dict(frames.items()).keys() == {"team"}
+    assert len(list(sidecars.rglob("team.*.parquet"))) == 1
+
+    read_csv = mocker.patch.object(pd, "read_csv", side_effect=AssertionError)
+    pd.testing.assert_frame_equal(CSVCatalog(csv_dir).table("team"), first)
+    mocker.stop(read_csv)
+
+    pd.DataFrame({"team_id": [3], "nickname": ["Knicks"]}).to_csv(
+        csv_dir / "team.csv", index=False
+    )
+    os.utime(csv_dir / "team.csv", ns=(1, 1))
+    catalog.refresh()
+
+    assert catalog.table("team")["nickname"].tolist() == ["Knicks"]
+    assert len(list(sidecars.rglob("team.*.parquet"))) == 1
+
+
+def test_frontend_and_backend_share_one_catalog(csv_dir) -> None:
+    """The frontend cache serves the DataFrames the analysis nodes loaded."""
+    team = LoadData().exec(str(csv_dir))["team"]
+    cache = DataFrameCache(str(csv_dir))
+
+    assert cache.get_dataframes()["team"] is team
+    assert get_csv_catalog(csv_dir.parent / "csv") is get_csv_catalog(str(csv_dir))
+
+    cache.invalidate()
+    assert cache.get_dataframes()["team"] is not team
+
+
+def test_value_index_is_keyed_on_csv_files(mocker, csv_dir) -> None:
+    """Repeated questions neither re-hash nor re-copy unchanged CSV tables."""
+    mocker.patch("backend.nodes.data_ingestion.resolve_safe_dir", return_value=csv_dir)
+    index = value_index.ValueIndex(csv_dir.parent / "values.npz")
+    mocker.patch("backend.nodes.entity.get_value_index", return_value=index)
+    mocker.patch("backend.nodes.entity.knowledge_store")
+    mocker.patch.object(EntityResolver, "_extract_entities", return_value=["Lakers"])
+    mocker.patch.object(EntityResolver, "_resolve_entity_id", return_value=None)
+    fingerprint = mocker.spy(value_index, "table_fingerprint")
+    scan = mocker.spy(pd.Series, "value_counts")
+
+    for _ in range(3):
+        shared = {"question": "How did the Lakers do?", "schema_str": ""}
+        LoadData().run(shared)
+        DataMerger().run(shared)
+        EntityResolver().run(shared)
+
+    assert shared["entity_map"] == {"Lakers": {"team": ["nickname"]}}
+    # One scan of team.nickname: untagged, and only on the first question
+    assert fingerprint.call_count == 0
+    assert scan.call_count == 1
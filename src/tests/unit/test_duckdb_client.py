@@ -0,0 +1,216 @@
+"""Tests for DuckDBClient catalog caching and query execution."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from src.backend.config import DatabaseConfig
+from src.backend.utils.duckdb_client import DuckDBClient
+from src.backend.utils.duckdb_pool import DuckDBConnectionPool
+
+
+@pytest.fixture
+def nba_db(tmp_path):
+    """Small on-disk database with gold, raw and view relations."""
+    db_path = tmp_path / "nba.duckdb"
+    conn = duckdb.connect(str(db_path))
+    conn.execute("CREATE TABLE player_gold (player_id INTEGER NOT NULL, name VARCHAR)")
+    conn.execute(
+        "INSERT INTO player_gold VALUES (1, 'LeBron James'), (2, 'Stephen Curry')"
+    )
+    conn.execute("CREATE TABLE game_raw (game_id VARCHAR)")
+    conn.execute("CREATE VIEW active_players AS SELECT name FROM player_gold")
+    conn.close()
+    return db_path
+
+
+@pytest.fixture
+def client(nba_db):
+    """DuckDBClient bound to the test database."""
+    db_client = DuckDBClient(db_path=nba_db)
+    yield db_client
+    db_client.close()
+
+
+def test_get_all_tables_uses_catalog(client) -> None:
+    """Tables come back in gold/other/raw order with catalog row estimates."""
+    tables = client.get_all_tables()
+
+    assert [t.name for t in tables] == ["player_gold", "active_players", "game_raw"]
+    assert tables[0].row_count == 2
+    assert tables[0].columns == ["player_id", "name"]
+    assert tables[1].row_count is None
+
+
+def test_catalog_is_cached_until_file_changes(client, nba_db) -> None:
+    """The catalog is reused until the database file changes."""
+    first = client.get_catalog()
+    assert client.get_catalog() is first
+
+    client.close()
+    conn = duckdb.connect(str(nba_db))
+    conn.execute("CREATE TABLE team_gold (team_id INTEGER)")
+    conn.close()
+
+    refreshed = client.get_catalog()
+    assert refreshed is not first
+    assert "team_gold" in refreshed.tables
+
+
+def test_reload_drains_old_pool_in_background(client, nba_db, tmp_path, mocker) -> None:
+    """A replaced database file swaps in a fresh pool; the old one drains aside."""
+    closed_on: list[str] = []
+    close = DuckDBConnectionPool.close
+
+    def record_close(pool: DuckDBConnectionPool, *args, **kwargs) -> None:
+        closed_on.append(threading.current_thread().name)
+        close(pool, *args, **kwargs)
+
+    mocker.patch.object(
+        DuckDBConnectionPool, "close", autospec=True, side_effect=record_close
+    )
+    first = client.get_catalog()
+
+    replacement = tmp_path / "next.duckdb"
+    conn = duckdb.connect(str(replacement))
+    conn.execute("CREATE TABLE team_gold (team_id INTEGER)")
+    conn.close()
+    os.replace(replacement, nba_db)
+
+    refreshed = client.get_catalog()
+    assert refreshed is not first
+    assert list(refreshed.tables) == ["team_gold"]
+    assert closed_on == ["duckdb-pool-drain"]
+
+
+def test_unknown_table_is_rejected(client) -> None:
+    """Table validation uses the catalog and lists valid tables."""
+    with pytest.raises(ValueError, match="not found in database"):
+        client.get_sample_data("missing_table")
+
+
+def test_get_table_schema_renders_from_catalog(client, mocker) -> None:
+    """DDL is rendered from the catalog and memoized per table."""
+    ddl = client.get_table_schema(["player_gold", "game_raw"])
+
+    assert 'CREATE TABLE "player_gold" (' in ddl
+    assert "NOT NULL" in ddl
+    assert "-- 2 rows" in ddl
+    assert "game_raw" in ddl
+
+    render = mocker.spy(DuckDBClient, "_render_table_ddl")
+    assert client.get_table_schema(["player_gold"]) in ddl
+    render.assert_not_called()
+
+
+def test_get_table_schema_rejects_unknown_table(client) -> None:
+    """Unknown tables raise ValueError."""
+    with pytest.raises(ValueError, match="not found in database"):
+        client.get_table_schema(["nope"])
+
+
+def test_concurrent_queries_use_separate_cursors(client) -> None:
+    """Concurrent queries check out their own cursors from one instance."""
+    barrier = threading.Barrier(4)
+
+    def run_query(_: int) -> int:
+        barrier.wait()
+        return len(client.execute_query("SELECT * FROM player_gold"))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(run_query, range(4))) == [2, 2, 2, 2]
+
+    stats = client.pool_stats()
+    assert stats["in_use"] == 0
+    assert stats["checkouts"] >= 4
+    assert stats["idle"] == stats["created"] <= stats["max_cursors"]
+
+
+def test_pool_applies_duckdb_settings(nba_db) -> None:
+    """Thread and memory settings are applied to the shared instance."""
+    db_client = DuckDBClient(
+        db_path=nba_db, config=DatabaseConfig(threads=2, memory_limit="256MB")
+    )
+    try:
+        result = db_client.execute_query("SELECT current_setting('threads') AS threads")
+        assert int(result["threads"].iloc[0]) == 2
+    finally:
+        db_client.close()
+
+
+def test_query_timeout_interrupts_running_query(nba_db) -> None:
+    """A query past its deadline is interrupted and reported as a timeout."""
+    db_client = DuckDBClient(db_path=nba_db, query_timeout=0.2)
+    try:
+        start = time.time()
+        with pytest.raises(TimeoutError, match="timed out"):
+            db_client.execute_query("SELECT COUNT(*) FROM range(1000000000000)")
+        assert time.time() - start < 5
+
+        deadline = time.time() + 5
+        while db_client.pool_stats()["in_use"] and time.time() < deadline:
+            time.sleep(0.01)
+        assert db_client.pool_stats()["in_use"] == 0
+        assert len(db_client.execute_query("SELECT * FROM player_gold")) == 2
+    finally:
+        db_client.close()
+
+
+def test_result_cache_serves_repeats_until_file_changes(client, nba_db) -> None:
+    """Equivalent queries hit the cache; rewriting the file invalidates it."""
+    first = client.execute_query("SELECT name FROM player_gold ORDER BY player_id")
+    second = client.execute_query(
+        "SELECT name\n  FROM player_gold   ORDER BY player_id"
+    )
+
+    assert second.equals(first)
+    assert client.result_cache_stats()["hits"] == 1
+
+    client.close()
+    conn = duckdb.connect(str(nba_db))
+    conn.execute("INSERT INTO player_gold VALUES (3, 'Kevin Durant')")
+    conn.close()
+
+    third = client.execute_query("SELECT name FROM player_gold ORDER BY player_id")
+
+    assert third["name"].tolist()[-1] == "Kevin Durant"
+    assert client.result_cache_stats()["hits"] == 1
+
+
+def test_result_cache_evicts_to_byte_bound(nba_db) -> None:
+    """Entries are evicted least recently used first to respect the size bound."""
+    db_client = DuckDBClient(db_path=nba_db, result_cache_bytes=4096)
+    try:
+        for n in range(10):
+            db_client.execute_query("SELECT range AS n FROM range(?)", [n * 50 + 100])
+        stats = db_client.result_cache_stats()
+    finally:
+        db_client.close()
+
+    assert stats["bytes"] <= 4096
+    assert stats["evictions"] > 0
+
+
+def test_preview_caps_rows_and_summarizes_full_result(client) -> None:
+    """Only the preview window is loaded; statistics cover every row."""
+    preview = client.execute_preview(
+        "SELECT range AS n FROM range(100000)", max_rows=10
+    )
+
+    assert preview.truncated
+    assert preview.total_rows == 100000
+    assert preview.to_pandas()["n"].tolist() == list(range(10))
+    assert preview.summary()["columns"][0]["max"] == "99999"
+
+
+def test_preview_of_small_result_is_complete(client) -> None:
+    """Results under the cap are returned whole and not marked truncated."""
+    preview = client.execute_preview("SELECT * FROM player_gold", max_rows=10)
+
+    assert not preview.truncated
+    assert preview.total_rows == 2
+    assert len(preview.to_pandas()) == 2
@@ -0,0 +1,186 @@
+"""Tests for the embedding service and its binary cache."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.backend.models import TableMeta
+from src.backend.utils.embedding_store import EmbeddingStore
+from src.backend.utils.embeddings import EmbeddingService
+from src.backend.utils.schema_index import TableEmbeddingIndex, table_embedding_text
+from src.backend.utils.vector_index import CandidateMatrix
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Embedding store that only flushes when asked."""
+    return EmbeddingStore(tmp_path, flush_batch_size=100, flush_delay_seconds=60)
+
+
+def test_store_round_trip_after_flush(store, tmp_path) -> None:
+    """Flushed vectors are memory-mapped back by a new store."""
+    store.put("a", [1.0, 2.0, 3.0])
+    store.put("b", [4.0, 5.0, 6.0])
+
+    assert store.get("a").tolist() == [1.0, 2.0, 3.0]
+    assert not (tmp_path / "embeddings.f32").exists()
+
+    store.flush()
+    reopened = EmbeddingStore(tmp_path)
+
+    assert len(reopened) == 2
+    np.testing.assert_array_equal(reopened.get("b"), [4.0, 5.0, 6.0])
+    assert reopened.get("missing") is None
+
+
+def test_store_flushes_when_batch_is_full(tmp_path) -> None:
+    """Reaching the batch size appends pending vectors immediately."""
+    store = EmbeddingStore(tmp_path, flush_batch_size=2, flush_delay_seconds=60)
+    store.put("a", [1.0, 0.0])
+    store.put("b", [0.0, 1.0])
+
+    assert (tmp_path / "embeddings.f32").stat().st_size == 2 * 2 * 4
+    assert (tmp_path / "embeddings.keys").read_text().splitlines() == ["a", "b"]
+
+
+def test_store_rejects_other_dimensions(store) -> None:
+    """Vectors that do not match the store dimension are not cached."""
+    store.put("a", [1.0, 0.0])
+    store.put("b", [1.0, 0.0, 0.0])
+
+    assert "b" not in store
+
+
+def test_store_migrates_legacy_json(tmp_path) -> None:
+    """A legacy embeddings.json is converted on first access."""
+    legacy = tmp_path / "embeddings.json"
+    legacy.write_text(json.dumps({"k1": [0.5, 0.5], "k2": [1.0, 0.0]}))
+
+    store = EmbeddingStore(tmp_path, legacy_json=legacy)
+
+    assert store.get("k2").tolist() == [1.0, 0.0]
+    assert (tmp_path / "embeddings.meta.json").exists()
+    assert legacy.exists()
+
+
+def test_store_repairs_partial_write(store, tmp_path) -> None:
+    """A trailing partial row or orphan key is dropped on open."""
+    store.put("a", [1.0, 0.0])
+    store.flush()
+    with open(tmp_path / "embeddings.keys", "a") as f:
+        f.write("orphan\n")
+    with open(tmp_path / "embeddings.f32", "ab") as f:
+        f.write(b"\x00\x00")
+
+    reopened = EmbeddingStore(tmp_path, flush_batch_size=1)
+    reopened.put("b", [0.0, 1.0])
+
+    assert "orphan" not in reopened
+    assert EmbeddingStore(tmp_path).get("b").tolist() == [0.0, 1.0]
+
+
+def test_candidate_matrix_top_k_matches_find_similar() -> None:
+    """CandidateMatrix ranks like the per-candidate find_similar loop."""
+    rng = np.random.default_rng(0)
+    candidates = {f"t{i}": rng.normal(size=8).tolist() for i in range(20)}
+    query = rng.normal(size=8)
+
+    expected = sorted(
+        candidates,
+        key=lambda name: (
+            -np.dot(query, candidates[name]) / np.linalg.norm(candidates[name])
+        ),
+    )[:5]
+
+    assert CandidateMatrix(candidates).top_k(query, 5) == expected
+    assert EmbeddingService(use_cache=False).find_similar(query, candidates, 5) == (
+        expected
+    )
+
+
+def test_candidate_matrix_batch_and_zero_query() -> None:
+    """Batched scoring returns one ranking per query; zero queries keep order."""
+    matrix = CandidateMatrix({"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [1.0, 1.0]})
+
+    assert matrix.top_k_batch([[0.0, 2.0], [0.0, 0.0]], k=2) == [
+        ["b", "c"],
+        ["a", "b"],
+    ]
+
+
+def test_candidate_matrix_tolerates_dimension_mismatches() -> None:
+    """Stale candidates score 0.0 and mismatched queries fall back to order."""
+    matrix = CandidateMatrix({"stale": [0.0], "a": [1.0, 0.0], "b": [0.0, 1.0]})
+
+    assert matrix.top_k([0.0, 1.0], k=3) == ["b", "stale", "a"]
+    assert matrix.top_k([1.0, 0.0, 0.0], k=2) == ["stale", "a"]
+
+
+def test_register_candidates_is_retrievable() -> None:
+    """Registered candidate sets can be fetched by name."""
+    service = EmbeddingService(use_cache=False)
+    matrix = service.register_candidates("tables", {"a": [1.0, 0.0]})
+
+    assert service.get_candidates("tables") is matrix
+    assert service.get_candidates("missing") is None
+
+
+def test_table_index_reembeds_only_changed_tables(tmp_path, mocker) -> None:
+    """The table index persists and re-embeds only changed tables."""
+    mocker.patch.object(
+        EmbeddingService, "active_model", new_callable=mocker.PropertyMock
+    ).return_value = "test-model"
+    embed_batch = mocker.patch(
+        "src.backend.utils.schema_index.embed_batch_with_fallbacks",
+        side_effect=lambda texts: (
+            [[float(len(text)), 1.0] for text in texts],
+            [False] * len(texts),
+        ),
+    )
+    tables = [
+        TableMeta(name="player_gold", description="Players", columns=["id"]),
+        TableMeta(name="team_gold", description="Teams", columns=["id"]),
+    ]
+    index_path = tmp_path / "nba.duckdb.table_index.npz"
+
+    TableEmbeddingIndex(index_path).sync(tables)
+    assert embed_batch.call_count == 1
+    assert len(embed_batch.call_args.args[0]) == 2
+
+    tables[1] = TableMeta(name="team_gold", description="Teams", columns=["id", "abbr"])
+    candidates = TableEmbeddingIndex(index_path).sync(tables)
+
+    assert embed_batch.call_count == 2
+    assert embed_batch.call_args.args[0] == [table_embedding_text(tables[1])]
+    assert candidates.names == ["player_gold", "team_gold"]
+
+    TableEmbeddingIndex(index_path).sync(tables)
+    assert embed_batch.call_count == 2
+
+
+def test_table_index_retries_fallback_embeddings(tmp_path, mocker) -> None:
+    """Fallback vectors from a failing API are served but not persisted."""
+    mocker.patch.object(
+        EmbeddingService, "active_model", new_callable=mocker.PropertyMock
+    ).return_value = "test-model"
+    mocker.patch(
+        "src.backend.utils.schema_index.get_embedding_service",
+        return_value=EmbeddingService(use_cache=False),
+    )
+    embed = mocker.patch(
+        "src.backend.utils.schema_index.embed_batch_with_fallbacks",
+        side_effect=[
+            ([[0.0, 1.0]], [True]),
+            ([[1.0, 0.0]], [False]),
+        ],
+    )
+    tables = [TableMeta(name="player_gold", description="Players", columns=["id"])]
+    index_path = tmp_path / "nba.duckdb.table_index.npz"
+
+    assert TableEmbeddingIndex(index_path).sync(tables).names == ["player_gold"]
+    assert not index_path.exists()
+
+    TableEmbeddingIndex(index_path).sync(tables)
+    TableEmbeddingIndex(index_path).sync(tables)
+    assert embed.call_count == 2
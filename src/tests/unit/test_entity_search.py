@@ -0,0 +1,135 @@
+"""Tests for DuckDB-backed player and team name search."""
+
+import duckdb
+import pytest
+
+from src.backend.nodes.query_rewriter import QueryRewriter
+from src.backend.utils.duckdb_client import DuckDBClient
+from src.backend.utils.entity_search import (
+    build_entity_search,
+    search_available,
+    search_entities,
+)
+
+
+@pytest.fixture
+def db_client(tmp_path):
+    db_path = tmp_path / "nba.duckdb"
+    conn = duckdb.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE player_gold AS SELECT * FROM (VALUES "
+        "(2544, 'LeBron James', 'LeBron', 'James'), "
+        "(201939, 'Stephen Curry', 'Stephen', 'Curry'), "
+        "(203110, 'Seth Curry', 'Seth', 'Curry'), "
+        "(203999, 'Nikola Jokić', 'Nikola', 'Jokić')"
+        ") t(id, full_name, first_name, last_name)"
+    )
+    conn.execute(
+        "CREATE TABLE team_gold AS SELECT * FROM (VALUES "
+        "(1610612747, 'Los Angeles Lakers', 'LAL', 'Lakers')"
+        ") t(id, full_name, abbreviation, nickname)"
+    )
+    build_entity_search(conn)
+    conn.close()
+    client = DuckDBClient(db_path)
+    yield client
+    client.close()
+
+
+def test_ranks_fuzzy_names_nicknames_and_abbreviations(db_client) -> None:
+    """Misspellings, accents and team aliases resolve to canonical names."""
+    best = {
+        text: search_entities(text, k=1, db_client=db_client)[0].name
+        for text in ("Lebron Jmaes", "Steph Curry", "Jokic", "lakers", "LAL")
+    }
+
+    assert best == {
+        "Lebron Jmaes": "LeBron James",
+        "Steph Curry": "Stephen Curry",
+        "Jokic": "Nikola Jokić",
+        "lakers": "Los Angeles Lakers",
+        "LAL": "Los Angeles Lakers",
+    }
+    curries = search_entities("Curry", db_client=db_client)
+    assert [m.score for m in curries] == [1.0, 1.0]
+    assert search_entities("Zzyzx", db_client=db_client) == []
+
+
+def test_missing_search_tables_return_no_matches(tmp_path) -> None:
+    """A database without the search tables degrades to an empty result."""
+    db_path = tmp_path / "empty.duckdb"
+    duckdb.connect(str(db_path)).close()
+    client = DuckDBClient(db_path)
+
+    assert search_entities("LeBron", db_client=client) == []
+    client.close()
+
+
+def _use_client(mocker, client) -> None:
+    mocker.patch(
+        "src.backend.nodes.query_rewriter.search_available",
+        side_effect=lambda: search_available(client),
+    )
+    mocker.patch(
+        "src.backend.nodes.query_rewriter.search_entities",
+        side_effect=lambda text, k: search_entities(text, k, db_client=client),
+    )
+
+
+def test_rewriter_resolves_names_without_llm(mocker, db_client) -> None:
+    """First-turn questions are rewritten from name search alone."""
+    _use_client(mocker, db_client)
+    llm = mocker.patch("src.backend.nodes.query_rewriter.call_llm")
+    rewriter = QueryRewriter()
+    shared = {
+        "question": "How many points did Steph Curry score against the Lakers?",
+        "conversation_history": [],
+    }
+
+    rewriter.run(shared)
+
+    llm.assert_not_called()
+    assert shared["rewritten_query"] == (
+        "How many points did Stephen Curry score against the Los Angeles Lakers?"
+    )
+    assert shared["resolved_references"].resolved_entities == {
+        "Steph Curry": "Stephen Curry",
+        "Lakers": "Los Angeles Lakers",
+    }
+
+
+def test_rewriter_uses_llm_for_abbreviations(mocker, db_client) -> None:
+    """Stat shorthand still goes to the LLM, with the matched names as hints."""
+    _use_client(mocker, db_client)
+    llm = mocker.patch(
+        "src.backend.nodes.query_rewriter.call_llm",
+        return_value="rewritten_query: Stephen Curry field goal percentage",
+    )
+    shared = {
+        "question": "What was the FG% of Steph Curry in 2016?",
+        "conversation_history": [],
+    }
+
+    QueryRewriter().run(shared)
+
+    assert "'Steph Curry' is 'Stephen Curry'" in llm.call_args.args[0]
+    assert shared["rewritten_query"] == "Stephen Curry field goal percentage"
+
+
+def test_rewriter_uses_llm_without_search_tables(mocker, tmp_path) -> None:
+    """A database without the search tables falls back to the LLM rewrite."""
+    db_path = tmp_path / "empty.duckdb"
+    duckdb.connect(str(db_path)).close()
+    client = DuckDBClient(db_path)
+    _use_client(mocker, client)
+    llm = mocker.patch(
+        "src.backend.nodes.query_rewriter.call_llm",
+        return_value="rewritten_query: Points by LeBron James",
+    )
+    shared = {"question": "Points by LeBron James", "conversation_history": []}
+
+    QueryRewriter().run(shared)
+
+    llm.assert_called_once()
+    assert shared["rewritten_query"] == "Points by LeBron James"
+    client.close()
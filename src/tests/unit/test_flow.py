@@ -0,0 +1,79 @@
+"""Tests for parallel sub-query execution in the async flow."""
+
+import asyncio
+
+import pytest
+from pocketflow import AsyncNode
+
+from src.backend.flow import ParallelSubQueryBatchFlow
+from src.backend.models import QueryComplexity, QueryPlan, SubQuery
+
+
+class RecordingNode(AsyncNode):
+    """Branch node that records when each sub-query starts and finishes."""
+
+    def __init__(self, events: list[str]) -> None:
+        super().__init__()
+        self.events = events
+
+    async def exec_async(self, prep_res):
+        sub_id = self.params["sub_query_id"]
+        self.events.append(f"start:{sub_id}")
+        await asyncio.sleep(0.01)
+        self.events.append(f"end:{sub_id}")
+
+    async def post_async(self, shared, prep_res, exec_res):
+        shared["table_schemas"] = self.params["sub_query_id"]
+        shared["sub_query_results"][self.params["sub_query_id"]] = "ok"
+
+
+def _plan(*sub_queries: SubQuery) -> QueryPlan:
+    return QueryPlan(
+        complexity=QueryComplexity.COMPLEX,
+        sub_queries=list(sub_queries),
+        combination_strategy="chain",
+    )
+
+
+@pytest.mark.asyncio
+async def test_parallel_flow_respects_dependencies(mocker) -> None:
+    """Independent sub-queries overlap; dependent ones wait for their inputs."""
+    mocker.patch("src.backend.flow.rank_candidate_tables", side_effect=RuntimeError)
+    events: list[str] = []
+    flow = ParallelSubQueryBatchFlow(start=RecordingNode(events), max_concurrency=4)
+    shared = {
+        "query_plan": _plan(
+            SubQuery(id="total", description="Combine", depends_on=["lakers"]),
+            SubQuery(id="lakers", description="Lakers wins"),
+            SubQuery(id="celtics", description="Celtics wins"),
+        )
+    }
+
+    await flow.run_async(shared)
+
+    assert events.index("end:lakers") < events.index("start:total")
+    assert events.index("start:celtics") < events.index("end:lakers")
+    assert shared["sub_query_results"] == {
+        "total": "ok",
+        "lakers": "ok",
+        "celtics": "ok",
+    }
+    assert "table_schemas" not in shared
+
+
+@pytest.mark.asyncio
+async def test_parallel_flow_caps_concurrency(mocker) -> None:
+    """No more than max_concurrency branches run at once."""
+    mocker.patch("src.backend.flow.rank_candidate_tables", side_effect=RuntimeError)
+    events: list[str] = []
+    flow = ParallelSubQueryBatchFlow(start=RecordingNode(events), max_concurrency=1)
+    shared = {
+        "query_plan": _plan(
+            SubQuery(id="a", description="A"),
+            SubQuery(id="b", description="B"),
+        )
+    }
+
+    await flow.run_async(shared)
+
+    assert events == ["start:a", "end:a", "start:b", "end:b"]
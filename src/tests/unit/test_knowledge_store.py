@@ -0,0 +1,98 @@
+"""Tests for the SQLite-backed knowledge store."""
+
+import json
+import sqlite3
+
+from src.backend.utils.knowledge_store import KnowledgeStore
+
+
+def _store(tmp_path, **kwargs) -> KnowledgeStore:
+    return KnowledgeStore(
+        tmp_path / "knowledge.sqlite3", legacy_json=None, flush_interval=60, **kwargs
+    )
+
+
+def test_writes_are_batched_into_one_commit(tmp_path) -> None:
+    """Queued writes stay invisible to other connections until the batch commits."""
+    store = _store(tmp_path)
+    store.load()
+    for table in ("player", "common_player_info", "draft_history"):
+        store.add_entity_mapping("LeBron James", table, ["first_name", "last_name"])
+
+    other = sqlite3.connect(tmp_path / "knowledge.sqlite3")
+    count = "SELECT count(*) FROM entity_mappings"
+    assert other.execute(count).fetchone() == (0,)
+
+    store.save()
+    assert other.execute(count).fetchone() == (6,)
+    assert other.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    other.close()
+    store.close()
+
+
+def test_lookups_match_the_json_layout(tmp_path) -> None:
+    """Reads commit pending writes and keep the legacy return shapes."""
+    store = _store(tmp_path)
+    store.add_entity_mapping("LeBron James", "player", ["full_name"])
+    store.add_entity_mapping("Stephen Curry", "player", ["full_name"])
+    store.add_column_hint("Points Scored", "player_game_stats", "pts")
+    store.add_join_pattern(["team", "game"], ["team_id"])
+    store.add_join_pattern(["game", "team"], ["team_id"])
+
+    assert store.get_entity_hints("lebron") == {
+        "LeBron James": {"player": ["full_name"]}
+    }
+    assert store.get_entity_hints("Did Stephen Curry play?") == {
+        "Stephen Curry": {"player": ["full_name"]}
+    }
+    assert store.get_column_hints() == {
+        "points scored": {"table": "player_game_stats", "column": "pts"}
+    }
+    assert store.get_join_patterns() == [
+        {"tables": ["game", "team"], "keys": ["team_id"]}
+    ]
+
+    store.clear()
+    assert store.data == {
+        "entity_mappings": {},
+        "successful_patterns": {},
+        "column_hints": {},
+        "join_patterns": [],
+    }
+    store.close()
+
+
+def test_successful_patterns_are_trimmed(tmp_path, mocker) -> None:
+    """Only the most recent patterns per query type are kept."""
+    mocker.patch("src.backend.utils.knowledge_store.SUCCESSFUL_PATTERN_LIMIT", 2)
+    store = _store(tmp_path, flush_every=3)
+    for n in range(4):
+        store.add_successful_pattern("ranking", {"sql": f"q{n}"})
+    store.add_successful_pattern("ranking", {"sql": "q3"})
+
+    assert store.get_successful_patterns("ranking") == [{"sql": "q2"}, {"sql": "q3"}]
+    store.close()
+
+
+def test_imports_legacy_json_once(tmp_path) -> None:
+    """The old JSON document is migrated on first open and set aside."""
+    legacy = tmp_path / "knowledge_store.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "entity_mappings": {"Lakers": {"team": ["nickname"]}},
+                "successful_patterns": {"ranking": ["q1"]},
+                "column_hints": {},
+                "join_patterns": [{"tables": ["b", "a"], "keys": ["id"]}],
+            }
+        )
+    )
+    store = KnowledgeStore(tmp_path / "knowledge.sqlite3", legacy_json=legacy)
+
+    assert store.get_all_hints()["entity_mappings"] == {
+        "Lakers": {"team": ["nickname"]}
+    }
+    assert store.get_successful_patterns() == {"ranking": ["q1"]}
+    assert store.get_join_patterns() == [{"tables": ["a", "b"], "keys": ["id"]}]
+    assert not legacy.exists()
+    store.close()
@@ -0,0 +1,55 @@
+"""Tests for the warm process-pool sandbox behind the Executor node."""
+
+import pandas as pd
+import pytest
+
+from backend.nodes.execution import Executor
+from backend.utils.sandbox import SandboxPool
+
+
+@pytest.fixture
+def pool():
+    sandbox = SandboxPool(workers=1)
+    yield sandbox
+    sandbox.close()
+
+
+def test_runs_code_on_shared_frames(pool) -> None:
+    """Frames are published once and DataFrame results come back intact."""
+    df = pd.DataFrame({"team": ["LAL", "BOS", "LAL"], "pts": [110, 102, 98]})
+    code = "final_result = dfs['games'].groupby('team', as_index=False)['pts'].sum()"
+
+    first = pool.run(code, {"games": df}, timeout=10)
+    second = pool.run(code, {"games": df}, timeout=10)
+
+    assert first[0] == "success"
+    pd.testing.assert_frame_equal(
+        first[1], pd.DataFrame({"team": ["BOS", "LAL"], "pts": [102, 208]})
+    )
+    assert second[0] == "success"
+    assert len(list(pool.shared_dir.glob("frame-*.arrow"))) == 1
+
+
+def test_runaway_code_is_killed_and_worker_replaced(pool) -> None:
+    """A task past its deadline is killed; the next task gets a fresh worker."""
+    status, message = pool.run("while True:\n    pass", {}, timeout=1)
+
+    assert status == "error"
+    assert "timed out after 1 seconds" in message
+    assert pool.stats.timeouts == 1
+    assert pool.run("final_result = 2 + 2", {}, timeout=5) == ("success", 4)
+
+
+def test_executor_reports_errors_from_the_sandbox(mocker, pool) -> None:
+    """The Executor node keeps its (status, payload) contract."""
+    mocker.patch("backend.nodes.execution.get_sandbox_pool", return_value=pool)
+    executor = Executor()
+
+    result = executor.exec(
+        {"csv_code": "x = 1", "api_code": "final_result = 1 / 0", "dfs": {}}
+    )
+
+    assert result == {
+        "csv": ("error", "Code did not define 'final_result' variable"),
+        "api": ("error", "division by zero"),
+    }
@@ -0,0 +1,206 @@
+"""Tests for the semantic LLM response cache."""
+
+import hashlib
+import json
+import time
+
+import pytest
+
+from src.backend.utils import cache as cache_module
+from src.backend.utils.cache import SemanticCache
+from src.backend.utils.eviction import create_eviction_policy
+from src.backend.utils.vector_index import VectorIndex
+
+
+class FakeEmbeddingService:
+    """Deterministic embeddings keyed by the first word of the prompt."""
+
+    VECTORS = {
+        "points": [1.0, 0.0, 0.0],
+        "rebounds": [0.0, 1.0, 0.0],
+        "pts": [0.99, 0.05, 0.0],
+    }
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_text(self, text: str) -> list[float]:
+        self.calls += 1
+        return self.VECTORS.get(text.split(maxsplit=1)[0].lower(), [0.0, 0.0, 1.0])
+
+
+@pytest.fixture
+def semantic_cache(tmp_path, monkeypatch):
+    """SemanticCache persisted under a temporary directory."""
+    monkeypatch.setattr(cache_module, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(
+        "src.backend.utils.embeddings.get_embedding_service",
+        FakeEmbeddingService,
+    )
+    return SemanticCache(similarity_threshold=0.95)
+
+
+def test_vector_index_search_and_remove() -> None:
+    """VectorIndex ranks by cosine similarity and compacts on removal."""
+    index = VectorIndex(initial_capacity=1)
+    index.add("a", [1.0, 0.0])
+    index.add("b", [0.0, 2.0])
+    index.add("c", [1.0, 1.0])
+
+    assert [key for key, _ in index.search([1.0, 0.1], k=2)] == ["a", "c"]
+
+    assert index.remove("a")
+    assert not index.remove("a")
+    assert len(index) == 2
+    assert index.search([1.0, 0.0], k=1)[0][0] == "c"
+
+
+def test_vector_index_rejects_dimension_mismatch() -> None:
+    """Vectors with a different dimension are rejected."""
+    index = VectorIndex()
+    index.add("a", [1.0, 0.0])
+
+    with pytest.raises(ValueError, match="dimension"):
+        index.add("b", [1.0, 0.0, 0.0])
+
+
+def test_semantic_hit_uses_index(semantic_cache) -> None:
+    """Similar prompts hit the cache through the vector index."""
+    semantic_cache.set("points leaders 2023", "LeBron")
+
+    assert semantic_cache.get("pts leaders 2023") == "LeBron"
+    assert semantic_cache.get("rebounds leaders 2023") is None
+
+
+def test_index_stays_in_sync_with_entries(semantic_cache) -> None:
+    """Invalidate, eviction, and expiry drop vectors from the index."""
+    semantic_cache.max_entries = 2
+    semantic_cache.set("points one", "a")
+    semantic_cache.set("rebounds two", "b")
+    semantic_cache.set("other three", "c")
+
+    assert semantic_cache.stats()["indexed_entries"] == 2
+
+    semantic_cache.invalidate("rebounds")
+    assert semantic_cache.stats()["indexed_entries"] == 1
+
+    semantic_cache.ttl_seconds = 0
+    assert semantic_cache.get("other three") is None
+    assert semantic_cache.stats()["indexed_entries"] == 0
+
+
+def test_stats_report_latency_percentiles(semantic_cache) -> None:
+    """stats() exposes lookup latency percentiles."""
+    semantic_cache.get("points anything")
+
+    latency = semantic_cache.stats()["lookup_latency_ms"]
+
+    assert set(latency) == {"p50", "p95", "p99"}
+    assert latency["p99"] >= latency["p50"] >= 0.0
+
+
+def test_entries_persist_across_instances(semantic_cache, tmp_path) -> None:
+    """Entries written by one cache are loaded lazily by the next."""
+    semantic_cache.set("points leaders 2023", "LeBron")
+    semantic_cache.set("rebounds leaders 2023", "Sabonis")
+    semantic_cache.invalidate("rebounds")
+
+    reopened = SemanticCache(similarity_threshold=0.95)
+
+    assert reopened.get("pts leaders 2023") == "LeBron"
+    assert reopened.get("rebounds leaders 2023") is None
+    assert (tmp_path / "cache.sqlite3").exists()
+    assert not (tmp_path / "cache.json").exists()
+
+
+def test_legacy_json_cache_is_migrated(tmp_path, monkeypatch) -> None:
+    """A legacy cache.json is imported once and set aside."""
+    monkeypatch.setattr(cache_module, "CACHE_DIR", tmp_path)
+    cache = SemanticCache(use_embeddings=False)
+    prompt_hash = hashlib.sha256(b"who won in 2016?").hexdigest()
+    (tmp_path / "cache.json").write_text(
+        json.dumps(
+            {
+                "entries": [
+                    {
+                        "prompt_hash": prompt_hash,
+                        "prompt": "Who won in 2016?",
+                        "response": "Cavaliers",
+                        "timestamp": time.time(),
+                        "embedding": None,
+                    }
+                ]
+            }
+        )
+    )
+
+    assert cache.get("Who won in 2016?") == "Cavaliers"
+    assert (tmp_path / "cache.json.migrated").exists()
+
+
+@pytest.mark.parametrize(
+    ("policy", "evicted"),
+    [("lru", "rebounds two"), ("lfu", "rebounds two"), ("ttl_first", "points one")],
+)
+def test_eviction_policies(tmp_path, monkeypatch, policy, evicted) -> None:
+    """Each policy evicts the expected entry once the cache is full."""
+    monkeypatch.setattr(cache_module, "CACHE_DIR", tmp_path)
+    cache = SemanticCache(max_entries=2, use_embeddings=False, eviction_policy=policy)
+    cache.set("points one", "a")
+    cache.set("rebounds two", "b")
+    cache.get("points one")
+    cache.set("other three", "c")
+
+    assert cache.get(evicted) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lfu_ignores_entries_from_before_a_reinsert() -> None:
+    """A removed and reinserted key is not evicted through its old heap entry."""
+    policy = create_eviction_policy("lfu")
+    policy.record_insert("a")
+    policy.record_insert("b")
+    policy.remove("a")
+    policy.record_insert("a")
+
+    assert policy.pop_victim() == "b"
+    assert policy.pop_victim() == "a"
+
+
+def test_lfu_keeps_tie_order_across_heap_rebuilds() -> None:
+    """Compacting stale heap entries keeps oldest-first order on ties."""
+    policy = create_eviction_policy("lfu")
+    policy.record_insert("a")
+    policy.record_insert("b")
+    policy.record_access("b")
+    policy.record_access("a")
+    for _ in range(100):
+        policy.record_insert("churn")
+        policy.remove("churn")
+
+    assert policy.pop_victim() == "b"
+    assert policy.pop_victim() == "a"
+
+
+def test_unknown_eviction_policy_is_rejected() -> None:
+    """An unknown policy name raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown eviction policy"):
+        create_eviction_policy("random")
+
+
+def test_sweep_expires_entries_and_counts(semantic_cache) -> None:
+    """sweep() drops expired entries and stats() tracks hits and misses."""
+    semantic_cache.set("points one", "a")
+    assert semantic_cache.get("points one") == "a"
+    assert semantic_cache.get("rebounds two") is None
+
+    semantic_cache.ttl_seconds = 0
+    assert semantic_cache.sweep() == 1
+
+    stats = semantic_cache.stats()
+    assert stats["total_entries"] == 0
+    assert stats["indexed_entries"] == 0
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
@@ -0,0 +1,91 @@
+"""Tests for speculative multi-candidate SQL generation."""
+
+import threading
+
+import pytest
+
+from src.backend.models import ValidationResult
+from src.backend.nodes.sql_generator import (
+    AsyncSQLGenerator,
+    SQLGenerator,
+    candidate_hints,
+)
+
+
+SCHEMA = "CREATE TABLE player_gold (player_id BIGINT, full_name TEXT);"
+INVALID = "```yaml\nsql: SELECT nickname FROM player_gold\n```"
+VALID = "```yaml\nsql: SELECT full_name FROM player_gold\n```"
+
+
+def _responses(prompt: str) -> str:
+    # Only the JOIN-flavoured candidate produces valid SQL
+    return VALID if "explicit JOINs" in prompt else INVALID
+
+
+@pytest.fixture
+def db_client(mocker):
+    client = mocker.Mock(spec=["validate_sql_syntax"])
+    client.validate_sql_syntax.return_value = ValidationResult(is_valid=True)
+    mocker.patch(
+        "src.backend.nodes.sql_generator.get_duckdb_client", return_value=client
+    )
+    return client
+
+
+def test_candidate_hints_are_distinct() -> None:
+    """Every candidate gets its own prompt, so none share an LLM request."""
+    hints = candidate_hints(6)
+
+    assert hints[0] == ""
+    assert len(set(hints)) == 6
+
+
+def test_first_valid_candidate_wins_without_serial_retry(mocker, db_client) -> None:
+    """Candidates run concurrently and a valid one ends the round."""
+    started = threading.Barrier(3, timeout=5)
+
+    def llm(prompt: str) -> str:
+        started.wait()
+        return _responses(prompt)
+
+    mocker.patch("src.backend.nodes.sql_generator.call_llm", side_effect=llm)
+    generator = SQLGenerator(candidates=3)
+
+    result = generator.exec(
+        generator.prep({"rewritten_query": "Q", "table_schemas": SCHEMA})
+    )
+
+    assert result["is_valid"]
+    assert result["sql"] == "SELECT full_name FROM player_gold"
+    assert result["attempts"][-1].validation.is_valid
+
+
+def test_serial_loop_follows_a_failed_round(mocker, db_client) -> None:
+    """When no candidate is valid, later rounds use the reflection loop."""
+    llm = mocker.patch("src.backend.nodes.sql_generator.call_llm", return_value=INVALID)
+    generator = SQLGenerator(max_retries=3, candidates=2)
+
+    result = generator.exec(
+        generator.prep({"rewritten_query": "Q", "table_schemas": SCHEMA})
+    )
+
+    assert not result["is_valid"]
+    assert llm.call_count == 4
+    assert "nickname" in llm.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_async_candidates(mocker, db_client) -> None:
+    """The async node races candidates the same way."""
+
+    async def llm(prompt: str) -> str:
+        return _responses(prompt)
+
+    mocker.patch("src.backend.nodes.sql_generator.call_llm_async", side_effect=llm)
+    generator = AsyncSQLGenerator(candidates=3)
+    prep = generator.prep({"rewritten_query": "Q", "table_schemas": SCHEMA})
+
+    result = await generator.exec_async(prep)
+
+    assert result["is_valid"]
+    assert result["sql"] == "SELECT full_name FROM player_gold"
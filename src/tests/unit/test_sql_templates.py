@@ -0,0 +1,107 @@
+"""Tests for learned question-to-SQL templates."""
+
+from src.backend.models import ValidationResult
+from src.backend.nodes.template_matcher import TemplateMatcher
+from src.backend.utils.sql_templates import TemplateStore, build_template
+
+
+LEADER_SQL = (
+    "SELECT name, SUM(pts) AS total FROM player_game_stats_gold "
+    "WHERE season = '2023-24' GROUP BY name ORDER BY total DESC LIMIT 1"
+)
+
+
+def test_template_lifts_season_and_stat_slots() -> None:
+    """Seasons and stat names become slots that refill from a new question."""
+    template = build_template("Who led the league in points in 2023-24?", LEADER_SQL)
+
+    values = template.match("who led the league in assists in 2019-20")
+
+    assert template.pattern == "Who led the league in {stat_1} in {season_0}"
+    assert template.render(values) == LEADER_SQL.replace("pts", "ast").replace(
+        "2023-24", "2019-20"
+    )
+    assert template.match("Who scored the most points in 2019-20?") is None
+
+
+def test_template_lifts_entity_names() -> None:
+    """String literals that echo the question are filled and escaped."""
+    template = build_template(
+        "How many points did LeBron James score in 2020?",
+        "SELECT SUM(pts) FROM player_game_stats_gold "
+        "WHERE lower(name) LIKE '%lebron james%' AND season = '2019-20'",
+    )
+
+    values = template.match("How many rebounds did Shaquille O'Neal score in 2001?")
+
+    assert template.render(values) == (
+        "SELECT SUM(reb) FROM player_game_stats_gold "
+        "WHERE lower(name) LIKE '%shaquille o''neal%' AND season = '2000-01'"
+    )
+
+
+def test_entity_slot_matches_only_name_like_text() -> None:
+    """An entity slot does not absorb extra names or clauses."""
+    template = build_template(
+        "How many points did LeBron James score in 2020?",
+        "SELECT SUM(pts) FROM player_game_stats_gold "
+        "WHERE name = 'LeBron James' AND season = '2019-20'",
+    )
+
+    assert template.match("How many points did Karl-Anthony Towns score in 2020")
+    assert (
+        template.match(
+            "How many points did LeBron James and Anthony Davis score in 2020"
+        )
+        is None
+    )
+    assert (
+        template.match("How many points did the team score against Boston in 2020")
+        is None
+    )
+
+
+def test_store_persists_matches_and_discards(tmp_path) -> None:
+    """Recorded templates survive a reload and can be forgotten."""
+    path = tmp_path / "templates.sqlite3"
+    TemplateStore(path).record(
+        "Who led the league in points in 2023-24?", LEADER_SQL, ["player_gold"]
+    )
+
+    store = TemplateStore(path)
+    template, sql = store.match("Who led the league in steals in 2021-22?")
+
+    assert "SUM(stl)" in sql
+    assert "'2021-22'" in sql
+    assert template.tables == ["player_gold"]
+
+    store.discard(template.template_id)
+    assert TemplateStore(path).match("Who led the league in steals in 2021-22?") is None
+
+
+def test_matcher_routes_valid_sql_to_executor(tmp_path, mocker) -> None:
+    """A validated template hit skips straight to execution."""
+    store = TemplateStore(tmp_path / "templates.sqlite3")
+    store.record("Who led the league in points in 2023-24?", LEADER_SQL)
+    mocker.patch(
+        "src.backend.nodes.template_matcher.get_template_store", return_value=store
+    )
+    db_client = mocker.patch(
+        "src.backend.nodes.template_matcher.get_duckdb_client"
+    ).return_value
+    db_client.validate_sql_syntax.return_value = ValidationResult(is_valid=True)
+    shared = {"rewritten_query": "Who led the league in blocks in 2022-23?"}
+
+    action = TemplateMatcher().run(shared)
+
+    assert action == "template"
+    assert "SUM(blk)" in shared["sql_query"]
+    assert shared["template_id"]
+
+    db_client.validate_sql_syntax.return_value = ValidationResult(
+        is_valid=False, errors=["Binder Error"]
+    )
+    shared = {"rewritten_query": "Who led the league in blocks in 2022-23?"}
+
+    assert TemplateMatcher().run(shared) == "default"
+    assert "sql_query" not in shared
@@ -0,0 +1,133 @@
+"""Tests for the static, catalog-aware SQL validator."""
+
+from src.backend.models import ValidationResult
+from src.backend.nodes.sql_generator import SQLGenerator
+from src.backend.utils.sql_validator import SQLValidator, parse_ddl_columns
+
+
+CATALOG = {
+    "player_gold": ["player_id", "full_name", "is_active"],
+    "player_game_stats_gold": ["player_id", "game_id", "season", "pts", "reb"],
+}
+
+
+def test_resolves_aliases_ctes_and_correlated_subqueries() -> None:
+    """Valid references through aliases, CTEs and outer scopes pass untouched."""
+    sql = (
+        "WITH totals AS (SELECT player_id, SUM(pts) AS total "
+        "FROM player_game_stats_gold GROUP BY player_id) "
+        "SELECT p.full_name, t.total, "
+        "(SELECT MAX(reb) FROM player_game_stats_gold s "
+        "WHERE s.player_id = p.player_id) AS best_reb "
+        "FROM totals t JOIN player_gold p ON p.player_id = t.player_id "
+        "WHERE EXTRACT(year FROM current_date) > 2000 ORDER BY total DESC"
+    )
+
+    result = SQLValidator(CATALOG).validate(sql)
+
+    assert result.is_valid
+    assert result.sql == sql
+    assert result.fixes == []
+
+
+def test_accepts_collations_and_schema_qualified_columns() -> None:
+    """COLLATE names and schema.table.column references are not misread."""
+    validator = SQLValidator(CATALOG)
+
+    for sql in (
+        "SELECT full_name FROM player_gold ORDER BY full_name COLLATE NOCASE",
+        "SELECT main.player_gold.full_name FROM main.player_gold",
+    ):
+        result = validator.validate(sql)
+        assert result.is_valid, result.errors
+        assert result.sql == sql
+
+    assert validator.validate(
+        "SELECT main.player_gold.points FROM main.player_gold"
+    ).errors == ["Column 'points' not found in 'player_gold'"]
+
+
+def test_reports_unknown_tables_and_columns() -> None:
+    """Unknown names are reported with the relation they were looked up in."""
+    validator = SQLValidator(CATALOG)
+
+    assert validator.validate("SELECT p.points FROM player_gold p").errors == [
+        "Column 'points' not found in 'p'"
+    ]
+    assert validator.validate("SELECT x.full_name FROM player_gold p").errors == [
+        "Unknown table or alias 'x'"
+    ]
+    assert validator.validate("SELECT 1 FROM teams").errors == [
+        "Table 'teams' does not exist"
+    ]
+
+
+def test_repairs_trivial_mistakes_locally() -> None:
+    """Case, unique fuzzy matches and missing quotes are fixed in place."""
+    validator = SQLValidator(CATALOG)
+
+    result = validator.validate(
+        "SELECT p.fullname, playerid FROM Player_Gold p WHERE full_name = 'LeBron James"
+    )
+    escaped = validator.validate(
+        "SELECT full_name FROM player_gold WHERE full_name = 'Shaquille O'Neal'"
+    )
+
+    assert result.is_valid
+    assert result.sql == (
+        "SELECT p.full_name, player_id FROM player_gold p "
+        "WHERE full_name = 'LeBron James'"
+    )
+    assert len(result.fixes) == 4
+    assert escaped.sql.endswith("'Shaquille O''Neal'")
+
+
+def test_parses_prompt_ddl() -> None:
+    """Columns are read from single-line and rendered multi-line DDL."""
+    ddl = (
+        "CREATE TABLE stats (player_name TEXT, points DECIMAL(10,2), season TEXT);\n\n"
+        'CREATE TABLE "team gold" (\n    "Team Id" INTEGER NOT NULL,\n    name VARCHAR\n);'
+        "\n-- 30 rows"
+    )
+
+    assert parse_ddl_columns(ddl) == {
+        "stats": ["player_name", "points", "season"],
+        "team gold": ["Team Id", "name"],
+    }
+
+
+def test_generator_skips_explain_and_retry_for_repairable_sql(mocker) -> None:
+    """A repaired column name is validated once, with no extra LLM call."""
+    db_client = mocker.Mock(spec=["validate_sql_syntax"])
+    db_client.validate_sql_syntax.return_value = ValidationResult(is_valid=True)
+    mocker.patch(
+        "src.backend.nodes.sql_generator.get_duckdb_client", return_value=db_client
+    )
+    llm = mocker.patch(
+        "src.backend.nodes.sql_generator.call_llm",
+        return_value="```yaml\nsql: SELECT fullname FROM player_gold\n```",
+    )
+    generator = SQLGenerator()
+    prep = generator.prep(
+        {
+            "rewritten_query": "List players",
+            "table_schemas": "CREATE TABLE player_gold (player_id BIGINT, full_name TEXT);",
+        }
+    )
+
+    result = generator.exec(prep)
+
+    assert result["is_valid"]
+    assert result["sql"] == "SELECT full_name FROM player_gold"
+    assert llm.call_count == 1
+    db_client.validate_sql_syntax.assert_called_once_with(
+        "SELECT full_name FROM player_gold"
+    )
+
+    llm.return_value = "```yaml\nsql: SELECT nickname FROM player_gold\n```"
+    db_client.validate_sql_syntax.reset_mock()
+
+    result = generator.exec(prep)
+
+    assert not result["is_valid"]
+    db_client.validate_sql_syntax.assert_not_called()
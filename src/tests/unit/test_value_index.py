@@ -0,0 +1,86 @@
+"""Tests for the distinct-value index behind entity resolution."""
+
+import pandas as pd
+
+from src.backend.utils import value_index
+from src.backend.utils.value_index import ValueIndex
+
+
+def _tables() -> dict[str, pd.DataFrame]:
+    filler = pd.DataFrame(
+        {"first_name": ["Role"] * 5000, "last_name": ["Player"] * 5000}
+    )
+    players = pd.concat(
+        [filler, pd.DataFrame({"first_name": ["LeBron"], "last_name": ["James"]})],
+        ignore_index=True,
+    )
+    teams = pd.DataFrame(
+        {"full_name": ["Los Angeles Lakers", "Boston Celtics"], "wins": [50, 60]}
+    )
+    return {"player": players, "team": teams}
+
+
+def test_finds_values_beyond_any_sample_window(tmp_path) -> None:
+    """Every distinct value is indexed, including rows past the first thousand."""
+    index = ValueIndex(tmp_path / "values.npz")
+    index.sync(_tables())
+
+    assert index.find("lebron") == {"player": {"first_name": 1}}
+    assert index.find("LAKERS") == {"team": {"full_name": 1}}
+    assert index.find("Player") == {"player": {"last_name": 5000}}
+    assert index.find("Knicks") == {}
+
+
+def test_persists_and_rescans_only_changed_tables(tmp_path, mocker) -> None:
+    """A reload reuses stored values; a changed table is rescanned alone."""
+    path = tmp_path / "values.npz"
+    tables = _tables()
+    ValueIndex(path).sync(tables)
+
+    reloaded = ValueIndex(path)
+    scan = mocker.spy(pd.Series, "value_counts")
+    reloaded.sync(tables)
+    assert scan.call_count == 0
+    assert reloaded.find("celtics") == {"team": {"full_name": 1}}
+
+    tables["team"] = pd.DataFrame({"full_name": ["New York Knicks"]})
+    reloaded.sync(tables)
+    assert scan.call_count == 1
+    assert reloaded.find("knicks") == {"team": {"full_name": 1}}
+    assert reloaded.find("celtics") == {}
+
+
+def test_same_frames_are_not_rehashed(tmp_path, mocker) -> None:
+    """Re-syncing the same DataFrames skips hashing; a new frame is hashed."""
+    fingerprint = mocker.patch(
+        "src.backend.utils.value_index.table_fingerprint",
+        side_effect=lambda name, df: f"{name}:{len(df)}",
+    )
+    index = ValueIndex(tmp_path / "values.npz")
+    tables = _tables()
+
+    index.sync(tables)
+    index.sync(tables)
+    assert fingerprint.call_count == 2
+
+    tables["team"] = tables["team"].copy()
+    index.sync(tables)
+    assert fingerprint.call_count == 3
+
+
+def test_signed_tables_are_neither_hashed_nor_reread(tmp_path, mocker) -> None:
+    """Tables with a source signature are fingerprinted from it, even as copies."""
+    fingerprint = mocker.spy(value_index, "table_fingerprint")
+    scan = mocker.spy(pd.Series, "value_counts")
+    index = ValueIndex(tmp_path / "values.npz")
+    signatures = {"player": (10, 1), "team": (20, 1)}
+
+    for _ in range(3):
+        index.sync({name: df.copy() for name, df in _tables().items()}, signatures)
+
+    assert fingerprint.call_count == 0
+    assert scan.call_count == 3
+    assert index.find("celtics") == {"team": {"full_name": 1}}
+
+    index.sync(_tables(), {**signatures, "team": (21, 2)})
+    assert scan.call_count == 4